@@ -1,6 +1,17 @@
 """AI analysis modules for Research Agent."""
 
+from .base import LLMProvider, LLMResponse
 from .claude_analyzer import ClaudeAnalyzer
 from .gemini_analyzer import GeminiAnalyzer
+from .router import LLMRouter, create_analyzer
+from .sources import SourceSummary
 
-__all__ = ["ClaudeAnalyzer", "GeminiAnalyzer"]
+__all__ = [
+    "LLMProvider",
+    "LLMResponse",
+    "ClaudeAnalyzer",
+    "GeminiAnalyzer",
+    "LLMRouter",
+    "create_analyzer",
+    "SourceSummary",
+]
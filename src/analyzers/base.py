@@ -0,0 +1,303 @@
+"""Base interface for LLM providers."""
+
+import asyncio
+import time
+import weakref
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, Any, Callable, List, Union
+
+from src.config import Config
+from src.utils.logger import get_logger
+from src.utils.metrics import metrics
+from .prompt_templates import PromptSpec, get_analysis_spec
+from .sources import SourceSummary
+
+
+@dataclass
+class LLMResponse:
+    """Normalized result of one LLM call."""
+
+    text: str
+    provider: str
+    model: str
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    approximate: bool = False  # token counts are estimates
+    latency: float = 0.0
+    failover: bool = False  # answered by a fallback provider
+
+    @property
+    def tokens_used(self) -> int:
+        """Total tokens processed, cached prompt tokens included."""
+        return self.input_tokens + self.cache_read_tokens + self.cache_write_tokens + self.output_tokens
+
+
+class LLMProvider(ABC):
+    """
+    Common interface of the AI analyzers.
+
+    Subclasses only implement ``generate``; prompt building, error handling
+    and the result and metadata schema are shared, so callers can switch
+    providers (or route between them) without caring which one answered.
+    """
+
+    name: str = "llm"
+    display_name: str = "AI"
+
+    def __init__(self):
+        """Initialize provider."""
+        self.logger = get_logger(self.__class__.__name__)
+        self._loop_state = weakref.WeakKeyDictionary()
+
+    @property
+    @abstractmethod
+    def model(self) -> str:
+        """Model identifier used for requests."""
+
+    @abstractmethod
+    def generate(self, prompt: Union[str, PromptSpec]) -> LLMResponse:
+        """
+        Run one completion.
+
+        Args:
+            prompt: Plain prompt string or structured PromptSpec
+
+        Returns:
+            Normalized response
+
+        Raises:
+            Exception: Any provider or network error
+        """
+
+    async def agenerate(self, prompt: Union[str, PromptSpec]) -> LLMResponse:
+        """
+        Run one completion without blocking the event loop.
+
+        Providers with an async SDK client override this; the default runs
+        ``generate`` in a worker thread.
+
+        Args:
+            prompt: Plain prompt string or structured PromptSpec
+
+        Returns:
+            Normalized response
+        """
+        return await asyncio.to_thread(self.generate, prompt)
+
+    def analyze(
+        self,
+        topic: str,
+        data_items: List[Dict[str, Any]],
+        depth: str = "detailed",
+        custom_prompt: Union[str, PromptSpec] = None
+    ) -> Dict[str, Any]:
+        """
+        Analyze collected research data.
+
+        Args:
+            topic: Research topic
+            data_items: List of collected data items
+            depth: Analysis depth (quick or detailed)
+            custom_prompt: Optional custom prompt (for interactive mode)
+
+        Returns:
+            Dictionary containing analysis results
+        """
+        prompt = self._prepare(topic, data_items, depth, custom_prompt)
+        if prompt is None:
+            return self._no_data()
+
+        start = time.monotonic()
+        try:
+            response = self.generate(prompt)
+        except Exception as e:
+            return self._failure(e)
+        return self._success(response, start, depth, len(data_items), prompt)
+
+    async def aanalyze(
+        self,
+        topic: str,
+        data_items: List[Dict[str, Any]],
+        depth: str = "detailed",
+        custom_prompt: Union[str, PromptSpec] = None
+    ) -> Dict[str, Any]:
+        """
+        Analyze collected research data on the running event loop.
+
+        At most ``Config.LLM_MAX_CONCURRENCY`` calls per provider are in
+        flight at once; further calls wait for a free slot.
+
+        Args:
+            topic: Research topic
+            data_items: List of collected data items
+            depth: Analysis depth (quick or detailed)
+            custom_prompt: Optional custom prompt (for interactive mode)
+
+        Returns:
+            Dictionary containing analysis results
+        """
+        prompt = self._prepare(topic, data_items, depth, custom_prompt)
+        if prompt is None:
+            return self._no_data()
+
+        async with self._loop_local("semaphore", lambda: asyncio.Semaphore(Config.LLM_MAX_CONCURRENCY)):
+            start = time.monotonic()
+            try:
+                response = await self.agenerate(prompt)
+            except Exception as e:
+                return self._failure(e)
+        return self._success(response, start, depth, len(data_items), prompt)
+
+    def analyze_concurrently(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run several independent analyses together on one event loop.
+
+        Args:
+            requests: Keyword arguments for ``aanalyze``, one dict per analysis
+
+        Returns:
+            Analysis results in request order
+        """
+        async def run_all():
+            return await asyncio.gather(*(self.aanalyze(**request) for request in requests))
+
+        return asyncio.run(run_all())
+
+    def _loop_local(self, key: str, factory: Callable[[], Any]) -> Any:
+        """
+        Get an object bound to the running event loop, creating it once.
+
+        Semaphores and async SDK clients must not be shared across event
+        loops, so each loop gets its own.
+        """
+        state = self._loop_state.setdefault(asyncio.get_running_loop(), {})
+        if key not in state:
+            state[key] = factory()
+        return state[key]
+
+    def _prepare(
+        self,
+        topic: str,
+        data_items: List[Dict[str, Any]],
+        depth: str,
+        custom_prompt: Union[str, PromptSpec]
+    ) -> Union[str, PromptSpec, None]:
+        """Log the request and build its prompt (None when there is no data)."""
+        self.logger.info(f"🤖 Analyzing {len(data_items)} items with {self.display_name}...")
+
+        if not data_items:
+            self.logger.warning("⚠️  No data to analyze")
+            return None
+
+        # Generate prompt (use custom if provided)
+        return custom_prompt or get_analysis_spec(topic, data_items, depth)
+
+    @staticmethod
+    def _no_data() -> Dict[str, Any]:
+        return {
+            "success": False,
+            "error": "No data collected",
+            "analysis": None
+        }
+
+    def _failure(self, error: Exception) -> Dict[str, Any]:
+        self.logger.error(f"❌ {self.display_name} error: {error}")
+        return {
+            "success": False,
+            "error": f"{self.display_name} error: {str(error)}",
+            "analysis": None
+        }
+
+    def _success(
+        self,
+        response: LLMResponse,
+        start: float,
+        depth: str,
+        items: int,
+        prompt: Union[str, PromptSpec]
+    ) -> Dict[str, Any]:
+        response.latency = response.latency or time.monotonic() - start
+        self._record_usage(response, items, prompt)
+
+        if response.cache_read_tokens:
+            self.logger.info(f"♻️  Reused {response.cache_read_tokens:,} cached prompt tokens")
+        self.logger.info("✅ Analysis completed successfully")
+
+        return {
+            "success": True,
+            "analysis": response.text,
+            "metadata": self.build_metadata(response, depth, items)
+        }
+
+    def _record_usage(self, response: LLMResponse, items: int, prompt: Union[str, PromptSpec]) -> None:
+        """Count the call's items, payload bytes, tokens and prompt cache hits."""
+        sent = prompt.render() if isinstance(prompt, PromptSpec) else prompt
+        provider = response.provider or self.name  # the router reports who answered
+        metrics.increment("items_total", items)
+        metrics.increment("bytes_sent_total", len(sent.encode("utf-8")), provider=provider)
+        metrics.increment("bytes_received_total", len((response.text or "").encode("utf-8")), provider=provider)
+        for kind in ("input", "output", "cache_read", "cache_write"):
+            metrics.increment("llm_tokens_total", getattr(response, f"{kind}_tokens"), provider=provider, kind=kind)
+        if response.cache_read_tokens:
+            metrics.increment("cache_hits_total", cache="prompt")
+
+    @staticmethod
+    def build_metadata(response: LLMResponse, depth: str, items_analyzed: int) -> Dict[str, Any]:
+        """
+        Build the provider-independent analysis metadata.
+
+        Args:
+            response: Normalized response
+            depth: Analysis depth
+            items_analyzed: Number of data items analyzed
+
+        Returns:
+            Metadata dictionary
+        """
+        return {
+            "provider": response.provider,
+            "model": response.model,
+            "tokens_used": response.tokens_used,
+            "input_tokens": response.input_tokens,
+            "output_tokens": response.output_tokens,
+            "cache_read_tokens": response.cache_read_tokens,
+            "cache_write_tokens": response.cache_write_tokens,
+            "tokens_approximate": response.approximate,
+            "latency_seconds": round(response.latency, 3),
+            "failover": response.failover,
+            "depth": depth,
+            "items_analyzed": items_analyzed
+        }
+
+    def open_context(self, context: PromptSpec) -> bool:
+        """
+        Prepare caching of an interactive session's context.
+
+        Args:
+            context: Session prefix (system prompt and context blocks)
+
+        Returns:
+            True if follow-ups will reuse a cached prefix
+        """
+        return False
+
+    def close_context(self) -> None:
+        """Release the session context, if any."""
+
+    def summarize_sources(self, data_items: List[Dict[str, Any]]) -> SourceSummary:
+        """
+        Summarize collected items for reports.
+
+        Runs that stream their items through ``StreamingAnalysis`` already
+        have this summary (``StreamingAnalysis.sources``).
+
+        Args:
+            data_items: List of collected data items
+
+        Returns:
+            Columnar source summary
+        """
+        return SourceSummary.from_items(data_items)
@@ -0,0 +1,261 @@
+"""Offline batch analysis through provider batch APIs."""
+
+import time
+import uuid
+from abc import ABC, abstractmethod
+from typing import Dict, Union
+
+from src.config import Config
+from src.utils.logger import get_logger
+from src.utils.retry import retry_call
+from .base import LLMProvider, LLMResponse
+from .claude_analyzer import ClaudeAnalyzer
+from .gemini_analyzer import GeminiAnalyzer
+from .prompt_templates import PromptSpec
+
+
+logger = get_logger("batch")
+
+Prompt = Union[str, PromptSpec]
+BatchResult = Union[LLMResponse, Exception]
+
+
+class BatchError(Exception):
+    """Raised when a batch job fails, expires or exceeds its wait time."""
+
+
+class BatchBackend(ABC):
+    """
+    A provider's asynchronous batch endpoint.
+
+    Prompts are submitted together as one job keyed by custom ids; the job is
+    polled until the provider has processed it, then every result is fetched
+    at once. Batch jobs trade latency for throughput and lower cost.
+    """
+
+    def __init__(self, provider: LLMProvider):
+        """
+        Initialize batch backend.
+
+        Args:
+            provider: Provider whose request format and response
+                normalization the batch reuses
+        """
+        self.provider = provider
+
+    @abstractmethod
+    def submit(self, prompts: Dict[str, Prompt]) -> str:
+        """
+        Create a batch job.
+
+        Args:
+            prompts: Prompts keyed by custom id
+
+        Returns:
+            Job id
+        """
+
+    @abstractmethod
+    def poll(self, job_id: str) -> bool:
+        """
+        Check a batch job.
+
+        Args:
+            job_id: Job id returned by ``submit``
+
+        Returns:
+            True once the job has finished processing
+
+        Raises:
+            BatchError: If the job failed as a whole
+        """
+
+    @abstractmethod
+    def results(self, job_id: str) -> Dict[str, BatchResult]:
+        """
+        Fetch the results of a finished job.
+
+        Args:
+            job_id: Job id returned by ``submit``
+
+        Returns:
+            Normalized response (or the request's error) per custom id
+        """
+
+
+class AnthropicBatchBackend(BatchBackend):
+    """Anthropic Message Batches API."""
+
+    def __init__(self, provider: ClaudeAnalyzer = None):
+        super().__init__(provider or ClaudeAnalyzer())
+
+    def submit(self, prompts: Dict[str, Prompt]) -> str:
+        requests = [
+            {"custom_id": custom_id, "params": self.provider._request_kwargs(prompt)}
+            for custom_id, prompt in prompts.items()
+        ]
+        batch = retry_call("claude-batch", self.provider.client.messages.batches.create, requests=requests)
+        return batch.id
+
+    def poll(self, job_id: str) -> bool:
+        batch = retry_call("claude-batch", self.provider.client.messages.batches.retrieve, job_id)
+        return batch.processing_status == "ended"
+
+    def results(self, job_id: str) -> Dict[str, BatchResult]:
+        results = {}
+        for entry in self.provider.client.messages.batches.results(job_id):
+            result = entry.result
+            if result.type == "succeeded":
+                results[entry.custom_id] = self.provider._to_response(result.message)
+            else:
+                detail = getattr(result, "error", None) or result.type
+                results[entry.custom_id] = BatchError(f"Request {result.type}: {detail}")
+        return results
+
+
+class GeminiBatchBackend(BatchBackend):
+    """Gemini Batch API with inlined requests."""
+
+    FINISHED_STATES = {
+        "JOB_STATE_SUCCEEDED", "JOB_STATE_PARTIALLY_SUCCEEDED",
+        "JOB_STATE_FAILED", "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED",
+    }
+    FAILED_STATES = {"JOB_STATE_FAILED", "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED"}
+
+    def __init__(self, provider: GeminiAnalyzer = None):
+        super().__init__(provider or GeminiAnalyzer())
+        self._sent: Dict[str, Dict[str, str]] = {}
+
+    def submit(self, prompts: Dict[str, Prompt]) -> str:
+        src = []
+        sent = {}
+        for custom_id, prompt in prompts.items():
+            contents, config = self.provider._attempts(prompt)[-1]
+            sent[custom_id] = contents
+            src.append({
+                "contents": [{"role": "user", "parts": [{"text": contents}]}],
+                "config": config,
+                "metadata": {"custom_id": custom_id},
+            })
+
+        job = retry_call(
+            "gemini-batch",
+            self.provider.client.batches.create,
+            model=self.provider.model,
+            src=src,
+            config={"display_name": f"research-agent-{uuid.uuid4().hex[:8]}"}
+        )
+        self._sent[job.name] = sent
+        return job.name
+
+    def poll(self, job_id: str) -> bool:
+        job = retry_call("gemini-batch", self.provider.client.batches.get, name=job_id)
+        state = getattr(job.state, "name", str(job.state))
+        if state in self.FAILED_STATES:
+            raise BatchError(f"Gemini batch {job_id} ended as {state}: {job.error}")
+        return state in self.FINISHED_STATES
+
+    def results(self, job_id: str) -> Dict[str, BatchResult]:
+        job = retry_call("gemini-batch", self.provider.client.batches.get, name=job_id)
+        sent = self._sent.get(job_id, {})
+        custom_ids = list(sent)
+
+        results = {}
+        for index, entry in enumerate(job.dest.inlined_responses or []):
+            # Responses come back in request order; metadata echoes the id
+            custom_id = (entry.metadata or {}).get("custom_id") or custom_ids[index]
+            if entry.error:
+                results[custom_id] = BatchError(f"Request failed: {entry.error}")
+            else:
+                results[custom_id] = self.provider._to_response(entry.response, sent.get(custom_id, ""))
+        return results
+
+
+class LocalBatchBackend(BatchBackend):
+    """
+    In-process stand-in for a batch endpoint.
+
+    Jobs finish after ``polls_until_done`` polls and are answered with the
+    provider's regular ``generate``. Used by tests and for dry runs.
+    """
+
+    def __init__(self, provider: LLMProvider, polls_until_done: int = 1):
+        super().__init__(provider)
+        self.polls_until_done = polls_until_done
+        self.jobs: Dict[str, Dict[str, Prompt]] = {}
+        self._polls: Dict[str, int] = {}
+
+    def submit(self, prompts: Dict[str, Prompt]) -> str:
+        job_id = f"local-{uuid.uuid4().hex[:8]}"
+        self.jobs[job_id] = dict(prompts)
+        self._polls[job_id] = 0
+        return job_id
+
+    def poll(self, job_id: str) -> bool:
+        self._polls[job_id] += 1
+        return self._polls[job_id] >= self.polls_until_done
+
+    def results(self, job_id: str) -> Dict[str, BatchResult]:
+        results = {}
+        for custom_id, prompt in self.jobs[job_id].items():
+            try:
+                results[custom_id] = self.provider.generate(prompt)
+            except Exception as e:
+                results[custom_id] = e
+        return results
+
+
+def run_batch(
+    backend: BatchBackend,
+    prompts: Dict[str, Prompt],
+    poll_interval: float = None,
+    timeout: float = None
+) -> Dict[str, BatchResult]:
+    """
+    Submit prompts as one batch job and wait for its results.
+
+    Args:
+        backend: Batch backend to use
+        prompts: Prompts keyed by custom id
+        poll_interval: Seconds between status checks (default: Config.BATCH_POLL_INTERVAL)
+        timeout: Seconds to wait for the job (default: Config.BATCH_TIMEOUT)
+
+    Returns:
+        Normalized response (or the request's error) per custom id
+
+    Raises:
+        BatchError: If the job failed or did not finish in time
+    """
+    poll_interval = Config.BATCH_POLL_INTERVAL if poll_interval is None else poll_interval
+    timeout = timeout or Config.BATCH_TIMEOUT
+
+    job_id = backend.submit(prompts)
+    logger.info(f"📦 Submitted batch {job_id} with {len(prompts)} requests")
+
+    started = time.monotonic()
+    while not backend.poll(job_id):
+        elapsed = time.monotonic() - started
+        if elapsed > timeout:
+            raise BatchError(f"Batch {job_id} did not finish within {timeout:.0f}s")
+        logger.debug(f"Batch {job_id} still processing ({elapsed:.0f}s)")
+        time.sleep(poll_interval)
+
+    results = backend.results(job_id)
+    failed = sum(isinstance(result, Exception) for result in results.values())
+    logger.info(f"✅ Batch {job_id} finished: {len(results) - failed} succeeded, {failed} failed")
+    return results
+
+
+def create_batch_backend(model: str) -> BatchBackend:
+    """
+    Create the batch backend for a model choice.
+
+    Args:
+        model: Provider name (claude or gemini)
+
+    Returns:
+        Batch backend for the provider
+    """
+    if model.lower() == "claude":
+        return AnthropicBatchBackend()
+    return GeminiBatchBackend()
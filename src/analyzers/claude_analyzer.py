@@ -1,133 +1,138 @@
 """Claude AI analyzer for research data."""
 
-from typing import Dict, Any, List
+from typing import Dict, Any, Union
 import anthropic
 
 from src.config import Config
-from src.utils.logger import get_logger
-from .prompt_templates import get_analysis_prompt
+from src.utils.retry import aretry_call, retry_call
+from .base import LLMProvider, LLMResponse
+from .prompt_templates import PromptSpec
 
 
-class ClaudeAnalyzer:
+class ClaudeAnalyzer(LLMProvider):
     """Analyzer using Claude AI for research data analysis."""
 
+    name = "claude"
+    display_name = "Claude AI"
+
     def __init__(self):
         """Initialize Claude analyzer."""
-        self.client = anthropic.Anthropic(api_key=Config.ANTHROPIC_API_KEY)
-        self.logger = get_logger(self.__class__.__name__)
-
-    def analyze(
-        self,
-        topic: str,
-        data_items: List[Dict[str, Any]],
-        depth: str = "detailed",
-        custom_prompt: str = None
-    ) -> Dict[str, Any]:
+        super().__init__()
+        # Retries are handled by retry_call so they share the run's budget
+        self.client = anthropic.Anthropic(api_key=Config.ANTHROPIC_API_KEY, max_retries=0)
+
+    @property
+    def model(self) -> str:
+        """Claude model used for requests."""
+        return Config.CLAUDE_MODEL
+
+    def generate(self, prompt: Union[str, PromptSpec]) -> LLMResponse:
         """
-        Analyze collected research data using Claude AI.
+        Run one Claude completion.
 
         Args:
-            topic: Research topic
-            data_items: List of collected data items
-            depth: Analysis depth (quick or detailed)
-            custom_prompt: Optional custom prompt (for interactive mode)
+            prompt: Plain prompt string or structured PromptSpec
 
         Returns:
-            Dictionary containing analysis results
+            Normalized response
         """
-        self.logger.info(f"🤖 Analyzing {len(data_items)} items with Claude AI...")
-
-        if not data_items:
-            self.logger.warning("⚠️  No data to analyze")
-            return {
-                "success": False,
-                "error": "No data collected",
-                "analysis": None
-            }
-
-        try:
-            # Generate prompt (use custom if provided)
-            if custom_prompt:
-                prompt = custom_prompt
-            else:
-                prompt = get_analysis_prompt(topic, data_items, depth)
-
-            # Call Claude API
-            response = self.client.messages.create(
-                model=Config.CLAUDE_MODEL,
-                max_tokens=Config.CLAUDE_MAX_TOKENS,
-                temperature=Config.CLAUDE_TEMPERATURE,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
-            )
-
-            # Extract analysis from response
-            analysis_text = response.content[0].text
-
-            self.logger.info("✅ Analysis completed successfully")
-
-            return {
-                "success": True,
-                "analysis": analysis_text,
-                "metadata": {
-                    "model": Config.CLAUDE_MODEL,
-                    "tokens_used": response.usage.input_tokens + response.usage.output_tokens,
-                    "depth": depth,
-                    "items_analyzed": len(data_items)
-                }
-            }
-
-        except anthropic.APIError as e:
-            self.logger.error(f"❌ Claude API error: {e}")
-            return {
-                "success": False,
-                "error": f"Claude API error: {str(e)}",
-                "analysis": None
-            }
-        except Exception as e:
-            self.logger.error(f"❌ Unexpected error during analysis: {e}")
-            return {
-                "success": False,
-                "error": f"Analysis error: {str(e)}",
-                "analysis": None
-            }
-
-    def summarize_sources(self, data_items: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, str]]]:
+        response = retry_call("claude", self.client.messages.create, **self._request_kwargs(prompt))
+        return self._to_response(response)
+
+    async def agenerate(self, prompt: Union[str, PromptSpec]) -> LLMResponse:
         """
-        Organize and summarize data sources.
+        Run one Claude completion with the async client.
 
         Args:
-            data_items: List of collected data items
+            prompt: Plain prompt string or structured PromptSpec
 
         Returns:
-            Dictionary with organized sources by type
+            Normalized response
         """
-        sources = {
-            "x": [],
-            "web": []
+        client = self._loop_local(
+            "client",
+            lambda: anthropic.AsyncAnthropic(api_key=Config.ANTHROPIC_API_KEY, max_retries=0)
+        )
+        response = await aretry_call("claude", client.messages.create, **self._request_kwargs(prompt))
+        return self._to_response(response)
+
+    def _request_kwargs(self, prompt: Union[str, PromptSpec]) -> Dict[str, Any]:
+        """Build the full ``messages.create`` arguments for a prompt."""
+        return {
+            "model": self.model,
+            "max_tokens": Config.CLAUDE_MAX_TOKENS,
+            "temperature": Config.CLAUDE_TEMPERATURE,
+            **self._build_request(prompt)
         }
 
-        for item in data_items:
-            source_type = item.get("source", "unknown")
-
-            if source_type == "x":
-                sources["x"].append({
-                    "author": item.get("author", ""),
-                    "content": item.get("content", "")[:200] + "...",
-                    "date": item.get("date", ""),
-                    "url": item.get("url", ""),
-                    "engagement": item.get("engagement", {})
-                })
-            elif source_type == "web":
-                sources["web"].append({
-                    "title": item.get("title", ""),
-                    "source": item.get("author", ""),
-                    "date": item.get("date", ""),
-                    "url": item.get("url", "")
-                })
-
-        return sources
+    def _to_response(self, response: Any) -> LLMResponse:
+        """Normalize a Messages API response."""
+        usage = response.usage
+        return LLMResponse(
+            text=response.content[0].text,
+            provider=self.name,
+            model=self.model,
+            input_tokens=usage.input_tokens,
+            output_tokens=usage.output_tokens,
+            cache_read_tokens=getattr(usage, "cache_read_input_tokens", None) or 0,
+            cache_write_tokens=getattr(usage, "cache_creation_input_tokens", None) or 0
+        )
+
+    def open_context(self, context: PromptSpec) -> bool:
+        """
+        Prepare caching of an interactive session's context.
+
+        Claude caches prefixes per request through ``cache_control`` blocks,
+        so there is no server-side object to create.
+
+        Args:
+            context: Session prefix (system prompt and context blocks)
+
+        Returns:
+            True if follow-ups will reuse a cached prefix
+        """
+        return Config.CLAUDE_PROMPT_CACHING
+
+    def close_context(self) -> None:
+        """Release the session context (cached prefixes expire on their own)."""
+
+    def _build_request(self, prompt: Union[str, PromptSpec]) -> Dict[str, Any]:
+        """
+        Build the ``system`` and ``messages`` arguments for a prompt.
+
+        For a PromptSpec, the system prompt and the stable context blocks get
+        ``cache_control`` breakpoints, so the analysis and every follow-up
+        about the same data share one cached prefix and only the task is
+        billed as fresh input.
+
+        Args:
+            prompt: Plain prompt string or structured PromptSpec
+
+        Returns:
+            Keyword arguments for ``messages.create``
+        """
+        if not isinstance(prompt, PromptSpec):
+            return {"messages": [{"role": "user", "content": prompt}]}
+
+        def block(text: str, cache: bool = False) -> Dict[str, Any]:
+            content = {"type": "text", "text": text}
+            if cache and Config.CLAUDE_PROMPT_CACHING:
+                content["cache_control"] = {"type": "ephemeral"}
+            return content
+
+        # One breakpoint after the system prompt and one after the last
+        # context block (Anthropic allows up to four per request)
+        context = [
+            block(text, cache=i == len(prompt.context) - 1)
+            for i, text in enumerate(prompt.context)
+        ]
+
+        return {
+            "system": [block(prompt.system, cache=True)],
+            "messages": [
+                {
+                    "role": "user",
+                    "content": context + [block(prompt.task)]
+                }
+            ]
+        }
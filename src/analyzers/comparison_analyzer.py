@@ -1,7 +1,9 @@
 """Comparison analyzer for research reports."""
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from src.utils.logger import get_logger
+from .history import ReportSnapshot, detect_change_points, parse_timestamp, trend_line
+from .keyword_drift import keyword_drift, keyword_weights, merge_weights
 
 
 class ComparisonAnalyzer:
@@ -101,58 +103,61 @@ class ComparisonAnalyzer:
     def _compare_keywords(
         self,
         current_keywords: List,
-        previous_keywords: List[str]
-    ) -> Dict[str, List[str]]:
+        previous_keywords: List
+    ) -> Dict[str, Any]:
         """
         Compare keywords between current and previous.
 
         Args:
             current_keywords: Current keywords (list of tuples)
-            previous_keywords: Previous keywords (list of strings)
+            previous_keywords: Previous keywords (strings, or tuples with scores)
 
         Returns:
-            Keyword comparison data
+            Keyword comparison data, with score-weighted drift when both
+            reports have keywords
         """
         if not current_keywords:
             return {}
 
-        # Extract just the keyword strings from current (may be tuples)
-        if current_keywords and isinstance(current_keywords[0], tuple):
-            current_kw_list = [kw[0] for kw in current_keywords]
-        else:
-            current_kw_list = current_keywords
+        current_names = self._display_names(current_keywords)
+        previous_names = self._display_names(previous_keywords or [])
 
-        if not previous_keywords:
+        if not previous_names:
             # All keywords are new
             return {
-                "new_topics": current_kw_list[:10],
+                "new_topics": list(current_names.values())[:10],
                 "removed_topics": []
             }
 
-        # Normalize keywords (lowercase for comparison)
-        current_set = set(kw.lower() for kw in current_kw_list)
-        previous_set = set(kw.lower() for kw in previous_keywords)
-
-        # Find new and removed topics
-        new_topics = list(current_set - previous_set)
-        removed_topics = list(previous_set - current_set)
-
-        # Map back to original case for display
-        new_topics_display = [
-            kw for kw in current_kw_list if kw.lower() in new_topics
-        ][:10]
-
-        removed_topics_display = [
-            kw for kw in previous_keywords if kw.lower() in removed_topics
-        ][:10]
+        new_topics = [name for key, name in current_names.items() if key not in previous_names]
+        removed_topics = [name for key, name in previous_names.items() if key not in current_names]
 
+        drift = keyword_drift(keyword_weights(current_keywords), keyword_weights(previous_keywords))
         return {
-            "new_topics": new_topics_display,
-            "removed_topics": removed_topics_display,
+            "new_topics": new_topics[:10],
+            "removed_topics": removed_topics[:10],
             "total_new": len(new_topics),
-            "total_removed": len(removed_topics)
+            "total_removed": len(removed_topics),
+            "keyword_drift": self._named_drift(drift, {**previous_names, **current_names})
         }
 
+    @staticmethod
+    def _display_names(keywords: List) -> Dict[str, str]:
+        """Map lowercased keywords to their first spelling, in rank order."""
+        names: Dict[str, str] = {}
+        for keyword in keywords:
+            if isinstance(keyword, (tuple, list)):
+                keyword = keyword[0]
+            names.setdefault(keyword.lower(), keyword)
+        return names
+
+    @staticmethod
+    def _named_drift(drift: Dict[str, Any], names: Dict[str, str]) -> Dict[str, Any]:
+        """Restore display spellings in a drift result."""
+        for key in ("rising", "falling"):
+            drift[key] = [(names.get(keyword, keyword), change) for keyword, change in drift[key]]
+        return drift
+
     def _determine_trend_direction(
         self,
         sentiment_comparison: Dict[str, str],
@@ -197,6 +202,126 @@ class ComparisonAnalyzer:
 
         return " | ".join(trends) if trends else "Stable"
 
+    def compare_history(
+        self,
+        current: ReportSnapshot,
+        history: List[ReportSnapshot]
+    ) -> Dict[str, Any]:
+        """
+        Compare the current analysis with a topic's report history.
+
+        Args:
+            current: Snapshot of the current analysis
+            history: Earlier reports of the topic, oldest first
+
+        Returns:
+            Dictionary with trend lines and change points for sentiment and
+            volume, and keyword rank movements over the series
+        """
+        series = [snapshot for snapshot in history if snapshot.path != current.path] + [current]
+        self.logger.info(f"Comparing with {len(series) - 1} earlier reports")
+
+        start = parse_timestamp(series[0].generated)
+        dates = [snapshot.generated[:10] for snapshot in series]
+        days = [
+            (parse_timestamp(snapshot.generated) - start).total_seconds() / 86400
+            for snapshot in series
+        ]
+
+        return {
+            "reports": len(series),
+            "since": dates[0],
+            "sentiment": self._series_trend(
+                days, dates, [snapshot.compound for snapshot in series]
+            ),
+            "volume": self._series_trend(
+                days, dates, [float(snapshot.volume) for snapshot in series]
+            ),
+            "keywords": self._keyword_movements(series)
+        }
+
+    def _series_trend(
+        self,
+        days: List[float],
+        dates: List[str],
+        values: List[Optional[float]]
+    ) -> Dict[str, Any]:
+        """Trend line and change points of one metric over the reports."""
+        points = [(day, date, value) for day, date, value in zip(days, dates, values) if value is not None]
+        if len(points) < 2:
+            return {}
+
+        xs = [day for day, _, _ in points]
+        ys = [value for _, _, value in points]
+        line = trend_line(xs, ys)
+
+        change_points = []
+        for index in detect_change_points(ys):
+            before = ys[:index]
+            after = ys[index:]
+            change_points.append({
+                "date": points[index][1],
+                "before": round(sum(before) / len(before), 3),
+                "after": round(sum(after) / len(after), 3)
+            })
+
+        result = {
+            "first": round(ys[0], 3),
+            "last": round(ys[-1], 3),
+            "change_points": change_points
+        }
+        if line:
+            result["slope_per_day"] = round(line["slope"], 4)
+            result["r2"] = round(line["r2"], 3)
+            # Direction of the fitted line over the window; works for
+            # values around zero, unlike the ratio in calculate_trend_direction
+            start = line["intercept"] + line["slope"] * xs[0]
+            change = line["slope"] * (xs[-1] - xs[0])
+            scale = max(abs(start), abs(start + change), 1e-9)
+            if change > 0.1 * scale:
+                result["direction"] = "↗️ Increasing"
+            elif change < -0.1 * scale:
+                result["direction"] = "↘️ Decreasing"
+            else:
+                result["direction"] = "→ Stable"
+        return result
+
+    def _keyword_movements(self, series: List[ReportSnapshot], top: int = 10) -> Dict[str, List[str]]:
+        """Keywords climbing or dropping in rank relative to the earlier reports."""
+        if len(series) < 2:
+            return {}
+
+        absent = top + 1
+        ranks = [
+            {keyword.lower(): rank for rank, (keyword, _) in enumerate(snapshot.keywords[:top], 1)}
+            for snapshot in series
+        ]
+        earlier, current = ranks[:-1], ranks[-1]
+        names = {keyword.lower(): keyword for snapshot in series for keyword, _ in snapshot.keywords[:top]}
+
+        movement = {}
+        for key in set().union(*ranks):
+            average = sum(ranked.get(key, absent) for ranked in earlier) / len(earlier)
+            movement[key] = average - current.get(key, absent)
+
+        persistent = [
+            names[key] for key in current
+            if sum(key in ranked for ranked in ranks) >= 0.8 * len(ranks)
+        ]
+        rising = sorted((key for key in movement if movement[key] > 0), key=lambda k: -movement[k])
+        falling = sorted((key for key in movement if movement[key] < 0), key=lambda k: movement[k])
+
+        # Weighted drift over the full keyword lists, against the averaged history
+        earlier_weights = merge_weights([keyword_weights(snapshot.keywords) for snapshot in series[:-1]])
+        drift = keyword_drift(keyword_weights(series[-1].keywords), earlier_weights, top=5)
+        all_names = {keyword.lower(): keyword for snapshot in series for keyword, _ in snapshot.keywords}
+        return {
+            "rising": [names[key] for key in rising[:5]],
+            "falling": [names[key] for key in falling[:5]],
+            "persistent": persistent[:5],
+            "drift": self._named_drift(drift, all_names)
+        }
+
     def identify_changes(
         self,
         current_data: List[Dict[str, Any]],
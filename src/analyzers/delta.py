@@ -0,0 +1,242 @@
+"""Incremental re-analysis of recurring topics."""
+
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from src.config import Config
+from src.utils.files import atomic_writer
+from src.utils.logger import get_logger
+from src.utils.metrics import metrics
+from .prompt_templates import get_delta_spec
+
+
+logger = get_logger("delta")
+
+
+# Post URL the X collector builds when the post has no id
+_SYNTHESIZED_URL = re.compile(r"/status/?$")
+
+
+def item_key(item: Dict[str, Any]) -> str:
+    """
+    Get a stable identity for a collected item.
+
+    Args:
+        item: Collected data item
+
+    Returns:
+        Key built from the item's id, its URL, or (when the URL is missing
+        or was built without an id) a hash of its source, author and content
+    """
+    source = item.get("source", "")
+    item_id = (item.get("metadata") or {}).get("id")
+    if item_id:
+        return f"{source}:id:{item_id}"
+
+    url = item.get("url")
+    if url and not _SYNTHESIZED_URL.search(url):
+        return f"{source}:{url}"
+
+    text = "\n".join([source, item.get("author", ""), item.get("title", ""), item.get("content", "")])
+    return "sha1:" + hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class Baseline:
+    """The last analysis of a topic and the items it covered."""
+
+    topic: str
+    depth: str
+    analysis: str
+    item_keys: Set[str] = field(default_factory=set)
+    updated_at: str = ""
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+class BaselineStore:
+    """Stores one baseline per topic as JSON under the output directory."""
+
+    def __init__(self, directory: Path = None):
+        """
+        Initialize baseline store.
+
+        Args:
+            directory: Storage directory (default: OUTPUT_DIR/.baselines)
+        """
+        self.directory = Path(directory) if directory else Config.OUTPUT_DIR / ".baselines"
+
+    def path(self, topic: str) -> Path:
+        """Get the baseline file of a topic."""
+        normalized = " ".join(topic.lower().split())
+        slug = re.sub(r"[^a-z0-9]+", "-", normalized).strip("-")[:40]
+        digest = hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:8]
+        return self.directory / f"{slug}-{digest}.json"
+
+    def load(self, topic: str) -> Optional[Baseline]:
+        """
+        Load a topic's baseline.
+
+        Args:
+            topic: Research topic
+
+        Returns:
+            Baseline, or None if the topic has none (or it is unreadable)
+        """
+        try:
+            data = json.loads(self.path(topic).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️  Ignoring unreadable baseline for '{topic}': {e}")
+            return None
+
+        return Baseline(
+            topic=data.get("topic", topic),
+            depth=data.get("depth", ""),
+            analysis=data.get("analysis", ""),
+            item_keys=set(data.get("item_keys", [])),
+            updated_at=data.get("updated_at", ""),
+            metadata=data.get("metadata", {})
+        )
+
+    def save(self, baseline: Baseline) -> None:
+        """
+        Store a baseline, replacing the previous one atomically.
+
+        Args:
+            baseline: Baseline to store
+        """
+        with atomic_writer(self.path(baseline.topic)) as handle:
+            json.dump({
+                "topic": baseline.topic,
+                "depth": baseline.depth,
+                "analysis": baseline.analysis,
+                "item_keys": sorted(baseline.item_keys),
+                "updated_at": baseline.updated_at,
+                "metadata": baseline.metadata,
+            }, handle, ensure_ascii=False)
+
+
+def split_new_items(
+    data_items: List[Dict[str, Any]],
+    baseline: Baseline
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Separate items the baseline has not seen.
+
+    Args:
+        data_items: Collected data items
+        baseline: Topic baseline
+
+    Returns:
+        Tuple of (new items, number of already covered items)
+    """
+    new_items = [item for item in data_items if item_key(item) not in baseline.item_keys]
+    return new_items, len(data_items) - len(new_items)
+
+
+class DeltaAnalyzer:
+    """
+    Analyzes a topic incrementally against its stored baseline.
+
+    A full analysis is stored as the topic's baseline. On the next
+    incremental run only items missing from the baseline are sent to the
+    LLM, together with the previous analysis text, and the updated analysis
+    becomes the new baseline.
+    """
+
+    def __init__(self, analyzer: Any, store: BaselineStore = None):
+        """
+        Initialize delta analyzer.
+
+        Args:
+            analyzer: AI analyzer (LLMProvider)
+            store: Baseline store (default: under Config.OUTPUT_DIR)
+        """
+        self.analyzer = analyzer
+        self.store = store or BaselineStore()
+
+    def analyze(
+        self,
+        topic: str,
+        data_items: List[Dict[str, Any]],
+        depth: str = "detailed",
+        incremental: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Analyze a topic, reusing its baseline when possible.
+
+        Args:
+            topic: Research topic
+            data_items: List of collected data items
+            depth: Analysis depth (quick or detailed)
+            incremental: Update the baseline with new items only; a full
+                analysis is run (and stored) when False or without a
+                usable baseline
+
+        Returns:
+            Dictionary containing analysis results; ``metadata.delta``
+            describes what was sent
+        """
+        baseline = self.store.load(topic) if incremental else None
+        if baseline and (baseline.depth != depth or not baseline.analysis):
+            logger.info(f"Baseline for '{topic}' was a {baseline.depth} analysis, running a full one")
+            baseline = None
+
+        if baseline is None:
+            result = self.analyzer.analyze(topic, data_items, depth)
+            mode, new_items, known = "full", data_items, 0
+        else:
+            new_items, known = split_new_items(data_items, baseline)
+            if not new_items:
+                logger.info(f"♻️  No new items for '{topic}', reusing the baseline analysis")
+                result = self._reuse(baseline, depth)
+                mode = "unchanged"
+                metrics.increment("cache_hits_total", cache="baseline")
+            else:
+                logger.info(f"🔁 Updating '{topic}' with {len(new_items)} new items ({known} already covered)")
+                prompt = get_delta_spec(topic, new_items, baseline.analysis, depth)
+                result = self.analyzer.analyze(topic, new_items, depth, custom_prompt=prompt)
+                mode = "incremental"
+
+        if not result.get("success"):
+            return result
+
+        result.setdefault("metadata", {})["delta"] = {
+            "mode": mode,
+            "new_items": len(new_items),
+            "known_items": known,
+            "baseline_updated_at": baseline.updated_at if baseline else None,
+        }
+        result["metadata"]["items_analyzed"] = len(data_items)
+
+        covered = set(baseline.item_keys) if baseline else set()
+        covered.update(item_key(item) for item in data_items)
+        self.store.save(Baseline(
+            topic=topic,
+            depth=depth,
+            analysis=result["analysis"],
+            item_keys=covered,
+            updated_at=datetime.now().isoformat(timespec="seconds"),
+            metadata={k: v for k, v in result["metadata"].items() if k != "delta"}
+        ))
+        return result
+
+    @staticmethod
+    def _reuse(baseline: Baseline, depth: str) -> Dict[str, Any]:
+        metadata = dict(baseline.metadata)
+        metadata.update({
+            "tokens_used": 0,
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "cache_read_tokens": 0,
+            "cache_write_tokens": 0,
+            "latency_seconds": 0.0,
+            "depth": depth,
+        })
+        return {"success": True, "analysis": baseline.analysis, "metadata": metadata}
@@ -1,129 +1,243 @@
 """Gemini AI analyzer for research data."""
 
-from typing import Dict, Any, List
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
 from google import genai
 
 from src.config import Config
-from src.utils.logger import get_logger
-from .prompt_templates import get_analysis_prompt
+from src.utils.retry import aretry_call, is_retriable_error, retry_call
+from .base import LLMProvider, LLMResponse
+from .prompt_templates import PromptSpec
 
 
-class GeminiAnalyzer:
+class GeminiAnalyzer(LLMProvider):
     """Analyzer using Google Gemini AI for research data analysis."""
 
+    name = "gemini"
+    display_name = "Gemini AI"
+
     def __init__(self):
         """Initialize Gemini analyzer."""
+        super().__init__()
         self.client = genai.Client(api_key=Config.GEMINI_API_KEY)
-        self.logger = get_logger(self.__class__.__name__)
-
-    def analyze(
-        self,
-        topic: str,
-        data_items: List[Dict[str, Any]],
-        depth: str = "detailed",
-        custom_prompt: str = None
-    ) -> Dict[str, Any]:
+
+        # Cached-content object holding an interactive session's context
+        self._cache_name: Optional[str] = None
+        self._cache_key = None
+        self._cache_expires = 0.0
+
+    @property
+    def model(self) -> str:
+        """Gemini model used for requests."""
+        return Config.GEMINI_MODEL
+
+    def generate(self, prompt: Union[str, PromptSpec]) -> LLMResponse:
+        """
+        Run one Gemini completion.
+
+        Args:
+            prompt: Plain prompt string or structured PromptSpec
+
+        Returns:
+            Normalized response
         """
-        Analyze collected research data using Gemini AI.
+        attempts = self._attempts(prompt)
+        for i, (contents, config) in enumerate(attempts):
+            try:
+                if 'cached_content' in config:
+                    self._extend_cache()
+                response = retry_call(
+                    "gemini",
+                    self.client.models.generate_content,
+                    model=self.model,
+                    contents=contents,
+                    config=config
+                )
+            except Exception as e:
+                if i == len(attempts) - 1:
+                    raise
+                self._drop_cache(e)
+                continue
+            return self._to_response(response, contents)
+
+    async def agenerate(self, prompt: Union[str, PromptSpec]) -> LLMResponse:
+        """
+        Run one Gemini completion with the async client.
 
         Args:
-            topic: Research topic
-            data_items: List of collected data items
-            depth: Analysis depth (quick or detailed)
-            custom_prompt: Optional custom prompt (for interactive mode)
+            prompt: Plain prompt string or structured PromptSpec
 
         Returns:
-            Dictionary containing analysis results
+            Normalized response
+        """
+        aio = self._loop_local("client", lambda: genai.Client(api_key=Config.GEMINI_API_KEY).aio)
+
+        attempts = self._attempts(prompt)
+        for i, (contents, config) in enumerate(attempts):
+            try:
+                if 'cached_content' in config:
+                    await asyncio.to_thread(self._extend_cache)
+                response = await aretry_call(
+                    "gemini",
+                    aio.models.generate_content,
+                    model=self.model,
+                    contents=contents,
+                    config=config
+                )
+            except Exception as e:
+                if i == len(attempts) - 1:
+                    raise
+                self._drop_cache(e)
+                continue
+            return self._to_response(response, contents)
+
+    def _to_response(self, response: Any, sent: str) -> LLMResponse:
         """
-        self.logger.info(f"🤖 Analyzing {len(data_items)} items with Gemini AI...")
+        Normalize a generate_content response.
 
-        if not data_items:
-            self.logger.warning("⚠️  No data to analyze")
-            return {
-                "success": False,
-                "error": "No data collected",
-                "analysis": None
-            }
+        Args:
+            response: SDK response
+            sent: Prompt text that was sent (for approximate counts)
+
+        Returns:
+            Normalized response
+        """
+        # Extract analysis from response
+        analysis_text = response.text or ""
+
+        usage = getattr(response, "usage_metadata", None)
+        prompt_tokens = getattr(usage, "prompt_token_count", None)
+        completion_tokens = getattr(usage, "candidates_token_count", None)
+        cache_read = getattr(usage, "cached_content_token_count", None) or 0
+
+        if prompt_tokens is None or completion_tokens is None:
+            # Count tokens (approximate) when the response carries no usage
+            return LLMResponse(
+                text=analysis_text,
+                provider=self.name,
+                model=self.model,
+                input_tokens=int(len(sent.split()) * 1.3),  # rough estimate
+                output_tokens=int(len(analysis_text.split()) * 1.3),
+                cache_read_tokens=cache_read,
+                approximate=True
+            )
+
+        # prompt_token_count includes the cached tokens
+        return LLMResponse(
+            text=analysis_text,
+            provider=self.name,
+            model=self.model,
+            input_tokens=prompt_tokens - cache_read,
+            output_tokens=completion_tokens,
+            cache_read_tokens=cache_read
+        )
+
+    def open_context(self, context: PromptSpec) -> bool:
+        """
+        Cache an interactive session's context on the Gemini side.
 
+        Creates a cached-content object holding the system prompt and context
+        blocks (collected data and original analysis). Follow-up prompts with
+        the same prefix then only send their task and reference the cache.
+
+        Args:
+            context: Session prefix (system prompt and context blocks)
+
+        Returns:
+            True if the cache was created
+        """
+        if not Config.GEMINI_CONTEXT_CACHING:
+            return False
+
+        self.close_context()
         try:
-            # Generate prompt (use custom if provided)
-            if custom_prompt:
-                prompt = custom_prompt
-            else:
-                prompt = get_analysis_prompt(topic, data_items, depth)
-
-            # Call Gemini API with new client
-            response = self.client.models.generate_content(
-                model=Config.GEMINI_MODEL,
-                contents=prompt,
+            cache = retry_call(
+                "gemini",
+                self.client.caches.create,
+                model=self.model,
                 config={
-                    'max_output_tokens': Config.GEMINI_MAX_TOKENS,
-                    'temperature': Config.GEMINI_TEMPERATURE,
+                    "display_name": "research-agent-session",
+                    "system_instruction": context.system,
+                    "contents": [
+                        {"role": "user", "parts": [{"text": text} for text in context.context]}
+                    ],
+                    "ttl": f"{Config.GEMINI_CACHE_TTL}s",
                 }
             )
-
-            # Extract analysis from response
-            analysis_text = response.text
-
-            # Count tokens (approximate)
-            # Gemini doesn't provide exact token counts in the same way as Claude
-            prompt_tokens = len(prompt.split()) * 1.3  # rough estimate
-            completion_tokens = len(analysis_text.split()) * 1.3
-            total_tokens = int(prompt_tokens + completion_tokens)
-
-            self.logger.info("✅ Analysis completed successfully")
-
-            return {
-                "success": True,
-                "analysis": analysis_text,
-                "metadata": {
-                    "model": Config.GEMINI_MODEL,
-                    "tokens_used": total_tokens,  # approximate
-                    "depth": depth,
-                    "items_analyzed": len(data_items)
-                }
-            }
-
         except Exception as e:
-            self.logger.error(f"❌ Gemini API error: {e}")
-            return {
-                "success": False,
-                "error": f"Gemini API error: {str(e)}",
-                "analysis": None
-            }
-
-    def summarize_sources(self, data_items: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, str]]]:
+            # e.g. context below the model's minimum cacheable size
+            self.logger.warning(f"⚠️  Gemini context cache unavailable, sending full prompts: {e}")
+            return False
+
+        self._cache_name = cache.name
+        self._cache_key = (context.system, tuple(context.context))
+        self._cache_expires = time.monotonic() + Config.GEMINI_CACHE_TTL
+        self.logger.info(f"♻️  Cached session context ({cache.name})")
+        return True
+
+    def close_context(self) -> None:
+        """Delete the session's cached context, if any."""
+        if not self._cache_name:
+            return
+
+        name, self._cache_name, self._cache_key = self._cache_name, None, None
+        try:
+            self.client.caches.delete(name=name)
+        except Exception as e:
+            # The cache expires on its own once its TTL runs out
+            self.logger.debug(f"Could not delete Gemini cache {name}: {e}")
+
+    def _attempts(self, prompt: Union[str, PromptSpec]) -> List[Tuple[str, Dict[str, Any]]]:
         """
-        Organize and summarize data sources.
+        Plan the requests for a prompt, in the order they should be tried.
+
+        A PromptSpec whose prefix matches the session cache is first sent as
+        its task alone, referencing the cache; the full prompt follows as a
+        fallback in case the cache has expired.
 
         Args:
-            data_items: List of collected data items
+            prompt: Plain prompt string or structured PromptSpec
 
         Returns:
-            Dictionary with organized sources by type
+            List of (contents, config) pairs
         """
-        sources = {
-            "x": [],
-            "web": []
+        config = {
+            'max_output_tokens': Config.GEMINI_MAX_TOKENS,
+            'temperature': Config.GEMINI_TEMPERATURE,
         }
+        if not isinstance(prompt, PromptSpec):
+            return [(prompt, config)]
 
-        for item in data_items:
-            source_type = item.get("source", "unknown")
-
-            if source_type == "x":
-                sources["x"].append({
-                    "author": item.get("author", ""),
-                    "content": item.get("content", "")[:200] + "...",
-                    "date": item.get("date", ""),
-                    "url": item.get("url", ""),
-                    "engagement": item.get("engagement", {})
-                })
-            elif source_type == "web":
-                sources["web"].append({
-                    "title": item.get("title", ""),
-                    "source": item.get("author", ""),
-                    "date": item.get("date", ""),
-                    "url": item.get("url", "")
-                })
-
-        return sources
+        attempts = []
+        if self._cache_name and self._cache_key == (prompt.system, tuple(prompt.context)):
+            attempts.append((prompt.task, {**config, 'cached_content': self._cache_name}))
+        attempts.append((prompt.render(), config))
+        return attempts
+
+    def _drop_cache(self, error: Exception) -> None:
+        """
+        React to a failed request that referenced the session cache.
+
+        Only a cache the server no longer has (not found or expired) is
+        forgotten. Transient failures (timeouts, rate limits, server errors)
+        keep it for the next follow-up; any other rejection invalidates it
+        on purpose, deleting it on the server too.
+        """
+        message = str(error).lower()
+        if getattr(error, "code", None) == 404 or "not found" in message or "expired" in message:
+            self.logger.warning(f"⚠️  Gemini context cache is gone, resending context: {error}")
+            self._cache_name = self._cache_key = None
+        elif is_retriable_error(error):
+            self.logger.warning(f"⚠️  Gemini cached request failed, resending context: {error}")
+        else:
+            self.logger.warning(f"⚠️  Gemini context cache rejected, deleting it: {error}")
+            self.close_context()
+
+    def _extend_cache(self) -> None:
+        """Push the cache expiry out while the session is still in use."""
+        ttl = Config.GEMINI_CACHE_TTL
+        if self._cache_expires - time.monotonic() > ttl / 2:
+            return
+        self.client.caches.update(name=self._cache_name, config={"ttl": f"{ttl}s"})
+        self._cache_expires = time.monotonic() + ttl
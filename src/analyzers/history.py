@@ -0,0 +1,710 @@
+"""Per-topic history of past reports and time-series comparison."""
+
+import hashlib
+import logging
+import math
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from src.config import Config
+from src.utils.logger import get_logger
+from src.utils.metrics import metrics
+
+
+logger = get_logger("history")
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    digest TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS reports (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    topic TEXT NOT NULL,
+    topic_key TEXT NOT NULL,
+    generated TEXT NOT NULL,
+    volume INTEGER NOT NULL DEFAULT 0,
+    sentiment TEXT,
+    compound REAL,
+    positive REAL,
+    neutral REAL,
+    negative REAL,
+    model TEXT
+);
+CREATE INDEX IF NOT EXISTS reports_topic ON reports (topic_key, generated);
+CREATE TABLE IF NOT EXISTS keywords (
+    report_id INTEGER NOT NULL REFERENCES reports (id) ON DELETE CASCADE,
+    rank INTEGER NOT NULL,
+    keyword TEXT NOT NULL,
+    score REAL,
+    PRIMARY KEY (report_id, rank)
+);
+CREATE INDEX IF NOT EXISTS keywords_keyword ON keywords (keyword);
+"""
+
+
+def topic_key(topic: str) -> str:
+    """Normalize a topic so spelling variants share one history."""
+    return " ".join(topic.lower().split())
+
+
+def parse_timestamp(value: str) -> Optional[datetime]:
+    """Parse a report timestamp (ISO or ``%Y-%m-%d %H:%M:%S``)."""
+    try:
+        return datetime.fromisoformat(value.strip())
+    except (AttributeError, ValueError):
+        return None
+
+
+@dataclass
+class ReportSnapshot:
+    """The comparable figures of one report."""
+
+    topic: str
+    generated: str  # ISO timestamp
+    path: str = ""
+    volume: int = 0  # items analyzed
+    sentiment: Optional[str] = None
+    compound: Optional[float] = None
+    positive: Optional[float] = None  # distribution percentages
+    neutral: Optional[float] = None
+    negative: Optional[float] = None
+    keywords: List[Tuple[str, Optional[float]]] = field(default_factory=list)  # rank order
+    model: str = ""
+
+    @classmethod
+    def from_results(
+        cls,
+        topic: str,
+        sentiment: Dict[str, Any] = None,
+        keywords: Sequence[Tuple[str, float]] = None,
+        volume: int = 0,
+        generated: str = None,
+        path: str = "",
+        model: str = ""
+    ) -> "ReportSnapshot":
+        """
+        Build a snapshot from analysis results.
+
+        Args:
+            topic: Research topic
+            sentiment: Sentiment analysis results
+            keywords: Keywords as (keyword, score) tuples, or plain strings
+            volume: Number of items analyzed
+            generated: ISO timestamp (default: now)
+            path: Report path
+            model: Analysis model
+
+        Returns:
+            Report snapshot
+        """
+        sentiment = sentiment or {}
+        distribution = sentiment.get("distribution", {})
+        return cls(
+            topic=topic,
+            generated=generated or datetime.now().isoformat(timespec="seconds"),
+            path=path,
+            volume=volume,
+            sentiment=sentiment.get("overall"),
+            compound=sentiment.get("average_compound"),
+            positive=distribution.get("positive", {}).get("percentage"),
+            neutral=distribution.get("neutral", {}).get("percentage"),
+            negative=distribution.get("negative", {}).get("percentage"),
+            keywords=[
+                (kw[0], kw[1]) if isinstance(kw, (tuple, list)) else (kw, None)
+                for kw in keywords or []
+            ],
+            model=model
+        )
+
+    @classmethod
+    def from_report(cls, parsed: Dict[str, Any], path: Path) -> Optional["ReportSnapshot"]:
+        """
+        Build a snapshot from a parsed report (``ReportParser.parse_report``).
+
+        Args:
+            parsed: Parsed report data
+            path: Report path
+
+        Returns:
+            Report snapshot, or None if the file is not a research report
+        """
+        metadata = parsed.get("metadata", {})
+        topic = metadata.get("topic")
+        if not topic:
+            return None
+
+        generated = parse_timestamp(metadata.get("generated", ""))
+        if generated is None:
+            generated = datetime.fromtimestamp(Path(path).stat().st_mtime)
+
+        sources = parsed.get("sources", {})
+        volume = parsed.get("analysis_metadata", {}).get("items_analyzed") or (
+            sources.get("x_count", 0) + sources.get("web_count", 0)
+        )
+        return cls.from_results(
+            topic,
+            sentiment=parsed.get("sentiment"),
+            keywords=parsed.get("keywords"),
+            volume=volume,
+            generated=generated.isoformat(timespec="seconds"),
+            path=str(path),
+            model=metadata.get("model", "")
+        )
+
+    def as_previous(self) -> Dict[str, Any]:
+        """Convert to the previous-report shape ``ComparisonAnalyzer`` expects."""
+        sentiment = None
+        if self.sentiment:
+            sentiment = {
+                "overall": self.sentiment,
+                "average_compound": self.compound or 0.0,
+                "distribution": {
+                    label: {"percentage": value}
+                    for label, value in (
+                        ("positive", self.positive),
+                        ("neutral", self.neutral),
+                        ("negative", self.negative)
+                    )
+                    if value is not None
+                }
+            }
+        return {
+            "metadata": {"generated": self.generated, "model": self.model, "topic": self.topic},
+            "sentiment": sentiment,
+            "keywords": list(self.keywords),
+            "file_path": self.path
+        }
+
+
+class HistoryIndex:
+    """
+    SQLite index of every report's sentiment, keyword ranks and volume.
+
+    Files are tracked by modification time, size and content hash, so a
+    sync only parses reports that are new or changed; queries for a topic's
+    history never re-read report files.
+    """
+
+    def __init__(self, path: Path = None):
+        """
+        Initialize history index.
+
+        Args:
+            path: Database file (default: OUTPUT_DIR/.history.sqlite3)
+        """
+        self.path = Path(path) if path else Config.OUTPUT_DIR / ".history.sqlite3"
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection with the schema in place; commits on success."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=30)
+        try:
+            connection.execute("PRAGMA foreign_keys = ON")
+            connection.executescript(_SCHEMA)
+            connection.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)",
+                (str(SCHEMA_VERSION),)
+            )
+            yield connection
+            connection.commit()
+        finally:
+            connection.close()
+
+    def add(self, snapshot: ReportSnapshot) -> None:
+        """
+        Store a report snapshot, replacing any previous one for its path.
+
+        Args:
+            snapshot: Report snapshot with a path
+        """
+        with self._connect() as connection:
+            self._store(connection, snapshot)
+
+    @staticmethod
+    def _store(connection: sqlite3.Connection, snapshot: ReportSnapshot) -> None:
+        connection.execute("DELETE FROM reports WHERE path = ?", (snapshot.path,))
+        cursor = connection.execute(
+            "INSERT INTO reports (path, topic, topic_key, generated, volume, sentiment, compound,"
+            " positive, neutral, negative, model) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (snapshot.path, snapshot.topic, topic_key(snapshot.topic), snapshot.generated,
+             snapshot.volume, snapshot.sentiment, snapshot.compound, snapshot.positive,
+             snapshot.neutral, snapshot.negative, snapshot.model)
+        )
+        connection.executemany(
+            "INSERT INTO keywords (report_id, rank, keyword, score) VALUES (?, ?, ?, ?)",
+            [(cursor.lastrowid, rank, keyword, score)
+             for rank, (keyword, score) in enumerate(snapshot.keywords, 1)]
+        )
+
+    def index_file(self, path: Path, force: bool = False) -> bool:
+        """
+        Index one report file if it is new or changed.
+
+        Args:
+            path: Markdown report (its sidecar is used when present)
+            force: Re-parse even if the file looks unchanged
+
+        Returns:
+            True if the file was parsed
+        """
+        return self.index_files([path], force=force).parsed > 0
+
+    def sync(self, directory: Path = None) -> int:
+        """
+        Index new and changed reports in a directory.
+
+        Args:
+            directory: Report directory (default: Config.OUTPUT_DIR)
+
+        Returns:
+            Number of files parsed
+        """
+        directory = Path(directory) if directory else Config.OUTPUT_DIR
+        if not directory.is_dir():
+            return 0
+
+        parsed = self.index_files(sorted(directory.glob("*.md"))).parsed
+        if parsed:
+            logger.info(f"🗂️  Indexed {parsed} new or changed reports")
+        return parsed
+
+    def pending(self, paths: Sequence[Path], force: bool = False) -> List[Tuple[Path, Optional[str]]]:
+        """
+        Select the files whose modification time or size changed.
+
+        Args:
+            paths: Candidate report files
+            force: Select every file
+
+        Returns:
+            (resolved path, previously indexed digest or None) per selected file
+        """
+        with self._connect() as connection:
+            known = {
+                path: (mtime, size, digest)
+                for path, mtime, size, digest in connection.execute("SELECT * FROM files")
+            }
+
+        selected = []
+        for path in paths:
+            path = Path(path).resolve()
+            entry = known.get(str(path))
+            if entry and not force:
+                stat = path.stat()
+                if (entry[0], entry[1]) == (stat.st_mtime, stat.st_size):
+                    continue
+            selected.append((path, None if force or not entry else entry[2]))
+        return selected
+
+    def index_files(
+        self,
+        paths: Sequence[Path],
+        workers: int = 0,
+        force: bool = False,
+        batch_size: int = 200,
+        on_progress: Callable[["ScanResult"], None] = None
+    ) -> "IndexStats":
+        """
+        Index many report files, optionally parsing them on a process pool.
+
+        Unchanged files are skipped by modification time and size, then by
+        content hash. Results are committed in batches, so an interrupted
+        import resumes where it stopped.
+
+        Args:
+            paths: Report files
+            workers: Worker processes; 0 parses in this process
+            force: Re-parse every file
+            batch_size: Files per committed transaction
+            on_progress: Called with each file's scan result
+
+        Returns:
+            Import statistics
+        """
+        started = time.monotonic()
+        paths = list(paths)
+        todo = self.pending(paths, force)
+        stats = IndexStats(files=len(paths), skipped=len(paths) - len(todo))
+
+        if workers and len(todo) > 1:
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=_quiet_worker)
+            chunksize = max(1, min(64, len(todo) // (workers * 8)))
+            results = executor.map(_scan_star, todo, chunksize=chunksize)
+        else:
+            executor = None
+            results = (scan_report(path, digest) for path, digest in todo)
+
+        try:
+            batch: List[ScanResult] = []
+            for result in results:
+                stats.add(result)
+                batch.append(result)
+                if on_progress:
+                    on_progress(result)
+                if len(batch) >= batch_size:
+                    self._store_scans(batch)
+                    batch = []
+            self._store_scans(batch)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+        stats.seconds = time.monotonic() - started
+        metrics.increment("items_total", stats.parsed)
+        if stats.skipped + stats.unchanged:
+            metrics.increment("cache_hits_total", stats.skipped + stats.unchanged, cache="history")
+        return stats
+
+    def _store_scans(self, results: List["ScanResult"]) -> None:
+        """Write one batch of scan results in a single transaction."""
+        if not results:
+            return
+        with self._connect() as connection:
+            for result in results:
+                if result.error is not None:
+                    continue
+                if result.parsed:
+                    if result.snapshot is not None:
+                        self._store(connection, result.snapshot)
+                    else:
+                        connection.execute("DELETE FROM reports WHERE path = ?", (result.path,))
+                connection.execute(
+                    "INSERT OR REPLACE INTO files (path, mtime, size, digest) VALUES (?, ?, ?, ?)",
+                    (result.path, result.mtime, result.size, result.digest)
+                )
+
+    def history(
+        self,
+        topic: str,
+        since: datetime = None,
+        limit: int = None,
+        exclude: Sequence[str] = ()
+    ) -> List[ReportSnapshot]:
+        """
+        Get a topic's reports, oldest first.
+
+        Args:
+            topic: Research topic
+            since: Only reports generated at or after this time
+            limit: Only the most recent ``limit`` reports
+            exclude: Report paths to leave out (such as the current run's)
+
+        Returns:
+            Report snapshots
+        """
+        query = "SELECT * FROM reports WHERE topic_key = ?"
+        params: List[Any] = [topic_key(topic)]
+        if since is not None:
+            query += " AND generated >= ?"
+            params.append(since.isoformat(timespec="seconds"))
+        excluded = [str(Path(path).resolve()) for path in exclude]
+        if excluded:
+            query += f" AND path NOT IN ({', '.join('?' for _ in excluded)})"
+            params.extend(excluded)
+        query += " ORDER BY generated DESC, id DESC"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self._connect() as connection:
+            connection.row_factory = sqlite3.Row
+            rows = connection.execute(query, params).fetchall()
+            snapshots = []
+            for row in reversed(rows):
+                keywords = connection.execute(
+                    "SELECT keyword, score FROM keywords WHERE report_id = ? ORDER BY rank",
+                    (row["id"],)
+                ).fetchall()
+                snapshots.append(ReportSnapshot(
+                    topic=row["topic"],
+                    generated=row["generated"],
+                    path=row["path"],
+                    volume=row["volume"],
+                    sentiment=row["sentiment"],
+                    compound=row["compound"],
+                    positive=row["positive"],
+                    neutral=row["neutral"],
+                    negative=row["negative"],
+                    keywords=[(keyword, score) for keyword, score in keywords],
+                    model=row["model"] or ""
+                ))
+        return snapshots
+
+    def latest(self, topic: str, exclude: Sequence[str] = ()) -> Optional[ReportSnapshot]:
+        """
+        Get a topic's most recent report.
+
+        Args:
+            topic: Research topic
+            exclude: Report paths to leave out
+
+        Returns:
+            Report snapshot, or None if the topic has no indexed report
+        """
+        history = self.history(topic, limit=1, exclude=exclude)
+        return history[-1] if history else None
+
+    def topics(self, since: datetime = None) -> List[Dict[str, Any]]:
+        """
+        Summarize every indexed topic.
+
+        Args:
+            since: Only count reports generated at or after this time
+
+        Returns:
+            Topic rows (topic, reports, first, last, sentiment, compound),
+            most recently reported first
+        """
+        query = """
+            WITH ranked AS (
+                SELECT *,
+                       ROW_NUMBER() OVER (PARTITION BY topic_key ORDER BY generated DESC, id DESC) AS recency,
+                       COUNT(*) OVER (PARTITION BY topic_key) AS reports,
+                       MIN(generated) OVER (PARTITION BY topic_key) AS first
+                FROM reports WHERE generated >= ?
+            )
+            SELECT topic, reports, first, generated AS last, sentiment, compound
+            FROM ranked WHERE recency = 1 ORDER BY generated DESC
+        """
+        with self._connect() as connection:
+            connection.row_factory = sqlite3.Row
+            rows = connection.execute(query, (_since(since),)).fetchall()
+        return [dict(row) for row in rows]
+
+    def topics_turned(self, sentiment: str, since: datetime = None) -> List[Dict[str, Any]]:
+        """
+        Find topics whose overall sentiment changed to a label.
+
+        A topic turned when one of its reports in the window has the label
+        and the report before it (which may be older) did not.
+
+        Args:
+            sentiment: Sentiment label (Positive, Neutral or Negative)
+            since: Only changes reported at or after this time
+
+        Returns:
+            The latest change per topic (topic, generated, previous,
+            sentiment, compound, previous_compound, path), newest first
+        """
+        query = """
+            WITH ordered AS (
+                SELECT topic_key, topic, generated, sentiment, compound, path,
+                       LAG(sentiment) OVER topic_order AS previous,
+                       LAG(compound) OVER topic_order AS previous_compound
+                FROM reports
+                WINDOW topic_order AS (PARTITION BY topic_key ORDER BY generated, id)
+            ),
+            turned AS (
+                SELECT *, ROW_NUMBER() OVER (PARTITION BY topic_key ORDER BY generated DESC) AS recency
+                FROM ordered
+                WHERE generated >= ? AND sentiment = ? COLLATE NOCASE
+                  AND previous IS NOT NULL AND previous != sentiment
+            )
+            SELECT topic, generated, previous, sentiment, compound, previous_compound, path
+            FROM turned WHERE recency = 1 ORDER BY generated DESC
+        """
+        with self._connect() as connection:
+            connection.row_factory = sqlite3.Row
+            rows = connection.execute(query, (_since(since), sentiment)).fetchall()
+        return [dict(row) for row in rows]
+
+
+@dataclass
+class ScanResult:
+    """Outcome of reading one report file."""
+
+    path: str
+    mtime: float = 0.0
+    size: int = 0
+    digest: str = ""
+    parsed: bool = False  # False when the content hash was unchanged
+    snapshot: Optional[ReportSnapshot] = None  # None for files that are not reports
+    error: Optional[str] = None
+
+
+@dataclass
+class IndexStats:
+    """Counters of one import."""
+
+    files: int = 0
+    skipped: int = 0  # unchanged modification time and size
+    unchanged: int = 0  # touched, same content
+    parsed: int = 0
+    reports: int = 0
+    failed: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+
+    def add(self, result: ScanResult) -> None:
+        """Count one scan result."""
+        if result.error is not None:
+            self.failed += 1
+            return
+        self.bytes += result.size
+        if not result.parsed:
+            self.unchanged += 1
+            return
+        self.parsed += 1
+        if result.snapshot is not None:
+            self.reports += 1
+
+    @property
+    def files_per_second(self) -> float:
+        """Files scanned per second."""
+        scanned = self.files - self.skipped
+        return scanned / self.seconds if self.seconds else 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        """Megabytes read per second."""
+        return self.bytes / 1e6 / self.seconds if self.seconds else 0.0
+
+
+def scan_report(path: Path, known_digest: str = None) -> ScanResult:
+    """
+    Hash and parse one report file.
+
+    Runs in worker processes during bulk imports, so it only returns data
+    and never touches the index.
+
+    Args:
+        path: Report file
+        known_digest: Digest stored for the file; a matching file is not parsed
+
+    Returns:
+        Scan result
+    """
+    from src.parsers.report_parser import ReportParser
+
+    path = Path(path)
+    result = ScanResult(path=str(path))
+    try:
+        stat = path.stat()
+        content = path.read_bytes()
+        result.mtime, result.size = stat.st_mtime, stat.st_size
+        result.digest = hashlib.sha1(content).hexdigest()
+        if result.digest == known_digest:
+            return result
+
+        result.parsed = True
+        result.snapshot = ReportSnapshot.from_report(ReportParser().parse_report(path), path)
+    except Exception as e:
+        logger.warning(f"⚠️  Could not index {path.name}: {e}")
+        result.error = str(e)
+    return result
+
+
+def _since(since: Optional[datetime]) -> str:
+    return since.isoformat(timespec="seconds") if since else ""
+
+
+def _scan_star(job: Tuple[Path, Optional[str]]) -> ScanResult:
+    return scan_report(*job)
+
+
+def _quiet_worker() -> None:
+    """Keep per-file info logs of worker processes off the console."""
+    logging.disable(logging.INFO)
+
+
+def trend_line(xs: Sequence[float], ys: Sequence[float]) -> Optional[Dict[str, float]]:
+    """
+    Fit a least-squares line.
+
+    Args:
+        xs: Positions (days since the first report)
+        ys: Values
+
+    Returns:
+        Slope per unit of x, intercept and R², or None with fewer than two
+        distinct positions
+    """
+    n = len(xs)
+    if n < 2:
+        return None
+    mean_x = sum(xs) / n
+    mean_y = sum(ys) / n
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    if not sxx:
+        return None
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    syy = sum((y - mean_y) ** 2 for y in ys)
+
+    slope = sxy / sxx
+    return {
+        "slope": slope,
+        "intercept": mean_y - slope * mean_x,
+        "r2": (sxy * sxy) / (sxx * syy) if syy else 1.0,
+    }
+
+
+def detect_change_points(values: Sequence[float], min_size: int = 2, penalty: float = None) -> List[int]:
+    """
+    Find positions where the mean of a series shifts.
+
+    Binary segmentation: the split that most reduces the squared error is
+    kept if the reduction beats a BIC-style penalty based on a robust noise
+    estimate, and both halves are searched again.
+
+    Args:
+        values: Series in time order
+        min_size: Minimum segment length
+        penalty: Required error reduction per split (default: 2·σ²·ln n)
+
+    Returns:
+        Sorted indexes where a new segment starts
+    """
+    n = len(values)
+    if n < 2 * min_size:
+        return []
+
+    if penalty is None:
+        # Noise from the median absolute difference of neighbours, which a
+        # level shift barely affects
+        diffs = sorted(abs(b - a) for a, b in zip(values, values[1:]))
+        sigma = diffs[len(diffs) // 2] / (0.6745 * math.sqrt(2)) if diffs else 0.0
+        sigma = max(sigma, 1e-9 + 0.05 * (max(values) - min(values)))
+        penalty = 2 * sigma * sigma * math.log(n)
+
+    prefix = [0.0]
+    prefix_sq = [0.0]
+    for value in values:
+        prefix.append(prefix[-1] + value)
+        prefix_sq.append(prefix_sq[-1] + value * value)
+
+    def cost(start: int, end: int) -> float:
+        total = prefix[end] - prefix[start]
+        return prefix_sq[end] - prefix_sq[start] - total * total / (end - start)
+
+    points: List[int] = []
+    segments = [(0, n)]
+    while segments:
+        start, end = segments.pop()
+        if end - start < 2 * min_size:
+            continue
+        whole = cost(start, end)
+        best, split = max(
+            (whole - cost(start, k) - cost(k, end), k)
+            for k in range(start + min_size, end - min_size + 1)
+        )
+        if best > penalty:
+            points.append(split)
+            segments.extend([(start, split), (split, end)])
+    return sorted(points)
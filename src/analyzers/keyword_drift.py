@@ -0,0 +1,172 @@
+"""Drift between ranked, scored keyword lists."""
+
+import heapq
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+# YAKE scores are unbounded below; floor them so near-zero scores stay finite
+_MIN_SCORE = 1e-6
+
+
+def keyword_weights(keywords: Iterable[Any]) -> Dict[str, float]:
+    """
+    Turn a keyword list into a normalized weight vector.
+
+    YAKE scores are lower for more relevant keywords, so each keyword is
+    weighted by its inverse score. Keywords without a score (older reports
+    parsed from Markdown) fall back to a 1/rank weight. Spelling variants
+    differing only in case are merged.
+
+    Args:
+        keywords: (keyword, score) tuples or plain strings, most relevant first
+
+    Returns:
+        Lowercased keyword -> weight (summing to 1), in rank order
+    """
+    weights: Dict[str, float] = {}
+    for rank, entry in enumerate(keywords, 1):
+        if isinstance(entry, (tuple, list)):
+            keyword, score = entry[0], entry[1] if len(entry) > 1 else None
+        else:
+            keyword, score = entry, None
+        weight = 1.0 / max(score, _MIN_SCORE) if score is not None else 1.0 / rank
+        key = keyword.lower()
+        weights[key] = weights.get(key, 0.0) + weight
+
+    total = sum(weights.values())
+    if not total:
+        return {}
+    return {key: weight / total for key, weight in weights.items()}
+
+
+def merge_weights(vectors: Sequence[Dict[str, float]]) -> Dict[str, float]:
+    """
+    Average several weight vectors, e.g. a topic's earlier reports.
+
+    Args:
+        vectors: Weight vectors from ``keyword_weights``
+
+    Returns:
+        Mean weight per keyword, heaviest first
+    """
+    if not vectors:
+        return {}
+    merged: Dict[str, float] = {}
+    for vector in vectors:
+        for key, weight in vector.items():
+            merged[key] = merged.get(key, 0.0) + weight
+    count = len(vectors)
+    return {key: merged[key] / count for key in sorted(merged, key=merged.__getitem__, reverse=True)}
+
+
+def rank_biased_overlap(first: Sequence[str], second: Sequence[str], p: float = 0.9) -> float:
+    """
+    Extrapolated rank-biased overlap of two rankings (Webber et al., 2010).
+
+    Agreement near the top counts most; ``p`` sets how quickly deeper ranks
+    lose weight (0.9 puts ~86% of the weight on the first 10 ranks). Lists of
+    different lengths and disjoint tails are handled. Runs in linear time.
+
+    Args:
+        first: Ranked keys, best first
+        second: Ranked keys, best first
+        p: Persistence between 0 and 1
+
+    Returns:
+        Similarity between 0 (disjoint) and 1 (identical rankings)
+    """
+    short, long = list(dict.fromkeys(first)), list(dict.fromkeys(second))
+    if len(short) > len(long):
+        short, long = long, short
+    s, l = len(short), len(long)
+    if not s:
+        return 1.0 if not l else 0.0
+
+    seen_short, seen_long = set(), set()
+    overlap = 0
+    overlap_at_s = 0
+    total = 0.0
+    weight = 1.0
+    for depth in range(1, l + 1):
+        weight *= p
+        item = long[depth - 1]
+        if depth <= s:
+            other = short[depth - 1]
+            if other == item:
+                overlap += 1
+            else:
+                overlap += (other in seen_long) + (item in seen_short)
+            seen_short.add(other)
+        else:
+            overlap += item in seen_short
+        seen_long.add(item)
+
+        total += overlap / depth * weight
+        if depth == s:
+            overlap_at_s = overlap
+        elif depth > s:
+            total += overlap_at_s * (depth - s) / (s * depth) * weight
+
+    extrapolated = ((overlap - overlap_at_s) / l + overlap_at_s / s) * weight
+    return min(1.0, (1 - p) / p * total + extrapolated)
+
+
+def weighted_jaccard(first: Dict[str, float], second: Dict[str, float]) -> float:
+    """
+    Weighted Jaccard similarity: sum of minimum over sum of maximum weights.
+
+    Args:
+        first: Keyword weights
+        second: Keyword weights
+
+    Returns:
+        Similarity between 0 and 1
+    """
+    numerator = denominator = 0.0
+    for key, weight in first.items():
+        other = second.get(key, 0.0)
+        numerator += min(weight, other)
+        denominator += max(weight, other)
+    for key, weight in second.items():
+        if key not in first:
+            denominator += weight
+    return numerator / denominator if denominator else 1.0
+
+
+def keyword_drift(
+    current: Dict[str, float],
+    previous: Dict[str, float],
+    top: int = 10,
+    p: float = 0.9
+) -> Dict[str, Any]:
+    """
+    Measure how far a keyword vector moved from an earlier one.
+
+    Args:
+        current: Current keyword weights
+        previous: Earlier keyword weights (one report, or merged history)
+        top: Number of rising and falling keywords to return
+        p: Rank-biased overlap persistence
+
+    Returns:
+        Dictionary with ``rbo``, ``weighted_jaccard``, ``magnitude`` (total
+        variation distance, 0 = same weights, 1 = disjoint) and ``rising`` /
+        ``falling`` lists of (keyword, weight change in percentage points)
+    """
+    deltas: List[Tuple[str, float]] = [
+        (key, weight - previous.get(key, 0.0)) for key, weight in current.items()
+    ]
+    deltas.extend((key, -weight) for key, weight in previous.items() if key not in current)
+
+    rising = heapq.nlargest(top, (item for item in deltas if item[1] > 0), key=lambda item: item[1])
+    falling = heapq.nsmallest(top, (item for item in deltas if item[1] < 0), key=lambda item: item[1])
+    return {
+        "rbo": round(rank_biased_overlap(_ranked(current), _ranked(previous), p), 3),
+        "weighted_jaccard": round(weighted_jaccard(current, previous), 3),
+        "magnitude": round(sum(abs(delta) for _, delta in deltas) / 2, 3),
+        "rising": [(key, round(delta * 100, 2)) for key, delta in rising],
+        "falling": [(key, round(delta * 100, 2)) for key, delta in falling],
+    }
+
+
+def _ranked(weights: Dict[str, float]) -> List[str]:
+    return sorted(weights, key=weights.__getitem__, reverse=True)
@@ -1,11 +1,15 @@
 """Keyword extraction for research data."""
 
+import re
 from typing import List, Tuple, Dict, Any
 import yake
 from collections import Counter
 from src.utils.logger import get_logger
 
 
+_WORD_PATTERN = re.compile(r"[a-z][a-z0-9'-]+")
+
+
 class KeywordExtractor:
     """Extracts keywords from collected data using YAKE."""
 
@@ -43,18 +47,28 @@ class KeywordExtractor:
 
         self.logger.info(f"Extracting keywords from {len(data_items)} items")
 
-        # Combine all text content
-        all_text = []
+        accumulator = KeywordAccumulator(self)
         for item in data_items:
-            content = item.get("content", "") or item.get("title", "")
-            if content:
-                all_text.append(content)
+            accumulator.add(item)
+
+        return accumulator.result(top_n)
 
-        if not all_text:
+    def extract_from_texts(self, texts: List[str], top_n: int = 20) -> List[Tuple[str, float]]:
+        """
+        Extract top keywords from item texts.
+
+        Args:
+            texts: Non-empty item texts
+            top_n: Number of top keywords to return
+
+        Returns:
+            List of (keyword, score) tuples, lower score = more important
+        """
+        if not texts:
             return []
 
         # Join all text
-        combined_text = " ".join(all_text)
+        combined_text = " ".join(texts)
 
         try:
             # Extract keywords using YAKE
@@ -212,3 +226,71 @@ class KeywordExtractor:
                 formatted.append(keyword)            # Less important
 
         return ", ".join(formatted)
+
+
+class KeywordAccumulator:
+    """
+    Collects item text for keyword extraction as items arrive.
+
+    Candidate terms (words and two-word phrases without stopwords) are
+    counted per item, so the leading terms are known while collection is
+    still running. YAKE scores the collected text in ``result``, because its
+    statistics need the whole corpus.
+    """
+
+    def __init__(self, extractor: KeywordExtractor = None):
+        """
+        Initialize accumulator.
+
+        Args:
+            extractor: Extractor used for the final scoring (default: a new one)
+        """
+        self.extractor = extractor or KeywordExtractor()
+        self.stopwords = getattr(self.extractor.extractor, "stopword_set", set())
+        self.texts: List[str] = []
+        self.candidates: Counter = Counter()
+
+    def add(self, item: Dict[str, Any]) -> None:
+        """
+        Add one data item's text and count its candidate terms.
+
+        Args:
+            item: Collected data item
+        """
+        content = item.get("content", "") or item.get("title", "")
+        if not content:
+            return
+
+        self.texts.append(content)
+
+        words = [
+            word if word not in self.stopwords and len(word) > 2 else None
+            for word in _WORD_PATTERN.findall(content.lower())
+        ]
+        terms = {word for word in words if word}
+        terms.update(f"{a} {b}" for a, b in zip(words, words[1:]) if a and b)
+        self.candidates.update(terms)
+
+    def top_candidates(self, n: int = 5) -> List[Tuple[str, int]]:
+        """
+        Get the candidate terms found in the most items so far.
+
+        Args:
+            n: Number of terms
+
+        Returns:
+            List of (term, item count) tuples
+        """
+        return self.candidates.most_common(n)
+
+    def result(self, top_n: int = 20) -> List[Tuple[str, float]]:
+        """
+        Score the collected text with YAKE.
+
+        Args:
+            top_n: Number of top keywords to return
+
+        Returns:
+            List of (keyword, score) tuples, lower score = more important
+        """
+        return self.extractor.extract_from_texts(self.texts, top_n)
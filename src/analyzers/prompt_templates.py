@@ -1,15 +1,32 @@
 """Prompt templates for Claude AI analysis."""
 
+from dataclasses import dataclass, field
+from typing import List
 
-DETAILED_ANALYSIS_PROMPT = """You are a professional research analyst. Analyze the following collected data about "{topic}" and provide a comprehensive research analysis.
+from .relevance import RelevanceRanker
 
-# Collected Data
 
-{data_summary}
+ANALYST_SYSTEM_PROMPT = """You are a professional research analyst. You analyze data collected from X (Twitter) and web search about a research topic.
 
-# Your Task
+# Guidelines
+
+- Be objective and evidence-based
+- Cite specific sources when making claims
+- Identify patterns and trends across multiple sources
+- Note any contradictions or inconsistencies
+- Focus on actionable insights
+- Use clear, professional language
+- Avoid speculation without evidence"""
+
+
+DATA_BLOCK_TEMPLATE = """# Collected Data about "{topic}"
+
+{data_summary}"""
 
-Analyze this data and provide:
+
+DETAILED_ANALYSIS_TASK = """# Your Task
+
+Analyze the collected data about "{topic}" and provide a comprehensive research analysis:
 
 1. **Executive Summary** (3-5 sentences)
    - Synthesize the most important findings
@@ -37,28 +54,12 @@ Analyze this data and provide:
    - Overall conclusions based on the analysis
    - Suggested next steps or areas for further research
 
-# Guidelines
-
-- Be objective and evidence-based
-- Cite specific sources when making claims
-- Identify patterns and trends across multiple sources
-- Note any contradictions or inconsistencies
-- Focus on actionable insights
-- Use clear, professional language
-- Avoid speculation without evidence
-
 Please provide your analysis in a structured format that can be easily converted to Markdown."""
 
 
-QUICK_ANALYSIS_PROMPT = """You are a research analyst. Provide a quick analysis of the following data about "{topic}".
+QUICK_ANALYSIS_TASK = """# Your Task
 
-# Collected Data
-
-{data_summary}
-
-# Your Task
-
-Provide a concise analysis including:
+Provide a quick analysis of the collected data about "{topic}", including:
 
 1. **Executive Summary** (2-3 sentences)
    - Main takeaway from the data
@@ -75,6 +76,102 @@ Provide a concise analysis including:
 Keep your analysis focused and actionable. Cite specific sources when relevant."""
 
 
+DELTA_UPDATE_TASK = """# Your Task
+
+The previous analysis of "{topic}" above was written from data collected earlier. The data block contains only items collected since then ({new_count} new items).
+
+Update the previous analysis with the new items:
+- Keep findings that still hold and the same section structure
+- Revise conclusions, trends and opinions where the new items change them
+- Add notable new developments, citing the new sources
+- Do not drop earlier evidence just because it is not repeated in the new items
+
+Return the complete updated analysis (not just the changes), following this structure:
+
+{structure}"""
+
+
+@dataclass
+class PromptSpec:
+    """
+    A prompt split into a stable prefix and a per-request task.
+
+    ``system`` and ``context`` blocks stay identical across every request
+    about the same collected data (the analysis and each follow-up), so
+    providers can cache them; only ``task`` changes from call to call.
+    """
+
+    system: str
+    context: List[str] = field(default_factory=list)
+    task: str = ""
+
+    def render(self) -> str:
+        """Flatten the prompt into a single string."""
+        return "\n\n".join([self.system, *self.context, self.task])
+
+
+def build_data_block(topic: str, data_items: list) -> str:
+    """
+    Build the collected-data context block shared by every prompt of a run.
+
+    Args:
+        topic: Research topic
+        data_items: List of collected data items
+
+    Returns:
+        Data block text
+    """
+    return DATA_BLOCK_TEMPLATE.format(topic=topic, data_summary=_format_data_summary(data_items, topic))
+
+
+def get_analysis_spec(topic: str, data_items: list, depth: str = "detailed") -> PromptSpec:
+    """
+    Generate the structured analysis prompt for collected data.
+
+    Args:
+        topic: Research topic
+        data_items: List of collected data items
+        depth: Analysis depth (quick or detailed)
+
+    Returns:
+        Prompt split into system, cacheable data context and task
+    """
+    # Select appropriate task template
+    task = DETAILED_ANALYSIS_TASK if depth == "detailed" else QUICK_ANALYSIS_TASK
+
+    return PromptSpec(
+        system=ANALYST_SYSTEM_PROMPT,
+        context=[build_data_block(topic, data_items)],
+        task=task.format(topic=topic)
+    )
+
+
+def get_delta_spec(topic: str, new_items: list, previous_analysis: str, depth: str = "detailed") -> PromptSpec:
+    """
+    Generate the prompt updating a previous analysis with new items only.
+
+    Args:
+        topic: Research topic
+        new_items: Items not covered by the previous analysis
+        previous_analysis: Previous analysis text
+        depth: Analysis depth (quick or detailed)
+
+    Returns:
+        Prompt with the previous analysis and new data as context
+    """
+    task = DETAILED_ANALYSIS_TASK if depth == "detailed" else QUICK_ANALYSIS_TASK
+    structure = task.format(topic=topic).split("\n", 2)[2].strip()
+
+    return PromptSpec(
+        system=ANALYST_SYSTEM_PROMPT,
+        context=[
+            f"# Previous Analysis of \"{topic}\"\n\n{previous_analysis}",
+            build_data_block(topic, new_items)
+        ],
+        task=DELTA_UPDATE_TASK.format(topic=topic, new_count=len(new_items), structure=structure)
+    )
+
+
 def get_analysis_prompt(topic: str, data_items: list, depth: str = "detailed") -> str:
     """
     Generate analysis prompt based on collected data.
@@ -87,21 +184,19 @@ def get_analysis_prompt(topic: str, data_items: list, depth: str = "detailed") -
     Returns:
         Formatted prompt string
     """
-    # Format data summary
-    data_summary = _format_data_summary(data_items)
-
-    # Select appropriate prompt template
-    template = DETAILED_ANALYSIS_PROMPT if depth == "detailed" else QUICK_ANALYSIS_PROMPT
-
-    return template.format(topic=topic, data_summary=data_summary)
+    return get_analysis_spec(topic, data_items, depth).render()
 
 
-def _format_data_summary(data_items: list) -> str:
+def _format_data_summary(data_items: list, topic: str = None) -> str:
     """
     Format collected data items into a readable summary.
 
+    When a topic is given and the items exceed ``Config.PROMPT_DATA_TOKENS``,
+    only the most relevant and diverse items are kept (see RelevanceRanker).
+
     Args:
         data_items: List of data items from collectors
+        topic: Research topic used to rank items
 
     Returns:
         Formatted data summary string
@@ -109,41 +204,70 @@ def _format_data_summary(data_items: list) -> str:
     if not data_items:
         return "No data collected."
 
+    if topic:
+        selected = RelevanceRanker().select(topic, data_items, _estimate_tokens)
+        limit = None
+    else:
+        selected = data_items
+        limit = 50  # first 50 per source to avoid token limit
+
     # Group by source
-    x_items = [item for item in data_items if item.get("source") == "x"]
-    web_items = [item for item in data_items if item.get("source") == "web"]
+    x_total = sum(1 for item in data_items if item.get("source") == "x")
+    web_total = sum(1 for item in data_items if item.get("source") == "web")
+    x_items = [item for item in selected if item.get("source") == "x"][:limit]
+    web_items = [item for item in selected if item.get("source") == "web"][:limit]
 
     summary_parts = []
 
     # Format X data
     if x_items:
-        summary_parts.append(f"## X (Twitter) Posts ({len(x_items)} items)\n")
-        for i, item in enumerate(x_items[:50], 1):  # Limit to first 50 to avoid token limit
-            author = item.get("author", "Unknown")
-            content = item.get("content", "")[:300]  # Truncate long content
-            date = item.get("date", "")
-            likes = item.get("engagement", {}).get("likes", 0)
-
-            summary_parts.append(
-                f"{i}. **@{author}** ({date})\n"
-                f"   {content}\n"
-                f"   [Likes: {likes}]\n"
-            )
+        summary_parts.append(f"## X (Twitter) Posts ({_count_label(len(x_items), x_total)})\n")
+        for i, item in enumerate(x_items, 1):
+            summary_parts.append(_format_x_item(i, item))
 
     # Format Web data
     if web_items:
-        summary_parts.append(f"\n## Web Results ({len(web_items)} items)\n")
-        for i, item in enumerate(web_items[:50], 1):  # Limit to first 50
-            title = item.get("title", "Untitled")
-            content = item.get("content", "")[:300]  # Truncate
-            author = item.get("author", "Unknown")
-            url = item.get("url", "")
-
-            summary_parts.append(
-                f"{i}. **{title}**\n"
-                f"   Source: {author}\n"
-                f"   {content}\n"
-                f"   URL: {url}\n"
-            )
+        summary_parts.append(f"\n## Web Results ({_count_label(len(web_items), web_total)})\n")
+        for i, item in enumerate(web_items, 1):
+            summary_parts.append(_format_web_item(i, item))
 
     return "\n".join(summary_parts)
+
+
+def _count_label(shown: int, total: int) -> str:
+    if shown == total:
+        return f"{total} items"
+    return f"{shown} most relevant of {total} items"
+
+
+def _format_x_item(i: int, item: dict) -> str:
+    author = item.get("author", "Unknown")
+    content = item.get("content", "")[:300]  # Truncate long content
+    date = item.get("date", "")
+    likes = item.get("engagement", {}).get("likes", 0)
+
+    return (
+        f"{i}. **@{author}** ({date})\n"
+        f"   {content}\n"
+        f"   [Likes: {likes}]\n"
+    )
+
+
+def _format_web_item(i: int, item: dict) -> str:
+    title = item.get("title", "Untitled")
+    content = item.get("content", "")[:300]  # Truncate
+    author = item.get("author", "Unknown")
+    url = item.get("url", "")
+
+    return (
+        f"{i}. **{title}**\n"
+        f"   Source: {author}\n"
+        f"   {content}\n"
+        f"   URL: {url}\n"
+    )
+
+
+def _estimate_tokens(item: dict) -> int:
+    """Rough prompt tokens of one formatted item (about 4 characters each)."""
+    formatter = _format_x_item if item.get("source") == "x" else _format_web_item
+    return len(formatter(0, item)) // 4 + 1
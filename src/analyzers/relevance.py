@@ -0,0 +1,177 @@
+"""Local relevance ranking of collected items before they reach the LLM."""
+
+import math
+import re
+import zlib
+from collections import Counter
+from typing import Callable, Dict, List, Sequence
+
+from src.config import Config
+
+
+SparseVector = Dict[int, float]
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9#@][a-z0-9_'#@-]*")
+
+
+class HashedVectorizer:
+    """
+    Turns text into L2-normalized sparse TF-IDF vectors over hashed n-grams.
+
+    Word unigrams and bigrams (with a light plural folding) are hashed into
+    a fixed number of buckets with CRC32, so no vocabulary has to be stored
+    and results are identical across processes.
+    """
+
+    def __init__(self, n_features: int = 2 ** 20):
+        """
+        Initialize vectorizer.
+
+        Args:
+            n_features: Number of hash buckets
+        """
+        self.n_features = n_features
+        self.idf: Dict[int, float] = {}
+
+    def features(self, text: str) -> Counter:
+        """
+        Count the hashed n-gram features of a text.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Bucket to count
+        """
+        words = [_fold(word) for word in _TOKEN_PATTERN.findall(text.lower())]
+        grams = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+        return Counter(zlib.crc32(gram.encode("utf-8")) % self.n_features for gram in grams)
+
+    def fit(self, texts: Sequence[str]) -> List[SparseVector]:
+        """
+        Learn IDF weights from a corpus and vectorize it.
+
+        Args:
+            texts: Corpus texts
+
+        Returns:
+            One vector per text
+        """
+        counts = [self.features(text) for text in texts]
+        df = Counter(bucket for count in counts for bucket in count)
+        n = len(texts)
+        self.idf = {bucket: math.log((1 + n) / (1 + freq)) + 1 for bucket, freq in df.items()}
+        return [self._weigh(count) for count in counts]
+
+    def transform(self, text: str) -> SparseVector:
+        """Vectorize a text with the learned IDF weights."""
+        return self._weigh(self.features(text))
+
+    def _weigh(self, count: Counter) -> SparseVector:
+        vector = {
+            bucket: (1 + math.log(tf)) * self.idf.get(bucket, 1.0)
+            for bucket, tf in count.items()
+        }
+        norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+        if not norm:
+            return {}
+        return {bucket: weight / norm for bucket, weight in vector.items()}
+
+
+def _fold(word: str) -> str:
+    """Fold simple English plurals ("batteries" -> "battery", "cars" -> "car")."""
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+def cosine(a: SparseVector, b: SparseVector) -> float:
+    """Cosine similarity of two L2-normalized sparse vectors."""
+    # Key-view intersection runs in C; only shared buckets are multiplied
+    return sum(a[bucket] * b[bucket] for bucket in a.keys() & b.keys())
+
+
+def item_text(item: dict) -> str:
+    """Text of a collected item used for ranking."""
+    return f"{item.get('title', '')} {item.get('content', '')}"
+
+
+class RelevanceRanker:
+    """
+    Picks the most relevant, least redundant items within a token budget.
+
+    Every item is scored against the topic with hashed n-gram TF-IDF
+    vectors. The best-scoring candidates are then re-ranked with Maximal
+    Marginal Relevance, so near-duplicate posts do not crowd out other
+    viewpoints, until the token budget is spent. Runs locally on the CPU.
+    """
+
+    def __init__(self, token_budget: int = None, diversity: float = None, candidate_factor: int = 4):
+        """
+        Initialize ranker.
+
+        Args:
+            token_budget: Tokens the selected items may use
+                (default: Config.PROMPT_DATA_TOKENS)
+            diversity: MMR weight of redundancy against relevance, 0 to 1
+                (default: Config.RELEVANCE_DIVERSITY)
+            candidate_factor: Only the top ``candidate_factor`` times the
+                expected selection size are considered for MMR
+        """
+        self.token_budget = token_budget or Config.PROMPT_DATA_TOKENS
+        self.diversity = Config.RELEVANCE_DIVERSITY if diversity is None else diversity
+        self.candidate_factor = candidate_factor
+
+    def select(self, topic: str, items: List[dict], cost: Callable[[dict], int]) -> List[dict]:
+        """
+        Select items for a prompt.
+
+        Args:
+            topic: Research topic the items are scored against
+            items: Collected data items
+            cost: Estimated prompt tokens of one item
+
+        Returns:
+            Selected items, most relevant first (all items in collection
+            order if they fit the budget)
+        """
+        costs = [max(1, cost(item)) for item in items]
+        if sum(costs) <= self.token_budget:
+            # Everything fits: keep collection order
+            return list(items)
+
+        vectorizer = HashedVectorizer()
+        vectors = vectorizer.fit([item_text(item) for item in items])
+        query = vectorizer.transform(topic)
+        relevance = [cosine(query, vector) for vector in vectors]
+
+        # Candidate pool: the best-scoring items, enough to fill the budget
+        # several times over; MMR then only compares within the pool
+        average_cost = sum(costs) / len(costs)
+        pool_size = max(1, int(self.candidate_factor * self.token_budget / average_cost))
+        pool = sorted(range(len(items)), key=lambda i: (-relevance[i], i))[:pool_size]
+
+        selected: List[int] = []
+        redundancy = {i: 0.0 for i in pool}
+        remaining = self.token_budget
+        weight = 1.0 - self.diversity
+
+        while redundancy:
+            best = max(
+                redundancy,
+                key=lambda i: (weight * relevance[i] - self.diversity * redundancy[i], -i)
+            )
+            del redundancy[best]
+            if costs[best] > remaining:
+                continue
+
+            selected.append(best)
+            remaining -= costs[best]
+            for i in redundancy:
+                similarity = cosine(vectors[best], vectors[i])
+                if similarity > redundancy[i]:
+                    redundancy[i] = similarity
+
+        return [items[i] for i in selected]
@@ -0,0 +1,290 @@
+"""Routing between LLM providers with failover and hedging."""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, Future, wait
+from typing import Optional, Set, Union
+
+from src.config import Config
+from src.utils.metrics import metrics
+from src.utils.resilience import get_breaker
+from src.utils.retry import is_retriable_error
+from .base import LLMProvider, LLMResponse
+from .claude_analyzer import ClaudeAnalyzer
+from .gemini_analyzer import GeminiAnalyzer
+from .prompt_templates import PromptSpec
+
+
+class LLMTimeoutError(Exception):
+    """Raised when no provider answered within the routing timeout."""
+
+
+class LLMRouter(LLMProvider):
+    """
+    Sends each request to a primary provider and fails over to a fallback.
+
+    The fallback is called when the primary raises, when its circuit is open,
+    or when it has not answered within ``timeout``. With ``hedge_after`` set,
+    the fallback is started as soon as the primary exceeds that latency and
+    the first successful answer wins, so one vendor's slow minutes do not set
+    the analysis latency.
+    """
+
+    name = "router"
+
+    def __init__(
+        self,
+        primary: LLMProvider,
+        fallback: LLMProvider = None,
+        timeout: float = None,
+        hedge_after: float = None
+    ):
+        """
+        Initialize router.
+
+        Args:
+            primary: Provider tried first
+            fallback: Provider used on failure (None disables failover)
+            timeout: Seconds to wait for a provider before failing over
+                (default: Config.LLM_TIMEOUT)
+            hedge_after: Seconds after which the fallback is raced against a
+                still-running primary; 0 disables hedging
+                (default: Config.LLM_HEDGE_AFTER)
+        """
+        super().__init__()
+        self.primary = primary
+        self.fallback = fallback
+        self.timeout = timeout or Config.LLM_TIMEOUT
+        self.hedge_after = Config.LLM_HEDGE_AFTER if hedge_after is None else hedge_after
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="llm")
+
+    @property
+    def display_name(self) -> str:
+        """Name of the primary provider."""
+        return self.primary.display_name
+
+    @property
+    def model(self) -> str:
+        """Model of the primary provider."""
+        return self.primary.model
+
+    def generate(self, prompt: Union[str, PromptSpec]) -> LLMResponse:
+        """
+        Run one completion on the primary provider, failing over if needed.
+
+        Args:
+            prompt: Plain prompt string or structured PromptSpec
+
+        Returns:
+            Normalized response of whichever provider answered
+
+        Raises:
+            Exception: The last provider error if every provider failed
+        """
+        if self.fallback is None:
+            done, _ = wait([self._submit(self.primary, prompt)], timeout=self.timeout)
+            if not done:
+                raise LLMTimeoutError(f"No LLM provider answered within {self.timeout:.0f}s")
+            return done.pop().result()
+
+        primary = self._submit(self.primary, prompt)
+        window = self._first_window()
+
+        done, _ = wait([primary], timeout=window)
+        if done and primary.exception() is None:
+            return primary.result()
+
+        self._log_failover(primary.exception() if done else None, window)
+        pending: Set[Future] = set() if done else {primary}
+        pending.add(self._submit(self.fallback, prompt))
+
+        # Race whatever is still running; the first success wins
+        error: Optional[BaseException] = primary.exception() if done else None
+        deadline = time.monotonic() + self.timeout
+        while pending:
+            done, pending = wait(pending, timeout=max(0.0, deadline - time.monotonic()),
+                                 return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                if future.exception() is None:
+                    return self._winner(future.result())
+                error = future.exception()
+
+        if error is None or pending:
+            error = LLMTimeoutError(f"No LLM provider answered within {self.timeout:.0f}s")
+        raise error
+
+    async def agenerate(self, prompt: Union[str, PromptSpec]) -> LLMResponse:
+        """
+        Async variant of ``generate``; losing calls are cancelled.
+
+        Args:
+            prompt: Plain prompt string or structured PromptSpec
+
+        Returns:
+            Normalized response of whichever provider answered
+
+        Raises:
+            Exception: The last provider error if every provider failed
+        """
+        if self.fallback is None:
+            try:
+                return await asyncio.wait_for(self._acall(self.primary, prompt), self.timeout)
+            except asyncio.TimeoutError:
+                raise LLMTimeoutError(f"No LLM provider answered within {self.timeout:.0f}s")
+
+        primary = asyncio.ensure_future(self._acall(self.primary, prompt))
+        window = self._first_window()
+
+        done, _ = await asyncio.wait({primary}, timeout=window)
+        if done and primary.exception() is None:
+            return primary.result()
+
+        self._log_failover(primary.exception() if done else None, window)
+        pending = set() if done else {primary}
+        pending.add(asyncio.ensure_future(self._acall(self.fallback, prompt)))
+
+        error: Optional[BaseException] = primary.exception() if done else None
+        deadline = time.monotonic() + self.timeout
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, timeout=max(0.0, deadline - time.monotonic()),
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    break
+                for task in done:
+                    if task.exception() is None:
+                        return self._winner(task.result())
+                    error = task.exception()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if error is None or pending:
+            error = LLMTimeoutError(f"No LLM provider answered within {self.timeout:.0f}s")
+        raise error
+
+    def _first_window(self) -> float:
+        """Seconds to give the primary alone before involving the fallback."""
+        if self.hedge_after and self.hedge_after < self.timeout:
+            return self.hedge_after
+        return self.timeout
+
+    def _log_failover(self, error: Optional[BaseException], window: float) -> None:
+        reason = f"failed ({error})" if error else f"slow (no answer after {window:.0f}s)"
+        self.logger.warning(
+            f"⚠️  {self.primary.display_name} {reason}, trying {self.fallback.display_name}"
+        )
+        metrics.increment("llm_failovers_total", primary=self.primary.name, fallback=self.fallback.name)
+
+    def _winner(self, response: LLMResponse) -> LLMResponse:
+        response.failover = response.provider != self.primary.name
+        return response
+
+    def _submit(self, provider: LLMProvider, prompt: Union[str, PromptSpec]) -> Future:
+        """Run one provider call on the router's pool."""
+        return self._executor.submit(self._call, provider, prompt)
+
+    def _call(self, provider: LLMProvider, prompt: Union[str, PromptSpec]) -> LLMResponse:
+        """Call a provider through its circuit breaker and time it."""
+        breaker = get_breaker(f"llm:{provider.name}")
+        probe = breaker.before_call()
+
+        start = time.monotonic()
+        try:
+            response = provider.generate(prompt)
+        except Exception as e:
+            # Only outages and overload count against the provider
+            if is_retriable_error(e):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            raise
+        else:
+            breaker.record_success()
+        finally:
+            if probe:
+                breaker.release_probe()
+
+        response.latency = time.monotonic() - start
+        return response
+
+    async def _acall(self, provider: LLMProvider, prompt: Union[str, PromptSpec]) -> LLMResponse:
+        """Await a provider call through its circuit breaker and time it."""
+        breaker = get_breaker(f"llm:{provider.name}")
+        probe = breaker.before_call()
+
+        start = time.monotonic()
+        try:
+            response = await provider.agenerate(prompt)
+        except Exception as e:
+            if is_retriable_error(e):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            raise
+        else:
+            breaker.record_success()
+        finally:
+            # A call cancelled because the other one won says nothing about
+            # the provider's health: it is not recorded, only its probe freed
+            if probe:
+                breaker.release_probe()
+
+        response.latency = time.monotonic() - start
+        return response
+
+    def open_context(self, context: PromptSpec) -> bool:
+        """
+        Prepare caching of an interactive session's context on the primary.
+
+        Args:
+            context: Session prefix (system prompt and context blocks)
+
+        Returns:
+            True if follow-ups will reuse a cached prefix
+        """
+        return self.primary.open_context(context)
+
+    def close_context(self) -> None:
+        """Release the session context on every provider."""
+        for provider in (self.primary, self.fallback):
+            if provider is not None:
+                provider.close_context()
+
+
+PROVIDERS = {
+    "claude": (ClaudeAnalyzer, "ANTHROPIC_API_KEY"),
+    "gemini": (GeminiAnalyzer, "GEMINI_API_KEY"),
+}
+
+
+def create_analyzer(model: str) -> LLMProvider:
+    """
+    Create the analyzer for a model choice.
+
+    When ``Config.LLM_FAILOVER`` is enabled and the other provider has an API
+    key, the chosen provider is wrapped in an LLMRouter with the other one as
+    fallback.
+
+    Args:
+        model: Primary provider name (claude or gemini)
+
+    Returns:
+        Analyzer implementing the LLMProvider interface
+    """
+    name = model.lower()
+    provider_class, _ = PROVIDERS[name]
+    primary = provider_class()
+
+    if not Config.LLM_FAILOVER:
+        return primary
+
+    for other, (fallback_class, key_name) in PROVIDERS.items():
+        if other != name and getattr(Config, key_name):
+            return LLMRouter(primary, fallback_class())
+
+    return primary
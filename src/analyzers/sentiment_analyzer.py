@@ -48,72 +48,16 @@ class SentimentAnalyzer:
 
         self.logger.info(f"Analyzing sentiment for {len(data_items)} items")
 
-        sentiments = []
-        positive_count = 0
-        negative_count = 0
-        neutral_count = 0
-        total_compound = 0.0
-
+        accumulator = SentimentAccumulator(self)
         for item in data_items:
-            # Analyze content field
-            content = item.get("content", "") or item.get("title", "")
-            if not content:
-                continue
-
-            sentiment = self.analyze_sentiment(content)
-            sentiments.append(sentiment)
-
-            # Categorize based on compound score
-            compound = sentiment["compound"]
-            total_compound += compound
-
-            if compound >= 0.05:
-                positive_count += 1
-            elif compound <= -0.05:
-                negative_count += 1
-            else:
-                neutral_count += 1
-
-        if not sentiments:
-            return self._empty_result()
-
-        total = len(sentiments)
-        avg_compound = total_compound / total if total > 0 else 0.0
-
-        # Calculate percentages
-        positive_pct = (positive_count / total * 100) if total > 0 else 0
-        negative_pct = (negative_count / total * 100) if total > 0 else 0
-        neutral_pct = (neutral_count / total * 100) if total > 0 else 0
-
-        # Determine overall sentiment
-        if avg_compound >= 0.05:
-            overall = "Positive"
-        elif avg_compound <= -0.05:
-            overall = "Negative"
-        else:
-            overall = "Neutral"
-
-        result = {
-            "overall": overall,
-            "average_compound": round(avg_compound, 3),
-            "distribution": {
-                "positive": {
-                    "count": positive_count,
-                    "percentage": round(positive_pct, 1)
-                },
-                "neutral": {
-                    "count": neutral_count,
-                    "percentage": round(neutral_pct, 1)
-                },
-                "negative": {
-                    "count": negative_count,
-                    "percentage": round(negative_pct, 1)
-                }
-            },
-            "total_analyzed": total
-        }
-
-        self.logger.info(f"Sentiment analysis complete: {overall} (compound: {avg_compound:.3f})")
+            accumulator.add(item)
+
+        result = accumulator.result()
+        if accumulator.total:
+            self.logger.info(
+                f"Sentiment analysis complete: {result['overall']} "
+                f"(compound: {accumulator.average_compound:.3f})"
+            )
         return result
 
     def _empty_result(self) -> Dict[str, Any]:
@@ -145,3 +89,78 @@ class SentimentAnalyzer:
             return "Negative"
         else:
             return "Neutral"
+
+
+class SentimentAccumulator:
+    """
+    Running sentiment statistics, updated one item at a time.
+
+    Items can be added while collection is still running; ``result`` is
+    available at any point and matches ``SentimentAnalyzer.analyze_items``
+    over the same items.
+    """
+
+    def __init__(self, analyzer: SentimentAnalyzer = None):
+        """
+        Initialize accumulator.
+
+        Args:
+            analyzer: Analyzer used to score items (default: a new one)
+        """
+        self.analyzer = analyzer or SentimentAnalyzer()
+        self.total = 0
+        self.total_compound = 0.0
+        self.counts = {"positive": 0, "neutral": 0, "negative": 0}
+
+    def add(self, item: Dict[str, Any]) -> None:
+        """
+        Score one data item and update the statistics.
+
+        Args:
+            item: Collected data item
+        """
+        # Analyze content field
+        content = item.get("content", "") or item.get("title", "")
+        if not content:
+            return
+
+        compound = self.analyzer.analyze_sentiment(content)["compound"]
+        self.total += 1
+        self.total_compound += compound
+
+        # Categorize based on compound score
+        if compound >= 0.05:
+            self.counts["positive"] += 1
+        elif compound <= -0.05:
+            self.counts["negative"] += 1
+        else:
+            self.counts["neutral"] += 1
+
+    @property
+    def average_compound(self) -> float:
+        """Mean compound score of the items seen so far."""
+        return self.total_compound / self.total if self.total else 0.0
+
+    def result(self) -> Dict[str, Any]:
+        """
+        Get the sentiment statistics of the items seen so far.
+
+        Returns:
+            Dictionary with overall sentiment statistics
+        """
+        if not self.total:
+            return self.analyzer._empty_result()
+
+        avg_compound = self.average_compound
+        return {
+            "overall": self.analyzer.get_sentiment_label(avg_compound),
+            "average_compound": round(avg_compound, 3),
+            "distribution": {
+                label: {
+                    "count": count,
+                    "percentage": round(count / self.total * 100, 1)
+                }
+                for label, count in self.counts.items()
+            },
+            "total_analyzed": self.total
+        }
@@ -0,0 +1,162 @@
+"""Compact, columnar summary of the collected sources."""
+
+from typing import Any, Dict, Iterable, Iterator, List
+
+# Characters of an X post kept for reports and the interactive session
+CONTENT_PREVIEW = 200
+
+
+class SourceSummary:
+    """
+    The fields of every collected item that reports show, one list per field.
+
+    Items are projected as they are collected, so rendering a report needs
+    no pass over the raw data and no per-item dictionaries: renderers zip
+    the columns, and dictionaries are only built a chunk at a time when
+    the summary is written as JSON (``chunks``). Post text is cut to
+    ``CONTENT_PREVIEW`` characters.
+    """
+
+    __slots__ = (
+        "x_author", "x_content", "x_date", "x_url", "x_likes",
+        "web_title", "web_source", "web_date", "web_url",
+    )
+
+    def __init__(self):
+        """Initialize empty columns."""
+        self.x_author: List[str] = []
+        self.x_content: List[str] = []
+        self.x_date: List[str] = []
+        self.x_url: List[str] = []
+        self.x_likes: List[Any] = []
+        self.web_title: List[str] = []
+        self.web_source: List[str] = []
+        self.web_date: List[str] = []
+        self.web_url: List[str] = []
+
+    @classmethod
+    def from_items(cls, items: Iterable[Dict[str, Any]]) -> "SourceSummary":
+        """
+        Summarize already collected items.
+
+        Args:
+            items: Collected data items
+
+        Returns:
+            Source summary
+        """
+        summary = cls()
+        for item in items:
+            summary.add(item)
+        return summary
+
+    @classmethod
+    def from_sidecar(cls, sources: Dict[str, Any]) -> "SourceSummary":
+        """
+        Rebuild a summary from its JSON form (a sidecar's ``sources``).
+
+        Args:
+            sources: Dictionary with ``x`` and ``web`` row lists
+
+        Returns:
+            Source summary
+        """
+        summary = cls()
+        for row in sources.get("x", []):
+            summary.x_author.append(row.get("author", "Unknown"))
+            summary.x_content.append(row.get("content", ""))
+            summary.x_date.append(row.get("date", ""))
+            summary.x_url.append(row.get("url", ""))
+            summary.x_likes.append((row.get("engagement") or {}).get("likes", 0))
+        for row in sources.get("web", []):
+            summary.web_title.append(row.get("title", "Untitled"))
+            summary.web_source.append(row.get("source", "Unknown"))
+            summary.web_date.append(row.get("date", ""))
+            summary.web_url.append(row.get("url", ""))
+        return summary
+
+    def add(self, item: Dict[str, Any]) -> None:
+        """
+        Project one collected item into the columns.
+
+        Args:
+            item: Collected data item; items of unknown sources are ignored
+        """
+        source = item.get("source")
+        if source == "x":
+            self.x_author.append(item.get("author", ""))
+            self.x_content.append(item.get("content", "")[:CONTENT_PREVIEW] + "...")
+            self.x_date.append(item.get("date", ""))
+            self.x_url.append(item.get("url", ""))
+            self.x_likes.append((item.get("engagement") or {}).get("likes", 0))
+        elif source == "web":
+            self.web_title.append(item.get("title", ""))
+            self.web_source.append(item.get("author", ""))
+            self.web_date.append(item.get("date", ""))
+            self.web_url.append(item.get("url", ""))
+
+    @property
+    def x_count(self) -> int:
+        """Number of X posts."""
+        return len(self.x_url)
+
+    @property
+    def web_count(self) -> int:
+        """Number of web results."""
+        return len(self.web_url)
+
+    def __len__(self) -> int:
+        return self.x_count + self.web_count
+
+    def x_rows(self) -> Iterator[tuple]:
+        """Yield (author, content, date, url, likes) per X post."""
+        return zip(self.x_author, self.x_content, self.x_date, self.x_url, self.x_likes)
+
+    def web_rows(self) -> Iterator[tuple]:
+        """Yield (title, source, date, url) per web result."""
+        return zip(self.web_title, self.web_source, self.web_date, self.web_url)
+
+    def chunks(self, source: str, size: int) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Build the JSON rows of one source, ``size`` rows at a time.
+
+        Args:
+            source: "x" or "web"
+            size: Rows per chunk
+
+        Yields:
+            Lists of row dictionaries (the sidecar's ``sources`` layout)
+        """
+        if source == "x":
+            rows = (
+                {"author": author, "content": content, "date": date, "url": url,
+                 "engagement": {"likes": likes}}
+                for author, content, date, url, likes in self.x_rows()
+            )
+        else:
+            rows = (
+                {"title": title, "source": site, "date": date, "url": url}
+                for title, site, date, url in self.web_rows()
+            )
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def to_sidecar(self) -> Dict[str, Any]:
+        """
+        Build the JSON form of the summary.
+
+        Returns:
+            Dictionary with counts and ``x`` / ``web`` row lists
+        """
+        return {
+            "x_count": self.x_count,
+            "web_count": self.web_count,
+            "x": [row for chunk in self.chunks("x", 1024) for row in chunk],
+            "web": [row for chunk in self.chunks("web", 1024) for row in chunk],
+        }
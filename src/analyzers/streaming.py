@@ -0,0 +1,98 @@
+"""Enhanced analysis fed by the collection stream."""
+
+from typing import Any, Dict, List, Tuple
+
+from src.utils.logger import get_logger
+from src.utils.metrics import metrics
+from .keyword_extractor import KeywordAccumulator
+from .sentiment_analyzer import SentimentAccumulator
+from .sources import SourceSummary
+from .trend_analyzer import TrendAccumulator
+
+
+logger = get_logger("streaming")
+
+
+class StreamingAnalysis:
+    """
+    Sentiment, keyword and trend accumulators updated per collected item.
+
+    Feeding items as they arrive spreads the per-item work over the time
+    spent waiting on the network, so the aggregates are ready when
+    collection ends. An accumulator that raises is dropped; asking for its
+    result re-raises the error, as the batch analysis step would have.
+    Each item is also projected into ``sources``, the summary reports show.
+    """
+
+    def __init__(self):
+        """Initialize empty accumulators."""
+        self.items = 0
+        self.accumulators: Dict[str, Any] = {
+            "sentiment": SentimentAccumulator(),
+            "keywords": KeywordAccumulator(),
+            "trends": TrendAccumulator(),
+        }
+        self.errors: Dict[str, Exception] = {}
+        self.sources = SourceSummary()
+
+    def add(self, item: Dict[str, Any]) -> None:
+        """
+        Feed one collected item to every accumulator.
+
+        Args:
+            item: Collected data item
+        """
+        self.items += 1
+        self.sources.add(item)
+        for name, accumulator in self.accumulators.items():
+            if name in self.errors:
+                continue
+            try:
+                accumulator.add(item)
+            except Exception as e:
+                logger.warning(f"⚠️  Streaming {name} analysis failed: {e}")
+                self.errors[name] = e
+
+    def sentiment(self) -> Dict[str, Any]:
+        """Sentiment statistics of the items so far."""
+        return self._accumulator("sentiment").result()
+
+    def keywords(self, top_n: int = 20) -> List[Tuple[str, float]]:
+        """Top YAKE keywords of the items so far."""
+        return self._accumulator("keywords").result(top_n)
+
+    def trends(self) -> Dict[str, Any]:
+        """Temporal trends of the items so far."""
+        return self._accumulator("trends").result()
+
+    def summary(self) -> str:
+        """
+        Describe the partial statistics in one line for progress displays.
+
+        Returns:
+            Summary line (cheap enough to refresh a few times per second)
+        """
+        if not self.items:
+            return "📊 Waiting for items..."
+
+        parts = [f"📊 {self.items} items"]
+        if "sentiment" not in self.errors:
+            sentiment = self.accumulators["sentiment"]
+            if sentiment.total:
+                label = sentiment.analyzer.get_sentiment_label(sentiment.average_compound)
+                parts.append(f"{label} ({sentiment.average_compound:+.2f})")
+        if "keywords" not in self.errors:
+            top = [term for term, _ in self.accumulators["keywords"].top_candidates(3)]
+            if top:
+                parts.append("top: " + ", ".join(top))
+        if "trends" not in self.errors:
+            days = sum(1 for day in self.accumulators["trends"].buckets if day != "Unknown")
+            if days:
+                parts.append(f"{days} days")
+        return " · ".join(parts)
+
+    def _accumulator(self, name: str) -> Any:
+        if name in self.errors:
+            raise self.errors[name]
+        metrics.increment("items_total", self.items)
+        return self.accumulators[name]
@@ -1,8 +1,8 @@
 """Temporal trend analysis for research data."""
 
 from typing import Dict, List, Any, Optional
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from collections import defaultdict
 from src.utils.logger import get_logger
 
 
@@ -31,67 +31,40 @@ class TrendAnalyzer:
 
         self.logger.info(f"Analyzing temporal trends for {len(data_items)} items")
 
-        # Group items by date
-        items_by_date = self._group_by_date(data_items)
-
-        # Analyze X engagement trends if available
-        engagement_trends = self._analyze_engagement_trends(data_items)
-
-        # Get timeline summary
-        timeline = self._get_timeline_summary(items_by_date)
-
-        # Calculate posting frequency
-        frequency = self._calculate_frequency(items_by_date)
+        accumulator = TrendAccumulator(self)
+        for item in data_items:
+            accumulator.add(item)
 
-        result = {
-            "timeline": timeline,
-            "frequency": frequency,
-            "engagement_trends": engagement_trends,
-            "total_dates": len(items_by_date),
-            "date_range": self._get_date_range(items_by_date)
-        }
+        result = accumulator.result()
 
-        self.logger.info(f"Trend analysis complete: {len(items_by_date)} unique dates")
+        self.logger.info(f"Trend analysis complete: {result['total_dates']} unique dates")
         return result
 
-    def _group_by_date(
-        self,
-        data_items: List[Dict[str, Any]]
-    ) -> Dict[str, List[Dict[str, Any]]]:
+    def date_key(self, item: Dict[str, Any]) -> str:
         """
-        Group data items by date.
+        Get the day a data item belongs to.
 
         Args:
-            data_items: List of data items
+            item: Data item
 
         Returns:
-            Dictionary mapping date string to items
+            Date string (YYYY-MM-DD), or "Unknown"
         """
-        grouped = defaultdict(list)
+        date_str = item.get("date", "")
+        if not date_str:
+            # Try to parse from metadata
+            date_str = item.get("metadata", {}).get("date", "Unknown")
 
-        for item in data_items:
-            date_str = item.get("date", "")
-            if not date_str:
-                # Try to parse from metadata
-                date_str = item.get("metadata", {}).get("date", "Unknown")
-
-            # Normalize date to just the date part (no time)
-            try:
-                if date_str and date_str != "Unknown":
-                    # Try to parse various date formats
-                    parsed_date = self._parse_date(date_str)
-                    if parsed_date:
-                        date_key = parsed_date.strftime("%Y-%m-%d")
-                    else:
-                        date_key = "Unknown"
-                else:
-                    date_key = "Unknown"
-            except Exception:
-                date_key = "Unknown"
-
-            grouped[date_key].append(item)
-
-        return dict(grouped)
+        # Normalize date to just the date part (no time)
+        try:
+            if date_str and date_str != "Unknown":
+                # Try to parse various date formats
+                parsed_date = self._parse_date(date_str)
+                if parsed_date:
+                    return parsed_date.strftime("%Y-%m-%d")
+        except Exception:
+            pass
+        return "Unknown"
 
     def _parse_date(self, date_str: str) -> Optional[datetime]:
         """
@@ -128,15 +101,12 @@ class TrendAnalyzer:
 
         return None
 
-    def _get_timeline_summary(
-        self,
-        items_by_date: Dict[str, List[Dict[str, Any]]]
-    ) -> List[Dict[str, Any]]:
+    def _get_timeline_summary(self, buckets: Dict[str, "DateBucket"]) -> List[Dict[str, Any]]:
         """
         Generate timeline summary.
 
         Args:
-            items_by_date: Items grouped by date
+            buckets: Per-date statistics
 
         Returns:
             List of timeline entries
@@ -144,48 +114,31 @@ class TrendAnalyzer:
         timeline = []
 
         # Sort dates
-        sorted_dates = sorted([d for d in items_by_date.keys() if d != "Unknown"])
-
-        for date in sorted_dates:
-            items = items_by_date[date]
-            count = len(items)
-
-            # Calculate average engagement for this date
-            total_engagement = 0
-            engagement_count = 0
+        for date in sorted(d for d in buckets if d != "Unknown"):
+            bucket = buckets[date]
 
-            for item in items:
-                if item.get("source") == "x":
-                    engagement = item.get("engagement", {})
-                    likes = engagement.get("likes", 0)
-                    retweets = engagement.get("retweets", 0)
-                    total_engagement += likes + retweets
-                    engagement_count += 1
-
-            avg_engagement = total_engagement / engagement_count if engagement_count > 0 else 0
+            # Average engagement of this date's X posts
+            avg_engagement = bucket.engagement / bucket.x_posts if bucket.x_posts > 0 else 0
 
             timeline.append({
                 "date": date,
-                "count": count,
+                "count": bucket.count,
                 "avg_engagement": round(avg_engagement, 1)
             })
 
         return timeline
 
-    def _calculate_frequency(
-        self,
-        items_by_date: Dict[str, List[Dict[str, Any]]]
-    ) -> Dict[str, Any]:
+    def _calculate_frequency(self, buckets: Dict[str, "DateBucket"]) -> Dict[str, Any]:
         """
         Calculate posting frequency statistics.
 
         Args:
-            items_by_date: Items grouped by date
+            buckets: Per-date statistics
 
         Returns:
             Frequency statistics
         """
-        dates = [d for d in items_by_date.keys() if d != "Unknown"]
+        dates = [d for d in buckets if d != "Unknown"]
 
         if not dates:
             return {
@@ -195,7 +148,7 @@ class TrendAnalyzer:
                 "min_per_day": 0
             }
 
-        counts = [len(items_by_date[d]) for d in dates]
+        counts = [buckets[d].count for d in dates]
 
         return {
             "total_days": len(dates),
@@ -204,62 +157,17 @@ class TrendAnalyzer:
             "min_per_day": min(counts) if counts else 0
         }
 
-    def _analyze_engagement_trends(
-        self,
-        data_items: List[Dict[str, Any]]
-    ) -> Dict[str, Any]:
-        """
-        Analyze engagement trends for X posts.
-
-        Args:
-            data_items: List of data items
-
-        Returns:
-            Engagement trend statistics
-        """
-        x_items = [item for item in data_items if item.get("source") == "x"]
-
-        if not x_items:
-            return {
-                "available": False,
-                "total_posts": 0
-            }
-
-        total_likes = 0
-        total_retweets = 0
-        total_replies = 0
-
-        for item in x_items:
-            engagement = item.get("engagement", {})
-            total_likes += engagement.get("likes", 0)
-            total_retweets += engagement.get("retweets", 0)
-            total_replies += engagement.get("replies", 0)
-
-        count = len(x_items)
-
-        return {
-            "available": True,
-            "total_posts": count,
-            "avg_likes": round(total_likes / count, 1) if count > 0 else 0,
-            "avg_retweets": round(total_retweets / count, 1) if count > 0 else 0,
-            "avg_replies": round(total_replies / count, 1) if count > 0 else 0,
-            "total_engagement": total_likes + total_retweets + total_replies
-        }
-
-    def _get_date_range(
-        self,
-        items_by_date: Dict[str, List[Dict[str, Any]]]
-    ) -> Dict[str, str]:
+    def _get_date_range(self, buckets: Dict[str, "DateBucket"]) -> Dict[str, str]:
         """
         Get date range of data.
 
         Args:
-            items_by_date: Items grouped by date
+            buckets: Per-date statistics
 
         Returns:
             Dictionary with start and end dates
         """
-        dates = [d for d in items_by_date.keys() if d != "Unknown"]
+        dates = [d for d in buckets if d != "Unknown"]
 
         if not dates:
             return {"start": "Unknown", "end": "Unknown"}
@@ -288,3 +196,100 @@ class TrendAnalyzer:
             "total_dates": 0,
             "date_range": {"start": "Unknown", "end": "Unknown"}
         }
+
+
+@dataclass
+class DateBucket:
+    """Item statistics of one day."""
+
+    count: int = 0
+    engagement: int = 0  # likes and retweets of the day's X posts
+    x_posts: int = 0
+
+
+class TrendAccumulator:
+    """
+    Running temporal statistics, updated one item at a time.
+
+    Items are bucketed by day as they arrive; ``result`` is available at any
+    point and matches ``TrendAnalyzer.analyze_temporal_trends`` over the
+    same items.
+    """
+
+    def __init__(self, analyzer: TrendAnalyzer = None):
+        """
+        Initialize accumulator.
+
+        Args:
+            analyzer: Analyzer used for date parsing and summaries
+                (default: a new one)
+        """
+        self.analyzer = analyzer or TrendAnalyzer()
+        self.buckets: Dict[str, DateBucket] = {}
+        self.items = 0
+        self.x_posts = 0
+        self.likes = 0
+        self.retweets = 0
+        self.replies = 0
+
+    def add(self, item: Dict[str, Any]) -> None:
+        """
+        Bucket one data item.
+
+        Args:
+            item: Collected data item
+        """
+        self.items += 1
+        key = self.analyzer.date_key(item)
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = DateBucket()
+        bucket.count += 1
+
+        if item.get("source") == "x":
+            engagement = item.get("engagement", {})
+            likes = engagement.get("likes", 0)
+            retweets = engagement.get("retweets", 0)
+
+            bucket.engagement += likes + retweets
+            bucket.x_posts += 1
+            self.x_posts += 1
+            self.likes += likes
+            self.retweets += retweets
+            self.replies += engagement.get("replies", 0)
+
+    def result(self) -> Dict[str, Any]:
+        """
+        Get the temporal trends of the items seen so far.
+
+        Returns:
+            Dictionary with temporal trend information
+        """
+        if not self.items:
+            return self.analyzer._empty_result()
+
+        return {
+            "timeline": self.analyzer._get_timeline_summary(self.buckets),
+            "frequency": self.analyzer._calculate_frequency(self.buckets),
+            "engagement_trends": self._engagement_trends(),
+            "total_dates": len(self.buckets),
+            "date_range": self.analyzer._get_date_range(self.buckets)
+        }
+
+    def _engagement_trends(self) -> Dict[str, Any]:
+        """Engagement statistics of the X posts seen so far."""
+        if not self.x_posts:
+            return {
+                "available": False,
+                "total_posts": 0
+            }
+
+        count = self.x_posts
+        return {
+            "available": True,
+            "total_posts": count,
+            "avg_likes": round(self.likes / count, 1),
+            "avg_retweets": round(self.retweets / count, 1),
+            "avg_replies": round(self.replies / count, 1),
+            "total_engagement": self.likes + self.retweets + self.replies
+        }
@@ -1,21 +1,30 @@
 """Base collector class."""
 
+import math
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Callable
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
-    RetryError
-)
+from typing import List, Dict, Any, Callable, Iterator, Optional
 import requests
+from requests.adapters import HTTPAdapter
+from src.config import Config
 from src.utils.logger import get_logger
+from src.utils.resilience import get_breaker, hedged_call
+from src.utils.retry import RetryPolicy, is_retriable_error
+from .pagination import (
+    Page,
+    Deadline,
+    DeadlineExceeded,
+    iter_numbered_pages,
+    iter_cursor_pages,
+)
 
 
 class BaseCollector(ABC):
     """Base class for data collectors."""
 
+    # How the source pages through results: "page" (numbered, fetched
+    # concurrently) or "cursor" (sequential, each page names the next)
+    PAGINATION = "page"
+
     def __init__(self, api_key: str, api_url: str):
         """
         Initialize collector.
@@ -27,11 +36,27 @@ class BaseCollector(ABC):
         self.api_key = api_key
         self.api_url = api_url
         self.logger = get_logger(self.__class__.__name__)
-        self.retry_attempts = 5
-        self.retry_min_wait = 2
-        self.retry_max_wait = 30
+        self.retry_attempts = Config.MAX_RETRIES + 1
+        self.retry_min_wait = Config.RETRY_DELAY
+        self.retry_max_wait = Config.RETRY_MAX_WAIT
+        self.session = self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        """
+        Create requests session.
+
+        Retries are handled by _fetch_with_retry (one retry layer per run),
+        so the transport adapter itself never retries.
+
+        Returns:
+            Configured requests session
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(max_retries=0)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
 
-    @abstractmethod
     def collect(self, topic: str, max_items: int = 20) -> List[Dict[str, Any]]:
         """
         Collect data for the given topic.
@@ -43,6 +68,140 @@ class BaseCollector(ABC):
         Returns:
             List of collected data items
         """
+        return list(self.stream(topic, max_items))
+
+    def stream(
+        self,
+        topic: str,
+        max_items: int = 20,
+        deadline: Optional[Deadline] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream collected items page by page as they arrive.
+
+        Collection stops once ``max_items`` items were yielded, the source
+        runs out of pages, or the deadline expires (keeping what arrived).
+
+        Args:
+            topic: Research topic
+            max_items: Maximum number of items to collect
+            deadline: Shared collection deadline (default: Config.COLLECTION_DEADLINE)
+
+        Yields:
+            Formatted data items
+        """
+        deadline = deadline or Deadline(Config.COLLECTION_DEADLINE)
+        return self._stream_pages(topic, max_items, deadline)
+
+    def _stream_pages(
+        self,
+        query: Any,
+        max_items: int,
+        deadline: Deadline,
+        page_size: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Page through the results for one query and yield its items.
+
+        Args:
+            query: Research topic, or a collector-specific query target
+            max_items: Maximum number of items to yield
+            deadline: Shared collection deadline
+            page_size: Items per request (default: min(max_items, Config.PAGE_SIZE))
+
+        Yields:
+            Formatted data items
+        """
+        page_size = page_size or min(max_items, Config.PAGE_SIZE)
+        num_pages = math.ceil(max_items / page_size)
+
+        if self.PAGINATION == "cursor":
+            pages = iter_cursor_pages(
+                lambda cursor: self._guarded_fetch(query, page_size, deadline, cursor=cursor),
+                deadline,
+                max_pages=num_pages
+            )
+        else:
+            pages = iter_numbered_pages(
+                lambda page: self._guarded_fetch(query, page_size, deadline, page=page),
+                num_pages,
+                Config.MAX_CONCURRENT_PAGES,
+                deadline
+            )
+
+        yielded = 0
+        try:
+            for page in pages:
+                for item in page.items:
+                    yield item
+                    yielded += 1
+                    if yielded >= max_items:
+                        return
+        except DeadlineExceeded as e:
+            self.logger.warning(f"⏱️  Collection deadline reached after {yielded} items ({e})")
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"❌ Error collecting data after {yielded} items: {e}")
+        finally:
+            pages.close()
+
+    def _guarded_fetch(self, query: Any, page_size: int, deadline: Deadline, **kwargs) -> Page:
+        """
+        Fetch a page through the retry policy and the endpoint's circuit breaker.
+
+        Known-bad endpoints fail immediately with CircuitOpenError instead of
+        waiting for timeouts; slow calls may be hedged (see hedged_call).
+
+        Args:
+            query: Research topic, or a collector-specific query target
+            page_size: Number of items requested per page
+            deadline: Shared collection deadline
+            **kwargs: ``page`` or ``cursor`` for _fetch_page
+
+        Returns:
+            Page with formatted items and the next cursor, if any
+        """
+        endpoint = self._endpoint_name(query)
+        return self._fetch_with_retry(
+            get_breaker(endpoint).call,
+            hedged_call, endpoint, self._fetch_page, query, page_size, deadline,
+            deadline=deadline,
+            **kwargs
+        )
+
+    def _endpoint_name(self, query: Any) -> str:
+        """
+        Name the endpoint a query is sent to, for circuit breaking.
+
+        Args:
+            query: Research topic, or a collector-specific query target
+
+        Returns:
+            Endpoint name
+        """
+        return f"{self.__class__.__name__} {self.api_url}"
+
+    @abstractmethod
+    def _fetch_page(
+        self,
+        query: Any,
+        page_size: int,
+        deadline: Deadline,
+        page: int = 0,
+        cursor: Optional[str] = None
+    ) -> Page:
+        """
+        Fetch a single page of results.
+
+        Args:
+            query: Research topic, or a collector-specific query target
+            page_size: Number of items requested per page
+            deadline: Shared collection deadline (bounds the request timeout)
+            page: Zero-based page number (numbered pagination)
+            cursor: Cursor returned by the previous page (cursor pagination)
+
+        Returns:
+            Page with formatted items and the next cursor, if any
+        """
         pass
 
     def _format_result(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -63,39 +222,17 @@ class BaseCollector(ABC):
             "metadata": raw_data.get("metadata", {}),
         }
 
-    def _create_retry_decorator(self):
-        """
-        Create a retry decorator with exponential backoff.
-
-        Returns:
-            Configured retry decorator
-        """
-        return retry(
-            stop=stop_after_attempt(self.retry_attempts),
-            wait=wait_exponential(
-                multiplier=1,
-                min=self.retry_min_wait,
-                max=self.retry_max_wait
-            ),
-            retry=retry_if_exception_type((
-                requests.exceptions.RequestException,
-                requests.exceptions.Timeout,
-                requests.exceptions.ConnectionError,
-            )),
-            reraise=True,
-            before_sleep=lambda retry_state: self.logger.warning(
-                f"Retry attempt {retry_state.attempt_number}/{self.retry_attempts} "
-                f"after {retry_state.outcome.exception()}"
-            )
-        )
-
-    def _fetch_with_retry(self, func: Callable, *args, **kwargs) -> Any:
+    def _fetch_with_retry(self, func: Callable, *args, deadline: Deadline = None, **kwargs) -> Any:
         """
         Execute a function with retry logic.
 
+        Retries draw from the run's shared retry budget, back off with jitter
+        (honoring Retry-After) and never wait past the deadline.
+
         Args:
             func: Function to execute
             *args: Positional arguments for the function
+            deadline: Optional deadline bounding the retries
             **kwargs: Keyword arguments for the function
 
         Returns:
@@ -104,14 +241,15 @@ class BaseCollector(ABC):
         Raises:
             Exception: If all retry attempts fail
         """
-        retry_decorator = self._create_retry_decorator()
-        retried_func = retry_decorator(func)
-
-        try:
-            return retried_func(*args, **kwargs)
-        except RetryError as e:
-            self.logger.error(f"All retry attempts failed: {e}")
-            raise e.last_attempt.exception()
+        policy = RetryPolicy(
+            self.__class__.__name__,
+            max_attempts=self.retry_attempts,
+            min_wait=self.retry_min_wait,
+            max_wait=self.retry_max_wait,
+            classify=self._is_retriable_error,
+            deadline=deadline
+        )
+        return policy.call(func, *args, **kwargs)
 
     def _is_retriable_error(self, exception: Exception) -> bool:
         """
@@ -123,22 +261,4 @@ class BaseCollector(ABC):
         Returns:
             True if the error is retriable, False otherwise
         """
-        # Don't retry authentication errors (401, 403)
-        if isinstance(exception, requests.exceptions.HTTPError):
-            if exception.response.status_code in [401, 403]:
-                return False
-
-        # Retry on network errors, timeouts, and rate limits
-        if isinstance(exception, (
-            requests.exceptions.Timeout,
-            requests.exceptions.ConnectionError,
-            requests.exceptions.RequestException
-        )):
-            return True
-
-        # Check for rate limit in error message
-        error_msg = str(exception).lower()
-        if "rate limit" in error_msg or "429" in error_msg:
-            return True
-
-        return False
+        return is_retriable_error(exception)
@@ -0,0 +1,173 @@
+"""Schema-detecting normalizer for raw API items."""
+
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional, Tuple
+
+from src.utils.logger import get_logger
+
+
+logger = get_logger("normalizer")
+
+_MISSING = object()
+
+
+class Key:
+    """``item.get(name)``, or ``item.get(name, default)`` when a default is given."""
+
+    def __init__(self, name: str, default: Any = _MISSING):
+        self.name = name
+        self.default = default
+
+    def keys(self) -> Tuple[str, ...]:
+        return (self.name,)
+
+    def compile(self, variant: FrozenSet[str]) -> Optional[str]:
+        if self.name in variant:
+            return f"item[{self.name!r}]"
+        if self.default is _MISSING:
+            return None
+        return repr(self.default)
+
+
+class Nested:
+    """``item.get(outer, {}).get(inner, default)``."""
+
+    def __init__(self, outer: str, inner: str, default: Any):
+        self.outer = outer
+        self.inner = inner
+        self.default = default
+
+    def keys(self) -> Tuple[str, ...]:
+        return (self.outer,)
+
+    def compile(self, variant: FrozenSet[str]) -> Optional[str]:
+        if self.outer in variant:
+            return f"item[{self.outer!r}].get({self.inner!r}, {self.default!r})"
+        return repr(self.default)
+
+
+class Const:
+    """A literal value."""
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def keys(self) -> Tuple[str, ...]:
+        return ()
+
+    def compile(self, variant: FrozenSet[str]) -> Optional[str]:
+        return repr(self.value)
+
+
+class Format:
+    """An f-string built from literal text and other terms."""
+
+    def __init__(self, *parts: Any):
+        self.parts = parts
+
+    def keys(self) -> Tuple[str, ...]:
+        return tuple(k for part in self.parts if not isinstance(part, str) for k in part.keys())
+
+    def compile(self, variant: FrozenSet[str]) -> Optional[str]:
+        pieces = []
+        for part in self.parts:
+            if isinstance(part, str):
+                pieces.append(repr(part))
+            else:
+                pieces.append(f"format({part.compile(variant)}, '')")
+        return " + ".join(pieces)
+
+
+class FirstOf:
+    """``a or b or c`` over terms, in order."""
+
+    def __init__(self, *terms: Any):
+        self.terms = terms
+
+    def keys(self) -> Tuple[str, ...]:
+        return tuple(k for term in self.terms for k in term.keys())
+
+    def compile(self, variant: FrozenSet[str]) -> Optional[str]:
+        # Absent keys evaluate to None, which `or` skips, so they drop out
+        exprs = [expr for expr in (t.compile(variant) for t in self.terms) if expr is not None]
+        if not exprs:
+            return "None"
+        return "(" + " or ".join(exprs) + ")"
+
+
+class SchemaNormalizer:
+    """
+    Maps raw items onto the standard item structure.
+
+    The field spec mirrors ``item.get(a) or item.get(b) or ...`` chains. For
+    each schema variant (the set of spec keys an item carries) the spec is
+    compiled once into a specialized extractor that only reads the keys the
+    variant has, so results are identical to evaluating the chains directly.
+    """
+
+    def __init__(self, name: str, spec: Dict[str, Any], required_keys: Iterable[str]):
+        """
+        Initialize normalizer.
+
+        Args:
+            name: Schema name used in log messages
+            spec: Output field name to term (or nested dict of fields)
+            required_keys: Keys of which at least one must be present for the
+                schema to count as known
+        """
+        self.name = name
+        self.spec = spec
+        self.required_keys = frozenset(required_keys)
+        self.relevant_keys = frozenset(self._spec_keys(spec))
+        self._extractors: Dict[FrozenSet[str], Callable[[Dict[str, Any]], Dict[str, Any]]] = {}
+
+    def normalize(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Normalize one raw item.
+
+        Args:
+            item: Raw item from the API
+
+        Returns:
+            Formatted item
+        """
+        variant = self.relevant_keys.intersection(item)
+        extractor = self._extractors.get(variant)
+        if extractor is None:
+            extractor = self._compile(variant)
+        return extractor(item)
+
+    def _compile(self, variant: FrozenSet[str]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """Generate, cache and return the extractor for a schema variant."""
+        if not variant & self.required_keys:
+            logger.warning(
+                f"⚠️  Unknown {self.name} schema (keys: {sorted(variant) or 'none'}); "
+                f"expected one of {sorted(self.required_keys)}"
+            )
+
+        source = "def extract(item):\n    return " + self._compile_fields(self.spec, variant) + "\n"
+        namespace = {}
+        exec(compile(source, f"<{self.name} extractor>", "exec"), namespace)
+
+        extractor = namespace["extract"]
+        self._extractors[variant] = extractor
+        logger.debug(f"Compiled {self.name} extractor for keys {sorted(variant)}")
+        return extractor
+
+    def _compile_fields(self, fields: Dict[str, Any], variant: FrozenSet[str]) -> str:
+        """Compile a (nested) field spec into a dict display expression."""
+        entries = []
+        for name, term in fields.items():
+            if isinstance(term, dict):
+                expr = self._compile_fields(term, variant)
+            else:
+                expr = term.compile(variant) or "None"
+            entries.append(f"{name!r}: {expr}")
+        return "{" + ", ".join(entries) + "}"
+
+    def _spec_keys(self, fields: Dict[str, Any]) -> Iterable[str]:
+        """Collect every raw key referenced by a field spec."""
+        for term in fields.values():
+            if isinstance(term, dict):
+                yield from self._spec_keys(term)
+            else:
+                yield from term.keys()
@@ -0,0 +1,208 @@
+"""Pagination helpers for multi-page collection."""
+
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from src.utils.metrics import bind_stage
+
+
+@dataclass
+class Page:
+    """A single page of collected items."""
+
+    items: List[Dict[str, Any]] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+class DeadlineExceeded(Exception):
+    """Raised when the collection deadline expires before a page arrives."""
+
+
+class Deadline:
+    """Wall-clock deadline shared by every request of a collection run."""
+
+    def __init__(self, seconds: float):
+        """
+        Initialize deadline.
+
+        Args:
+            seconds: Seconds from now until the deadline expires
+        """
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Return seconds left before the deadline (never negative)."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        """Return True once the deadline has passed."""
+        return self.remaining() <= 0
+
+    def timeout(self, cap: float) -> float:
+        """
+        Get a request timeout that never outlives the deadline.
+
+        Args:
+            cap: Upper bound for the timeout in seconds
+
+        Returns:
+            Timeout in seconds (always positive)
+
+        Raises:
+            DeadlineExceeded: If no time is left for the request
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceeded("deadline reached before the request was sent")
+        return min(cap, remaining)
+
+
+def iter_numbered_pages(
+    fetch_page: Callable[[int], Page],
+    num_pages: int,
+    max_workers: int,
+    deadline: Deadline
+) -> Iterator[Page]:
+    """
+    Fetch numbered pages concurrently and yield them as they complete.
+
+    Pages are submitted in order with at most ``max_workers`` in flight.
+    Once a page comes back empty, no later pages are requested, pending
+    later pages are cancelled, and results of later pages are dropped.
+
+    Args:
+        fetch_page: Function fetching the page with the given zero-based index
+        num_pages: Number of pages needed to fill the item budget
+        max_workers: Maximum concurrent page requests
+        deadline: Shared collection deadline
+
+    Yields:
+        Pages in completion order
+
+    Raises:
+        DeadlineExceeded: If the deadline expires while pages are in flight
+    """
+    executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+    fetch = bind_stage(fetch_page)
+    in_flight = {}
+    next_page = 0
+    last_page = num_pages
+
+    try:
+        while next_page < last_page or in_flight:
+            while next_page < last_page and len(in_flight) < max_workers:
+                in_flight[executor.submit(fetch, next_page)] = next_page
+                next_page += 1
+
+            done, _ = wait(in_flight, timeout=deadline.remaining(), return_when=FIRST_COMPLETED)
+            if not done:
+                raise DeadlineExceeded(f"{len(in_flight)} page(s) still in flight")
+
+            for future in sorted(done, key=in_flight.get):
+                page_number = in_flight.pop(future, None)
+                if page_number is None or page_number >= last_page:
+                    continue  # past an empty page
+                page = future.result()
+                if not page.items:
+                    last_page = page_number
+                    # Later pages are past the end: stop waiting for them
+                    for pending in [f for f, n in in_flight.items() if n > page_number]:
+                        pending.cancel()
+                        del in_flight[pending]
+                    continue
+                yield page
+
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_cursor_pages(
+    fetch_page: Callable[[Optional[str]], Page],
+    deadline: Deadline,
+    max_pages: int
+) -> Iterator[Page]:
+    """
+    Follow a pagination cursor until it runs out.
+
+    Args:
+        fetch_page: Function fetching the page for a cursor (None for the first)
+        deadline: Shared collection deadline
+        max_pages: Upper bound on the number of pages requested
+
+    Yields:
+        Pages in cursor order
+
+    Raises:
+        DeadlineExceeded: If the deadline expires before the next page
+    """
+    cursor = None
+    seen_cursors = set()
+
+    for _ in range(max_pages):
+        if deadline.expired():
+            raise DeadlineExceeded("deadline reached before next page")
+
+        page = fetch_page(cursor)
+        if page.items:
+            yield page
+
+        cursor = page.next_cursor
+        if not page.items or not cursor or cursor in seen_cursors:
+            return
+        seen_cursors.add(cursor)
+
+
+def merge_streams(
+    streams: Dict[str, Iterator[Any]]
+) -> Iterator[Tuple[str, Any, Optional[Exception]]]:
+    """
+    Consume several item streams concurrently and merge them into one.
+
+    Each stream runs on its own thread; items are yielded on the caller's
+    thread as soon as any stream produces them.
+
+    Args:
+        streams: Mapping of stream name to item iterator
+
+    Yields:
+        (name, item, None) for items, or (name, None, error) if a stream raised
+    """
+    events = queue.Queue()
+    finished = object()
+    stop = threading.Event()
+
+    def pump(name: str, stream: Iterator[Any]) -> None:
+        try:
+            for item in stream:
+                if stop.is_set():
+                    break
+                events.put((name, item, None))
+        except Exception as e:
+            events.put((name, None, e))
+        finally:
+            close = getattr(stream, "close", None)
+            if close:
+                close()
+            events.put((name, finished, None))
+
+    threads = [
+        threading.Thread(target=bind_stage(pump), args=(name, stream), daemon=True)
+        for name, stream in streams.items()
+    ]
+    for thread in threads:
+        thread.start()
+
+    active = len(threads)
+    try:
+        while active:
+            name, item, error = events.get()
+            if item is finished:
+                active -= 1
+                continue
+            yield name, item, error
+    finally:
+        stop.set()
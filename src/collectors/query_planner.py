@@ -0,0 +1,137 @@
+"""Query planning for X (Twitter) collection."""
+
+import re
+from dataclasses import dataclass
+from typing import List
+from urllib.parse import quote
+
+from src.config import Config
+
+
+# Topics mapped to accounts known to post about them
+TOPIC_ACCOUNTS = {
+    "uniswap": ["Uniswap", "haydenzadams"],
+    "ethereum": ["ethereum", "VitalikButerin"],
+    "bitcoin": ["Bitcoin", "BitcoinMagazine"],
+    "crypto": ["CoinDesk", "Cointelegraph"],
+    "defi": ["DefiLlama", "TheDefiant"],
+    "anthropic": ["AnthropicAI"],
+    "claude": ["AnthropicAI"],
+    "openai": ["OpenAI"],
+    "gemini": ["GoogleDeepMind"],
+}
+
+STOPWORDS = {
+    "the", "and", "for", "with", "about", "from", "into", "what", "how",
+    "why", "news", "latest", "update", "updates",
+}
+
+
+@dataclass(frozen=True)
+class QueryTarget:
+    """A single X scrape target produced by the planner."""
+
+    kind: str  # account, hashtag or search
+    value: str
+
+    @property
+    def url(self) -> str:
+        """URL handed to the Sela scraper."""
+        if self.kind == "account":
+            return f"https://twitter.com/{self.value}"
+        if self.kind == "hashtag":
+            return f"https://twitter.com/hashtag/{quote(self.value)}?f=live"
+        return f"https://twitter.com/search?q={quote(self.value)}&f=live"
+
+    @property
+    def scrape_type(self) -> str:
+        """Sela scrape type for this target."""
+        return "TWITTER_PROFILE" if self.kind == "account" else "TWITTER_SEARCH"
+
+    def __str__(self) -> str:
+        prefix = {"account": "@", "hashtag": "#"}.get(self.kind, "")
+        return f"{self.kind}:{prefix}{self.value}"
+
+
+class QueryPlanner:
+    """Expands a research topic into account, hashtag and search targets."""
+
+    def __init__(self, max_targets: int = None):
+        """
+        Initialize query planner.
+
+        Args:
+            max_targets: Maximum targets per topic (default: Config.X_MAX_TARGETS)
+        """
+        self.max_targets = max_targets or Config.X_MAX_TARGETS
+
+    def plan(self, topic: str) -> List[QueryTarget]:
+        """
+        Plan the X targets for a topic.
+
+        Explicit ``@handles`` and ``#hashtags`` in the topic come first, then
+        accounts known for the topic, a free-text search and a topic hashtag.
+        If no account is known, the compacted topic is tried as a handle.
+
+        Args:
+            topic: Research topic
+
+        Returns:
+            Ordered, de-duplicated list of targets
+        """
+        targets = []
+
+        handles = re.findall(r"@(\w{1,15})", topic)
+        hashtags = re.findall(r"#(\w+)", topic)
+        text = re.sub(r"[@#]\w+", " ", topic).strip()
+
+        targets.extend(QueryTarget("account", handle) for handle in handles)
+        targets.extend(QueryTarget("hashtag", tag) for tag in hashtags)
+
+        accounts = self._known_accounts(topic)
+        targets.extend(QueryTarget("account", account) for account in accounts)
+
+        if text:
+            targets.append(QueryTarget("search", text))
+
+            tag = self._hashtag_for(text)
+            if tag:
+                targets.append(QueryTarget("hashtag", tag))
+
+        if not handles and not accounts:
+            # Clean topic for use as account name (remove spaces, special chars)
+            compact = topic.replace(" ", "").replace("#", "").replace("@", "")
+            if compact:
+                targets.append(QueryTarget("account", compact))
+
+        return self._dedupe(targets)[:self.max_targets]
+
+    def _known_accounts(self, topic: str) -> List[str]:
+        """Get accounts mapped to keywords contained in the topic."""
+        topic_lower = topic.lower()
+        accounts = []
+        for key, usernames in TOPIC_ACCOUNTS.items():
+            if key in topic_lower:
+                accounts.extend(usernames)
+        return accounts
+
+    def _hashtag_for(self, text: str) -> str:
+        """Build a CamelCase hashtag from the significant words of a topic."""
+        words = [
+            word for word in re.findall(r"[A-Za-z0-9]+", text)
+            if word.lower() not in STOPWORDS
+        ]
+        if not words:
+            return ""
+        return "".join(word if word.isupper() else word.capitalize() for word in words[:3])
+
+    def _dedupe(self, targets: List[QueryTarget]) -> List[QueryTarget]:
+        """Drop repeated targets (case-insensitive), keeping the first."""
+        seen = set()
+        unique = []
+        for target in targets:
+            key = (target.kind, target.value.lower())
+            if key not in seen:
+                seen.add(key)
+                unique.append(target)
+        return unique
@@ -0,0 +1,354 @@
+"""Incremental parser for Sela Network API responses."""
+
+import codecs
+import json
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+
+CHUNK_SIZE = 64 * 1024  # bytes read from the response per refill
+COMPACT_THRESHOLD = 256 * 1024  # drop consumed buffer prefix beyond this size
+
+_WHITESPACE = " \t\n\r"
+# Characters that change the nesting of a skipped value, and the rest of a
+# JSON string after its opening quote
+_STRUCTURE = re.compile(r'["{}\[\]]')
+_STRING_TAIL = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+
+
+class ResponseStream:
+    """
+    Streams the items of ``data.result`` out of a Sela response body.
+
+    The body is read chunk by chunk and only one result item is decoded at a
+    time, so the full response is never held in memory. Scalar fields next to
+    the result (``success``, ``message``, ``data.next_cursor``...) are kept in
+    ``envelope`` and ``data_fields`` for the caller to inspect; ``bytes_read``
+    counts the body bytes consumed.
+
+    ``data.result`` may be a list of items, an object holding the item list
+    under one of ``container_keys``, or a single item object (any of
+    ``single_item_keys`` present). Containers are picked by key priority:
+    the first non-empty one in ``container_keys`` order wins, and a single
+    item takes precedence over every container. A container is streamed as
+    it is read when nothing read before it can outrank it; otherwise it is
+    buffered until the end of ``data.result``. A single-item key appearing
+    only after a streamed container no longer changes the result.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[Union[bytes, str]],
+        container_keys: Tuple[str, ...],
+        single_item_keys: Tuple[str, ...] = ()
+    ):
+        """
+        Initialize response stream.
+
+        Args:
+            chunks: Response body chunks (e.g. ``response.iter_content()``)
+            container_keys: Keys of ``data.result`` that may hold the item list
+            single_item_keys: Keys marking ``data.result`` itself as one item
+        """
+        self.container_keys = container_keys
+        self.single_item_keys = single_item_keys
+        self.envelope: Dict[str, Any] = {}
+        self.data_fields: Dict[str, Any] = {}
+        self.result_fields: Dict[str, Any] = {}
+        self.container: Optional[str] = None
+        self.finished = False
+        self.bytes_read = 0
+
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._decoder_json = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._walk: Optional[Iterator[Dict[str, Any]]] = None
+        self._skipping = False
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def items(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield raw result items in document order.
+
+        Every call returns the same iterator, so a caller that stopped early
+        can resume it (or ``finish`` it) later.
+
+        Yields:
+            Raw item dictionaries
+        """
+        if self._walk is None:
+            self._walk = self._parse_document()
+        return self._walk
+
+    def finish(self) -> None:
+        """
+        Read the rest of the body without decoding the remaining items.
+
+        Item values are skipped structurally; scalar fields after them
+        (e.g. a ``next_cursor`` following the item list) are still recorded.
+        """
+        self._skipping = True
+        for _ in self.items():
+            pass
+
+    @property
+    def failed(self) -> bool:
+        """
+        True if the API reported ``success=false``.
+
+        A missing flag only counts as failure once the whole body was read.
+        """
+        if "success" in self.envelope:
+            return not self.envelope["success"]
+        return self.finished
+
+    @property
+    def message(self) -> Optional[str]:
+        """The API ``message`` field, if it has been read."""
+        return self.envelope.get("message")
+
+    def field(self, key: str) -> Any:
+        """
+        Look up a scalar field next to the result items.
+
+        ``data.result.<key>`` takes precedence over ``data.<key>``.
+
+        Args:
+            key: Field name
+
+        Returns:
+            Field value, or None if it has not been read
+        """
+        value = self.result_fields.get(key)
+        return value if value is not None else self.data_fields.get(key)
+
+    # ------------------------------------------------------------------
+    # Document structure
+    # ------------------------------------------------------------------
+
+    def _parse_document(self) -> Iterator[Dict[str, Any]]:
+        """Walk the response object, streaming ``data.result``."""
+        if self._peek() != "{":
+            raise ValueError("Sela response is not a JSON object")
+
+        for path, key in self._iter_object(()):
+            if path == () and key == "data" and self._peek() == "{":
+                yield from self._parse_data()
+            else:
+                self._store(path, key, self._read_value())
+
+        self.finished = True
+
+    def _parse_data(self) -> Iterator[Dict[str, Any]]:
+        """Walk the ``data`` object, streaming ``data.result``."""
+        for path, key in self._iter_object(("data",)):
+            if key != "result":
+                self._store(path, key, self._read_value())
+                continue
+
+            char = self._peek()
+            if char == "[":
+                yield from self._iter_array()
+            elif char == "{":
+                yield from self._parse_result()
+            else:
+                self._store(path, key, self._read_value())
+
+    def _parse_result(self) -> Iterator[Dict[str, Any]]:
+        """Walk a ``data.result`` object, streaming its item container."""
+        buffered: Dict[str, List[Any]] = {}
+        for path, key in self._iter_object(("data", "result")):
+            if self._skipping and key in self.container_keys and self._peek() == "[":
+                self._skip_value()
+                continue
+            if self.container is None and key in self.container_keys and self._peek() == "[":
+                if not self._leads(key, buffered):
+                    buffered[key] = list(self._iter_array())
+                    continue
+                streamed = False
+                for item in self._iter_array():
+                    streamed = True
+                    yield item
+                if streamed:
+                    self.container = key
+                else:
+                    buffered[key] = []
+                continue
+
+            self._store(path, key, self._read_value())
+
+        if self.container is not None:
+            return
+        if any(k in self.result_fields for k in self.single_item_keys):
+            yield {**self.result_fields, **buffered}
+            return
+        for key in self.container_keys:
+            if buffered.get(key):
+                self.container = key
+                yield from buffered[key]
+                return
+
+    def _leads(self, key: str, buffered: Dict[str, List[Any]]) -> bool:
+        """
+        True if a container can be streamed as soon as it is reached.
+
+        That is when no single-item key and no unread container of a higher
+        priority could still take precedence over it.
+        """
+        if any(k in self.result_fields for k in self.single_item_keys):
+            return False
+        higher = self.container_keys[:self.container_keys.index(key)]
+        return all(k in buffered or k in self.result_fields for k in higher)
+
+    def _store(self, path: Tuple[str, ...], key: str, value: Any) -> None:
+        """Keep a field that is not part of the streamed item list."""
+        if path == ():
+            self.envelope[key] = value
+        elif path == ("data",):
+            self.data_fields[key] = value
+        else:
+            self.result_fields[key] = value
+
+    def _iter_object(self, path: Tuple[str, ...]) -> Iterator[Tuple[Tuple[str, ...], str]]:
+        """
+        Iterate the keys of the object at the cursor.
+
+        The caller must consume each key's value before advancing.
+        """
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+
+        while True:
+            key = self._read_value()
+            self._expect(":")
+            self._peek()
+            yield path, key
+
+            char = self._peek()
+            self._pos += 1
+            if char == "}":
+                return
+            if char != ",":
+                raise ValueError(f"Malformed Sela response: expected ',' or '}}', got {char!r}")
+
+    def _iter_array(self) -> Iterator[Any]:
+        """Iterate the elements of the array at the cursor one at a time."""
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+
+        while True:
+            if self._skipping:
+                self._skip_value()
+            else:
+                yield self._read_value()
+
+            char = self._peek()
+            self._pos += 1
+            if char == "]":
+                return
+            if char != ",":
+                raise ValueError(f"Malformed Sela response: expected ',' or ']', got {char!r}")
+
+    # ------------------------------------------------------------------
+    # Tokenizer
+    # ------------------------------------------------------------------
+
+    def _read_value(self) -> Any:
+        """Decode one complete JSON value at the cursor."""
+        self._peek()
+        want = CHUNK_SIZE
+        while True:
+            try:
+                value, end = self._decoder_json.raw_decode(self._buf, self._pos)
+                # A value ending exactly at the buffer edge may be truncated
+                # (e.g. a number split across chunks), so read on first
+                if end < len(self._buf) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            # Grow reads geometrically so large values stay linear
+            self._fill(want)
+            want *= 2
+
+    def _skip_value(self) -> None:
+        """Move the cursor past one JSON value without decoding it."""
+        if self._peek() not in ("{", "["):
+            self._read_value()
+            return
+
+        depth = 0
+        want = CHUNK_SIZE
+        while True:
+            match = _STRUCTURE.search(self._buf, self._pos)
+            if match is None:
+                self._pos = len(self._buf)
+            elif match.group() == '"':
+                end = _STRING_TAIL.match(self._buf, match.end())
+                if end:
+                    self._pos = end.end()
+                    continue
+                # The string runs past the buffer: rescan it with more input
+                self._pos = match.start()
+            else:
+                self._pos = match.end()
+                depth += 1 if match.group() in "{[" else -1
+                if depth == 0:
+                    return
+                continue
+
+            if self._eof:
+                raise ValueError("Malformed Sela response: truncated value")
+            self._fill(want)
+            want *= 2
+
+    def _peek(self) -> Optional[str]:
+        """Skip whitespace and return the next character (None at EOF)."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if self._eof:
+                return None
+            self._fill(CHUNK_SIZE)
+
+    def _expect(self, char: str) -> None:
+        """Consume the expected structural character."""
+        found = self._peek()
+        if found != char:
+            raise ValueError(f"Malformed Sela response: expected {char!r}, got {found!r}")
+        self._pos += 1
+
+    def _fill(self, size: int) -> None:
+        """Append at least ``size`` bytes of decoded input to the buffer."""
+        if self._pos > COMPACT_THRESHOLD:
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+
+        parts = []
+        read = 0
+        while read < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                parts.append(self._decoder.decode(b"", final=True))
+                self._eof = True
+                break
+            if isinstance(chunk, str):
+                chunk = chunk.encode("utf-8")
+            read += len(chunk)
+            self.bytes_read += len(chunk)
+            parts.append(self._decoder.decode(chunk))
+
+        self._buf += "".join(parts)
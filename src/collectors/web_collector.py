@@ -1,13 +1,39 @@
 """Web search data collector using Sela Network API."""
 
-from typing import List, Dict, Any
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from typing import List, Dict, Any, Optional
 from urllib.parse import quote_plus
 
 from .base import BaseCollector
+from .pagination import Page, Deadline
+from .stream_parser import ResponseStream, CHUNK_SIZE
+from .normalizer import SchemaNormalizer, Key, Const, FirstOf
 from src.config import Config
+from src.utils.metrics import metrics
+
+
+# Keys of data.result that may hold the result list
+WEB_CONTAINER_KEYS = ("organic_results", "news_results", "results", "items", "articles")
+# Keys marking data.result itself as a single result
+WEB_SINGLE_ITEM_KEYS = ("title", "link")
+
+# Raw search result fields, with the alternate key names seen across Sela responses
+WEB_RESULT_SCHEMA = SchemaNormalizer(
+    "web result",
+    {
+        "source": Const("web"),
+        "title": FirstOf(Key("title"), Key("headline"), Const("")),
+        "content": FirstOf(Key("snippet"), Key("description"), Key("summary"), Const("")),
+        "url": FirstOf(Key("link"), Key("url"), Const("")),
+        "author": FirstOf(Key("source"), Key("domain"), Key("site_name"), Const("")),
+        "date": FirstOf(Key("date"), Key("published_date"), Key("timestamp", "")),
+        "metadata": {
+            "domain": FirstOf(Key("domain"), Key("displayed_link"), Const("")),
+            "position": Key("position", 0),
+            "thumbnail": FirstOf(Key("thumbnail"), Key("image", "")),
+        },
+    },
+    required_keys=("title", "headline", "snippet", "description", "summary", "link", "url"),
+)
 
 
 class WebCollector(BaseCollector):
@@ -19,73 +45,67 @@ class WebCollector(BaseCollector):
             api_key=Config.SELA_API_KEY,
             api_url=Config.SELA_API_ENDPOINT
         )
-        self.session = self._create_session()
 
-    def _create_session(self) -> requests.Session:
+    def _fetch_page(
+        self,
+        topic: str,
+        page_size: int,
+        deadline: Deadline,
+        page: int = 0,
+        cursor: Optional[str] = None
+    ) -> Page:
         """
-        Create requests session with retry logic.
-
-        Returns:
-            Configured requests session
-        """
-        session = requests.Session()
-        retry = Retry(
-            total=Config.MAX_RETRIES,
-            backoff_factor=Config.RETRY_DELAY,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-        adapter = HTTPAdapter(max_retries=retry)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        return session
-
-    def collect(self, topic: str, max_items: int = 20) -> List[Dict[str, Any]]:
-        """
-        Collect web search results for the given topic.
+        Fetch one page of web search results for the given topic.
 
         Args:
             topic: Research topic
-            max_items: Maximum number of results to collect
+            page_size: Number of results requested per page
+            deadline: Shared collection deadline
+            page: Zero-based results page
+            cursor: Unused (web search pages by number)
 
         Returns:
-            List of collected web results
+            Page of formatted web results
         """
-        self.logger.info(f"🌐 Collecting web data for topic: '{topic}'")
-
-        try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-
-            # Google Search - use search_parameters only (no URL)
-            payload = {
-                "scrapeType": "GOOGLE_SEARCH",
-                "search_parameters": {
-                    "engine": "google",
-                    "q": topic,
-                    "location": "United States",
-                    "location_requested": "United States",
-                    "google_domain": "google.com",
-                    "hl": "en",
-                    "gl": "us",
-                    "device": "desktop"
-                },
-                "postCount": max_items,
-                "timeoutMs": 120000  # 2 minutes
-            }
-
-            # Debug logging
-            self.logger.debug(f"Request URL: {self.api_url}")
-            self.logger.debug(f"Request payload: {payload}")
-
-            response = self.session.post(
-                self.api_url,
-                headers=headers,
-                json=payload,
-                timeout=180  # 3 minutes timeout (longer than timeoutMs)
-            )
-
+        if page == 0:
+            self.logger.info(f"🌐 Collecting web data for topic: '{topic}'")
+
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+
+        # Google Search - use search_parameters only (no URL)
+        payload = {
+            "scrapeType": "GOOGLE_SEARCH",
+            "search_parameters": {
+                "engine": "google",
+                "q": topic,
+                "location": "United States",
+                "location_requested": "United States",
+                "google_domain": "google.com",
+                "hl": "en",
+                "gl": "us",
+                "device": "desktop"
+            },
+            "postCount": page_size,
+            "timeoutMs": 120000  # 2 minutes
+        }
+        if page > 0:
+            payload["search_parameters"]["start"] = page * page_size
+            payload["search_parameters"]["num"] = page_size
+
+        # Debug logging
+        self.logger.debug(f"Request URL: {self.api_url}")
+        self.logger.debug(f"Request payload: {payload}")
+
+        with self.session.post(
+            self.api_url,
+            headers=headers,
+            json=payload,
+            timeout=deadline.timeout(180),  # 3 minutes timeout (longer than timeoutMs)
+            stream=True
+        ) as response:
             # Log response for debugging
             self.logger.info(f"Response status: {response.status_code}")
             if response.status_code != 200:
@@ -93,27 +113,30 @@ class WebCollector(BaseCollector):
 
             response.raise_for_status()
 
-            data = response.json()
-
-            if not data.get("success"):
-                self.logger.error(f"❌ API returned success=false: {data.get('message')}")
-                return []
-
-            results = self._parse_web_response(data, max_items)
+            body = ResponseStream(
+                response.iter_content(CHUNK_SIZE),
+                container_keys=WEB_CONTAINER_KEYS,
+                single_item_keys=WEB_SINGLE_ITEM_KEYS
+            )
+            results = self._parse_web_response(body, page_size)
 
-            self.logger.info(f"✅ Collected {len(results)} web results")
-            return results
+        metrics.increment("bytes_received_total", body.bytes_read, collector=self.__class__.__name__)
+        if body.failed:
+            self.logger.error(f"❌ API returned success=false: {body.message}")
+            return Page()
 
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"❌ Error collecting web data: {e}")
-            return []
+        self.logger.info(f"✅ Collected {len(results)} web results (page {page + 1})")
+        return Page(items=results)
 
-    def _parse_web_response(self, data: Dict[str, Any], max_items: int) -> List[Dict[str, Any]]:
+    def _parse_web_response(self, stream: ResponseStream, max_items: int) -> List[Dict[str, Any]]:
         """
-        Parse Sela Network Web API response.
+        Parse a streamed Sela Network Web API response.
+
+        Results are decoded one at a time and reading stops as soon as
+        ``max_items`` results were formatted.
 
         Args:
-            data: Raw API response
+            stream: Streaming API response
             max_items: Maximum items to return
 
         Returns:
@@ -122,46 +145,31 @@ class WebCollector(BaseCollector):
         results = []
 
         try:
-            result_data = data.get("data", {}).get("result", {})
-
-            # Handle different possible response structures
-            items = []
-            if isinstance(result_data, dict):
-                # Look for common keys that contain search results
-                items = (result_data.get("organic_results") or
-                        result_data.get("news_results") or
-                        result_data.get("results") or
-                        result_data.get("items") or
-                        result_data.get("articles", []))
-
-                # If result is a single item
-                if "title" in result_data or "link" in result_data:
-                    items = [result_data]
-            elif isinstance(result_data, list):
-                items = result_data
-
-            for item in items[:max_items]:
+            for item in stream.items():
+                if len(results) >= max_items:
+                    break
                 try:
-                    # Extract data with various possible key names
-                    formatted = {
-                        "source": "web",
-                        "title": item.get("title") or item.get("headline") or "",
-                        "content": item.get("snippet") or item.get("description") or item.get("summary") or "",
-                        "url": item.get("link") or item.get("url") or "",
-                        "author": item.get("source") or item.get("domain") or item.get("site_name") or "",
-                        "date": item.get("date") or item.get("published_date") or item.get("timestamp", ""),
-                        "metadata": {
-                            "domain": item.get("domain") or item.get("displayed_link") or "",
-                            "position": item.get("position", 0),
-                            "thumbnail": item.get("thumbnail") or item.get("image", ""),
-                        }
-                    }
-                    results.append(formatted)
+                    results.append(self._format_item(item))
                 except Exception as e:
                     self.logger.warning(f"⚠️  Failed to parse web result: {e}")
                     continue
 
+            if stream.container:
+                self.logger.debug(f"Web results found under result.{stream.container}")
+
         except Exception as e:
             self.logger.error(f"❌ Error parsing web response: {e}")
 
         return results
+
+    def _format_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Format a raw search result into the standard item structure.
+
+        Args:
+            item: Raw search result from the API
+
+        Returns:
+            Formatted web result
+        """
+        return WEB_RESULT_SCHEMA.normalize(item)
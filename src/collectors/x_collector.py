@@ -1,131 +1,235 @@
 """X (Twitter) data collector using Sela Network API."""
 
-import time
-from typing import List, Dict, Any
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import math
+from typing import List, Dict, Any, Iterator, Optional
 
 from .base import BaseCollector
+from .pagination import Page, Deadline, merge_streams
+from .query_planner import QueryPlanner, QueryTarget
+from .stream_parser import ResponseStream, CHUNK_SIZE
+from .normalizer import SchemaNormalizer, Key, Nested, Const, Format, FirstOf
 from src.config import Config
+from src.utils.metrics import metrics
+
+
+# Keys of data.result that may hold the post list
+X_CONTAINER_KEYS = ("tweets", "posts", "results", "items")
+# Keys marking data.result itself as a single post
+X_SINGLE_ITEM_KEYS = ("username", "text", "content")
+
+# Raw post fields, with the alternate key names seen across Sela responses
+X_POST_SCHEMA = SchemaNormalizer(
+    "X post",
+    {
+        "source": Const("x"),
+        "content": FirstOf(Key("text"), Key("content"), Key("tweet_text"), Key("full_text", "")),
+        "author": FirstOf(Key("username"), Key("author"), Nested("user", "username", "")),
+        "author_name": FirstOf(Key("displayName"), Key("name"), Nested("user", "name", "")),
+        "date": FirstOf(Key("created_at"), Key("timestamp"), Key("date", "")),
+        "url": FirstOf(
+            Key("url"),
+            Key("link"),
+            Format("https://twitter.com/", Key("username", "user"), "/status/", Key("id", "")),
+        ),
+        "engagement": {
+            "likes": FirstOf(Key("likes"), Key("favorite_count"), Key("like_count", 0)),
+            "retweets": FirstOf(Key("retweets"), Key("retweet_count", 0)),
+            "replies": FirstOf(Key("replies"), Key("reply_count", 0)),
+        },
+        "metadata": {
+            "id": FirstOf(Key("id"), Key("tweet_id", "")),
+            "language": FirstOf(Key("lang"), Key("language", "")),
+            "verified": Key("verified", False),
+        },
+    },
+    required_keys=("text", "content", "tweet_text", "full_text"),
+)
 
 
 class XCollector(BaseCollector):
     """Collector for X (Twitter) data via Sela Network API."""
 
+    PAGINATION = "cursor"
+
     def __init__(self):
         """Initialize X collector with Sela Network API credentials."""
         super().__init__(
             api_key=Config.SELA_API_KEY,
             api_url=Config.SELA_API_ENDPOINT
         )
-        self.session = self._create_session()
-
-    def _create_session(self) -> requests.Session:
+        self.planner = QueryPlanner()
+
+    def stream(
+        self,
+        topic: str,
+        max_items: int = 20,
+        deadline: Optional[Deadline] = None
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Create requests session with retry logic.
+        Stream X posts from every planned target in parallel.
 
-        Returns:
-            Configured requests session
+        Targets share the deadline and the item budget; posts seen through
+        more than one target are yielded once (deduplicated by tweet id).
+
+        Args:
+            topic: Research topic
+            max_items: Maximum number of posts to collect across all targets
+            deadline: Shared collection deadline (default: Config.COLLECTION_DEADLINE)
+
+        Yields:
+            Formatted posts
         """
-        session = requests.Session()
-        retry = Retry(
-            total=Config.MAX_RETRIES,
-            backoff_factor=Config.RETRY_DELAY,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-        adapter = HTTPAdapter(max_retries=retry)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        return session
+        self.logger.info(f"🔍 Collecting X data for topic: '{topic}'")
 
-    def collect(self, topic: str, max_items: int = 20) -> List[Dict[str, Any]]:
+        deadline = deadline or Deadline(Config.COLLECTION_DEADLINE)
+        targets = self.planner.plan(topic)
+        self.logger.info(f"Planned {len(targets)} X targets: {', '.join(map(str, targets))}")
+
+        # Spread the first pages across targets, then let cursors fill the budget
+        page_size = min(Config.PAGE_SIZE, math.ceil(max_items / len(targets)))
+        streams = {
+            str(target): self._stream_pages(target, max_items, deadline, page_size=page_size)
+            for target in targets
+        }
+        return self._merge_targets(streams, max_items)
+
+    def _merge_targets(
+        self,
+        streams: Dict[str, Iterator[Dict[str, Any]]],
+        max_items: int
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Collect X (Twitter) posts for the given topic.
+        Merge per-target streams, dropping duplicate posts.
 
         Args:
-            topic: Research topic
-            max_items: Maximum number of posts to collect
+            streams: Mapping of target name to post stream
+            max_items: Maximum number of posts to yield
 
-        Returns:
-            List of collected posts with metadata
+        Yields:
+            Unique posts in arrival order
         """
-        self.logger.info(f"🔍 Collecting X data for topic: '{topic}'")
+        seen_ids = set()
+        yielded = 0
+        errors = []
 
+        merged = merge_streams(streams)
         try:
-            # For topic research, scrape relevant Twitter profiles
-            # Map common topics to relevant Twitter accounts
-            topic_accounts = {
-                "uniswap": "Uniswap",
-                "ethereum": "ethereum",
-                "bitcoin": "Bitcoin",
-                "crypto": "CoinDesk",
-            }
-
-            # Try to find a relevant account, otherwise use a default
-            topic_lower = topic.lower()
-            account = None
-            for key, username in topic_accounts.items():
-                if key in topic_lower:
-                    account = username
+            for target, post, error in merged:
+                if error is not None:
+                    self.logger.warning(f"⚠️  X target {target} failed: {error}")
+                    errors.append(error)
+                    continue
+
+                post_id = post.get("metadata", {}).get("id") or post.get("url")
+                if post_id in seen_ids:
+                    continue
+                seen_ids.add(post_id)
+
+                yield post
+                yielded += 1
+                if yielded >= max_items:
                     break
+        finally:
+            merged.close()
+
+        # Surface the failure when no target got through (e.g. open circuits)
+        if not yielded and errors and len(errors) == len(streams):
+            raise errors[-1]
+
+        self.logger.info(f"✅ Collected {yielded} unique X posts from {len(streams)} targets")
+
+    def _endpoint_name(self, query: QueryTarget) -> str:
+        """Profile and search scrapes fail independently, so break them separately."""
+        return f"{self.__class__.__name__} {query.scrape_type} {self.api_url}"
+
+    def _fetch_page(
+        self,
+        query: QueryTarget,
+        page_size: int,
+        deadline: Deadline,
+        page: int = 0,
+        cursor: Optional[str] = None
+    ) -> Page:
+        """
+        Fetch one page of X (Twitter) posts for a planned target.
 
-            # If no specific account found, use the topic as account name
-            if not account:
-                # Clean topic for use as account name (remove spaces, special chars)
-                account = topic.replace(" ", "").replace("#", "").replace("@", "")
-
-            profile_url = f"https://twitter.com/{account}"
-
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-
-            payload = {
-                "url": profile_url,
-                "scrapeType": "TWITTER_PROFILE",
-                "timeoutMs": 60000,  # 1 minute
-                "postCount": max_items,
-                "scrollPauseTime": 2000
-            }
-
-            self.logger.debug(f"Request payload: {payload}")
-
-            response = self.session.post(
-                self.api_url,
-                headers=headers,
-                json=payload,
-                timeout=120  # 2 minutes timeout (longer than timeoutMs)
-            )
+        Args:
+            query: Account, hashtag or search target
+            page_size: Number of posts requested per page
+            deadline: Shared collection deadline
+            page: Unused (X pages by cursor)
+            cursor: Cursor returned by the previous page
 
+        Returns:
+            Page of formatted posts and the next cursor
+        """
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+
+        payload = {
+            "url": query.url,
+            "scrapeType": query.scrape_type,
+            "timeoutMs": 60000,  # 1 minute
+            "postCount": page_size,
+            "scrollPauseTime": 2000
+        }
+        if cursor:
+            payload["cursor"] = cursor
+
+        self.logger.debug(f"Request payload: {payload}")
+
+        with self.session.post(
+            self.api_url,
+            headers=headers,
+            json=payload,
+            timeout=deadline.timeout(120),  # 2 minutes timeout (longer than timeoutMs)
+            stream=True
+        ) as response:
             self.logger.info(f"Response status: {response.status_code}")
             if response.status_code != 200:
                 self.logger.error(f"Error response: {response.text}")
 
             response.raise_for_status()
 
-            data = response.json()
+            body = ResponseStream(
+                response.iter_content(CHUNK_SIZE),
+                container_keys=X_CONTAINER_KEYS,
+                single_item_keys=X_SINGLE_ITEM_KEYS
+            )
+            results = self._parse_x_response(body, page_size)
 
-            if not data.get("success"):
-                self.logger.error(f"❌ API returned success=false: {data.get('message')}")
-                return []
+        metrics.increment("bytes_received_total", body.bytes_read, collector=self.__class__.__name__)
+        if body.failed:
+            self.logger.error(f"❌ API returned success=false: {body.message}")
+            return Page()
 
-            results = self._parse_x_response(data, max_items)
+        self.logger.debug(f"Collected {len(results)} X posts from {query}")
+        return Page(items=results, next_cursor=self._extract_cursor(body))
+
+    def _extract_cursor(self, stream: ResponseStream) -> Optional[str]:
+        """
+        Extract the next-page cursor from a Sela Network X API response.
 
-            self.logger.info(f"✅ Collected {len(results)} X posts")
-            return results
+        Args:
+            stream: Parsed API response
 
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"❌ Error collecting X data: {e}")
-            return []
+        Returns:
+            Cursor string, or None if there are no more pages
+        """
+        return stream.field("next_cursor") or stream.field("cursor") or None
 
-    def _parse_x_response(self, data: Dict[str, Any], max_items: int) -> List[Dict[str, Any]]:
+    def _parse_x_response(self, stream: ResponseStream, max_items: int) -> List[Dict[str, Any]]:
         """
-        Parse Sela Network X API response.
+        Parse a streamed Sela Network X API response.
+
+        Posts are decoded one at a time and decoding stops as soon as
+        ``max_items`` posts were formatted; the rest of the body is then
+        only scanned if the next-page cursor has not been read yet.
 
         Args:
-            data: Raw API response
+            stream: Streaming API response
             max_items: Maximum items to return
 
         Returns:
@@ -134,65 +238,35 @@ class XCollector(BaseCollector):
         results = []
 
         try:
-            result_data = data.get("data", {}).get("result", {})
-
-            # Handle different possible response structures
-            posts = []
-            if isinstance(result_data, dict):
-                # Check for common keys that might contain tweet data
-                posts = (result_data.get("tweets") or
-                        result_data.get("posts") or
-                        result_data.get("results") or
-                        result_data.get("items") or [])
-
-                # If result is a single tweet/post
-                if "username" in result_data or "text" in result_data or "content" in result_data:
-                    posts = [result_data]
-            elif isinstance(result_data, list):
-                posts = result_data
-
-            for post in posts[:max_items]:
+            for post in stream.items():
+                if len(results) >= max_items:
+                    break
                 try:
-                    # Extract data with various possible key names
-                    formatted = {
-                        "source": "x",
-                        "content": (post.get("text") or
-                                   post.get("content") or
-                                   post.get("tweet_text") or
-                                   post.get("full_text", "")),
-                        "author": (post.get("username") or
-                                  post.get("author") or
-                                  post.get("user", {}).get("username", "")),
-                        "author_name": (post.get("displayName") or
-                                       post.get("name") or
-                                       post.get("user", {}).get("name", "")),
-                        "date": (post.get("created_at") or
-                                post.get("timestamp") or
-                                post.get("date", "")),
-                        "url": (post.get("url") or
-                               post.get("link") or
-                               f"https://twitter.com/{post.get('username', 'user')}/status/{post.get('id', '')}"),
-                        "engagement": {
-                            "likes": (post.get("likes") or
-                                     post.get("favorite_count") or
-                                     post.get("like_count", 0)),
-                            "retweets": (post.get("retweets") or
-                                        post.get("retweet_count", 0)),
-                            "replies": (post.get("replies") or
-                                       post.get("reply_count", 0)),
-                        },
-                        "metadata": {
-                            "id": post.get("id") or post.get("tweet_id", ""),
-                            "language": post.get("lang") or post.get("language", ""),
-                            "verified": post.get("verified", False),
-                        }
-                    }
-                    results.append(formatted)
+                    results.append(self._format_post(post))
                 except Exception as e:
                     self.logger.warning(f"⚠️  Failed to parse post: {e}")
                     continue
 
+            # The cursor may follow the post list
+            if not self._extract_cursor(stream):
+                stream.finish()
+
+            if stream.container:
+                self.logger.debug(f"X posts found under result.{stream.container}")
+
         except Exception as e:
             self.logger.error(f"❌ Error parsing X response: {e}")
 
         return results
+
+    def _format_post(self, post: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Format a raw post into the standard item structure.
+
+        Args:
+            post: Raw post from the API
+
+        Returns:
+            Formatted post
+        """
+        return X_POST_SCHEMA.normalize(post)
@@ -26,22 +26,66 @@ class Config:
     CLAUDE_MODEL: str = "claude-sonnet-4-20250514"
     CLAUDE_MAX_TOKENS: int = 4096
     CLAUDE_TEMPERATURE: float = 0.7
+    CLAUDE_PROMPT_CACHING: bool = os.getenv("CLAUDE_PROMPT_CACHING", "true").lower() == "true"
 
     # Gemini settings
     GEMINI_MODEL: str = "gemini-2.5-flash"
     GEMINI_MAX_TOKENS: int = 8192
     GEMINI_TEMPERATURE: float = 0.7
+    GEMINI_CONTEXT_CACHING: bool = os.getenv("GEMINI_CONTEXT_CACHING", "true").lower() == "true"
+    GEMINI_CACHE_TTL: int = int(os.getenv("GEMINI_CACHE_TTL", "1800"))  # seconds idle before expiry
+
+    # Prompt data selection
+    PROMPT_DATA_TOKENS: int = int(os.getenv("PROMPT_DATA_TOKENS", "12000"))  # budget for collected items
+    RELEVANCE_DIVERSITY: float = float(os.getenv("RELEVANCE_DIVERSITY", "0.3"))  # MMR redundancy weight
+
+    # Provider routing
+    LLM_FAILOVER: bool = os.getenv("LLM_FAILOVER", "true").lower() == "true"
+    LLM_TIMEOUT: int = int(os.getenv("LLM_TIMEOUT", "180"))  # seconds before failing over
+    LLM_MAX_CONCURRENCY: int = int(os.getenv("LLM_MAX_CONCURRENCY", "4"))  # in-flight async calls per provider
+    LLM_HEDGE_AFTER: float = float(os.getenv("LLM_HEDGE_AFTER", "0"))  # latency SLO; 0 disables hedging
+
+    # Batch mode
+    BATCH_POLL_INTERVAL: int = int(os.getenv("BATCH_POLL_INTERVAL", "30"))  # seconds
+    BATCH_TIMEOUT: int = int(os.getenv("BATCH_TIMEOUT", "86400"))  # providers finish within 24h
+
+    # Report output
+    REPORT_FORMATS: str = os.getenv("REPORT_FORMATS", "")  # extra formats next to the Markdown report: html, json
+    RENDER_WORKERS: int = int(os.getenv("RENDER_WORKERS", "4"))  # concurrent report writes in batch mode
+
+    # Run profiling
+    RUN_RECORDS: bool = os.getenv("RUN_RECORDS", "true").lower() == "true"  # JSON record per run in OUTPUT_DIR/.runs
+    METRICS_TEXTFILE: str = os.getenv("METRICS_TEXTFILE", "")  # Prometheus textfile written after each run
+
+    # History index
+    INDEX_WORKERS: int = int(os.getenv("INDEX_WORKERS", str(os.cpu_count() or 1)))  # parser processes
 
     # Collection settings
     DEFAULT_MAX_ITEMS: int = 20
     DEFAULT_SOURCES: str = "all"  # x, web, all
     DEFAULT_DEPTH: str = "detailed"  # quick, detailed
+    MAX_ITEMS_LIMIT: int = int(os.getenv("MAX_ITEMS_LIMIT", "5000"))
+
+    # Pagination settings
+    PAGE_SIZE: int = int(os.getenv("PAGE_SIZE", "100"))  # items per Sela request
+    MAX_CONCURRENT_PAGES: int = int(os.getenv("MAX_CONCURRENT_PAGES", "4"))
+    COLLECTION_DEADLINE: int = int(os.getenv("COLLECTION_DEADLINE", "300"))  # seconds
+    X_MAX_TARGETS: int = int(os.getenv("X_MAX_TARGETS", "4"))  # accounts/hashtags/searches per topic
 
     # API settings
     MAX_RETRIES: int = 3
     RETRY_DELAY: int = 2  # seconds
+    RETRY_MAX_WAIT: int = 30  # seconds, cap for a single backoff
+    RETRY_BUDGET: int = int(os.getenv("RETRY_BUDGET", "10"))  # retries per run
+    RETRY_BUDGET_SECONDS: int = int(os.getenv("RETRY_BUDGET_SECONDS", "90"))  # backoff per run
     REQUEST_TIMEOUT: int = 30  # seconds
 
+    # Resilience settings
+    CIRCUIT_FAILURE_THRESHOLD: int = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "3"))
+    CIRCUIT_RESET_TIMEOUT: int = int(os.getenv("CIRCUIT_RESET_TIMEOUT", "120"))  # seconds
+    HEDGE_REQUESTS: bool = os.getenv("HEDGE_REQUESTS", "false").lower() == "true"
+    HEDGE_MIN_SAMPLES: int = 5  # latencies needed before p95 is trusted
+
     # Output settings
     OUTPUT_DIR: Path = Path(os.getenv("OUTPUT_DIR", "./reports"))
 
@@ -1,5 +1,6 @@
 """Report generation modules for Research Agent."""
 
 from .markdown_generator import MarkdownGenerator
+from .render_pool import RenderJob, RenderPool, RenderResult
 
-__all__ = ["MarkdownGenerator"]
+__all__ = ["MarkdownGenerator", "RenderJob", "RenderPool", "RenderResult"]
@@ -0,0 +1,223 @@
+"""Concurrent report rendering with a per-batch manifest."""
+
+import json
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from src.analyzers.sources import SourceSummary
+from src.config import Config
+from src.utils.files import atomic_writer
+from src.utils.logger import get_logger
+from .markdown_generator import MarkdownGenerator
+from .sidecar import sidecar_path
+
+
+logger = get_logger("render_pool")
+
+MANIFEST_FORMAT = "research-agent.batch-manifest"
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class RenderJob:
+    """One completed analysis waiting to be written as a report."""
+
+    topic: str
+    analysis_result: Dict[str, Any]
+    sources: SourceSummary
+    output_path: Path
+    sentiment: Optional[Dict[str, Any]] = None
+    keywords: Optional[List[tuple]] = None
+    trends: Optional[Dict[str, Any]] = None
+    comparison: Optional[Dict[str, Any]] = None
+    formats: Sequence[str] = ()
+
+
+@dataclass
+class RenderResult:
+    """Outcome of one render job."""
+
+    job: RenderJob
+    ok: bool
+    seconds: float
+    outputs: List[str] = field(default_factory=list)  # every file written
+    bytes: int = 0
+    error: Optional[str] = None
+    error_type: Optional[str] = None  # exception class name, if one was raised
+
+
+class RenderPool:
+    """
+    Thread pool writing reports concurrently.
+
+    Rendering a report takes well under a millisecond; fsyncing its files
+    takes longer and releases the GIL, so threads keep many reports in
+    flight. Every file is written to a temporary name, fsynced and renamed,
+    so readers only ever see complete reports. The pool keeps a manifest
+    of the batch (written atomically, at most once per second and when the
+    pool closes) listing each report's files or error.
+
+    Example:
+        with RenderPool(manifest_path=path) as pool:
+            for job in jobs:
+                pool.submit(job)
+            for result in pool.results():
+                ...
+    """
+
+    def __init__(
+        self,
+        max_workers: int = None,
+        generator: MarkdownGenerator = None,
+        manifest_path: Path = None
+    ):
+        """
+        Initialize render pool.
+
+        Args:
+            max_workers: Concurrent renders (default: Config.RENDER_WORKERS)
+            generator: Report generator (default: a new MarkdownGenerator)
+            manifest_path: Batch manifest file (default: no manifest)
+        """
+        self.generator = generator or MarkdownGenerator()
+        self.manifest_path = Path(manifest_path) if manifest_path else None
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers or Config.RENDER_WORKERS,
+            thread_name_prefix="render"
+        )
+        self.pending: List[Future] = []
+        self.completed: List[RenderResult] = []
+        self.started = datetime.now().isoformat(timespec="seconds")
+        self._manifest_written = 0.0
+
+    def submit(self, job: RenderJob) -> Future:
+        """
+        Queue a report for rendering.
+
+        Args:
+            job: Render job
+
+        Returns:
+            Future of the render result
+        """
+        future = self.executor.submit(self._render, job)
+        self.pending.append(future)
+        return future
+
+    def results(self) -> Iterator[RenderResult]:
+        """
+        Wait for the submitted jobs, yielding results as they complete.
+
+        Yields:
+            Render results, in completion order
+        """
+        pending, self.pending = self.pending, []
+        for future in as_completed(pending):
+            result = future.result()
+            self.completed.append(result)
+            if time.monotonic() - self._manifest_written >= 1.0:
+                self.write_manifest()
+            yield result
+
+    def render(self, jobs: Iterable[RenderJob]) -> Iterator[RenderResult]:
+        """
+        Render many reports concurrently.
+
+        Args:
+            jobs: Render jobs
+
+        Yields:
+            Render results, in completion order
+        """
+        for job in jobs:
+            self.submit(job)
+        yield from self.results()
+
+    def close(self) -> None:
+        """Wait for running jobs and write the final manifest."""
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        for future in self.pending:
+            if future.done() and not future.cancelled():
+                self.completed.append(future.result())
+        self.pending = []
+        self.write_manifest(complete=True)
+
+    def __enter__(self) -> "RenderPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _render(self, job: RenderJob) -> RenderResult:
+        """Write one report and its extra formats (runs on a worker thread)."""
+        started = time.perf_counter()
+        try:
+            self.generator.write_report(
+                job.topic,
+                job.analysis_result,
+                job.sources,
+                job.output_path,
+                sentiment=job.sentiment,
+                keywords=job.keywords,
+                trends=job.trends,
+                comparison=job.comparison,
+                formats=job.formats
+            )
+        except Exception as e:
+            logger.exception(f"❌ Rendering the report on '{job.topic}' failed")
+            return RenderResult(
+                job, False, time.perf_counter() - started,
+                error=str(e), error_type=type(e).__name__
+            )
+
+        seconds = time.perf_counter() - started
+        paths = [job.output_path, sidecar_path(job.output_path)] + [
+            job.output_path.with_suffix(self.generator.renderers[name].suffix)
+            for name in job.formats if name != "markdown"
+        ]
+        outputs = [path for path in paths if path.exists()]
+        return RenderResult(
+            job, True, seconds,
+            outputs=[str(path) for path in outputs],
+            bytes=sum(path.stat().st_size for path in outputs)
+        )
+
+    def write_manifest(self, complete: bool = False) -> None:
+        """
+        Write the batch manifest atomically.
+
+        Args:
+            complete: Whether every job has finished
+        """
+        if self.manifest_path is None:
+            return
+        manifest = {
+            "format": MANIFEST_FORMAT,
+            "version": MANIFEST_VERSION,
+            "started": self.started,
+            "updated": datetime.now().isoformat(timespec="seconds"),
+            "complete": complete,
+            "reports": [
+                {
+                    "topic": result.job.topic,
+                    "path": str(result.job.output_path),
+                    "status": "ok" if result.ok else "failed",
+                    "outputs": result.outputs,
+                    "bytes": result.bytes,
+                    "seconds": round(result.seconds, 4),
+                    "error": result.error,
+                    "error_type": result.error_type,
+                }
+                for result in self.completed
+            ],
+        }
+        try:
+            with atomic_writer(self.manifest_path) as handle:
+                json.dump(manifest, handle, ensure_ascii=False, indent=2)
+        except OSError as e:
+            logger.warning(f"⚠️  Could not write batch manifest {self.manifest_path}: {e}")
+        self._manifest_written = time.monotonic()
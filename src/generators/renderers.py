@@ -0,0 +1,559 @@
+"""Report renderers turning one structured report into Markdown, HTML or JSON."""
+
+import html
+import json
+from datetime import datetime
+from json.encoder import encode_basestring
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Type
+from urllib.parse import urlsplit
+
+from src.analyzers.sources import SourceSummary
+from .templates import TemplateSet
+
+
+class ReportRenderer:
+    """
+    Base class for report output formats.
+
+    Renderers read the structured report built by ``build_sidecar`` and
+    yield the output as text parts joined by ``separator``. Template-based
+    formats share the section walk below and only provide ``TEMPLATES``;
+    every format defines the same template names. A template set to None
+    is not used by that format.
+    """
+
+    name = ""
+    suffix = ""
+    separator = "\n"
+    TEMPLATES: Dict[str, Optional[str]] = {}
+    escape: Optional[Callable[[Any], str]] = None
+    # Escapes source URLs for link targets (templates use them with ``:s``)
+    escape_url: Optional[Callable[[Any], str]] = None
+
+    def __init__(self):
+        """Load the format's compiled templates."""
+        self.t = _compiled(type(self))
+
+    def render(self, report: Dict[str, Any]) -> Iterator[str]:
+        """
+        Render a structured report.
+
+        Args:
+            report: Structured report (see ``sidecar.build_sidecar``)
+
+        Yields:
+            Output text parts, in order
+        """
+        t = self.t
+        analysis = report.get("analysis") or {}
+        metadata = analysis.get("metadata") or {}
+        sources = report.get("sources") or {}
+        if not isinstance(sources, SourceSummary):
+            sources = SourceSummary.from_sidecar(sources)
+        sentiment = report.get("sentiment")
+        keywords = report.get("keywords")
+        trends = report.get("trends")
+        comparison = report.get("comparison")
+
+        yield t.header(
+            topic=report.get("topic", ""),
+            generated=_display_time(report.get("generated", "")),
+            x_count=sources.x_count,
+            web_count=sources.web_count,
+            total=len(sources),
+            model=metadata.get("model", "Claude Sonnet 4"),
+            tokens_used=metadata.get("tokens_used", "N/A")
+        )
+
+        if sentiment or keywords or trends:
+            yield self._quick_stats(sentiment, keywords, trends)
+        if comparison:
+            yield from self._comparison(comparison)
+        if sentiment:
+            yield from self._sentiment(sentiment)
+        if keywords:
+            yield from self._keywords(keywords)
+        if trends:
+            yield from self._trends(trends)
+
+        if analysis.get("text"):
+            yield t.analysis(text=analysis["text"])
+
+        link = self.escape_url or str
+        yield t.sources_open()
+        if sources.x_count:
+            yield t.x_open(count=sources.x_count)
+            x_item = t.x_item
+            for i, (author, content, date, url, likes) in enumerate(sources.x_rows(), 1):
+                yield x_item(
+                    index=i,
+                    author=author,
+                    content=content,
+                    date=date,
+                    url=link(url),
+                    # "N/A" if likes data is not available (0 or None)
+                    likes="N/A" if likes == 0 else likes
+                )
+            yield from self._close(t.x_close)
+        if sources.web_count:
+            yield t.web_open(count=sources.web_count)
+            web_item = t.web_item
+            for i, (title, source, date, url) in enumerate(sources.web_rows(), 1):
+                yield web_item(index=i, title=title, source=source, date=date, url=link(url))
+            yield from self._close(t.web_close)
+        yield t.footer()
+
+    def _quick_stats(self, sentiment: Dict[str, Any], keywords: List, trends: Dict[str, Any]) -> str:
+        t = self.t
+        stats = []
+        if sentiment:
+            stats.append(t.stat_sentiment(
+                overall=sentiment.get("overall", "Unknown"),
+                compound=sentiment.get("average_compound", 0.0)
+            ))
+        if keywords:
+            stats.append(t.stat_keyword(keyword=keywords[0][0]))
+        if trends:
+            stats.append(t.stat_activity(avg_per_day=trends.get("frequency", {}).get("avg_per_day", 0)))
+        return t.quick_stats(stats=t.stat_separator().join(stats))
+
+    def _comparison(self, comparison: Dict[str, Any]) -> Iterator[str]:
+        t = self.t
+        yield t.comparison_open()
+
+        new_topics = comparison.get("new_topics", [])
+        if new_topics:
+            yield t.new_topics_open()
+            for topic in new_topics[:5]:
+                yield t.new_topic(topic=topic)
+            yield t.list_close()
+
+        removed_topics = comparison.get("removed_topics", [])
+        if removed_topics:
+            yield t.removed_topics_open()
+            for topic in removed_topics[:5]:
+                yield t.removed_topic(topic=topic)
+            yield t.list_close()
+
+        drift = comparison.get("keyword_drift")
+        if drift:
+            yield t.drift(**self._drift_scores(drift))
+            if drift.get("rising"):
+                yield t.drift_gaining(movers=self._movers(drift["rising"]))
+            if drift.get("falling"):
+                yield t.drift_losing(movers=self._movers(drift["falling"]))
+            yield t.list_close()
+
+        sentiment_change = comparison.get("sentiment_change", {})
+        if sentiment_change:
+            yield t.sentiment_shift(
+                old=sentiment_change.get("old", "Unknown"),
+                direction=sentiment_change.get("direction", "→"),
+                new=sentiment_change.get("new", "Unknown")
+            )
+
+        trend_direction = comparison.get("trend_direction", "")
+        if trend_direction:
+            yield t.overall_trend(trend=trend_direction)
+
+        history = comparison.get("history")
+        if history:
+            yield from self._history(history)
+
+    def _history(self, history: Dict[str, Any]) -> Iterator[str]:
+        t = self.t
+        yield t.history_open(reports=history.get("reports", 0), since=history.get("since", "?"))
+
+        for label, key, spec in (("Sentiment", "sentiment", "+.3f"), ("Volume", "volume", ".0f")):
+            series = history.get(key) or {}
+            if not series:
+                continue
+            first, last = format(series["first"], spec), format(series["last"], spec)
+            if "direction" in series:
+                yield t.history_series_trend(
+                    label=label, first=first, last=last,
+                    direction=series["direction"], slope=series["slope_per_day"]
+                )
+            else:
+                yield t.history_series(label=label, first=first, last=last)
+            for point in series.get("change_points", []):
+                yield t.history_shift(
+                    date=point["date"],
+                    before=format(point["before"], spec),
+                    after=format(point["after"], spec)
+                )
+
+        keywords = history.get("keywords") or {}
+        for label, key in (("Rising", "rising"), ("Fading", "falling"), ("Persistent", "persistent")):
+            if keywords.get(key):
+                yield t.history_keywords(label=label, keywords=", ".join(keywords[key]))
+        if keywords.get("drift"):
+            yield t.history_drift(**self._drift_scores(keywords["drift"]))
+        yield t.list_close()
+
+    def _sentiment(self, sentiment: Dict[str, Any]) -> Iterator[str]:
+        t = self.t
+        yield t.sentiment_open(
+            overall=sentiment.get("overall", "Unknown"),
+            compound=sentiment.get("average_compound", 0.0)
+        )
+        distribution = sentiment.get("distribution", {})
+        for label in ("Positive", "Neutral", "Negative"):
+            share = distribution.get(label.lower(), {})
+            percentage = share.get("percentage", 0)
+            yield t.sentiment_bar(
+                label=label,
+                pad=" " * (8 - len(label)),
+                bars="█" * int(percentage / 2),  # 1 block = 2%
+                percentage=percentage,
+                count=share.get("count", 0)
+            )
+        yield t.sentiment_close(total=sentiment.get("total_analyzed", 0))
+
+    def _keywords(self, keywords: List) -> Iterator[str]:
+        t = self.t
+        yield t.keywords_open()
+        for i, (keyword, _) in enumerate(keywords[:15], 1):
+            # Lower score = more important in YAKE
+            marker = "🔥" if i <= 5 else "📌" if i <= 10 else "•"
+            yield t.keyword(marker=marker, keyword=keyword)
+        yield t.keywords_close(count=len(keywords))
+
+    def _trends(self, trends: Dict[str, Any]) -> Iterator[str]:
+        t = self.t
+        date_range = trends.get("date_range", {})
+        frequency = trends.get("frequency", {})
+        yield t.trends_open(
+            start=date_range.get("start", "Unknown"),
+            end=date_range.get("end", "Unknown"),
+            avg_per_day=frequency.get("avg_per_day", 0),
+            max_per_day=frequency.get("max_per_day", 0),
+            total_days=frequency.get("total_days", 0)
+        )
+
+        engagement = trends.get("engagement_trends", {})
+        if engagement.get("available"):
+            yield t.engagement(
+                avg_likes=engagement.get("avg_likes", 0),
+                avg_retweets=engagement.get("avg_retweets", 0),
+                avg_replies=engagement.get("avg_replies", 0),
+                total_engagement=engagement.get("total_engagement", 0)
+            )
+
+        timeline = trends.get("timeline", [])
+        if timeline:
+            yield t.timeline_open()
+            for entry in timeline[-7:]:  # Last 7 days
+                yield t.timeline_entry(date=entry.get("date"), count=entry.get("count"))
+            yield from self._close(t.timeline_close)
+        yield t.trends_close()
+
+    def _drift_scores(self, drift: Dict[str, Any]) -> Dict[str, float]:
+        return {key: drift[key] for key in ("rbo", "weighted_jaccard", "magnitude")}
+
+    def _movers(self, movers: List) -> str:
+        return self.t.mover_separator().join(
+            self.t.mover(keyword=keyword, change=change) for keyword, change in movers[:5]
+        )
+
+    @staticmethod
+    def _close(template) -> Iterator[str]:
+        if template is not None:
+            yield template()
+
+
+class MarkdownRenderer(ReportRenderer):
+    """The Markdown report (also what ``ReportParser`` reads back)."""
+
+    name = "markdown"
+    suffix = ".md"
+    TEMPLATES = {
+        "header": (
+            "# {topic} - Research Report\n\n"
+            "**Generated**: {generated}  \n"
+            "**Data Sources**: X ({x_count}), Web ({web_count}) - Total: {total}  \n"
+            "**Analysis Model**: {model}  \n"
+            "**Tokens Used**: {tokens_used}  \n"
+            "\n---\n"
+        ),
+        "quick_stats": "\n## 📊 Quick Stats\n\n{stats:s}\n\n",
+        "stat_sentiment": "**Overall Sentiment**: {overall} ({compound:+.3f})",
+        "stat_keyword": "**Top Keyword**: {keyword}",
+        "stat_activity": "**Avg Activity**: {avg_per_day} items/day",
+        "stat_separator": " | ",
+        "comparison_open": "\n## 🔄 Changes Since Last Report\n",
+        "new_topics_open": "**New Topics**:",
+        "new_topic": "- ✨ {topic}",
+        "removed_topics_open": "**Declining Topics**:",
+        "removed_topic": "- 📉 {topic}",
+        "list_close": "",
+        "drift": (
+            "**Keyword Drift**: {rbo:.0%} rank overlap, {weighted_jaccard:.0%} weighted overlap, "
+            "{magnitude:.0%} of keyword weight moved"
+        ),
+        "drift_gaining": "- Gaining weight: {movers:s}",
+        "drift_losing": "- Losing weight: {movers:s}",
+        "mover": "{keyword} ({change:+.1f} pp)",
+        "mover_separator": ", ",
+        "sentiment_shift": "**Sentiment Shift**: {old} {direction} {new}\n",
+        "overall_trend": "**Overall Trend**: {trend}\n",
+        "history_open": "**📆 History** ({reports} reports since {since}):",
+        "history_series": "- **{label}**: {first} → {last}",
+        "history_series_trend": "- **{label}**: {first} → {last} ({direction}, {slope:+.4f}/day)",
+        "history_shift": "  - Shift on {date}: {before} → {after}",
+        "history_keywords": "- **{label} keywords**: {keywords}",
+        "history_drift": (
+            "- **Keyword drift vs. history**: {rbo:.0%} rank overlap, "
+            "{weighted_jaccard:.0%} weighted overlap, {magnitude:.0%} of keyword weight moved"
+        ),
+        "sentiment_open": (
+            "\n## 😊 Sentiment Analysis\n\n"
+            "**Overall Sentiment**: {overall} (compound score: {compound:+.3f})\n\n"
+            "**Distribution**:\n"
+        ),
+        "sentiment_bar": "- {label}:{pad} {bars} {percentage:.1f}% ({count} items)",
+        "sentiment_close": "\n*Analyzed {total} items*\n",
+        "keywords_open": "\n## 🔑 Top Keywords\n\n**Most Important Topics**:\n",
+        "keyword": "{marker} {keyword}",
+        "keywords_close": "\n*Extracted {count} total keywords*\n",
+        "trends_open": (
+            "\n## 📈 Temporal Trends\n\n"
+            "**Date Range**: {start} to {end}\n\n"
+            "**Activity Frequency**:\n"
+            "- Average: {avg_per_day} items/day\n"
+            "- Peak: {max_per_day} items/day\n"
+            "- Coverage: {total_days} days\n"
+        ),
+        "engagement": (
+            "**Engagement Trends** (X/Twitter):\n"
+            "- Average Likes: {avg_likes}\n"
+            "- Average Retweets: {avg_retweets}\n"
+            "- Average Replies: {avg_replies}\n"
+            "- Total Engagement: {total_engagement:,}\n"
+        ),
+        "timeline_open": "**Recent Activity**:",
+        "timeline_entry": "- {date}: {count} items",
+        "timeline_close": None,
+        "trends_close": "",
+        "analysis": "{text}\n\n---\n",
+        "sources_open": "\n## 📚 Data Sources\n",
+        "x_open": "\n### X (Twitter) - {count} posts\n",
+        "x_item": (
+            "{index}. **@{author}** - {date}  \n"
+            "   {content}  \n"
+            "   👍 {likes} likes | [View Tweet]({url})  \n"
+        ),
+        "x_close": None,
+        "web_open": "\n### Web - {count} results\n",
+        "web_item": (
+            "{index}. **{title}**  \n"
+            "   Source: {source} | Date: {date}  \n"
+            "   [Read Article]({url})  \n"
+        ),
+        "web_close": None,
+        "footer": (
+            "\n---\n\n"
+            "\n*This report was generated by Research Agent - AI-powered research automation tool*\n"
+        ),
+    }
+
+
+def _escape_html(value: Any) -> str:
+    return html.escape(str(value))
+
+
+def _escape_html_url(value: Any) -> str:
+    # Scraped URLs must not become javascript: or data: links
+    url = str(value)
+    if urlsplit(url).scheme.lower() not in ("http", "https"):
+        return "#"
+    return html.escape(url)
+
+
+class HtmlRenderer(ReportRenderer):
+    """A standalone HTML page."""
+
+    name = "html"
+    suffix = ".html"
+    escape = staticmethod(_escape_html)
+    escape_url = staticmethod(_escape_html_url)
+    TEMPLATES = {
+        "header": (
+            "<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n<meta charset=\"utf-8\">\n"
+            "<title>{topic} - Research Report</title>\n"
+            "<style>body{{font-family:sans-serif;max-width:60rem;margin:2rem auto;padding:0 1rem}}"
+            ".analysis{{white-space:pre-wrap}}meter{{width:12rem}}</style>\n"
+            "</head>\n<body>\n<h1>{topic} - Research Report</h1>\n<p>"
+            "<strong>Generated</strong>: {generated}<br>\n"
+            "<strong>Data Sources</strong>: X ({x_count}), Web ({web_count}) - Total: {total}<br>\n"
+            "<strong>Analysis Model</strong>: {model}<br>\n"
+            "<strong>Tokens Used</strong>: {tokens_used}</p>\n<hr>"
+        ),
+        "quick_stats": "<h2>📊 Quick Stats</h2>\n<p>{stats:s}</p>",
+        "stat_sentiment": "<strong>Overall Sentiment</strong>: {overall} ({compound:+.3f})",
+        "stat_keyword": "<strong>Top Keyword</strong>: {keyword}",
+        "stat_activity": "<strong>Avg Activity</strong>: {avg_per_day} items/day",
+        "stat_separator": " | ",
+        "comparison_open": "<h2>🔄 Changes Since Last Report</h2>",
+        "new_topics_open": "<h3>New Topics</h3>\n<ul>",
+        "new_topic": "<li>✨ {topic}</li>",
+        "removed_topics_open": "<h3>Declining Topics</h3>\n<ul>",
+        "removed_topic": "<li>📉 {topic}</li>",
+        "list_close": "</ul>",
+        "drift": (
+            "<h3>Keyword Drift</h3>\n<p>{rbo:.0%} rank overlap, {weighted_jaccard:.0%} weighted overlap, "
+            "{magnitude:.0%} of keyword weight moved</p>\n<ul>"
+        ),
+        "drift_gaining": "<li>Gaining weight: {movers:s}</li>",
+        "drift_losing": "<li>Losing weight: {movers:s}</li>",
+        "mover": "{keyword} ({change:+.1f} pp)",
+        "mover_separator": ", ",
+        "sentiment_shift": "<p><strong>Sentiment Shift</strong>: {old} {direction} {new}</p>",
+        "overall_trend": "<p><strong>Overall Trend</strong>: {trend}</p>",
+        "history_open": "<h3>📆 History ({reports} reports since {since})</h3>\n<ul>",
+        "history_series": "<li><strong>{label}</strong>: {first} → {last}</li>",
+        "history_series_trend": (
+            "<li><strong>{label}</strong>: {first} → {last} ({direction}, {slope:+.4f}/day)</li>"
+        ),
+        "history_shift": "<li>Shift on {date}: {before} → {after}</li>",
+        "history_keywords": "<li><strong>{label} keywords</strong>: {keywords}</li>",
+        "history_drift": (
+            "<li><strong>Keyword drift vs. history</strong>: {rbo:.0%} rank overlap, "
+            "{weighted_jaccard:.0%} weighted overlap, {magnitude:.0%} of keyword weight moved</li>"
+        ),
+        "sentiment_open": (
+            "<h2>😊 Sentiment Analysis</h2>\n"
+            "<p><strong>Overall Sentiment</strong>: {overall} (compound score: {compound:+.3f})</p>\n<ul>"
+        ),
+        "sentiment_bar": (
+            "<li>{label}: <meter min=\"0\" max=\"100\" value=\"{percentage:.1f}\"></meter> "
+            "{percentage:.1f}% ({count} items)</li>"
+        ),
+        "sentiment_close": "</ul>\n<p><em>Analyzed {total} items</em></p>",
+        "keywords_open": "<h2>🔑 Top Keywords</h2>\n<ol>",
+        "keyword": "<li>{marker} {keyword}</li>",
+        "keywords_close": "</ol>\n<p><em>Extracted {count} total keywords</em></p>",
+        "trends_open": (
+            "<h2>📈 Temporal Trends</h2>\n"
+            "<p><strong>Date Range</strong>: {start} to {end}</p>\n"
+            "<ul>\n<li>Average: {avg_per_day} items/day</li>\n<li>Peak: {max_per_day} items/day</li>\n"
+            "<li>Coverage: {total_days} days</li>\n</ul>"
+        ),
+        "engagement": (
+            "<h3>Engagement Trends (X/Twitter)</h3>\n<ul>\n"
+            "<li>Average Likes: {avg_likes}</li>\n<li>Average Retweets: {avg_retweets}</li>\n"
+            "<li>Average Replies: {avg_replies}</li>\n<li>Total Engagement: {total_engagement:,}</li>\n</ul>"
+        ),
+        "timeline_open": "<h3>Recent Activity</h3>\n<ul>",
+        "timeline_entry": "<li>{date}: {count} items</li>",
+        "timeline_close": "</ul>",
+        "trends_close": "",
+        "analysis": "<h2>Analysis</h2>\n<div class=\"analysis\">{text}</div>\n<hr>",
+        "sources_open": "<h2>📚 Data Sources</h2>",
+        "x_open": "<h3>X (Twitter) - {count} posts</h3>\n<ol>",
+        "x_item": (
+            "<li><strong>@{author}</strong> - {date}<br>\n{content}<br>\n"
+            "👍 {likes} likes | <a href=\"{url:s}\">View Tweet</a></li>"
+        ),
+        "x_close": "</ol>",
+        "web_open": "<h3>Web - {count} results</h3>\n<ol>",
+        "web_item": (
+            "<li><strong>{title}</strong><br>\nSource: {source} | Date: {date}<br>\n"
+            "<a href=\"{url:s}\">Read Article</a></li>"
+        ),
+        "web_close": "</ol>",
+        "footer": (
+            "<hr>\n<p><em>This report was generated by Research Agent - "
+            "AI-powered research automation tool</em></p>\n</body>\n</html>\n"
+        ),
+    }
+
+
+class JsonRenderer(ReportRenderer):
+    """The structured report itself, as compact JSON."""
+
+    name = "json"
+    suffix = ".json"
+    separator = ""
+
+    # The report and its sections are streamed member by member, long lists
+    # (sources) in chunks; anything else is encoded in one call
+    STREAM_DEPTH = 2
+    CHUNK_SIZE = 256
+
+    def __init__(self):
+        """Set up the encoder."""
+        super().__init__()
+        self.encode = json.JSONEncoder(ensure_ascii=False).encode
+
+    def render(self, report: Dict[str, Any]) -> Iterator[str]:
+        """Encode the report incrementally, a chunk of sources at a time."""
+        yield from self._stream(report, self.STREAM_DEPTH)
+        yield "\n"
+
+    def _stream(self, value: Any, depth: int) -> Iterator[str]:
+        # JSONEncoder.iterencode streams too, but only encode() uses the
+        # C encoder; chunks keep the number of encode() calls small
+        if depth and isinstance(value, dict) and value:
+            opening = "{"
+            for key, member in value.items():
+                yield opening + encode_basestring(str(key)) + ":"
+                yield from self._stream(member, depth - 1)
+                opening = ","
+            yield "}"
+        elif isinstance(value, SourceSummary):
+            yield f'{{"x_count":{value.x_count},"web_count":{value.web_count}'
+            for source in ("x", "web"):
+                opening = f',"{source}":['
+                for chunk in value.chunks(source, self.CHUNK_SIZE):
+                    yield opening + self.encode(chunk)[1:-1]
+                    opening = ","
+                yield "]" if opening == "," else opening + "]"
+            yield "}"
+        elif isinstance(value, (list, tuple)) and len(value) > self.CHUNK_SIZE:
+            opening = "["
+            for start in range(0, len(value), self.CHUNK_SIZE):
+                yield opening + self.encode(value[start:start + self.CHUNK_SIZE])[1:-1]
+                opening = ","
+            yield "]"
+        else:
+            yield self.encode(value)
+
+
+RENDERERS: Dict[str, Type[ReportRenderer]] = {
+    renderer.name: renderer for renderer in (MarkdownRenderer, HtmlRenderer, JsonRenderer)
+}
+
+
+def get_renderer(name: str) -> ReportRenderer:
+    """
+    Get the renderer of an output format.
+
+    Args:
+        name: Output format (markdown, html or json)
+
+    Returns:
+        Renderer instance
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    try:
+        return RENDERERS[name.lower()]()
+    except KeyError:
+        raise ValueError(f"Unknown report format '{name}'. Valid formats: {', '.join(RENDERERS)}")
+
+
+@lru_cache(maxsize=None)
+def _compiled(renderer: Type[ReportRenderer]) -> TemplateSet:
+    """Compile a format's templates once per process."""
+    return TemplateSet(renderer.TEMPLATES, renderer.escape)
+
+
+def _display_time(generated: str) -> str:
+    """Show an ISO timestamp as ``%Y-%m-%d %H:%M:%S``."""
+    try:
+        return datetime.fromisoformat(generated).strftime("%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        return generated
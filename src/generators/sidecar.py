@@ -0,0 +1,133 @@
+"""Machine-readable JSON sidecars written next to every report."""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from src.analyzers.sources import SourceSummary
+from src.utils.files import atomic_writer
+from src.utils.logger import get_logger
+
+
+logger = get_logger("sidecar")
+
+SIDECAR_FORMAT = "research-agent.report"
+SIDECAR_VERSION = 1
+SIDECAR_SUFFIX = ".sidecar.json"
+
+
+class SidecarError(ValueError):
+    """Raised when a sidecar is not a report sidecar or has an unsupported version."""
+
+
+def sidecar_path(report_path: Path) -> Path:
+    """
+    Get the sidecar file of a report.
+
+    Args:
+        report_path: Markdown report path (or the sidecar path itself)
+
+    Returns:
+        Sidecar path (``report.md`` -> ``report.sidecar.json``)
+    """
+    report_path = Path(report_path)
+    if report_path.name.endswith(SIDECAR_SUFFIX):
+        return report_path
+    return report_path.with_suffix(SIDECAR_SUFFIX)
+
+
+def build_sidecar(
+    topic: str,
+    analysis_result: Dict[str, Any],
+    sources: Union[SourceSummary, Dict[str, List[Dict[str, Any]]]],
+    sentiment: Dict[str, Any] = None,
+    keywords: List[tuple] = None,
+    trends: Dict[str, Any] = None,
+    comparison: Dict[str, Any] = None,
+    report_name: str = ""
+) -> Dict[str, Any]:
+    """
+    Build the sidecar document of a report.
+
+    Args:
+        topic: Research topic
+        analysis_result: Analysis results
+        sources: Source summary (or its JSON form)
+        sentiment: Sentiment analysis results
+        keywords: Keyword extraction results as (keyword, score) tuples
+        trends: Temporal trend analysis results
+        comparison: Comparison with previous report
+        report_name: File name of the Markdown report
+
+    Returns:
+        JSON-serializable sidecar dictionary
+    """
+    return {
+        "format": SIDECAR_FORMAT,
+        "version": SIDECAR_VERSION,
+        "topic": topic,
+        "generated": datetime.now().isoformat(timespec="seconds"),
+        "report": report_name,
+        "analysis": {
+            "text": analysis_result.get("analysis") or "",
+            "metadata": analysis_result.get("metadata", {}),
+        },
+        "sentiment": sentiment,
+        "keywords": [[keyword, score] for keyword, score in keywords or []],
+        "trends": trends,
+        "comparison": comparison,
+        # Kept columnar; rows are built when the document is serialized
+        "sources": sources if isinstance(sources, SourceSummary) else SourceSummary.from_sidecar(sources),
+    }
+
+
+def write_sidecar(path: Path, sidecar: Dict[str, Any]) -> None:
+    """
+    Write a sidecar, replacing any previous one atomically.
+
+    Args:
+        path: Sidecar path
+        sidecar: Sidecar document
+    """
+    with atomic_writer(path) as handle:
+        handle.write(json.dumps(sidecar, ensure_ascii=False, separators=(",", ":"), default=_encode))
+
+
+def load_sidecar(report_path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Load the sidecar of a report.
+
+    Args:
+        report_path: Markdown report path (or the sidecar path itself)
+
+    Returns:
+        Sidecar document with keywords as (keyword, score) tuples, or None
+        if the report has no sidecar
+
+    Raises:
+        SidecarError: If the file is not a supported report sidecar
+    """
+    path = sidecar_path(report_path)
+    try:
+        sidecar = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except ValueError as e:
+        raise SidecarError(f"Unreadable sidecar {path}: {e}")
+
+    if not isinstance(sidecar, dict) or sidecar.get("format") != SIDECAR_FORMAT:
+        raise SidecarError(f"{path} is not a Research Agent report sidecar")
+    version = sidecar.get("version")
+    if not isinstance(version, int) or version > SIDECAR_VERSION:
+        raise SidecarError(f"Unsupported sidecar version {version} in {path} (max {SIDECAR_VERSION})")
+
+    sidecar["keywords"] = [tuple(entry) for entry in sidecar.get("keywords") or []]
+    return sidecar
+
+
+def _encode(value: Any) -> Any:
+    """Serialize the sidecar's non-JSON values."""
+    if isinstance(value, SourceSummary):
+        return value.to_sidecar()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -0,0 +1,115 @@
+"""Report templates compiled to Python code once per process."""
+
+import keyword
+import re
+import string
+from typing import Any, Callable, Dict, Mapping, Optional
+
+_FIELD_NAME = re.compile(r"[A-Za-z][A-Za-z0-9_]*\Z")
+_FORMAT_SPEC = re.compile(r"[^{}'\"\\\n]*\Z")
+
+
+class TemplateError(ValueError):
+    """Raised when a template uses unsupported placeholder syntax."""
+
+
+class Template:
+    """
+    A text template with ``{field}`` and ``{field:spec}`` placeholders.
+
+    The template is compiled into a function taking its fields as
+    keyword-only arguments and returning one f-string, so rendering costs
+    a single call with no parsing or dictionary lookups. Fields without a
+    format spec pass through the escape function of the template's output
+    format; fields with a spec are not escaped (use ``{field:s}`` for
+    fragments rendered by other templates). Extra arguments are ignored,
+    so formats can share one call site while using different fields.
+    """
+
+    def __init__(self, name: str, source: str, escape: Callable[[Any], str] = None):
+        """
+        Compile a template.
+
+        Args:
+            name: Template name (used in error messages)
+            source: Template text
+            escape: Escape function applied to fields without a spec
+
+        Raises:
+            TemplateError: If a placeholder is not a plain field name
+        """
+        self.name = name
+        self.source = source
+        self.fields = []
+
+        pieces = []
+        try:
+            parsed = list(string.Formatter().parse(source))
+        except ValueError as e:
+            raise TemplateError(f"Template '{name}': {e}")
+
+        for literal, field, spec, conversion in parsed:
+            if literal:
+                pieces.append(repr(literal))
+            if field is None:
+                continue
+            if (not _FIELD_NAME.match(field) or keyword.iskeyword(field)
+                    or conversion or not _FORMAT_SPEC.match(spec or "")):
+                raise TemplateError(f"Template '{name}': unsupported placeholder {{{field}}}")
+            if field not in self.fields:
+                self.fields.append(field)
+            if spec:
+                pieces.append(f"f'{{{field}:{spec}}}'")
+            elif escape is not None:
+                pieces.append(f"f'{{_escape({field})}}'")
+            else:
+                pieces.append(f"f'{{{field}}}'")
+
+        params = "".join(f"{field}, " for field in self.fields)
+        signature = f"*, {params}**_" if params else "**_"
+        body = " ".join(pieces) or repr("")
+        code = compile(f"lambda {signature}: {body}", f"<template {name}>", "eval")
+        self.format: Callable[..., str] = eval(code, {"_escape": escape})
+
+    def render(self, context: Mapping[str, Any]) -> str:
+        """
+        Render with a mapping of field values.
+
+        Args:
+            context: Field values
+
+        Returns:
+            Rendered text
+
+        Raises:
+            TemplateError: If a field is missing
+        """
+        missing = [field for field in self.fields if field not in context]
+        if missing:
+            raise TemplateError(f"Template '{self.name}' needs fields: {', '.join(missing)}")
+        return self.format(**context)
+
+
+class TemplateSet:
+    """
+    Named templates of one output format.
+
+    Each template's ``format`` function is an attribute, so renderers call
+    ``templates.header(topic=...)`` with no lookup or wrapper overhead.
+    """
+
+    def __init__(self, sources: Dict[str, Optional[str]], escape: Callable[[Any], str] = None):
+        """
+        Compile every template of a format.
+
+        Args:
+            sources: Template text by name; None marks a template the
+                format does not use
+            escape: Escape function for the format's field values
+        """
+        self.templates: Dict[str, Optional[Template]] = {
+            name: None if source is None else Template(name, source, escape)
+            for name, source in sources.items()
+        }
+        for name, template in self.templates.items():
+            setattr(self, name, None if template is None else template.format)
@@ -1,6 +1,7 @@
 """Follow-up question analyzer."""
 
 from typing import Dict, List, Any
+from src.analyzers.prompt_templates import PromptSpec
 from src.utils.logger import get_logger
 from src.interactive.prompts import build_followup_prompt
 
@@ -26,7 +27,9 @@ class FollowupAnalyzer:
         question: str,
         data: List[Dict[str, Any]],
         original_analysis: Dict[str, Any],
-        context: Dict[str, Any] = None
+        context: Dict[str, Any] = None,
+        relevant_data: List[Dict[str, Any]] = None,
+        session_context: PromptSpec = None
     ) -> str:
         """
         Analyze a follow-up question using existing data.
@@ -36,6 +39,8 @@ class FollowupAnalyzer:
             data: Collected data items
             original_analysis: Original analysis results
             context: Additional context (topic, sentiment, etc.)
+            relevant_data: Items to highlight (default: matched from question)
+            session_context: Prebuilt session prefix (see ``build_session_context``)
 
         Returns:
             Answer to the question
@@ -43,41 +48,85 @@ class FollowupAnalyzer:
         self.logger.info(f"Analyzing follow-up question: {question[:50]}...")
 
         try:
-            # Extract relevant data for the question
-            relevant_data = self.extract_relevant_data(question, data)
+            request = self._build_request(
+                question, data, original_analysis, context, relevant_data, session_context
+            )
+            return self._format_answer(self.analyzer.analyze(**request))
 
-            if not relevant_data:
-                # Use all data if no specific matches
-                relevant_data = data
+        except Exception as e:
+            self.logger.error(f"Error analyzing question: {e}")
+            return f"❌ Error: {str(e)}"
 
-            # Limit data to prevent token overflow
-            limited_data = relevant_data[:30]  # Max 30 items
+    def analyze_questions(self, questions: List[Dict[str, Any]]) -> List[str]:
+        """
+        Answer several independent follow-up questions concurrently.
 
-            # Build follow-up prompt
-            prompt = build_followup_prompt(
-                question=question,
-                data=limited_data,
-                original_analysis=original_analysis.get("analysis", ""),
-                context=context or {}
-            )
+        The questions are sent together on one event loop, bounded by the
+        analyzer's concurrency limit.
 
-            # Use the analyzer's analyze method with the custom prompt
-            # For quick follow-ups, use "quick" depth
-            result = self.analyzer.analyze(
-                topic=question,
-                data=limited_data,
-                depth="quick",
-                custom_prompt=prompt
-            )
+        Args:
+            questions: Keyword arguments for ``analyze_question``, one dict
+                per question
 
-            if result.get("success"):
-                return result.get("analysis", "No answer generated")
-            else:
-                return f"❌ Analysis failed: {result.get('error', 'Unknown error')}"
+        Returns:
+            Answers in question order
+        """
+        self.logger.info(f"Analyzing {len(questions)} follow-up questions concurrently...")
+
+        try:
+            requests = [self._build_request(**question) for question in questions]
+            results = self.analyzer.analyze_concurrently(requests)
+            return [self._format_answer(result) for result in results]
 
         except Exception as e:
-            self.logger.error(f"Error analyzing question: {e}")
-            return f"❌ Error: {str(e)}"
+            self.logger.error(f"Error analyzing questions: {e}")
+            return [f"❌ Error: {str(e)}"] * len(questions)
+
+    def _build_request(
+        self,
+        question: str,
+        data: List[Dict[str, Any]],
+        original_analysis: Dict[str, Any],
+        context: Dict[str, Any] = None,
+        relevant_data: List[Dict[str, Any]] = None,
+        session_context: PromptSpec = None
+    ) -> Dict[str, Any]:
+        """Build the analyzer arguments for one follow-up question."""
+        # Extract relevant data for the question
+        if relevant_data is None:
+            relevant_data = self.extract_relevant_data(question, data)
+
+        if not relevant_data:
+            # Use all data if no specific matches
+            relevant_data = data
+
+        # Limit data to prevent token overflow
+        limited_data = relevant_data[:30]  # Max 30 items
+
+        # Build follow-up prompt; its data and analysis prefix is the
+        # same for every question, so providers can cache it
+        prompt = build_followup_prompt(
+            question=question,
+            data=data,
+            original_analysis=original_analysis.get("analysis") or "",
+            context=context or {},
+            relevant=limited_data,
+            session_context=session_context
+        )
+
+        # For quick follow-ups, use "quick" depth
+        return {
+            "topic": question,
+            "data_items": limited_data,
+            "depth": "quick",
+            "custom_prompt": prompt
+        }
+
+    @staticmethod
+    def _format_answer(result: Dict[str, Any]) -> str:
+        if result.get("success"):
+            return result.get("analysis", "No answer generated")
+        return f"❌ Analysis failed: {result.get('error', 'Unknown error')}"
 
     def extract_relevant_data(
         self,
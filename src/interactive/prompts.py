@@ -2,32 +2,50 @@
 
 from typing import Dict, List, Any
 
+from src.analyzers.prompt_templates import ANALYST_SYSTEM_PROMPT, PromptSpec, build_data_block
+
 
 def build_followup_prompt(
     question: str,
     data: List[Dict[str, Any]],
     original_analysis: str,
-    context: Dict[str, Any]
-) -> str:
+    context: Dict[str, Any],
+    relevant: List[Dict[str, Any]] = None,
+    session_context: PromptSpec = None
+) -> PromptSpec:
     """
     Build a prompt for follow-up questions.
 
+    The system prompt, the collected data and the original analysis form the
+    same prefix for every question of a session (the data block is the one
+    used by the original analysis), so it can be served from the provider's
+    prompt cache. Only the question-specific part changes.
+
     Args:
         question: User's question
-        data: Relevant data items
+        data: All collected data items of the session
         original_analysis: Original analysis text
         context: Additional context
+        relevant: Data items most relevant to the question (default: data)
+        session_context: The session's prefix from ``build_session_context``
+            (default: built from ``data`` and ``original_analysis``)
 
     Returns:
-        Formatted prompt string
+        Prompt split into cacheable context and question-specific task
     """
+    relevant = data if relevant is None else relevant
+    if session_context is None:
+        session_context = build_session_context(context.get("topic", "Unknown"), data, original_analysis)
+
     # Build data summary
-    data_summary = _summarize_data(data)
+    data_summary = _summarize_data(relevant)
 
     # Build context summary
     context_summary = _summarize_context(context)
 
-    prompt = f"""You are analyzing research data to answer a follow-up question.
+    task = f"""# Follow-up Question
+
+You are answering a follow-up question about the research data and analysis above.
 
 **Original Topic**: {context.get('topic', 'Unknown')}
 
@@ -35,12 +53,9 @@ def build_followup_prompt(
 
 {context_summary}
 
-**Relevant Data** ({len(data)} items):
+**Relevant Data** ({len(relevant)} items):
 {data_summary}
 
-**Original Analysis Summary**:
-{original_analysis[:500]}...
-
 **Instructions**:
 1. Answer the question directly and concisely
 2. Use specific examples from the data to support your answer
@@ -51,7 +66,35 @@ def build_followup_prompt(
 Provide a clear, focused answer to: "{question}"
 """
 
-    return prompt
+    return PromptSpec(
+        system=session_context.system,
+        context=session_context.context,
+        task=task
+    )
+
+
+def build_session_context(topic: str, data: List[Dict[str, Any]], original_analysis: str) -> PromptSpec:
+    """
+    Build the prefix shared by every follow-up question of a session.
+
+    The data block ranks every item, so sessions build the prefix once and
+    pass it to ``build_followup_prompt`` for each question.
+
+    Args:
+        topic: Research topic
+        data: All collected data items of the session
+        original_analysis: Original analysis text
+
+    Returns:
+        PromptSpec with system prompt and context blocks but no task
+    """
+    return PromptSpec(
+        system=ANALYST_SYSTEM_PROMPT,
+        context=[
+            build_data_block(topic, data),
+            f"# Original Analysis\n\n{original_analysis}"
+        ]
+    )
 
 
 def _summarize_data(data: List[Dict[str, Any]]) -> str:
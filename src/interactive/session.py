@@ -1,10 +1,12 @@
 """Interactive session manager for follow-up questions."""
 
+import heapq
 from typing import Dict, List, Any
 from rich.console import Console
+from src.analyzers.sources import SourceSummary
 from src.utils.logger import get_logger
 from src.interactive.followup_analyzer import FollowupAnalyzer
-from src.interactive.prompts import build_followup_prompt
+from src.interactive.prompts import build_session_context
 
 
 console = Console()
@@ -22,7 +24,8 @@ class InteractiveSession:
         analyzer: Any,  # ClaudeAnalyzer or GeminiAnalyzer
         sentiment: Dict[str, Any] = None,
         keywords: List[tuple] = None,
-        trends: Dict[str, Any] = None
+        trends: Dict[str, Any] = None,
+        sources: SourceSummary = None
     ):
         """
         Initialize interactive session.
@@ -35,6 +38,7 @@ class InteractiveSession:
             sentiment: Sentiment analysis results
             keywords: Keyword extraction results
             trends: Trend analysis results
+            sources: Source summary (default: built from ``data``)
         """
         self.topic = topic
         self.data = data
@@ -43,12 +47,22 @@ class InteractiveSession:
         self.sentiment = sentiment
         self.keywords = keywords
         self.trends = trends
+        self.sources = sources if sources is not None else SourceSummary.from_items(data)
 
         self.followup_analyzer = FollowupAnalyzer(analyzer)
         self.conversation_history = []
 
+        # Build the data and original analysis prefix once for all
+        # follow-ups, and cache it on the provider side
+        self.session_context = build_session_context(topic, data, (analysis or {}).get("analysis") or "")
+        self.context_cached = self.analyzer.open_context(self.session_context)
+
         logger.info(f"Interactive session started for topic: {topic}")
 
+    def close(self) -> None:
+        """End the session and release its cached context."""
+        self.analyzer.close_context()
+
     def ask_question(self, question: str) -> str:
         """
         Process a follow-up question.
@@ -90,7 +104,8 @@ class InteractiveSession:
                         "sentiment": self.sentiment,
                         "keywords": self.keywords,
                         "trends": self.trends
-                    }
+                    },
+                    session_context=self.session_context
                 )
 
             # Store in conversation history
@@ -111,7 +126,7 @@ class InteractiveSession:
 **Interactive Mode Commands**:
 
 - **Ask any question** - Get AI-powered answers about the research
-- **focus <topic>** - Deep dive on a specific topic
+- **focus <topic>** - Deep dive on a specific topic (comma-separate several to run them together)
 - **sentiment** - Show detailed sentiment breakdown
 - **keywords** - Show all extracted keywords
 - **sources** - Show data sources summary
@@ -128,37 +143,57 @@ class InteractiveSession:
 
     def _focus_on_topic(self, focus_topic: str) -> str:
         """
-        Deep dive on a specific topic.
+        Deep dive on one or more specific topics.
+
+        Several comma-separated topics are analyzed concurrently.
 
         Args:
-            focus_topic: Topic to focus on
+            focus_topic: Topic to focus on (or comma-separated topics)
 
         Returns:
             Focused analysis
         """
         logger.info(f"Focusing on topic: {focus_topic}")
 
-        # Filter data relevant to the focus topic
-        relevant_data = self.followup_analyzer.extract_relevant_data(
-            focus_topic,
-            self.data
-        )
-
-        if not relevant_data:
-            return f"❌ No data found related to '{focus_topic}'"
-
-        # Generate focused analysis
-        question = f"Provide a detailed analysis focusing specifically on {focus_topic}. Include key points, sentiment, and any notable insights."
-
-        with console.status(f"[bold cyan]🔍 Analyzing {focus_topic}...[/bold cyan]"):
-            answer = self.followup_analyzer.analyze_question(
-                question=question,
-                data=relevant_data,
-                original_analysis=self.analysis,
-                context={"topic": focus_topic}
-            )
+        topics = [topic.strip() for topic in focus_topic.split(",") if topic.strip()]
+        found = {}
+        questions = []
+
+        for topic in topics:
+            # Filter data relevant to the focus topic
+            relevant_data = self.followup_analyzer.extract_relevant_data(topic, self.data)
+            found[topic] = len(relevant_data)
+
+            if not relevant_data:
+                continue
+
+            questions.append({
+                "question": f"Provide a detailed analysis focusing specifically on {topic}. Include key points, sentiment, and any notable insights.",
+                "data": self.data,
+                "original_analysis": self.analysis,
+                "context": {"topic": self.topic},
+                "relevant_data": relevant_data,
+                "session_context": self.session_context
+            })
 
-        return f"**Focus: {focus_topic}** (found {len(relevant_data)} relevant items)\n\n{answer}"
+        # Generate focused analyses
+        answers = []
+        if len(questions) == 1:
+            with console.status(f"[bold cyan]🔍 Analyzing {focus_topic}...[/bold cyan]"):
+                answers = [self.followup_analyzer.analyze_question(**questions[0])]
+        elif questions:
+            with console.status(f"[bold cyan]🔍 Analyzing {len(questions)} topics...[/bold cyan]"):
+                answers = self.followup_analyzer.analyze_questions(questions)
+
+        answers = iter(answers)
+        parts = []
+        for topic, count in found.items():
+            if not count:
+                parts.append(f"❌ No data found related to '{topic}'")
+            else:
+                parts.append(f"**Focus: {topic}** (found {count} relevant items)\n\n{next(answers)}")
+
+        return "\n\n---\n\n".join(parts)
 
     def _show_sentiment_details(self) -> str:
         """Show detailed sentiment breakdown."""
@@ -222,14 +257,23 @@ class InteractiveSession:
 
     def _show_sources(self) -> str:
         """Show data sources summary."""
-        x_count = sum(1 for item in self.data if item.get("source") == "x")
-        web_count = sum(1 for item in self.data if item.get("source") == "web")
-
+        sources = self.sources
         lines = [
             "**Data Sources Summary**:\n",
             f"Total Items: {len(self.data)}",
-            f"- X (Twitter): {x_count} posts",
-            f"- Web: {web_count} articles\n",
+            f"- X (Twitter): {sources.x_count} posts",
+            f"- Web: {sources.web_count} articles\n",
+        ]
+
+        # Most liked posts, found from the likes column alone
+        liked = [i for i, likes in enumerate(sources.x_likes) if isinstance(likes, int) and likes > 0]
+        if liked:
+            lines.append("**Most liked X posts**:")
+            for i in heapq.nlargest(3, liked, key=sources.x_likes.__getitem__):
+                lines.append(f"- @{sources.x_author[i]} ({sources.x_likes[i]:,} likes): {sources.x_url[i]}")
+            lines.append("")
+
+        lines += [
             "To explore specific sources, ask:",
             '- "Show me what people are saying on X"',
             '- "What do web articles say?"'
@@ -1,31 +1,44 @@
 """Main CLI entry point for Research Agent."""
 
 import sys
+import time
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 import click
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
+from rich.table import Table
 
 from src.config import Config
 from src.collectors import XCollector, WebCollector
-from src.analyzers import ClaudeAnalyzer, GeminiAnalyzer
+from src.collectors.pagination import Deadline, merge_streams
+from src.analyzers import LLMProvider, create_analyzer
+from src.analyzers.delta import DeltaAnalyzer
+from src.analyzers.history import HistoryIndex, ReportSnapshot
+from src.analyzers.batch import BatchError, create_batch_backend, run_batch
+from src.analyzers.prompt_templates import get_analysis_spec
+from src.analyzers.sources import SourceSummary
+from src.analyzers.streaming import StreamingAnalysis
 from src.analyzers.sentiment_analyzer import SentimentAnalyzer
 from src.analyzers.keyword_extractor import KeywordExtractor
 from src.analyzers.trend_analyzer import TrendAnalyzer
-from src.generators import MarkdownGenerator
+from src.generators import MarkdownGenerator, RenderJob, RenderPool
 from src.utils import get_logger, validate_topic, validate_sources, validate_depth
-from src.utils.validators import validate_max_items
+from src.utils.validators import validate_formats, validate_max_items, validate_window
 from src.utils.error_reporter import ErrorReporter
+from src.utils.metrics import metrics
+from src.utils.pipeline import Pipeline, StageError
+from src.utils.profiling import build_run_record, write_prometheus_textfile, write_run_record
+from src.utils.retry import reset_retry_budget
 
 console = Console()
 logger = get_logger("main")
 
 
-@click.command()
+@click.group(invoke_without_command=True)
 @click.option(
     "--topic",
-    required=True,
+    default=None,
     help="Research topic to investigate",
     callback=lambda ctx, param, value: validate_topic(value) if value else None
 )
@@ -48,6 +61,13 @@ logger = get_logger("main")
     help="Output filename (default: auto-generated)",
     type=str
 )
+@click.option(
+    "--format",
+    "formats",
+    default=Config.REPORT_FORMATS,
+    help="Extra report formats written next to the Markdown report: html, json (comma-separated)",
+    callback=lambda ctx, param, value: validate_formats(value)
+)
 @click.option(
     "--depth",
     default=Config.DEFAULT_DEPTH,
@@ -69,17 +89,41 @@ logger = get_logger("main")
 @click.option(
     "--compare-with",
     default=None,
-    help="Previous report to compare with (file path)",
+    help="Previous report to compare with (Markdown report, its .sidecar.json, or 'latest')",
     type=str
 )
+@click.option(
+    "--compare-window",
+    default=None,
+    help="Compare with every report about the topic in this window, e.g. 30d (trend lines and change points)",
+    callback=lambda ctx, param, value: validate_window(value) if value else None
+)
 @click.option(
     "--interactive",
     is_flag=True,
     help="Enter interactive mode after analysis"
 )
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Only send items new since the topic's last analysis and update that analysis"
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Show wall time, CPU, memory, bytes, items, retries and cache hits per stage"
+)
+@click.option(
+    "--metrics-file",
+    default=Config.METRICS_TEXTFILE or None,
+    type=click.Path(dir_okay=False),
+    help="Also write the run's metrics to this Prometheus textfile (*.prom)"
+)
 @click.version_option(version="0.1.0", prog_name="Research Agent")
-def cli(topic: str, sources: list, max_items: int, output: str, depth: str, model: str,
-        allow_partial: bool, compare_with: str, interactive: bool):
+@click.pass_context
+def cli(ctx: click.Context, topic: str, sources: list, max_items: int, output: str, formats: list, depth: str,
+        model: str, allow_partial: bool, compare_with: str, compare_window: timedelta,
+        interactive: bool, incremental: bool, profile: bool, metrics_file: str):
     """
     Research Agent - AI-powered research automation tool.
 
@@ -92,6 +136,11 @@ def cli(topic: str, sources: list, max_items: int, output: str, depth: str, mode
 
         research-agent --topic "Anthropic Claude" --sources x,web --max-items 30 --model gemini
     """
+    if ctx.invoked_subcommand is not None:
+        return
+    if not topic:
+        raise click.UsageError("Missing option '--topic'.")
+
     console.print("\n[bold cyan]🔬 Research Agent[/bold cyan]")
     console.print(f"[dim]Topic: {topic}[/dim]")
     console.print(f"[dim]Sources: {', '.join(sources)}[/dim]")
@@ -104,90 +153,109 @@ def cli(topic: str, sources: list, max_items: int, output: str, depth: str, mode
         Config.validate(model=model)
         Config.ensure_output_dir()
 
+        # Every retry in this run draws from one budget
+        metrics.reset()
+        retry_budget = reset_retry_budget()
+        run_started = datetime.now()
+        run_options = {
+            "topic": topic, "sources": sources, "max_items": max_items, "depth": depth, "model": model,
+            "incremental": incremental, "formats": formats,
+        }
+
         # Initialize components
         collectors = {
             "x": XCollector() if "x" in sources else None,
             "web": WebCollector() if "web" in sources else None,
         }
 
-        # Select analyzer based on model choice
-        if model.lower() == "claude":
-            analyzer = ClaudeAnalyzer()
-            model_display = "Claude AI"
-        else:  # gemini
-            analyzer = GeminiAnalyzer()
-            model_display = "Gemini AI"
+        # Select analyzer based on model choice (the other provider, if
+        # configured, is used as fallback)
+        analyzer = create_analyzer(model)
+        model_display = analyzer.display_name
 
         generator = MarkdownGenerator()
 
+        # Stages after collection overlap; see the graph built below
+        pipeline = Pipeline()
+        live = StreamingAnalysis()
+
         # Step 1: Collect data with error tracking
         all_data = []
         collection_errors = []
         successful_sources = []
         failed_sources = []
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            console=console
-        ) as progress:
-
-            if collectors["x"]:
-                task = progress.add_task(
-                    f"🔍 Collecting X data... (0/{max_items})",
-                    total=max_items
-                )
-                try:
-                    x_data = collectors["x"].collect(topic, max_items)
-                    all_data.extend(x_data)
-                    progress.update(task, completed=len(x_data))
-
-                    if len(x_data) > 0:
-                        console.print(f"[green]✓[/green] Collected {len(x_data)} X posts")
-                        successful_sources.append("X")
-                    else:
-                        console.print(f"[yellow]⚠️[/yellow]  No X data collected")
-                        failed_sources.append("X")
-                except Exception as e:
-                    collection_errors.append(("X", e))
-                    failed_sources.append("X")
-                    console.print(f"[red]✗[/red] X collection failed: {str(e)[:50]}")
-                    logger.error(f"X collection error: {e}", exc_info=True)
-
-                    # Log error details
-                    ErrorReporter.log_error_to_file("X", e, {
-                        "topic": topic,
-                        "max_items": max_items
-                    })
-
-            if collectors["web"]:
-                task = progress.add_task(
-                    f"🌐 Collecting web data... (0/{max_items})",
-                    total=max_items
-                )
-                try:
-                    web_data = collectors["web"].collect(topic, max_items)
-                    all_data.extend(web_data)
-                    progress.update(task, completed=len(web_data))
-
-                    if len(web_data) > 0:
-                        console.print(f"[green]✓[/green] Collected {len(web_data)} web results")
-                        successful_sources.append("Web")
-                    else:
-                        console.print(f"[yellow]⚠️[/yellow]  No web data collected")
-                        failed_sources.append("Web")
-                except Exception as e:
-                    collection_errors.append(("Web", e))
-                    failed_sources.append("Web")
-                    console.print(f"[red]✗[/red] Web collection failed: {str(e)[:50]}")
-                    logger.error(f"Web collection error: {e}", exc_info=True)
+        source_labels = {"x": "X", "web": "Web"}
+        source_tasks = {"x": "🔍 Collecting X data...", "web": "🌐 Collecting web data..."}
+        source_nouns = {"x": ("X posts", "X"), "web": ("web results", "web")}
+        active = {name: collector for name, collector in collectors.items() if collector}
+        item_counts = {name: 0 for name in active}
+
+        with pipeline.time("collection"):
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                console=console
+            ) as progress:
+
+                # Stream every source concurrently under one shared deadline
+                deadline = Deadline(Config.COLLECTION_DEADLINE)
+                tasks = {
+                    name: progress.add_task(f"{source_tasks[name]} (0/{max_items})", total=max_items)
+                    for name in active
+                }
+                # Each collector is profiled as its own stage
+                streams = {
+                    name: pipeline.stream(f"collect.{name}", collector.stream(topic, max_items, deadline))
+                    for name, collector in active.items()
+                }
+                # Enhanced analysis runs on items as they arrive
+                stats_task = progress.add_task(live.summary(), total=None)
+                stats_shown = 0.0
+
+                for name, item, error in merge_streams(streams):
+                    label = source_labels[name]
+
+                    if error is not None:
+                        collection_errors.append((label, error))
+                        failed_sources.append(label)
+                        console.print(f"[red]✗[/red] {label} collection failed: {str(error)[:50]}")
+                        logger.error(f"{label} collection error: {error}", exc_info=error)
+
+                        # Log error details
+                        ErrorReporter.log_error_to_file(label, error, {
+                            "topic": topic,
+                            "max_items": max_items
+                        })
+                        continue
+
+                    all_data.append(item)
+                    item_counts[name] += 1
+                    progress.update(
+                        tasks[name],
+                        completed=item_counts[name],
+                        description=f"{source_tasks[name]} ({item_counts[name]}/{max_items})"
+                    )
 
-                    # Log error details
-                    ErrorReporter.log_error_to_file("Web", e, {
-                        "topic": topic,
-                        "max_items": max_items
-                    })
+                    live.add(item)
+                    if time.monotonic() - stats_shown > 0.25:
+                        progress.update(stats_task, description=live.summary())
+                        stats_shown = time.monotonic()
+
+                progress.update(stats_task, description=live.summary(), total=1, completed=1)
+
+        for name, count in item_counts.items():
+            label = source_labels[name]
+            if label in failed_sources:
+                continue
+            items_noun, data_noun = source_nouns[name]
+            if count > 0:
+                console.print(f"[green]✓[/green] Collected {count} {items_noun}")
+                successful_sources.append(label)
+            else:
+                console.print(f"[yellow]⚠️[/yellow]  No {data_noun} data collected")
+                failed_sources.append(label)
 
         # Handle collection results
         if not all_data:
@@ -214,106 +282,172 @@ def cli(topic: str, sources: list, max_items: int, output: str, depth: str, mode
 
         console.print(f"\n[cyan]Total items collected: {len(all_data)}[/cyan]\n")
 
-        # Step 2: Enhanced Analysis (sentiment, keywords, trends)
-        sentiment_results = None
-        keywords = None
-        trends = None
-
-        with console.status("[bold cyan]🔍 Running enhanced analysis...[/bold cyan]"):
-            try:
-                # Sentiment analysis
-                sentiment_analyzer = SentimentAnalyzer()
-                sentiment_results = sentiment_analyzer.analyze_items(all_data)
-                console.print(f"[green]✓[/green] Sentiment: {sentiment_results.get('overall', 'Unknown')}")
-
-                # Keyword extraction
-                keyword_extractor = KeywordExtractor()
-                keywords = keyword_extractor.extract_keywords(all_data, top_n=20)
-                console.print(f"[green]✓[/green] Extracted {len(keywords)} keywords")
-
-                # Trend analysis
-                trend_analyzer = TrendAnalyzer()
-                trends = trend_analyzer.analyze_temporal_trends(all_data)
-                console.print(f"[green]✓[/green] Analyzed trends across {trends.get('total_dates', 0)} dates")
-
-            except Exception as e:
-                logger.warning(f"Enhanced analysis failed: {e}")
-                console.print(f"[yellow]⚠️[/yellow]  Enhanced analysis partially failed, continuing...")
-
-        console.print("")
-
-        # Step 3: Analyze with AI
-        with console.status(f"[bold yellow]🤖 Analyzing with {model_display}...[/bold yellow]"):
-            analysis_result = analyzer.analyze(topic, all_data, depth)
-
-        if not analysis_result.get("success"):
-            console.print(f"[red]❌ Analysis failed: {analysis_result.get('error')}[/red]")
-            sys.exit(1)
-
-        metadata = analysis_result.get("metadata", {})
-        console.print(f"[green]✓[/green] Analysis completed")
-        console.print(f"[dim]  Tokens used: {metadata.get('tokens_used', 'N/A')}[/dim]\n")
-
-        # Step 4: Comparison analysis (if requested)
-        comparison_result = None
-        if compare_with:
-            with console.status("[bold cyan]🔄 Comparing with previous report...[/bold cyan]"):
-                try:
-                    from src.parsers.report_parser import ReportParser
-                    from src.analyzers.comparison_analyzer import ComparisonAnalyzer
-
-                    parser = ReportParser()
-                    previous_report = parser.parse_report(Path(compare_with))
-
-                    comparator = ComparisonAnalyzer()
-                    comparison_result = comparator.compare_analyses(
-                        current={
-                            "sentiment": sentiment_results,
-                            "keywords": keywords,
-                            "analysis": analysis_result
-                        },
-                        previous=previous_report
-                    )
-
-                    console.print(f"[green]✓[/green] Comparison complete")
-
-                except Exception as e:
-                    logger.warning(f"Comparison analysis failed: {e}")
-                    console.print(f"[yellow]⚠️[/yellow]  Comparison failed: {e}")
-
-        # Step 5: Generate report
-        with console.status("[bold yellow]📝 Generating report...[/bold yellow]"):
-            # Determine output path
-            if output:
-                output_path = Config.OUTPUT_DIR / output
-                if not output_path.suffix:
-                    output_path = output_path.with_suffix(".md")
-            else:
-                filename = generator.generate_filename(topic)
-                output_path = Config.OUTPUT_DIR / filename
-
-            # Organize sources
-            sources_organized = analyzer.summarize_sources(all_data)
+        # Steps 2-5 form a dependency graph: finishing the enhanced analysis
+        # (accumulated during collection), the AI analysis and parsing the
+        # previous report run concurrently, the comparison waits for its
+        # inputs and the report for everything
+        def analyze():
+            # Every analysis is stored as the topic's baseline for --incremental
+            result = DeltaAnalyzer(analyzer).analyze(topic, all_data, depth, incremental=incremental)
+            if not result.get("success"):
+                raise RuntimeError(result.get("error"))
+            return result
+
+        # Determine output path
+        if output:
+            output_path = Config.OUTPUT_DIR / output
+            if not output_path.suffix:
+                output_path = output_path.with_suffix(".md")
+        else:
+            filename = generator.generate_filename(topic)
+            output_path = Config.OUTPUT_DIR / filename
+
+        history_index = HistoryIndex()
+        use_history = compare_window is not None or (compare_with or "").lower() == "latest"
+
+        def read_previous():
+            # An explicit report file is parsed (from its sidecar when
+            # present); "latest" and windows come from the history index
+            report = None
+            if compare_with and compare_with.lower() != "latest":
+                from src.parsers.report_parser import ReportParser
+
+                report = ReportParser().parse_report(Path(compare_with))
+
+            history = None
+            if use_history:
+                history_index.sync()
+            if compare_window is not None:
+                since = datetime.now() - compare_window
+                history = history_index.history(topic, since=since, exclude=[output_path])
+
+            if report is None:
+                latest = history[-1] if history else history_index.latest(topic, exclude=[output_path])
+                if latest is None:
+                    raise ValueError(f"no earlier report about '{topic}' in {Config.OUTPUT_DIR}")
+                report = latest.as_previous()
+            return {"report": report, "history": history}
+
+        def compare(sentiment, keywords, analysis, previous):
+            from src.analyzers.comparison_analyzer import ComparisonAnalyzer
+
+            if previous is None:
+                raise ValueError(pipeline.errors.get("previous") or "previous report could not be read")
+
+            comparator = ComparisonAnalyzer()
+            comparison = comparator.compare_analyses(
+                current={
+                    "sentiment": sentiment,
+                    "keywords": keywords,
+                    "analysis": analysis
+                },
+                previous=previous["report"]
+            )
+            if previous["history"] is not None:
+                current = ReportSnapshot.from_results(
+                    topic, sentiment, keywords, volume=len(all_data), path=str(output_path.resolve())
+                )
+                comparison["history"] = comparator.compare_history(current, previous["history"])
+            return comparison
 
+        def render(analysis, sentiment, keywords, trends, comparison=None):
             # Generate report with enhanced features
             success = generator.generate_report(
                 topic,
-                analysis_result,
-                sources_organized,
+                analysis,
+                live.sources,
                 output_path,
-                sentiment=sentiment_results,
+                sentiment=sentiment,
                 keywords=keywords,
                 trends=trends,
-                comparison=comparison_result
+                comparison=comparison,
+                formats=formats
             )
+            if not success:
+                raise RuntimeError("Failed to generate report")
+            return output_path
+
+        after_collection = ("collection",)
+        pipeline.add("sentiment", live.sentiment, after=after_collection, required=False)
+        pipeline.add("keywords", lambda: live.keywords(top_n=20), after=after_collection, required=False)
+        pipeline.add("trends", live.trends, after=after_collection, required=False)
+        pipeline.add("analysis", analyze, after=after_collection)
+        report_inputs = ["analysis", "sentiment", "keywords", "trends"]
+        if compare_with or compare_window is not None:
+            pipeline.add("previous", read_previous, required=False)
+            pipeline.add("comparison", compare, after=("sentiment", "keywords", "analysis", "previous"),
+                         required=False)
+            report_inputs.append("comparison")
+        pipeline.add("report", render, after=report_inputs)
+        # Every report joins the topic's history for later comparisons
+        pipeline.add("index", lambda report: history_index.index_file(report), after=("report",), required=False)
+
+        def show_analysis(metadata):
+            console.print(f"[green]✓[/green] Analysis completed")
+            console.print(f"[dim]  Tokens used: {metadata.get('tokens_used', 'N/A')}[/dim]")
+            delta = metadata.get("delta", {})
+            if delta.get("mode") == "incremental":
+                console.print(
+                    f"[dim]  Incremental: {delta['new_items']} new items sent, "
+                    f"{delta['known_items']} already covered[/dim]"
+                )
+            elif delta.get("mode") == "unchanged":
+                console.print("[dim]  Incremental: no new items, previous analysis reused[/dim]")
+            if metadata.get("failover"):
+                console.print(f"[yellow]  ⚠️  Answered by fallback provider: {metadata.get('model')}[/yellow]")
+            if retry_budget.retries:
+                console.print(
+                    f"[dim]  Retries: {retry_budget.retries}/{retry_budget.max_retries} "
+                    f"({retry_budget.waited:.1f}s backoff)[/dim]"
+                )
 
-        if success:
-            console.print(f"[green]✓[/green] Report generated successfully!\n")
-            console.print(f"[bold]📄 Report saved to:[/bold] [cyan]{output_path}[/cyan]\n")
-            console.print("[dim]You can open it with any Markdown viewer or editor.[/dim]")
-        else:
-            console.print("[red]❌ Failed to generate report[/red]")
-            sys.exit(1)
+        def show(timing):
+            # Report each stage as it finishes; they complete in any order
+            result = pipeline.results.get(timing.name)
+            if timing.name == "sentiment":
+                if result is not None:
+                    console.print(f"[green]✓[/green] Sentiment: {result.get('overall', 'Unknown')}")
+                else:
+                    console.print("[yellow]⚠️[/yellow]  Sentiment analysis failed, continuing...")
+            elif timing.name == "keywords":
+                if result is not None:
+                    console.print(f"[green]✓[/green] Extracted {len(result)} keywords")
+                else:
+                    console.print("[yellow]⚠️[/yellow]  Keyword extraction failed, continuing...")
+            elif timing.name == "trends":
+                if result is not None:
+                    console.print(f"[green]✓[/green] Analyzed trends across {result.get('total_dates', 0)} dates")
+                else:
+                    console.print("[yellow]⚠️[/yellow]  Trend analysis failed, continuing...")
+            elif timing.name == "analysis" and result is not None:
+                show_analysis(result.get("metadata", {}))
+            elif timing.name == "comparison":
+                if result is not None:
+                    console.print("[green]✓[/green] Comparison complete")
+                else:
+                    console.print(f"[yellow]⚠️[/yellow]  Comparison failed: {pipeline.errors.get('comparison')}")
+
+        with console.status(f"[bold yellow]🤖 Analyzing with {model_display}...[/bold yellow]"):
+            try:
+                results = pipeline.run(on_done=show)
+            except StageError as e:
+                if e.stage == "analysis":
+                    console.print(f"[red]❌ Analysis failed: {e.error}[/red]")
+                else:
+                    console.print(f"[red]❌ {e.error}[/red]")
+                record_run(pipeline, run_started, run_options, output_path, "failed", profile, metrics_file)
+                sys.exit(1)
+
+        analysis_result = results["analysis"]
+        sentiment_results = results["sentiment"]
+        keywords = results["keywords"]
+        trends = results["trends"]
+
+        console.print(f"\n[green]✓[/green] Report generated successfully!\n")
+        console.print(f"[bold]📄 Report saved to:[/bold] [cyan]{output_path}[/cyan]\n")
+        console.print("[dim]You can open it with any Markdown viewer or editor.[/dim]")
+        print_stage_timings(pipeline)
+        record_run(pipeline, run_started, run_options, output_path, "ok", profile, metrics_file)
 
         # Step 6: Interactive mode (if requested)
         if interactive:
@@ -333,31 +467,36 @@ def cli(topic: str, sources: list, max_items: int, output: str, depth: str, mode
                     analyzer=analyzer,
                     sentiment=sentiment_results,
                     keywords=keywords,
-                    trends=trends
+                    trends=trends,
+                    sources=live.sources
                 )
 
-                while True:
-                    try:
-                        # Get user input
-                        user_input = console.input("[bold green]You:[/bold green] ").strip()
+                try:
+                    while True:
+                        try:
+                            # Get user input
+                            user_input = console.input("[bold green]You:[/bold green] ").strip()
 
-                        if not user_input:
-                            continue
+                            if not user_input:
+                                continue
 
-                        if user_input.lower() in ["exit", "quit", "q"]:
-                            console.print("\n[yellow]👋 Exiting interactive mode...[/yellow]")
-                            break
+                            if user_input.lower() in ["exit", "quit", "q"]:
+                                console.print("\n[yellow]👋 Exiting interactive mode...[/yellow]")
+                                break
 
-                        # Process question
-                        response = session.ask_question(user_input)
-                        console.print(f"\n[bold blue]Assistant:[/bold blue]\n{response}\n")
+                            # Process question
+                            response = session.ask_question(user_input)
+                            console.print(f"\n[bold blue]Assistant:[/bold blue]\n{response}\n")
 
-                    except KeyboardInterrupt:
-                        console.print("\n\n[yellow]👋 Exiting interactive mode...[/yellow]")
-                        break
-                    except EOFError:
-                        console.print("\n\n[yellow]👋 Exiting interactive mode...[/yellow]")
-                        break
+                        except KeyboardInterrupt:
+                            console.print("\n\n[yellow]👋 Exiting interactive mode...[/yellow]")
+                            break
+                        except EOFError:
+                            console.print("\n\n[yellow]👋 Exiting interactive mode...[/yellow]")
+                            break
+                finally:
+                    # The session's cached context lives only as long as the session
+                    session.close()
 
                 # Offer to export conversation
                 if session.conversation_history:
@@ -387,5 +526,472 @@ def cli(topic: str, sources: list, max_items: int, output: str, depth: str, mode
         sys.exit(1)
 
 
+def run_enhanced_analysis(all_data: list, quiet: bool = False) -> tuple:
+    """
+    Run sentiment, keyword and trend analysis on collected data.
+
+    Args:
+        all_data: Collected data items
+        quiet: Skip the per-step console output
+
+    Returns:
+        Tuple of (sentiment results, keywords, trends); entries are None if
+        their step failed
+    """
+    sentiment_results = None
+    keywords = None
+    trends = None
+
+    try:
+        # Sentiment analysis
+        sentiment_analyzer = SentimentAnalyzer()
+        sentiment_results = sentiment_analyzer.analyze_items(all_data)
+        if not quiet:
+            console.print(f"[green]✓[/green] Sentiment: {sentiment_results.get('overall', 'Unknown')}")
+
+        # Keyword extraction
+        keyword_extractor = KeywordExtractor()
+        keywords = keyword_extractor.extract_keywords(all_data, top_n=20)
+        if not quiet:
+            console.print(f"[green]✓[/green] Extracted {len(keywords)} keywords")
+
+        # Trend analysis
+        trend_analyzer = TrendAnalyzer()
+        trends = trend_analyzer.analyze_temporal_trends(all_data)
+        if not quiet:
+            console.print(f"[green]✓[/green] Analyzed trends across {trends.get('total_dates', 0)} dates")
+
+    except Exception as e:
+        logger.warning(f"Enhanced analysis failed: {e}")
+        if not quiet:
+            console.print(f"[yellow]⚠️[/yellow]  Enhanced analysis partially failed, continuing...")
+
+    return sentiment_results, keywords, trends
+
+
+def print_stage_timings(pipeline: Pipeline) -> None:
+    """
+    Print how long each pipeline stage took and the run's critical path.
+
+    Args:
+        pipeline: Pipeline that has run
+    """
+    timings = [timing for timing in pipeline.timings.values() if timing.status != "skipped"]
+    if not timings:
+        return
+
+    stages = " · ".join(f"{timing.name} {timing.seconds:.1f}s" for timing in timings)
+    wall = max(timing.finished for timing in timings) - min(timing.started for timing in timings)
+    path, seconds = pipeline.critical_path()
+
+    console.print(f"[dim]⏱️  Stages: {stages}[/dim]")
+    console.print(f"[dim]   Critical path: {' → '.join(path)} ({seconds:.1f}s of {wall:.1f}s wall time)[/dim]")
+
+
+def record_run(
+    pipeline: Pipeline,
+    started: datetime,
+    options: dict,
+    output_path: Path,
+    status: str,
+    profile: bool,
+    metrics_file: str = None
+) -> None:
+    """
+    Keep the run's per-stage profile: print it if asked, write the JSON run
+    record and export Prometheus metrics.
+
+    Args:
+        pipeline: Pipeline that has run
+        started: Start of the run
+        options: Run options stored in the record
+        output_path: Report path (the record is named after it)
+        status: Outcome of the run
+        profile: Print the profile table
+        metrics_file: Prometheus textfile to write, if any
+    """
+    record = build_run_record(pipeline, started, options, status)
+    if profile:
+        print_profile(record)
+
+    try:
+        if Config.RUN_RECORDS:
+            path = Config.OUTPUT_DIR / ".runs" / f"{output_path.stem}.json"
+            write_run_record(path, record)
+            logger.debug(f"Run record saved to: {path}")
+        if metrics_file:
+            write_prometheus_textfile(Path(metrics_file))
+    except OSError as e:
+        logger.warning(f"⚠️  Could not write run metrics: {e}")
+
+
+def print_profile(record: dict) -> None:
+    """
+    Print the per-stage resource table of a run record.
+
+    Args:
+        record: Run record from ``build_run_record``
+    """
+    table = Table(title="Stage profile", title_justify="left", show_edge=False)
+    for column in ("Stage", "Wall", "CPU", "Peak RSS", "Bytes in", "Bytes out", "Items", "Retries", "Cache hits"):
+        table.add_column(column, justify="left" if column == "Stage" else "right", no_wrap=True)
+
+    for stage in record["stages"]:
+        name = stage["stage"] if stage["status"] == "ok" else f"{stage['stage']} [red]({stage['status']})[/red]"
+        table.add_row(
+            name,
+            f"{stage['wall_seconds']:.2f}s",
+            f"{stage['cpu_seconds']:.2f}s",
+            format_bytes(stage["peak_rss_bytes"]),
+            format_bytes(stage["bytes_received"]),
+            format_bytes(stage["bytes_sent"]),
+            str(stage["items"] or ""),
+            str(stage["retries"] or ""),
+            str(stage["cache_hits"] or "")
+        )
+
+    console.print()
+    console.print(table)
+    console.print(f"[dim]   Run: {record['wall_seconds']:.1f}s wall time[/dim]")
+
+
+def format_bytes(size: int = None) -> str:
+    """Show a byte count with a binary unit (empty for none)."""
+    if not size:
+        return ""
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def collect_topic(topic: str, collectors: dict, max_items: int) -> tuple:
+    """
+    Collect one topic from every source without progress display.
+
+    Args:
+        topic: Research topic
+        collectors: Source name to collector
+        max_items: Maximum items per source
+
+    Returns:
+        Tuple of (collected items, their source summary, list of (source, error))
+    """
+    items = []
+    summary = SourceSummary()
+    errors = []
+    deadline = Deadline(Config.COLLECTION_DEADLINE)
+    streams = {name: collector.stream(topic, max_items, deadline) for name, collector in collectors.items()}
+
+    for name, item, error in merge_streams(streams):
+        if error is not None:
+            errors.append((name, error))
+            logger.error(f"{name} collection error for '{topic}': {error}")
+            ErrorReporter.log_error_to_file(name, error, {"topic": topic, "max_items": max_items})
+            continue
+        items.append(item)
+        summary.add(item)
+
+    return items, summary, errors
+
+
+def read_topics(path: str) -> list:
+    """
+    Read research topics from a file, one per line.
+
+    Blank lines and lines starting with ``#`` are skipped.
+
+    Args:
+        path: Topics file path
+
+    Returns:
+        Validated topics in file order, without duplicates
+    """
+    topics = []
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            topic = validate_topic(line)
+            if topic not in topics:
+                topics.append(topic)
+    return topics
+
+
+@cli.command()
+@click.option(
+    "--topics-file",
+    required=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help="File with one research topic per line"
+)
+@click.option(
+    "--sources",
+    default=Config.DEFAULT_SOURCES,
+    help="Data sources to use: x, web, or all (default: all)",
+    callback=lambda ctx, param, value: validate_sources(value)
+)
+@click.option(
+    "--max-items",
+    default=Config.DEFAULT_MAX_ITEMS,
+    type=int,
+    help=f"Maximum items to collect per source (default: {Config.DEFAULT_MAX_ITEMS})",
+    callback=lambda ctx, param, value: validate_max_items(value)
+)
+@click.option(
+    "--depth",
+    default=Config.DEFAULT_DEPTH,
+    help="Analysis depth: quick or detailed (default: detailed)",
+    callback=lambda ctx, param, value: validate_depth(value)
+)
+@click.option(
+    "--model",
+    default=Config.DEFAULT_MODEL,
+    type=click.Choice(["claude", "gemini"], case_sensitive=False),
+    help=f"AI model to use: claude or gemini (default: {Config.DEFAULT_MODEL})"
+)
+@click.option(
+    "--format",
+    "formats",
+    default=Config.REPORT_FORMATS,
+    help="Extra report formats written next to the Markdown report: html, json (comma-separated)",
+    callback=lambda ctx, param, value: validate_formats(value)
+)
+@click.option(
+    "--poll-interval",
+    default=Config.BATCH_POLL_INTERVAL,
+    type=float,
+    help=f"Seconds between batch status checks (default: {Config.BATCH_POLL_INTERVAL})"
+)
+def batch(topics_file: str, sources: list, max_items: int, depth: str, model: str, formats: list,
+          poll_interval: float):
+    """
+    Research many topics through the AI provider's batch API.
+
+    Collects every topic, submits all analysis prompts as one batch job
+    (Anthropic Message Batches or Gemini batch mode), waits for it and
+    writes one report per topic. Slower than the regular mode but cheaper
+    for large nightly runs.
+
+    Example:
+
+        research-agent batch --topics-file topics.txt --model claude
+    """
+    console.print("\n[bold cyan]🔬 Research Agent - Batch Mode[/bold cyan]")
+
+    try:
+        Config.validate(model=model)
+        Config.ensure_output_dir()
+
+        metrics.reset()
+        reset_retry_budget()
+
+        topics = read_topics(topics_file)
+        if not topics:
+            console.print("[red]❌ No topics found in topics file[/red]")
+            sys.exit(1)
+        console.print(f"[dim]Topics: {len(topics)} | Sources: {', '.join(sources)} | Model: {model}[/dim]\n")
+
+        collectors = {
+            name: collector_class()
+            for name, collector_class in (("x", XCollector), ("web", WebCollector))
+            if name in sources
+        }
+        backend = create_batch_backend(model)
+        generator = MarkdownGenerator()
+        history_index = HistoryIndex()
+
+        # Step 1: Collect every topic and build its prompt
+        jobs = {}
+        prompts = {}
+        for index, topic in enumerate(topics):
+            with console.status(f"[bold cyan]🔍 Collecting {topic} ({index + 1}/{len(topics)})...[/bold cyan]"):
+                all_data, source_summary, errors = collect_topic(topic, collectors, max_items)
+                if all_data:
+                    enhanced = run_enhanced_analysis(all_data, quiet=True)
+
+            if not all_data:
+                console.print(f"[red]✗[/red] {topic}: no data collected, skipped")
+                continue
+
+            custom_id = f"topic-{index}"
+            jobs[custom_id] = (topic, all_data, source_summary, enhanced)
+            prompts[custom_id] = get_analysis_spec(topic, all_data, depth)
+            suffix = f" ({len(errors)} source error(s))" if errors else ""
+            console.print(f"[green]✓[/green] {topic}: {len(all_data)} items{suffix}")
+
+        if not prompts:
+            console.print("\n[red]❌ No data collected for any topic.[/red]")
+            sys.exit(1)
+
+        # Step 2: One batch job for every analysis
+        with console.status(f"[bold yellow]📦 Waiting for batch of {len(prompts)} analyses...[/bold yellow]"):
+            results = run_batch(backend, prompts, poll_interval=poll_interval)
+
+        # Step 3: Render every report on the render pool
+        manifest_path = Config.OUTPUT_DIR / f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}.manifest.json"
+        written = 0
+        with RenderPool(generator=generator, manifest_path=manifest_path) as pool:
+            for custom_id, (topic, all_data, source_summary, (sentiment_results, keywords, trends)) in jobs.items():
+                response = results.get(custom_id)
+                if response is None or isinstance(response, Exception):
+                    console.print(f"[red]✗[/red] {topic}: analysis failed: {response or 'missing from batch results'}")
+                    continue
+
+                pool.submit(RenderJob(
+                    topic=topic,
+                    analysis_result={
+                        "success": True,
+                        "analysis": response.text,
+                        "metadata": LLMProvider.build_metadata(response, depth, len(all_data))
+                    },
+                    sources=source_summary,
+                    output_path=Config.OUTPUT_DIR / generator.generate_filename(topic),
+                    sentiment=sentiment_results,
+                    keywords=keywords,
+                    trends=trends,
+                    formats=formats
+                ))
+
+            for rendered in pool.results():
+                if not rendered.ok:
+                    console.print(f"[red]✗[/red] {rendered.job.topic}: {rendered.error}")
+                    continue
+                written += 1
+                console.print(f"[green]✓[/green] {rendered.job.topic}: [cyan]{rendered.job.output_path}[/cyan]")
+                try:
+                    history_index.index_file(rendered.job.output_path)
+                except Exception as e:
+                    logger.warning(f"Could not index {rendered.job.output_path}: {e}")
+
+        console.print(f"[dim]Manifest: {manifest_path}[/dim]")
+        console.print(f"\n[bold]📄 {written}/{len(topics)} reports written to {Config.OUTPUT_DIR}[/bold]")
+        if written < len(topics):
+            sys.exit(1)
+
+    except BatchError as e:
+        console.print(f"[red]❌ Batch failed: {e}[/red]")
+        sys.exit(1)
+    except ValueError as e:
+        console.print(f"[red]❌ Configuration error: {e}[/red]")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        console.print("\n\n[yellow]⚠️  Operation cancelled by user[/yellow]")
+        sys.exit(0)
+
+
+@cli.command()
+@click.option(
+    "--directory",
+    default=str(Config.OUTPUT_DIR),
+    type=click.Path(exists=True, file_okay=False),
+    help=f"Reports directory to import (default: {Config.OUTPUT_DIR})"
+)
+@click.option(
+    "--recursive",
+    is_flag=True,
+    default=False,
+    help="Also import reports in subdirectories"
+)
+@click.option(
+    "--workers",
+    default=Config.INDEX_WORKERS,
+    type=click.IntRange(min=0),
+    help="Parser processes, 0 to parse in this process (default: CPU count)"
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    default=False,
+    help="Re-parse every report, even unchanged ones"
+)
+@click.option(
+    "--turned",
+    type=click.Choice(["positive", "neutral", "negative"], case_sensitive=False),
+    help="List topics whose overall sentiment turned to this label"
+)
+@click.option(
+    "--window",
+    default="7d",
+    help="Time window for --turned and the topic summary (default: 7d)",
+    callback=lambda ctx, param, value: validate_window(value)
+)
+def index(directory: str, recursive: bool, workers: int, force: bool, turned: str, window: timedelta):
+    """
+    Import existing reports into the history index.
+
+    Parses reports in parallel and stores their sentiment, keywords and
+    volume so comparisons and cross-report queries never re-read files.
+    Safe to interrupt and re-run: unchanged files are skipped by
+    modification time and content hash.
+
+    Example:
+
+        research-agent index --directory reports --turned negative --window 7d
+    """
+    console.print("\n[bold cyan]🗂️  Research Agent - History Index[/bold cyan]")
+
+    try:
+        history_index = HistoryIndex()
+        pattern = "**/*.md" if recursive else "*.md"
+        paths = sorted(Path(directory).glob(pattern))
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("{task.completed}/{task.total}"),
+            console=console
+        ) as progress:
+            task = progress.add_task(f"[cyan]Importing {len(paths)} files...", total=len(paths))
+            stats = history_index.index_files(
+                paths,
+                workers=workers,
+                force=force,
+                on_progress=lambda result: progress.advance(task)
+            )
+            progress.update(task, completed=len(paths))
+
+        console.print(
+            f"[green]✓[/green] {stats.parsed} parsed ({stats.reports} reports), "
+            f"{stats.skipped + stats.unchanged} unchanged, {stats.failed} failed "
+            f"in {stats.seconds:.1f}s "
+            f"[dim]({stats.files_per_second:.0f} files/s, {stats.megabytes_per_second:.1f} MB/s)[/dim]"
+        )
+
+        since = datetime.now() - window
+        started = time.perf_counter()
+        if turned:
+            rows = history_index.topics_turned(turned, since=since)
+            elapsed = time.perf_counter() - started
+            title = f"Topics turned {turned.lower()} since {since:%Y-%m-%d %H:%M}"
+            table = Table(title=title)
+            for column in ("Topic", "Report", "Before", "Now", "Compound"):
+                table.add_column(column)
+            for row in rows:
+                change = ""
+                if row["compound"] is not None and row["previous_compound"] is not None:
+                    change = f"{row['previous_compound']:+.2f} → {row['compound']:+.2f}"
+                table.add_row(row["topic"], row["generated"], row["previous"], row["sentiment"], change)
+        else:
+            rows = history_index.topics(since=since)
+            elapsed = time.perf_counter() - started
+            table = Table(title=f"Topics reported since {since:%Y-%m-%d %H:%M}")
+            for column in ("Topic", "Reports", "Latest", "Sentiment"):
+                table.add_column(column)
+            for row in rows:
+                table.add_row(row["topic"], str(row["reports"]), row["last"], row["sentiment"] or "-")
+
+        if rows:
+            console.print(table)
+        else:
+            console.print(f"[dim]{table.title}: none[/dim]")
+        console.print(f"[dim]Query: {elapsed * 1000:.1f} ms[/dim]")
+
+    except KeyboardInterrupt:
+        console.print("\n\n[yellow]⚠️  Import interrupted; completed batches are kept, re-run to resume[/yellow]")
+        sys.exit(0)
+
+
 if __name__ == "__main__":
     cli()
@@ -3,7 +3,26 @@
 import re
 from pathlib import Path
 from typing import Dict, List, Any
+from src.generators.sidecar import SidecarError, load_sidecar, sidecar_path
 from src.utils.logger import get_logger
+from .sections import MarkdownDocument
+
+
+TITLE_SUFFIX = " - Research Report"
+SENTIMENT_HEADING = "😊 Sentiment Analysis"
+KEYWORDS_HEADING = "🔑 Top Keywords"
+SOURCES_HEADING = "📚 Data Sources"
+ENHANCEMENT_HEADINGS = {
+    "📊 Quick Stats",
+    SENTIMENT_HEADING,
+    KEYWORDS_HEADING,
+    "📈 Temporal Trends",
+    "🔄 Changes Since Last Report",
+}
+
+_METADATA_PATTERN = re.compile(r"\*\*(Generated|Data Sources|Analysis Model)\*\*:\s*(.+)")
+_METADATA_FIELDS = {"Generated": "generated", "Data Sources": "data_sources", "Analysis Model": "model"}
+_DISTRIBUTION_PATTERN = re.compile(r"(Positive|Neutral|Negative):.*?(\d+\.\d+)%.*?\((\d+) items\)")
 
 
 class ReportParser:
@@ -17,38 +36,40 @@ class ReportParser:
         """
         Parse an existing markdown report.
 
+        The report's JSON sidecar is used when it exists; older reports
+        without one are parsed from their Markdown.
+
         Args:
-            file_path: Path to the markdown report
+            file_path: Path to the markdown report (or its sidecar)
 
         Returns:
             Dictionary with parsed report data
         """
+        file_path = Path(file_path)
         self.logger.info(f"Parsing report: {file_path}")
 
+        # Reports with a structured sidecar are read from it exactly
         try:
-            content = file_path.read_text(encoding="utf-8")
-
-            # Extract metadata
-            metadata = self._extract_metadata(content)
+            sidecar = load_sidecar(file_path)
+        except SidecarError as e:
+            if file_path == sidecar_path(file_path):
+                raise
+            self.logger.warning(f"⚠️  {e}; parsing the Markdown report instead")
+            sidecar = None
+        if sidecar is not None:
+            return self.from_sidecar(sidecar, file_path)
 
-            # Extract sentiment
-            sentiment = self._extract_sentiment(content)
-
-            # Extract keywords
-            keywords = self._extract_keywords(content)
-
-            # Extract sources
-            sources = self._extract_sources(content)
-
-            # Extract main analysis
-            analysis = self._extract_analysis(content)
+        try:
+            # Split the document into sections once; every extractor then
+            # only reads its own slice
+            document = MarkdownDocument(file_path.read_text(encoding="utf-8"))
 
             return {
-                "metadata": metadata,
-                "sentiment": sentiment,
-                "keywords": keywords,
-                "sources": sources,
-                "analysis": analysis,
+                "metadata": self._extract_metadata(document),
+                "sentiment": self._extract_sentiment(document),
+                "keywords": self._extract_keywords(document),
+                "sources": self._extract_sources(document),
+                "analysis": self._extract_analysis(document),
                 "file_path": str(file_path)
             }
 
@@ -56,42 +77,65 @@ class ReportParser:
             self.logger.error(f"Error parsing report: {e}")
             raise
 
-    def _extract_metadata(self, content: str) -> Dict[str, str]:
-        """Extract metadata from report header."""
-        metadata = {}
+    def from_sidecar(self, sidecar: Dict[str, Any], file_path: Path) -> Dict[str, Any]:
+        """
+        Convert a report sidecar to parsed report data.
 
-        # Extract generated date
-        date_match = re.search(r"\*\*Generated\*\*:\s*(.+)", content)
-        if date_match:
-            metadata["generated"] = date_match.group(1).strip()
+        Args:
+            sidecar: Loaded sidecar document
+            file_path: Path the report was requested by
 
-        # Extract data sources
-        sources_match = re.search(r"\*\*Data Sources\*\*:\s*(.+)", content)
-        if sources_match:
-            metadata["data_sources"] = sources_match.group(1).strip()
+        Returns:
+            Dictionary with the same keys as a parsed Markdown report, plus
+            the full trends and per-source data; keywords keep their scores
+        """
+        sources = sidecar.get("sources", {})
+        analysis = sidecar.get("analysis", {})
+        x_count = sources.get("x_count", 0)
+        web_count = sources.get("web_count", 0)
+
+        return {
+            "metadata": {
+                "generated": sidecar.get("generated", ""),
+                "data_sources": f"X ({x_count}), Web ({web_count}) - Total: {x_count + web_count}",
+                "model": analysis.get("metadata", {}).get("model", ""),
+                "topic": sidecar.get("topic", ""),
+                "version": sidecar.get("version"),
+            },
+            "sentiment": sidecar.get("sentiment"),
+            "keywords": sidecar.get("keywords", []),
+            "trends": sidecar.get("trends"),
+            "sources": sources,
+            "analysis": analysis.get("text", ""),
+            "analysis_metadata": analysis.get("metadata", {}),
+            "file_path": str(file_path),
+            "exact": True
+        }
+
+    def _extract_metadata(self, document: MarkdownDocument) -> Dict[str, str]:
+        """Extract metadata from report header."""
+        metadata = {}
 
-        # Extract model
-        model_match = re.search(r"\*\*Analysis Model\*\*:\s*(.+)", content)
-        if model_match:
-            metadata["model"] = model_match.group(1).strip()
+        for line in document.lines[:document.preamble_end]:
+            if line.startswith("# ") and line.endswith(TITLE_SUFFIX):
+                metadata.setdefault("topic", line[2:-len(TITLE_SUFFIX)].strip())
+                continue
+            match = _METADATA_PATTERN.search(line)
+            if match and match.group(1) in _METADATA_FIELDS:
+                metadata.setdefault(_METADATA_FIELDS[match.group(1)], match.group(2).strip())
 
         return metadata
 
-    def _extract_sentiment(self, content: str) -> Dict[str, Any]:
+    def _extract_sentiment(self, document: MarkdownDocument) -> Dict[str, Any]:
         """Extract sentiment analysis section."""
         sentiment = {}
 
         # Look for sentiment section
-        sentiment_section = re.search(
-            r"## 😊 Sentiment Analysis\s*\n(.+?)(?=\n##|$)",
-            content,
-            re.DOTALL
-        )
-
-        if not sentiment_section:
+        section = document.section(SENTIMENT_HEADING)
+        if not section:
             return None
 
-        section_text = sentiment_section.group(1)
+        section_text = document.body(section)
 
         # Extract overall sentiment
         overall_match = re.search(r"\*\*Overall Sentiment\*\*:\s*(\w+)", section_text)
@@ -105,128 +149,85 @@ class ReportParser:
 
         # Extract distribution
         distribution = {}
-
-        pos_match = re.search(r"Positive:.*?(\d+\.\d+)%.*?\((\d+) items\)", section_text)
-        if pos_match:
-            distribution["positive"] = {
-                "percentage": float(pos_match.group(1)),
-                "count": int(pos_match.group(2))
-            }
-
-        neu_match = re.search(r"Neutral:.*?(\d+\.\d+)%.*?\((\d+) items\)", section_text)
-        if neu_match:
-            distribution["neutral"] = {
-                "percentage": float(neu_match.group(1)),
-                "count": int(neu_match.group(2))
-            }
-
-        neg_match = re.search(r"Negative:.*?(\d+\.\d+)%.*?\((\d+) items\)", section_text)
-        if neg_match:
-            distribution["negative"] = {
-                "percentage": float(neg_match.group(1)),
-                "count": int(neg_match.group(2))
-            }
+        for line in section_text.split("\n"):
+            match = _DISTRIBUTION_PATTERN.search(line)
+            if match:
+                distribution.setdefault(match.group(1).lower(), {
+                    "percentage": float(match.group(2)),
+                    "count": int(match.group(3))
+                })
 
         if distribution:
             sentiment["distribution"] = distribution
 
         return sentiment if sentiment else None
 
-    def _extract_keywords(self, content: str) -> List[str]:
+    def _extract_keywords(self, document: MarkdownDocument) -> List[str]:
         """Extract keywords from report."""
-        keywords = []
-
         # Look for keywords section
-        keywords_section = re.search(
-            r"## 🔑 Top Keywords\s*\n(.+?)(?=\n##|$)",
-            content,
-            re.DOTALL
-        )
-
-        if not keywords_section:
+        section = document.section(KEYWORDS_HEADING)
+        if not section:
             return []
 
-        section_text = keywords_section.group(1)
-
         # Extract keywords (remove emoji markers)
-        keyword_lines = re.findall(r"[🔥📌•]\s*(.+)", section_text)
-        keywords = [kw.strip() for kw in keyword_lines if kw.strip()]
-
-        return keywords
+        keyword_lines = re.findall(r"[🔥📌•]\s*(.+)", document.body(section))
+        return [kw.strip() for kw in keyword_lines if kw.strip()]
 
-    def _extract_sources(self, content: str) -> Dict[str, List[str]]:
+    def _extract_sources(self, document: MarkdownDocument) -> Dict[str, List[str]]:
         """Extract data sources from report."""
         sources = {"x": [], "web": []}
 
         # Look for data sources section
-        sources_section = re.search(
-            r"## 📚 Data Sources\s*\n(.+?)(?=\n##|---|\Z)",
-            content,
-            re.DOTALL
-        )
-
-        if not sources_section:
+        section = document.section(SOURCES_HEADING)
+        if not section:
             return sources
 
-        section_text = sources_section.group(1)
+        # Counts are in the subsection headings
+        for child in section.children:
+            x_match = re.match(r"X \(Twitter\) - (\d+) posts", child.title)
+            if x_match:
+                sources["x_count"] = int(x_match.group(1))
 
-        # Count X posts
-        x_match = re.search(r"### X \(Twitter\) - (\d+) posts", section_text)
-        if x_match:
-            sources["x_count"] = int(x_match.group(1))
-
-        # Count web results
-        web_match = re.search(r"### Web - (\d+) results", section_text)
-        if web_match:
-            sources["web_count"] = int(web_match.group(1))
+            web_match = re.match(r"Web - (\d+) results", child.title)
+            if web_match:
+                sources["web_count"] = int(web_match.group(1))
 
         return sources
 
-    def _extract_analysis(self, content: str) -> str:
+    def _extract_analysis(self, document: MarkdownDocument) -> str:
         """Extract main analysis text."""
-        # Find content between header and Data Sources section
-        analysis_match = re.search(
-            r"---\s*\n(.+?)\n## 📚 Data Sources",
-            content,
-            re.DOTALL
+        # The analysis sits between the header's separator and the Data
+        # Sources section; it may open with its own title and introduction
+        sources = document.section(SOURCES_HEADING)
+        if not sources:
+            return ""
+        start = next(
+            (i + 1 for i in range(sources.start) if document.lines[i].strip() == "---"),
+            document.preamble_end
         )
-
-        if analysis_match:
-            # Skip enhancement sections if present
-            analysis_text = analysis_match.group(1)
-
-            # Remove enhancement sections
-            analysis_text = re.sub(
-                r"## 📊 Quick Stats.+?(?=\n##|$)",
-                "",
-                analysis_text,
-                flags=re.DOTALL
-            )
-            analysis_text = re.sub(
-                r"## 😊 Sentiment Analysis.+?(?=\n##|$)",
-                "",
-                analysis_text,
-                flags=re.DOTALL
-            )
-            analysis_text = re.sub(
-                r"## 🔑 Top Keywords.+?(?=\n##|$)",
-                "",
-                analysis_text,
-                flags=re.DOTALL
-            )
-            analysis_text = re.sub(
-                r"## 📈 Temporal Trends.+?(?=\n##|$)",
-                "",
-                analysis_text,
-                flags=re.DOTALL
-            )
-            analysis_text = re.sub(
-                r"## 🔄 Changes Since Last Report.+?(?=\n##|$)",
-                "",
-                analysis_text,
-                flags=re.DOTALL
-            )
-
-            return analysis_text.strip()
-
-        return ""
+        if sources.start < start:
+            return ""
+
+        # Skip the generated enhancement sections (up to their next heading)
+        skipped = [
+            (section.start, section.end if section.body_end is None else section.body_end)
+            for section in document.sections
+            if section.title in ENHANCEMENT_HEADINGS and section.start < sources.start
+        ]
+
+        lines = []
+        skip = iter(sorted(skipped))
+        current = next(skip, None)
+        for i in range(start, sources.start):
+            while current and i >= current[1]:
+                current = next(skip, None)
+            if current and current[0] <= i < current[1]:
+                continue
+            lines.append(document.lines[i])
+
+        analysis_text = "\n".join(lines).strip()
+
+        # Drop the separator the generator puts before Data Sources
+        if analysis_text.endswith("---"):
+            analysis_text = analysis_text[:-3].rstrip()
+        return analysis_text
@@ -0,0 +1,96 @@
+"""Single-pass tokenizer splitting Markdown into a section tree."""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+@dataclass
+class Section:
+    """A heading and the lines up to the next heading of the same or a higher level."""
+
+    title: str
+    level: int  # number of #, 0 for the document root
+    start: int  # index of the heading line
+    end: int = 0  # index after the last line, subsections included
+    body_end: Optional[int] = None  # index of the first subsection heading
+    children: List["Section"] = field(default_factory=list)
+
+
+class MarkdownDocument:
+    """
+    Markdown split into a tree of sections by its headings.
+
+    The document is tokenized once, line by line; headings inside fenced
+    code blocks are ignored. Extractors then look sections up by title and
+    work on their own line range, so parsing stays linear in the document
+    size however many fields are extracted.
+    """
+
+    def __init__(self, content: str):
+        """
+        Tokenize a Markdown document.
+
+        Args:
+            content: Markdown text
+        """
+        self.lines = content.split("\n")
+        self.root = Section(title="", level=0, start=-1)
+        self.sections: List[Section] = []  # document order
+        self.index: Dict[str, Section] = {}  # first section per title
+        self.preamble_end = len(self.lines)  # first heading below level 1
+        self._tokenize()
+
+    def _tokenize(self) -> None:
+        stack = [self.root]
+        in_fence = False
+
+        for i, line in enumerate(self.lines):
+            if line.startswith("```") or line.startswith("~~~"):
+                in_fence = not in_fence
+                continue
+            if in_fence or not line.startswith("#"):
+                continue
+
+            hashes = len(line) - len(line.lstrip("#"))
+            if hashes > 6 or len(line) == hashes or line[hashes] != " ":
+                continue
+
+            while stack[-1].level >= hashes:
+                stack.pop().end = i
+
+            parent = stack[-1]
+            if parent.body_end is None:
+                parent.body_end = i
+
+            section = Section(title=line[hashes:].strip(), level=hashes, start=i)
+            parent.children.append(section)
+            self.sections.append(section)
+            self.index.setdefault(section.title, section)
+            stack.append(section)
+
+            if hashes > 1 and self.preamble_end == len(self.lines):
+                self.preamble_end = i
+
+        for section in stack:
+            section.end = len(self.lines)
+
+    def section(self, title: str) -> Optional[Section]:
+        """
+        Find the first section with a heading title.
+
+        Args:
+            title: Heading text without the leading #
+
+        Returns:
+            Section, or None if the document has no such heading
+        """
+        return self.index.get(title)
+
+    def body(self, section: Section) -> str:
+        """Text between a section's heading and its first subsection."""
+        end = section.end if section.body_end is None else section.body_end
+        return "\n".join(self.lines[section.start + 1:end])
+
+    def text(self, section: Section) -> str:
+        """Full text of a section, heading and subsections included."""
+        return "\n".join(self.lines[max(section.start, 0):section.end])
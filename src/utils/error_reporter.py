@@ -37,6 +37,11 @@ class ErrorReporter:
             "Try reducing --max-items value",
             "Check your network connection speed",
         ],
+        "circuit_open": [
+            "The source failed repeatedly and is being skipped for now",
+            "It will be probed again automatically after CIRCUIT_RESET_TIMEOUT seconds",
+            "Check if the API service is experiencing downtime",
+        ],
     }
 
     @staticmethod
@@ -89,7 +94,9 @@ class ErrorReporter:
         error_str = str(error).lower()
         error_type_name = type(error).__name__.lower()
 
-        if "auth" in error_str or "401" in error_str or "403" in error_str:
+        if error_type_name == "circuitopenerror":
+            return "circuit_open"
+        elif "auth" in error_str or "401" in error_str or "403" in error_str:
             return "api_auth"
         elif "rate limit" in error_str or "429" in error_str:
             return "api_rate_limit"
@@ -0,0 +1,70 @@
+"""Atomic, durable file writes."""
+
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator
+
+# Process umask, read once (setting it is the only way to read it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+@contextmanager
+def atomic_writer(path: Path, buffering: int = -1, durable: bool = True) -> Iterator[IO[str]]:
+    """
+    Open a temporary file that replaces ``path`` when the block succeeds.
+
+    Readers see either the previous file or the complete new one, never a
+    partial write. With ``durable``, the data is fsynced before the rename
+    and the directory after it, so the new file also survives a crash.
+    If the block raises, the temporary file is removed.
+
+    Args:
+        path: Destination file
+        buffering: Buffer size for the text file (-1 for the default)
+        durable: Fsync the file and its directory
+
+    Yields:
+        Text file handle (UTF-8)
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # A unique name per writer, so concurrent writes of one path never collide
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    tmp = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", buffering=buffering) as handle:
+            # mkstemp creates the file 0600; give it the mode open() would have
+            os.chmod(tmp, 0o666 & ~_UMASK)
+            yield handle
+            if durable:
+                handle.flush()
+                os.fsync(handle.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+    if durable:
+        fsync_directory(path.parent)
+
+
+def fsync_directory(directory: Path) -> None:
+    """
+    Flush a directory entry change (such as a rename) to disk.
+
+    Args:
+        directory: Directory to sync; ignored where directories cannot be
+            opened (Windows)
+    """
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
@@ -0,0 +1,183 @@
+"""In-process metrics for Research Agent runs."""
+
+import functools
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+LabelSet = Tuple[Tuple[str, str], ...]
+
+# Pipeline stage the current code runs for; added as the ``stage`` label
+# of every metric recorded without one
+_stage: ContextVar[Optional[str]] = ContextVar("stage", default=None)
+_local = threading.local()
+
+
+class MetricsRegistry:
+    """
+    Thread-safe counters and gauges keyed by metric name and labels.
+
+    Names ending in ``_total`` are counters (``increment``); other names
+    are gauges holding the highest value seen (``maximum``). Inside a
+    ``stage_scope``, metrics recorded without a ``stage`` label get the
+    scope's stage, so per-stage figures need no plumbing at the call sites.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._counters: Dict[str, Dict[LabelSet, float]] = defaultdict(lambda: defaultdict(float))
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, amount: float = 1, **labels: str) -> None:
+        """
+        Increase a counter.
+
+        Args:
+            name: Metric name
+            amount: Amount to add
+            **labels: Label values identifying the series
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._counters[name][key] += amount
+
+    def maximum(self, name: str, value: float, **labels: str) -> None:
+        """
+        Raise a gauge to ``value`` if it is higher than the current value.
+
+        Args:
+            name: Metric name
+            value: Observed value
+            **labels: Label values identifying the series
+        """
+        key = self._key(labels)
+        with self._lock:
+            series = self._counters[name]
+            if key not in series or value > series[key]:
+                series[key] = value
+
+    def total(self, name: str, **labels: str) -> float:
+        """
+        Sum a counter over every series matching the given labels.
+
+        Args:
+            name: Metric name
+            **labels: Label values to filter on
+
+        Returns:
+            Summed counter value
+        """
+        wanted = {(k, str(v)) for k, v in labels.items()}
+        with self._lock:
+            return sum(
+                value for key, value in self._counters.get(name, {}).items()
+                if wanted.issubset(key)
+            )
+
+    def snapshot(self) -> Dict[str, Dict[LabelSet, float]]:
+        """Return a copy of every counter."""
+        with self._lock:
+            return {name: dict(series) for name, series in self._counters.items()}
+
+    def reset(self) -> None:
+        """Clear every counter (start of a new run)."""
+        with self._lock:
+            self._counters.clear()
+
+    @staticmethod
+    def _key(labels: Dict[str, Any]) -> LabelSet:
+        if "stage" not in labels:
+            stage = _stage.get()
+            if stage is not None:
+                labels["stage"] = stage
+        return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+# Shared registry for the current process
+metrics = MetricsRegistry()
+
+
+def current_stage() -> Optional[str]:
+    """Name of the stage the calling code runs for, if any."""
+    return _stage.get()
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """
+    Highest resident set size of the process so far.
+
+    Returns:
+        Bytes, or None where the platform does not report it
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+@contextmanager
+def stage_scope(stage: str) -> Iterator[None]:
+    """
+    Attribute the work done in the block to a pipeline stage.
+
+    Records the CPU time of the calling thread as
+    ``stage_cpu_seconds_total`` (minus nested scopes, which record their
+    own) and the process's peak RSS at the end of the block as
+    ``stage_peak_rss_bytes``. Threads started inside the block join the
+    stage through ``bind_stage``.
+
+    Args:
+        stage: Stage name
+    """
+    token = _stage.set(stage)
+    nested = _local.__dict__.setdefault("nested", [])
+    nested.append(0.0)
+    started = time.thread_time()
+    try:
+        yield
+    finally:
+        elapsed = time.thread_time() - started
+        own = elapsed - nested.pop()
+        if nested:
+            nested[-1] += elapsed
+        metrics.increment("stage_cpu_seconds_total", own, stage=stage)
+        peak = peak_rss_bytes()
+        if peak is not None:
+            metrics.maximum("stage_peak_rss_bytes", peak, stage=stage)
+        _stage.reset(token)
+
+
+def bind_stage(func: Callable) -> Callable:
+    """
+    Make a function run for the caller's stage on whichever thread calls it.
+
+    Used where work is handed to other threads (executors, stream pumps),
+    which do not inherit the caller's context.
+
+    Args:
+        func: Function to hand to another thread
+
+    Returns:
+        Wrapped function, or ``func`` itself outside any stage
+    """
+    stage = _stage.get()
+    if stage is None:
+        return func
+
+    @functools.wraps(func)
+    def run(*args, **kwargs):
+        with stage_scope(stage):
+            return func(*args, **kwargs)
+
+    return run
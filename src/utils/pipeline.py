@@ -0,0 +1,293 @@
+"""Dependency-driven execution of pipeline stages."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, FIRST_COMPLETED, Future, wait
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from src.utils.logger import get_logger
+from src.utils.metrics import metrics, stage_scope
+
+
+logger = get_logger("pipeline")
+
+
+class StageError(Exception):
+    """Raised when a required stage fails; the stage's error is the cause."""
+
+    def __init__(self, stage: str, error: BaseException):
+        self.stage = stage
+        self.error = error
+        super().__init__(f"Stage '{stage}' failed: {error}")
+
+
+@dataclass
+class Stage:
+    """One unit of pipeline work and the stages it depends on."""
+
+    name: str
+    func: Callable[..., Any]
+    after: Tuple[str, ...] = ()
+    executor: str = "thread"  # thread or process
+    required: bool = True  # failure aborts the run instead of yielding None
+
+
+@dataclass
+class StageTiming:
+    """Wall-clock timing of one stage."""
+
+    name: str
+    started: float
+    finished: float
+    status: str = "ok"  # ok, failed or skipped
+    after: Tuple[str, ...] = field(default_factory=tuple)
+
+    @property
+    def seconds(self) -> float:
+        """Duration of the stage."""
+        return self.finished - self.started
+
+
+class Pipeline:
+    """
+    Runs stages as soon as the stages they depend on have finished.
+
+    Each stage function receives the results of its dependencies as keyword
+    arguments named after them. Independent stages run concurrently on a
+    thread pool (I/O-bound work such as LLM calls) or a process pool
+    (CPU-bound work with picklable inputs), so the wall time of a run is its
+    critical path rather than the sum of its stages.
+
+    A failing optional stage yields None to its dependents; a failing
+    required stage stops scheduling and ``run`` raises StageError once the
+    stages already running have finished.
+
+    Thread stages run in a ``stage_scope``: the metrics they record carry
+    the stage's name, along with their CPU time and peak RSS. Process stages
+    only record their wall time.
+    """
+
+    EXECUTORS = ("thread", "process")
+
+    def __init__(self, max_workers: int = 4, process_workers: int = None):
+        """
+        Initialize pipeline.
+
+        Args:
+            max_workers: Thread pool size
+            process_workers: Process pool size (default: CPU count)
+        """
+        self.max_workers = max_workers
+        self.process_workers = process_workers
+        self.stages: Dict[str, Stage] = {}
+        self.timings: Dict[str, StageTiming] = {}
+        self.results: Dict[str, Any] = {}
+        self.errors: Dict[str, BaseException] = {}
+
+    def add(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        after: Sequence[str] = (),
+        executor: str = "thread",
+        required: bool = True
+    ) -> "Pipeline":
+        """
+        Declare a stage.
+
+        Args:
+            name: Unique stage name (also the keyword its result is passed as)
+            func: Stage function; called with the results of ``after``
+            after: Names of the stages this one depends on; steps recorded
+                with ``time`` only order the critical path and pass no result
+            executor: Pool to run on, thread or process
+            required: Abort the run if this stage fails
+
+        Returns:
+            The pipeline, for chaining
+        """
+        if name in self.stages:
+            raise ValueError(f"Duplicate stage: {name}")
+        if executor not in self.EXECUTORS:
+            raise ValueError(f"Unknown executor '{executor}', use one of {', '.join(self.EXECUTORS)}")
+        missing = [dep for dep in after if dep not in self.stages and dep not in self.timings]
+        if missing:
+            # Dependencies must be declared (or timed) first, which also
+            # rules out cycles
+            raise ValueError(f"Stage '{name}' depends on undeclared stages: {', '.join(missing)}")
+
+        self.stages[name] = Stage(name, func, tuple(after), executor, required)
+        return self
+
+    @contextmanager
+    def time(self, name: str, after: Sequence[str] = ()) -> Iterator[None]:
+        """
+        Record the timing of work done by the caller as a stage.
+
+        Used for steps that must stay on the calling thread, such as
+        collection driving the progress display.
+
+        Args:
+            name: Stage name
+            after: Stages this step depended on (for the critical path)
+        """
+        started = time.monotonic()
+        status = "failed"
+        try:
+            with stage_scope(name):
+                yield
+            status = "ok"
+        finally:
+            self._record(StageTiming(name, started, time.monotonic(), status, tuple(after)))
+
+    def stream(self, name: str, items: Iterable[Any], after: Sequence[str] = ()) -> Iterator[Any]:
+        """
+        Record the production of a stream of items as a stage.
+
+        The stage lasts from the first request for an item until the stream
+        ends, on whichever thread consumes it (e.g. one collector's stream
+        pumped by ``merge_streams``), and counts its items as
+        ``items_total``. Closing the stream early is not a failure.
+
+        Args:
+            name: Stage name
+            items: Item iterator
+            after: Stages this step depended on (for the critical path)
+
+        Yields:
+            The items of ``items``
+        """
+        started = time.monotonic()
+        status = "failed"
+        count = 0
+        try:
+            with stage_scope(name):
+                for item in items:
+                    count += 1
+                    yield item
+            status = "ok"
+        except GeneratorExit:
+            status = "ok"
+            raise
+        finally:
+            metrics.increment("items_total", count, stage=name)
+            self._record(StageTiming(name, started, time.monotonic(), status, tuple(after)))
+
+    def run(self, on_done: Callable[[StageTiming], None] = None) -> Dict[str, Any]:
+        """
+        Run every declared stage.
+
+        Args:
+            on_done: Called on the calling thread after each stage finishes,
+                fails or is skipped
+
+        Returns:
+            Stage results by name (None for failed optional stages)
+
+        Raises:
+            StageError: If a required stage failed
+        """
+        threads = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="stage")
+        processes: Optional[ProcessPoolExecutor] = None
+        running: Dict[Future, Tuple[str, float]] = {}
+        waiting = [name for name in self.stages]
+        failure: Optional[StageError] = None
+
+        def finish(timing: StageTiming) -> None:
+            self._record(timing)
+            if on_done:
+                on_done(timing)
+
+        try:
+            while waiting or running:
+                if failure is None:
+                    for name in list(waiting):
+                        stage = self.stages[name]
+                        if any(dep in waiting or dep in self._running_names(running) for dep in stage.after):
+                            continue
+                        waiting.remove(name)
+
+                        kwargs = {dep: self.results.get(dep) for dep in stage.after if dep in self.stages}
+                        if stage.executor == "process":
+                            processes = processes or ProcessPoolExecutor(max_workers=self.process_workers)
+                            future = processes.submit(stage.func, **kwargs)
+                        else:
+                            future = threads.submit(self._call, name, stage.func, kwargs)
+                        running[future] = (name, time.monotonic())
+                elif waiting:
+                    # A required stage failed: start nothing new
+                    for name in waiting:
+                        now = time.monotonic()
+                        finish(StageTiming(name, now, now, "skipped", self.stages[name].after))
+                    waiting = []
+
+                if not running:
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name, started = running.pop(future)
+                    stage = self.stages[name]
+                    error = future.exception()
+                    finished = time.monotonic()
+
+                    if error is None:
+                        self.results[name] = future.result()
+                        finish(StageTiming(name, started, finished, "ok", stage.after))
+                        continue
+
+                    self.errors[name] = error
+                    self.results[name] = None
+                    finish(StageTiming(name, started, finished, "failed", stage.after))
+                    if stage.required:
+                        logger.error(f"❌ Stage '{name}' failed: {error}")
+                        failure = failure or StageError(name, error)
+                    else:
+                        logger.warning(f"⚠️  Optional stage '{name}' failed: {error}")
+        finally:
+            threads.shutdown(wait=True)
+            if processes is not None:
+                processes.shutdown(wait=True)
+
+        if failure is not None:
+            raise failure from failure.error
+        return self.results
+
+    @staticmethod
+    def _call(name: str, func: Callable[..., Any], kwargs: Dict[str, Any]) -> Any:
+        # Metrics recorded by the stage, and its CPU time, carry its name
+        with stage_scope(name):
+            return func(**kwargs)
+
+    @staticmethod
+    def _running_names(running: Dict[Future, Tuple[str, float]]) -> List[str]:
+        return [name for name, _ in running.values()]
+
+    def _record(self, timing: StageTiming) -> None:
+        self.timings[timing.name] = timing
+        if timing.status != "skipped":
+            metrics.increment("stage_seconds_total", timing.seconds, stage=timing.name)
+        logger.debug(f"Stage '{timing.name}' {timing.status} in {timing.seconds:.2f}s")
+
+    def critical_path(self) -> Tuple[List[str], float]:
+        """
+        Find the chain of dependent stages that determined the wall time.
+
+        Returns:
+            Tuple of (stage names in order, summed duration of the chain)
+        """
+        best: Dict[str, Tuple[float, List[str]]] = {}
+
+        def longest(name: str) -> Tuple[float, List[str]]:
+            if name not in best:
+                timing = self.timings[name]
+                chains = [longest(dep) for dep in timing.after if dep in self.timings]
+                seconds, path = max(chains, key=lambda chain: chain[0], default=(0.0, []))
+                best[name] = (seconds + timing.seconds, path + [name])
+            return best[name]
+
+        if not self.timings:
+            return [], 0.0
+        seconds, path = max((longest(name) for name in self.timings), key=lambda chain: chain[0])
+        return path, seconds
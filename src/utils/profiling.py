@@ -0,0 +1,174 @@
+"""Per-stage resource profiles of a run, as a run record and Prometheus text."""
+
+import json
+import re
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.utils.files import atomic_writer
+from src.utils.metrics import LabelSet, MetricsRegistry, metrics
+from src.utils.pipeline import Pipeline
+
+
+RUN_RECORD_FORMAT = "research-agent.run-record"
+RUN_RECORD_VERSION = 1
+
+_METRIC_PREFIX = "research_agent_"
+_INVALID_NAME = re.compile(r"[^a-zA-Z0-9_]")
+
+
+@dataclass
+class StageProfile:
+    """Resource use of one pipeline stage."""
+
+    stage: str
+    status: str
+    wall_seconds: float
+    cpu_seconds: float
+    peak_rss_bytes: Optional[int]  # process high-water mark when the stage ended
+    bytes_received: int
+    bytes_sent: int  # request payloads and files written
+    items: int
+    retries: int
+    cache_hits: int
+
+
+def stage_profiles(pipeline: Pipeline, registry: MetricsRegistry = metrics) -> List[StageProfile]:
+    """
+    Combine a pipeline's stage timings with the metrics its stages recorded.
+
+    Args:
+        pipeline: Pipeline that has run
+        registry: Metrics registry the stages recorded into
+
+    Returns:
+        One profile per stage that ran, in start order
+    """
+    profiles = []
+    for timing in sorted(pipeline.timings.values(), key=lambda timing: timing.started):
+        if timing.status == "skipped":
+            continue
+        stage = timing.name
+        peak = registry.total("stage_peak_rss_bytes", stage=stage)
+        profiles.append(StageProfile(
+            stage=stage,
+            status=timing.status,
+            wall_seconds=round(timing.seconds, 4),
+            cpu_seconds=round(registry.total("stage_cpu_seconds_total", stage=stage), 4),
+            peak_rss_bytes=int(peak) or None,
+            bytes_received=int(registry.total("bytes_received_total", stage=stage)),
+            bytes_sent=int(registry.total("bytes_sent_total", stage=stage)
+                           + registry.total("bytes_written_total", stage=stage)),
+            items=int(registry.total("items_total", stage=stage)),
+            retries=int(registry.total("retry_attempts_total", stage=stage, outcome="retry")),
+            cache_hits=int(registry.total("cache_hits_total", stage=stage)),
+        ))
+    return profiles
+
+
+def build_run_record(
+    pipeline: Pipeline,
+    started: datetime,
+    options: Dict[str, Any],
+    status: str = "ok",
+    registry: MetricsRegistry = metrics
+) -> Dict[str, Any]:
+    """
+    Build the JSON record of a run.
+
+    Args:
+        pipeline: Pipeline that has run
+        started: Start of the run
+        options: Run options (topic, sources, model...)
+        status: Outcome of the run
+        registry: Metrics registry of the run
+
+    Returns:
+        JSON-serializable run record
+    """
+    finished = datetime.now()
+    path, path_seconds = pipeline.critical_path()
+    return {
+        "format": RUN_RECORD_FORMAT,
+        "version": RUN_RECORD_VERSION,
+        "started": started.isoformat(timespec="seconds"),
+        "finished": finished.isoformat(timespec="seconds"),
+        "wall_seconds": round((finished - started).total_seconds(), 3),
+        "status": status,
+        "options": options,
+        "critical_path": {"stages": path, "seconds": round(path_seconds, 3)},
+        "stages": [asdict(profile) for profile in stage_profiles(pipeline, registry)],
+        "metrics": [
+            {"name": name, "labels": dict(labels), "value": value}
+            for name, series in sorted(registry.snapshot().items())
+            for labels, value in sorted(series.items())
+        ],
+    }
+
+
+def write_run_record(path: Path, record: Dict[str, Any]) -> None:
+    """
+    Write a run record atomically.
+
+    Args:
+        path: Record file
+        record: Run record from ``build_run_record``
+    """
+    with atomic_writer(path, durable=False) as handle:
+        json.dump(record, handle, ensure_ascii=False, indent=2)
+
+
+def prometheus_text(registry: MetricsRegistry = metrics) -> str:
+    """
+    Render every metric in the Prometheus text exposition format.
+
+    Names ending in ``_total`` are exported as counters, others as gauges;
+    every name gets the ``research_agent_`` prefix.
+
+    Args:
+        registry: Metrics registry
+
+    Returns:
+        Exposition text
+    """
+    lines = []
+    for name, series in sorted(registry.snapshot().items()):
+        metric = _METRIC_PREFIX + _INVALID_NAME.sub("_", name)
+        lines.append(f"# TYPE {metric} {'counter' if name.endswith('_total') else 'gauge'}")
+        for labels, value in sorted(series.items()):
+            lines.append(f"{metric}{_format_labels(labels)} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus_textfile(path: Path, registry: MetricsRegistry = metrics) -> None:
+    """
+    Write metrics for the node_exporter textfile collector.
+
+    The file is replaced atomically, so the collector never reads a
+    partial scrape.
+
+    Args:
+        path: Output file (``*.prom``)
+        registry: Metrics registry
+    """
+    with atomic_writer(path, durable=False) as handle:
+        handle.write(prometheus_text(registry))
+
+
+def _format_value(value: float) -> str:
+    # Full precision: large counters must keep growing between scrapes
+    value = float(value)
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def _format_labels(labels: LabelSet) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        f'{_INVALID_NAME.sub("_", key)}="'
+        + value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"') + '"'
+        for key, value in labels
+    )
+    return "{" + ",".join(escaped) + "}"
@@ -0,0 +1,333 @@
+"""Circuit breakers and hedged requests for remote endpoints."""
+
+import json
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import requests
+
+from src.config import Config
+from src.utils.files import atomic_writer
+from src.utils.logger import get_logger
+from src.utils.metrics import bind_stage
+
+
+logger = get_logger("resilience")
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the endpoint's circuit is open."""
+
+    def __init__(self, endpoint: str, retry_in: float):
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+        super().__init__(
+            f"Circuit open for {endpoint}: endpoint is failing, next probe in {retry_in:.0f}s"
+        )
+
+
+class CircuitBreaker:
+    """
+    Per-endpoint circuit breaker with half-open probing.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    calls fail immediately. Once ``reset_timeout`` has passed, a single probe
+    call is let through (half-open): success closes the circuit, failure
+    re-opens it for another ``reset_timeout``.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        endpoint: str,
+        failure_threshold: int = None,
+        reset_timeout: float = None,
+        on_change: Callable[["CircuitBreaker"], None] = None
+    ):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            endpoint: Endpoint name used in errors and logs
+            failure_threshold: Consecutive failures before opening
+            reset_timeout: Seconds to stay open before probing
+            on_change: Callback invoked after every state change
+        """
+        self.endpoint = endpoint
+        self.failure_threshold = failure_threshold or Config.CIRCUIT_FAILURE_THRESHOLD
+        self.reset_timeout = reset_timeout or Config.CIRCUIT_RESET_TIMEOUT
+        self.on_change = on_change
+
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0  # wall clock, so state can be persisted
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run a call through the breaker.
+
+        Args:
+            func: Function to execute
+            *args: Positional arguments for the function
+            **kwargs: Keyword arguments for the function
+
+        Returns:
+            Function result
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        probe = self.before_call()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            if is_endpoint_failure(e):
+                self.record_failure()
+            else:
+                self.record_success()
+            raise
+        else:
+            self.record_success()
+            return result
+        finally:
+            if probe:
+                self.release_probe()
+
+    def before_call(self) -> bool:
+        """
+        Reject the call if the circuit is open, or admit a half-open probe.
+
+        Returns:
+            True if the call was admitted as the half-open probe; the caller
+            must then ``release_probe`` however the call ends
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return False
+
+            retry_in = self.opened_at + self.reset_timeout - time.time()
+            if self.state == self.OPEN and retry_in <= 0:
+                self._set_state(self.HALF_OPEN)
+
+            if self.state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                logger.info(f"🔌 Probing {self.endpoint} (circuit half-open)")
+                return True
+
+            raise CircuitOpenError(self.endpoint, max(retry_in, 0))
+
+    def release_probe(self) -> None:
+        """Let another probe through once the current one has ended."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_success(self) -> None:
+        """Record a successful call."""
+        with self._lock:
+            self.failures = 0
+            self._probe_in_flight = False
+            if self.state != self.CLOSED:
+                logger.info(f"🔌 {self.endpoint} recovered, circuit closed")
+                self._set_state(self.CLOSED)
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit if needed."""
+        with self._lock:
+            self.failures += 1
+            self._probe_in_flight = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning(
+                        f"🔌 Circuit opened for {self.endpoint} after {self.failures} failure(s)"
+                    )
+                self.opened_at = time.time()
+                self._set_state(self.OPEN)
+
+    def _set_state(self, state: str) -> None:
+        self.state = state
+        if self.on_change:
+            self.on_change(self)
+
+
+class LatencyTracker:
+    """Rolling window of call latencies for one endpoint."""
+
+    def __init__(self, window: int = 50):
+        self.samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self.samples.append(seconds)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """
+        Get a latency percentile.
+
+        Args:
+            pct: Percentile between 0 and 100
+
+        Returns:
+            Latency in seconds, or None until enough samples were recorded
+        """
+        with self._lock:
+            if len(self.samples) < Config.HEDGE_MIN_SAMPLES:
+                return None
+            ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+
+def is_endpoint_failure(exception: Exception) -> bool:
+    """
+    Decide whether an error says the endpoint itself is unhealthy.
+
+    Timeouts, connection errors, 429 and 5xx responses count; client errors
+    such as bad credentials do not.
+
+    Args:
+        exception: The exception raised by the call
+
+    Returns:
+        True if the error should count against the circuit
+    """
+    if isinstance(exception, requests.exceptions.HTTPError) and exception.response is not None:
+        status = exception.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(exception, (
+        requests.exceptions.Timeout,
+        requests.exceptions.ConnectionError,
+    ))
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_latencies: Dict[str, LatencyTracker] = {}
+_registry_lock = threading.Lock()
+# Serializes the read-modify-write of the state file; taken under breaker
+# locks, so it must never wait for one
+_state_lock = threading.Lock()
+_hedge_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _state_file() -> Path:
+    return Config.OUTPUT_DIR / ".circuit_breakers.json"
+
+
+def _load_state() -> Dict[str, Dict[str, Any]]:
+    try:
+        return json.loads(_state_file().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_state(_: CircuitBreaker = None) -> None:
+    """Persist open circuits so the next run skips known-bad endpoints too."""
+    with _state_lock:
+        state = _load_state()
+        for name, breaker in list(_breakers.items()):
+            if breaker.state == CircuitBreaker.CLOSED:
+                state.pop(name, None)
+            else:
+                state[name] = {"opened_at": breaker.opened_at, "failures": breaker.failures}
+
+        try:
+            # Replaced atomically: readers never see a partial file
+            with atomic_writer(_state_file(), durable=False) as handle:
+                json.dump(state, handle)
+        except OSError as e:
+            logger.debug(f"Could not persist circuit state: {e}")
+
+
+def get_breaker(endpoint: str) -> CircuitBreaker:
+    """
+    Get the shared circuit breaker for an endpoint.
+
+    Circuits left open by a previous run are restored, so a known-bad
+    endpoint fails fast until its reset timeout allows a probe.
+
+    Args:
+        endpoint: Endpoint name
+
+    Returns:
+        Circuit breaker for the endpoint
+    """
+    with _registry_lock:
+        breaker = _breakers.get(endpoint)
+        if breaker is None:
+            breaker = CircuitBreaker(endpoint, on_change=_save_state)
+            saved = _load_state().get(endpoint)
+            if saved:
+                breaker.state = CircuitBreaker.OPEN
+                breaker.opened_at = saved.get("opened_at", 0.0)
+                breaker.failures = saved.get("failures", breaker.failure_threshold)
+            _breakers[endpoint] = breaker
+        return breaker
+
+
+def get_latency_tracker(endpoint: str) -> LatencyTracker:
+    """Get the shared latency tracker for an endpoint."""
+    with _registry_lock:
+        return _latencies.setdefault(endpoint, LatencyTracker())
+
+
+def hedged_call(endpoint: str, func: Callable, *args, **kwargs) -> Any:
+    """
+    Call an endpoint, firing a duplicate request if the first one is slow.
+
+    When ``Config.HEDGE_REQUESTS`` is enabled and the call has not finished
+    within the endpoint's p95 latency, a second identical call is started and
+    whichever finishes first wins. Every call's latency feeds the tracker.
+
+    Args:
+        endpoint: Endpoint name
+        func: Function to execute
+        *args: Positional arguments for the function
+        **kwargs: Keyword arguments for the function
+
+    Returns:
+        Function result
+    """
+    global _hedge_executor
+
+    tracker = get_latency_tracker(endpoint)
+
+    @bind_stage
+    def timed():
+        start = time.monotonic()
+        result = func(*args, **kwargs)
+        tracker.record(time.monotonic() - start)
+        return result
+
+    hedge_after = tracker.percentile(95) if Config.HEDGE_REQUESTS else None
+    if hedge_after is None:
+        return timed()
+
+    with _registry_lock:
+        if _hedge_executor is None:
+            _hedge_executor = ThreadPoolExecutor(thread_name_prefix="hedge")
+        executor = _hedge_executor
+
+    primary = executor.submit(timed)
+    done, _ = wait([primary], timeout=hedge_after)
+    if done:
+        return primary.result()
+
+    logger.debug(f"Hedging {endpoint}: no response after p95 ({hedge_after:.1f}s)")
+    pending = {primary, executor.submit(timed)}
+    error = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                return future.result()
+            error = future.exception()
+    raise error
@@ -0,0 +1,354 @@
+"""Unified retry logic with a per-run retry budget."""
+
+import asyncio
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Optional
+
+import requests
+
+from src.config import Config
+from src.utils.logger import get_logger
+from src.utils.metrics import metrics
+
+
+logger = get_logger("retry")
+
+# Status codes worth retrying: timeouts, conflicts, rate limits, server errors
+RETRIABLE_STATUS = {408, 409, 429, 500, 502, 503, 504, 529}
+
+
+class RetryBudget:
+    """
+    Caps the retries of a whole run.
+
+    Every retry anywhere in the pipeline (collectors and analyzers) draws from
+    the same budget: a number of retries and a total backoff time. Once either
+    is spent, failures surface immediately, so the worst-case run time stays
+    bounded however many calls fail.
+    """
+
+    def __init__(self, max_retries: int = None, max_wait: float = None):
+        """
+        Initialize retry budget.
+
+        Args:
+            max_retries: Retries allowed per run (default: Config.RETRY_BUDGET)
+            max_wait: Total backoff seconds per run (default: Config.RETRY_BUDGET_SECONDS)
+        """
+        self.max_retries = Config.RETRY_BUDGET if max_retries is None else max_retries
+        self.max_wait = Config.RETRY_BUDGET_SECONDS if max_wait is None else max_wait
+        self.retries = 0
+        self.waited = 0.0
+        self._lock = threading.Lock()
+
+    def try_spend(self, delay: float) -> bool:
+        """
+        Reserve one retry and its backoff delay.
+
+        Args:
+            delay: Seconds the retry will wait first
+
+        Returns:
+            True if the budget covers it, False if the retry must be skipped
+        """
+        with self._lock:
+            if self.retries >= self.max_retries or self.waited + delay > self.max_wait:
+                return False
+            self.retries += 1
+            self.waited += delay
+            return True
+
+    @property
+    def exhausted(self) -> bool:
+        """True once no further retries are allowed."""
+        return self.retries >= self.max_retries or self.waited >= self.max_wait
+
+
+_budget = RetryBudget()
+
+
+def get_retry_budget() -> RetryBudget:
+    """Get the retry budget of the current run."""
+    return _budget
+
+
+def reset_retry_budget(budget: RetryBudget = None) -> RetryBudget:
+    """
+    Start a new run's retry budget.
+
+    Args:
+        budget: Budget to install (default: a fresh one from Config)
+
+    Returns:
+        The installed budget
+    """
+    global _budget
+    _budget = budget or RetryBudget()
+    return _budget
+
+
+def is_retriable_error(exception: Exception) -> bool:
+    """
+    Determine if an error should trigger a retry.
+
+    Works for requests errors as well as the Anthropic and Gemini SDK errors,
+    which carry an HTTP status code.
+
+    Args:
+        exception: The exception to check
+
+    Returns:
+        True if the error is retriable, False otherwise
+    """
+    status = _status_code(exception)
+    if status is not None:
+        # Don't retry authentication errors (401, 403) or other client errors
+        return status in RETRIABLE_STATUS
+
+    # Retry on network errors and timeouts
+    if isinstance(exception, (
+        requests.exceptions.Timeout,
+        requests.exceptions.ConnectionError,
+        requests.exceptions.RequestException
+    )):
+        return True
+
+    # SDK connection/timeout errors have no status code
+    error_type = type(exception).__name__
+    if error_type in ("APIConnectionError", "APITimeoutError", "ConnectError", "ReadTimeout"):
+        return True
+
+    # Check for rate limit in error message
+    error_msg = str(exception).lower()
+    if "rate limit" in error_msg or "429" in error_msg:
+        return True
+
+    return False
+
+
+def _status_code(exception: Exception) -> Optional[int]:
+    """Get the HTTP status code carried by an exception, if any."""
+    for attr in ("status_code", "code"):
+        value = getattr(exception, attr, None)
+        if isinstance(value, int):
+            return value
+    response = getattr(exception, "response", None)
+    value = getattr(response, "status_code", None)
+    return value if isinstance(value, int) else None
+
+
+def retry_after(exception: Exception) -> Optional[float]:
+    """
+    Read the server's ``Retry-After`` hint from an error response.
+
+    Args:
+        exception: The exception raised by the call
+
+    Returns:
+        Seconds to wait, or None if the server gave no hint
+    """
+    response = getattr(exception, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    value = headers.get("retry-after") or headers.get("Retry-After")
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """Retries one operation with jittered exponential backoff."""
+
+    def __init__(
+        self,
+        operation: str,
+        max_attempts: int = None,
+        min_wait: float = None,
+        max_wait: float = None,
+        classify: Callable[[Exception], bool] = is_retriable_error,
+        budget: RetryBudget = None,
+        deadline: Any = None
+    ):
+        """
+        Initialize retry policy.
+
+        Args:
+            operation: Operation name used in logs and metrics
+            max_attempts: Attempts including the first (default: Config.MAX_RETRIES + 1)
+            min_wait: Base backoff in seconds (default: Config.RETRY_DELAY)
+            max_wait: Backoff cap in seconds (default: Config.RETRY_MAX_WAIT)
+            classify: Predicate deciding which errors are retriable
+            budget: Retry budget to draw from (default: the current run's)
+            deadline: Optional Deadline; retries never wait past it
+        """
+        self.operation = operation
+        self.max_attempts = max_attempts or Config.MAX_RETRIES + 1
+        self.min_wait = Config.RETRY_DELAY if min_wait is None else min_wait
+        self.max_wait = Config.RETRY_MAX_WAIT if max_wait is None else max_wait
+        self.classify = classify
+        self.budget = budget
+        self.deadline = deadline
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Execute a function with retry logic.
+
+        Args:
+            func: Function to execute
+            *args: Positional arguments for the function
+            **kwargs: Keyword arguments for the function
+
+        Returns:
+            Function result
+
+        Raises:
+            Exception: The last error once retries stop
+        """
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                delay = self._next_delay(attempt, e)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+            else:
+                self._record(attempt, "success")
+                return result
+
+    async def acall(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Await a coroutine function with retry logic.
+
+        Same policy as ``call``, but backoff waits with ``asyncio.sleep`` so
+        the event loop keeps serving other requests.
+
+        Args:
+            func: Coroutine function to execute
+            *args: Positional arguments for the function
+            **kwargs: Keyword arguments for the function
+
+        Returns:
+            Function result
+
+        Raises:
+            Exception: The last error once retries stop
+        """
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                delay = self._next_delay(attempt, e)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+            else:
+                self._record(attempt, "success")
+                return result
+
+    def _next_delay(self, attempt: int, exception: Exception) -> Optional[float]:
+        """
+        Decide whether a failed attempt is retried.
+
+        Args:
+            attempt: Number of the attempt that just failed (1-based)
+            exception: The error it raised
+
+        Returns:
+            Seconds to wait before retrying, or None to give up
+        """
+        budget = self.budget or get_retry_budget()
+
+        if not self.classify(exception):
+            self._record(attempt, "fatal")
+            return None
+
+        delay = self.backoff(attempt, exception)
+        if attempt == self.max_attempts:
+            self._record(attempt, "exhausted")
+            return None
+        if self.deadline is not None and delay >= self.deadline.remaining():
+            self._record(attempt, "deadline")
+            return None
+        if not budget.try_spend(delay):
+            self._record(attempt, "budget_exhausted")
+            logger.warning(f"Retry budget exhausted, not retrying {self.operation}: {exception}")
+            return None
+
+        self._record(attempt, "retry", delay)
+        logger.warning(
+            f"Retry attempt {attempt}/{self.max_attempts - 1} for {self.operation} "
+            f"in {delay:.1f}s after {exception}"
+        )
+        return delay
+
+    def backoff(self, attempt: int, exception: Exception) -> float:
+        """
+        Compute the wait before the next attempt.
+
+        Uses "full jitter" exponential backoff, unless the server asked for a
+        specific delay through ``Retry-After``.
+
+        Args:
+            attempt: Number of the attempt that just failed (1-based)
+            exception: The error it raised
+
+        Returns:
+            Seconds to wait
+        """
+        hinted = retry_after(exception)
+        if hinted is not None:
+            return hinted
+        ceiling = min(self.max_wait, self.min_wait * 2 ** (attempt - 1))
+        return random.uniform(self.min_wait / 2, ceiling)
+
+    def _record(self, attempt: int, outcome: str, delay: float = 0.0) -> None:
+        metrics.increment("retry_attempts_total", operation=self.operation, outcome=outcome)
+        if delay:
+            metrics.increment("retry_wait_seconds_total", delay, operation=self.operation)
+
+
+def retry_call(operation: str, func: Callable, *args, **kwargs) -> Any:
+    """
+    Call a function under the default retry policy.
+
+    Args:
+        operation: Operation name used in logs and metrics
+        func: Function to execute
+        *args: Positional arguments for the function
+        **kwargs: Keyword arguments for the function
+
+    Returns:
+        Function result
+    """
+    return RetryPolicy(operation).call(func, *args, **kwargs)
+
+
+async def aretry_call(operation: str, func: Callable, *args, **kwargs) -> Any:
+    """
+    Await a coroutine function under the default retry policy.
+
+    Args:
+        operation: Operation name used in logs and metrics
+        func: Coroutine function to execute
+        *args: Positional arguments for the function
+        **kwargs: Keyword arguments for the function
+
+    Returns:
+        Function result
+    """
+    return await RetryPolicy(operation).acall(func, *args, **kwargs)
@@ -1,8 +1,11 @@
 """Input validation utilities."""
 
+from datetime import timedelta
 from typing import List
 import click
 
+from src.config import Config
+
 
 def validate_topic(topic: str) -> str:
     """
@@ -101,7 +104,67 @@ def validate_max_items(max_items: int) -> int:
     if max_items < 1:
         raise click.BadParameter("max-items must be at least 1")
 
-    if max_items > 100:
-        raise click.BadParameter("max-items must be less than or equal to 100")
+    if max_items > Config.MAX_ITEMS_LIMIT:
+        raise click.BadParameter(
+            f"max-items must be less than or equal to {Config.MAX_ITEMS_LIMIT}"
+        )
 
     return max_items
+
+
+def validate_window(window: str) -> timedelta:
+    """
+    Validate a history window such as ``30d``.
+
+    Args:
+        window: Number followed by a unit: h (hours), d (days) or w (weeks)
+
+    Returns:
+        Window length
+
+    Raises:
+        click.BadParameter: If the window is invalid
+    """
+    units = {"h": "hours", "d": "days", "w": "weeks"}
+    value = window.strip().lower()
+
+    if len(value) < 2 or value[-1] not in units or not value[:-1].isdigit():
+        raise click.BadParameter(
+            f"Invalid window '{window}'. Use a number and a unit, e.g. 48h, 30d or 12w"
+        )
+
+    amount = int(value[:-1])
+    if amount < 1:
+        raise click.BadParameter("Window must be at least 1")
+
+    return timedelta(**{units[value[-1]]: amount})
+
+
+def validate_formats(formats: str) -> List[str]:
+    """
+    Validate and parse extra report formats.
+
+    Args:
+        formats: Comma-separated list of formats (html, json); empty for none
+
+    Returns:
+        List of format names, in the given order without duplicates
+
+    Raises:
+        click.BadParameter: If a format is invalid
+    """
+    valid_formats = {"markdown", "html", "json"}
+
+    format_list = []
+    for name in (formats or "").split(","):
+        name = name.strip().lower()
+        if not name:
+            continue
+        if name not in valid_formats:
+            raise click.BadParameter(
+                f"Invalid format '{name}'. Valid formats: html, json"
+            )
+        if name not in format_list:
+            format_list.append(name)
+
+    return format_list
@@ -0,0 +1,60 @@
+"""Tests for async analysis with bounded concurrency."""
+
+import asyncio
+
+from src.analyzers.base import LLMProvider, LLMResponse
+from src.interactive.session import InteractiveSession
+
+
+ITEMS = [
+    {"source": "x", "content": "battery prices are falling", "engagement": {}},
+    {"source": "web", "title": "Grid report", "content": "grid upgrades are slow"},
+]
+
+
+class SlowAsyncProvider(LLMProvider):
+    name = "fake"
+    display_name = "Fake AI"
+
+    def __init__(self):
+        super().__init__()
+        self.in_flight = 0
+        self.peak = 0
+
+    @property
+    def model(self):
+        return "fake-model"
+
+    def generate(self, prompt):
+        raise AssertionError("sync path should not be used")
+
+    async def agenerate(self, prompt):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.05)
+        self.in_flight -= 1
+        task = prompt.task if hasattr(prompt, "task") else prompt
+        return LLMResponse(text=task[-40:], provider=self.name, model=self.model)
+
+
+def test_concurrent_analyses_respect_the_limit(monkeypatch):
+    monkeypatch.setattr("src.config.Config.LLM_MAX_CONCURRENCY", 2)
+    provider = SlowAsyncProvider()
+
+    results = provider.analyze_concurrently([
+        {"topic": "t", "data_items": ITEMS, "custom_prompt": f"prompt {i}"} for i in range(6)
+    ])
+
+    assert [r["analysis"] for r in results] == [f"prompt {i}" for i in range(6)]
+    assert provider.peak == 2
+
+
+def test_focus_on_several_topics_runs_them_together():
+    provider = SlowAsyncProvider()
+    session = InteractiveSession(topic="energy", data=ITEMS, analysis={"analysis": "ok"}, analyzer=provider)
+
+    answer = session.ask_question("focus battery, grid, hydrogen")
+
+    assert "**Focus: battery**" in answer and "**Focus: grid**" in answer
+    assert "No data found related to 'hydrogen'" in answer
+    assert provider.peak == 2
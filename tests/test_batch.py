@@ -0,0 +1,71 @@
+"""Tests for the offline batch analysis path."""
+
+import pytest
+from click.testing import CliRunner
+
+from src import main
+from src.analyzers.base import LLMProvider, LLMResponse
+from src.analyzers.batch import BatchError, LocalBatchBackend, run_batch
+
+
+class EchoProvider(LLMProvider):
+    name = "echo"
+    display_name = "Echo AI"
+
+    @property
+    def model(self):
+        return "echo-model"
+
+    def generate(self, prompt):
+        topic = prompt.context[0].splitlines()[0]
+        if "broken" in topic:
+            raise RuntimeError("request errored")
+        return LLMResponse(text=f"## Executive Summary\n\nAnalysis of {topic}", provider=self.name,
+                           model=self.model, input_tokens=100, output_tokens=20)
+
+
+class FakeCollector:
+    def stream(self, topic, max_items, deadline=None):
+        for i in range(3):
+            yield {"source": "web", "title": f"{topic} article {i}", "content": f"{topic} is great",
+                   "author": "example.com", "date": "2026-01-01", "url": f"https://example.com/{i}"}
+
+
+def test_run_batch_polls_until_done():
+    backend = LocalBatchBackend(EchoProvider(), polls_until_done=3)
+
+    results = run_batch(backend, {"a": "prompt"}, poll_interval=0)
+
+    assert backend._polls[next(iter(backend.jobs))] == 3
+    assert isinstance(results["a"], Exception)  # plain prompt has no context
+
+
+def test_run_batch_times_out():
+    backend = LocalBatchBackend(EchoProvider(), polls_until_done=10 ** 6)
+
+    with pytest.raises(BatchError):
+        run_batch(backend, {"a": "prompt"}, poll_interval=0, timeout=0.01)
+
+
+def test_batch_command_renders_one_report_per_topic(monkeypatch, tmp_path):
+    topics = tmp_path / "topics.txt"
+    topics.write_text("# nightly\nsolar power\nbroken topic\nsolar power\n", encoding="utf-8")
+    backend = LocalBatchBackend(EchoProvider())
+
+    monkeypatch.setattr("src.config.Config.OUTPUT_DIR", tmp_path / "reports")
+    monkeypatch.setattr("src.config.Config.validate", classmethod(lambda cls, model=None: True))
+    monkeypatch.setattr(main, "WebCollector", FakeCollector)
+    monkeypatch.setattr(main, "create_batch_backend", lambda model: backend)
+
+    result = CliRunner().invoke(main.cli, [
+        "batch", "--topics-file", str(topics), "--sources", "web", "--poll-interval", "0"
+    ])
+
+    # One job with both topics; the failed request does not stop the others
+    assert len(backend.jobs) == 1
+    assert len(next(iter(backend.jobs.values()))) == 2
+    reports = list((tmp_path / "reports").glob("*.md"))
+    assert len(reports) == 1
+    assert "Analysis of # Collected Data about \"solar power\"" in reports[0].read_text(encoding="utf-8")
+    assert "1/2 reports written" in result.output
+    assert result.exit_code == 1
@@ -0,0 +1,100 @@
+"""Tests for incremental re-analysis against a stored baseline."""
+
+import pytest
+
+from src.analyzers.base import LLMProvider, LLMResponse
+from src.analyzers.delta import BaselineStore, DeltaAnalyzer, item_key
+
+
+class RecordingProvider(LLMProvider):
+    name = "rec"
+    display_name = "Recording AI"
+
+    def __init__(self):
+        super().__init__()
+        self.prompts = []
+
+    @property
+    def model(self):
+        return "rec-model"
+
+    def generate(self, prompt):
+        self.prompts.append(prompt)
+        return LLMResponse(text=f"analysis #{len(self.prompts)}", provider=self.name, model=self.model,
+                           input_tokens=len(prompt.render()) // 4, output_tokens=10)
+
+
+def _items(start, stop):
+    return [{"source": "web", "title": f"Article {i}", "content": f"Finding {i}",
+             "url": f"https://example.com/{i}"} for i in range(start, stop)]
+
+
+@pytest.fixture
+def delta(tmp_path):
+    provider = RecordingProvider()
+    return provider, DeltaAnalyzer(provider, BaselineStore(tmp_path))
+
+
+def test_first_run_is_full_and_stored(delta, tmp_path):
+    provider, analyzer = delta
+
+    result = analyzer.analyze("solar power", _items(0, 10), "quick")
+
+    assert result["metadata"]["delta"]["mode"] == "full"
+    baseline = BaselineStore(tmp_path).load("Solar  Power")
+    assert baseline.analysis == "analysis #1"
+    assert len(baseline.item_keys) == 10
+
+
+def test_rerun_sends_only_new_items_with_prior_analysis(delta):
+    provider, analyzer = delta
+    analyzer.analyze("solar power", _items(0, 10), "quick")
+
+    result = analyzer.analyze("solar power", _items(0, 12), "quick")
+
+    prompt = provider.prompts[-1]
+    assert "analysis #1" in prompt.context[0]
+    assert "Article 11" in prompt.context[1] and "Article 3" not in prompt.context[1]
+    assert result["metadata"]["delta"] == {
+        "mode": "incremental", "new_items": 2, "known_items": 10,
+        "baseline_updated_at": result["metadata"]["delta"]["baseline_updated_at"],
+    }
+    assert result["metadata"]["input_tokens"] < len(provider.prompts[0].render()) // 4 + 50
+
+    # The update is the new baseline covering every item seen so far
+    assert analyzer.store.load("solar power").analysis == "analysis #2"
+    assert len(analyzer.store.load("solar power").item_keys) == 12
+
+
+def test_unchanged_data_reuses_baseline_without_llm_call(delta):
+    provider, analyzer = delta
+    analyzer.analyze("solar power", _items(0, 5), "quick")
+
+    result = analyzer.analyze("solar power", _items(0, 5), "quick")
+
+    assert len(provider.prompts) == 1
+    assert result["analysis"] == "analysis #1"
+    assert result["metadata"]["tokens_used"] == 0
+
+
+def test_depth_change_or_non_incremental_runs_full(delta):
+    provider, analyzer = delta
+    analyzer.analyze("solar power", _items(0, 5), "quick")
+
+    assert analyzer.analyze("solar power", _items(0, 6), "detailed")["metadata"]["delta"]["mode"] == "full"
+    assert analyzer.analyze("solar power", _items(0, 7), "detailed", incremental=False)["metadata"]["delta"]["mode"] == "full"
+
+
+def test_item_key_falls_back_to_id_and_content():
+    assert item_key({"source": "x", "url": "u"}) == "x:u"
+    assert item_key({"source": "x", "metadata": {"id": "7"}}) == "x:id:7"
+    assert item_key({"source": "x", "url": "u", "metadata": {"id": "7"}}) == "x:id:7"
+    assert item_key({"source": "web", "content": "a"}) == item_key({"source": "web", "content": "a"})
+
+
+def test_item_key_ignores_synthesized_urls_without_id():
+    first = {"source": "x", "author": "ann", "content": "one", "url": "https://twitter.com/ann/status/"}
+    second = dict(first, content="two")
+
+    assert item_key(first) != item_key(second)
+    assert item_key(first).startswith("sha1:")
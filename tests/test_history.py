@@ -0,0 +1,153 @@
+"""Tests for the report history index and time-series comparison."""
+
+import os
+from datetime import datetime, timedelta
+
+from click.testing import CliRunner
+
+from src import main
+from src.analyzers.comparison_analyzer import ComparisonAnalyzer
+from src.analyzers.history import HistoryIndex, ReportSnapshot, detect_change_points, trend_line
+from src.generators import MarkdownGenerator
+from tests.test_batch import EchoProvider, FakeCollector
+
+
+def snapshot(day, compound, keywords, topic="Solar Power", volume=40):
+    return ReportSnapshot.from_results(
+        topic,
+        sentiment={"overall": "Positive" if compound > 0 else "Negative", "average_compound": compound},
+        keywords=[(kw, 0.01 * rank) for rank, kw in enumerate(keywords, 1)],
+        volume=volume,
+        generated=(datetime(2026, 1, 1) + timedelta(days=day)).isoformat(timespec="seconds"),
+        path=f"/reports/{day}.md"
+    )
+
+
+def test_trend_line_and_change_points():
+    line = trend_line([0, 1, 2, 3], [1.0, 3.0, 5.0, 7.0])
+    assert line["slope"] == 2.0 and line["r2"] == 1.0
+
+    values = [0.30, 0.32, 0.29, 0.31, 0.30, -0.20, -0.22, -0.19, -0.21]
+    assert detect_change_points(values) == [5]
+    assert detect_change_points([0.30, 0.31, 0.29, 0.30, 0.31, 0.30]) == []
+
+
+def test_index_stores_history_per_topic(tmp_path):
+    index = HistoryIndex(tmp_path / "history.sqlite3")
+    for day in range(3):
+        index.add(snapshot(day, 0.1 * day, ["solar", "battery"]))
+    index.add(snapshot(5, 0.5, ["wind"], topic="wind power"))
+
+    history = index.history("  solar   power ")
+    assert [s.generated[:10] for s in history] == ["2026-01-01", "2026-01-02", "2026-01-03"]
+    assert history[-1].keywords == [("solar", 0.01), ("battery", 0.02)]
+    assert index.latest("solar power", exclude=["/reports/2.md"]).path == "/reports/1.md"
+    assert len(index.history("solar power", since=datetime(2026, 1, 2))) == 2
+
+
+def test_sync_only_parses_new_or_changed_reports(tmp_path):
+    analysis = {"analysis": "## Executive Summary\n\nText.", "metadata": {"model": "m", "items_analyzed": 7}}
+    sentiment = {"overall": "Positive", "average_compound": 0.4, "distribution": {}}
+    report = tmp_path / "report.md"
+    MarkdownGenerator().generate_report("Solar power", analysis, {"x": [], "web": []}, report,
+                                        sentiment=sentiment, keywords=[("solar", 0.1)])
+    (tmp_path / "notes.md").write_text("# Notes\n", encoding="utf-8")
+    index = HistoryIndex(tmp_path / ".history.sqlite3")
+
+    assert index.sync(tmp_path) == 2
+    assert index.sync(tmp_path) == 0
+
+    stat = report.stat()
+    os.utime(report, (stat.st_atime, stat.st_mtime + 10))  # touched, same content
+    assert index.sync(tmp_path) == 0
+
+    latest = index.latest("solar power")
+    assert latest.volume == 7 and latest.compound == 0.4
+    assert latest.as_previous()["keywords"] == [("solar", 0.1)]
+
+
+def test_compare_history_reports_trends_and_keyword_movement():
+    history = [snapshot(day, 0.3, ["solar", "battery", "grid"]) for day in range(5)]
+    history += [snapshot(day, -0.2, ["grid", "outage", "solar"]) for day in range(5, 9)]
+    current = snapshot(9, -0.21, ["outage", "grid", "price"])
+
+    result = ComparisonAnalyzer().compare_history(current, history)
+
+    assert result["reports"] == 10
+    assert result["sentiment"]["direction"] == "↘️ Decreasing"
+    assert result["sentiment"]["change_points"][0]["date"] == "2026-01-06"
+    assert result["keywords"]["rising"][0] in ("outage", "price")
+    assert "battery" in result["keywords"]["falling"]
+    assert result["volume"]["direction"] == "→ Stable"
+
+
+def test_cli_compares_with_topic_history(monkeypatch, tmp_path):
+    monkeypatch.setattr("src.config.Config.OUTPUT_DIR", tmp_path)
+    monkeypatch.setattr("src.config.Config.validate", classmethod(lambda cls, model=None: True))
+    monkeypatch.setattr(main, "WebCollector", FakeCollector)
+    monkeypatch.setattr(main, "create_analyzer", lambda model: EchoProvider())
+    run = ["--topic", "solar power", "--sources", "web"]
+
+    assert CliRunner().invoke(main.cli, run + ["--output", "first"]).exit_code == 0
+    result = CliRunner().invoke(main.cli, run + ["--output", "second", "--compare-with", "latest",
+                                                 "--compare-window", "30d"])
+
+    assert result.exit_code == 0, result.output
+    assert "Comparison complete" in result.output
+    report = (tmp_path / "second.md").read_text(encoding="utf-8")
+    assert "**📆 History** (2 reports since" in report
+    assert len(HistoryIndex(tmp_path / ".history.sqlite3").history("solar power")) == 2
+
+
+def test_bulk_import_in_worker_processes_is_restartable(tmp_path):
+    generator = MarkdownGenerator()
+    analysis = {"analysis": "## Executive Summary\n\nText.", "metadata": {"model": "m", "items_analyzed": 7}}
+    for day in range(4):
+        sentiment = {"overall": "Positive", "average_compound": 0.1 * day, "distribution": {}}
+        generator.generate_report(f"Topic {day % 2}", analysis, {"x": [], "web": []},
+                                  tmp_path / f"report-{day}.md", sentiment=sentiment)
+    (tmp_path / "broken.md").write_bytes(b"\xff\xfe not utf-8")
+    index = HistoryIndex(tmp_path / ".history.sqlite3")
+    paths = sorted(tmp_path.glob("*.md"))
+
+    stats = index.index_files(paths, workers=2)
+    assert (stats.files, stats.parsed, stats.reports, stats.failed) == (5, 4, 4, 1)
+    assert stats.bytes > 0 and stats.files_per_second > 0
+    assert [row["reports"] for row in index.topics()] == [2, 2]
+
+    again = index.index_files(paths, workers=2)
+    assert (again.skipped, again.parsed, again.failed) == (4, 0, 1)
+
+
+def test_topics_turned_negative(tmp_path):
+    index = HistoryIndex(tmp_path / "history.sqlite3")
+    for day, compound in enumerate([0.4, 0.3, -0.3]):
+        index.add(snapshot(day, compound, ["solar"]))
+    for topic, day, compound in (("Wind", 0, 0.2), ("Wind", 1, -0.2), ("Coal", 0, -0.5)):
+        other = snapshot(day, compound, [topic.lower()], topic=topic)
+        other.path = f"/reports/{topic}-{day}.md"
+        index.add(other)
+
+    turned = index.topics_turned("negative", since=datetime(2026, 1, 2))
+    assert [(row["topic"], row["previous"]) for row in turned] == [("Solar Power", "Positive"), ("Wind", "Positive")]
+    assert turned[0]["previous_compound"] == 0.3
+    assert index.topics_turned("Negative", since=datetime(2026, 1, 3)) == turned[:1]
+
+
+def test_index_command(tmp_path, monkeypatch):
+    monkeypatch.setattr(main.Config, "OUTPUT_DIR", tmp_path)
+    analysis = {"analysis": "## Executive Summary\n\nText.", "metadata": {"model": "m", "items_analyzed": 7}}
+    for day, (overall, compound) in enumerate([("Positive", 0.4), ("Negative", -0.4)]):
+        path = tmp_path / f"report-{day}.md"
+        MarkdownGenerator().generate_report("Solar", analysis, {"x": [], "web": []}, path,
+                                            sentiment={"overall": overall, "average_compound": compound,
+                                                       "distribution": {}})
+        stamp = (datetime.now() - timedelta(days=1 - day)).timestamp()
+        os.utime(path, (stamp, stamp))
+
+    result = CliRunner().invoke(main.cli, ["index", "--directory", str(tmp_path), "--workers", "0",
+                                           "--turned", "negative"])
+
+    assert result.exit_code == 0, result.output
+    assert "2 parsed (2 reports)" in result.output
+    assert "Topics turned negative" in result.output and "Solar" in result.output
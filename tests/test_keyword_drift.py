@@ -0,0 +1,72 @@
+"""Tests for weighted keyword drift."""
+
+import time
+
+import pytest
+
+from src.analyzers.comparison_analyzer import ComparisonAnalyzer
+from src.analyzers.keyword_drift import (
+    keyword_drift, keyword_weights, merge_weights, rank_biased_overlap, weighted_jaccard
+)
+
+
+def test_rank_biased_overlap():
+    ranking = ["a", "b", "c", "d"]
+    assert rank_biased_overlap(ranking, ranking) == pytest.approx(1.0)
+    assert rank_biased_overlap(ranking, ["w", "x", "y", "z"]) == 0.0
+    assert rank_biased_overlap([], []) == 1.0
+
+    # Swapping the top pair costs more than swapping the bottom pair
+    top_swapped = rank_biased_overlap(ranking, ["b", "a", "c", "d"])
+    bottom_swapped = rank_biased_overlap(ranking, ["a", "b", "d", "c"])
+    assert bottom_swapped > top_swapped > 0.5
+
+    # A prefix of a ranking extrapolates to full agreement
+    assert rank_biased_overlap(ranking[:2], ranking) == pytest.approx(1.0)
+
+
+def test_weights_use_inverse_yake_scores_or_ranks():
+    weights = keyword_weights([("Solar", 0.01), ("battery", 0.02), ("solar", 0.04)])
+    assert list(weights) == ["solar", "battery"]
+    assert weights["solar"] == pytest.approx((100 + 25) / 175)
+    assert sum(weights.values()) == pytest.approx(1.0)
+
+    assert keyword_weights(["a", "b"]) == pytest.approx({"a": 2 / 3, "b": 1 / 3})
+    assert merge_weights([{"a": 1.0}, {"b": 0.5, "a": 0.5}]) == {"a": 0.75, "b": 0.25}
+
+
+def test_drift_scores_and_movers():
+    previous = keyword_weights([("solar", 0.01), ("battery", 0.02), ("grid", 0.04)])
+    current = keyword_weights([("battery", 0.01), ("solar", 0.02), ("hydrogen", 0.04)])
+
+    drift = keyword_drift(current, previous)
+    assert 0 < drift["rbo"] < 1 and 0 < drift["weighted_jaccard"] < 1
+    assert weighted_jaccard(current, current) == 1.0
+    assert drift["rising"][0][0] == "battery"
+    assert [keyword for keyword, _ in drift["falling"]] == ["solar", "grid"]
+    assert drift["magnitude"] == pytest.approx(
+        sum(abs(current.get(k, 0) - previous.get(k, 0)) for k in {*current, *previous}) / 2, abs=1e-3
+    )
+
+
+def test_drift_scales_to_large_keyword_sets():
+    previous = [(f"term {i}", 0.001 * (i + 1)) for i in range(40000)]
+    current = [(f"term {i}", 0.001 * (i + 1)) for i in range(20000, 60000)]
+
+    started = time.perf_counter()
+    comparison = ComparisonAnalyzer()._compare_keywords(current, previous)
+    assert time.perf_counter() - started < 2
+
+    assert comparison["total_new"] == comparison["total_removed"] == 20000
+    assert comparison["new_topics"][0] == "term 40000"
+    assert 0 < comparison["keyword_drift"]["weighted_jaccard"] < 1
+
+
+def test_comparison_keeps_display_spelling():
+    comparison = ComparisonAnalyzer().compare_analyses(
+        {"keywords": [("Solar", 0.01), ("Hydrogen", 0.02)]},
+        {"keywords": [("solar", 0.02), ("Grid", 0.01)]}
+    )
+    assert comparison["new_topics"] == ["Hydrogen"]
+    assert comparison["removed_topics"] == ["Grid"]
+    assert comparison["keyword_drift"]["rising"][0][0] in {"Solar", "Hydrogen"}
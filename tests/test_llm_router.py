@@ -0,0 +1,132 @@
+"""Tests for provider failover and hedging."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+import requests
+
+from src.analyzers.base import LLMProvider, LLMResponse
+from src.analyzers.router import LLMRouter, LLMTimeoutError
+from src.utils import resilience
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry(monkeypatch, tmp_path):
+    monkeypatch.setattr("src.config.Config.OUTPUT_DIR", tmp_path)
+    monkeypatch.setattr(resilience, "_breakers", {})
+
+
+class FakeProvider(LLMProvider):
+    def __init__(self, name, error=None, delay=0.0):
+        super().__init__()
+        self.name = name
+        self.display_name = name
+        self.error = error
+        self.delay = delay
+        self.calls = 0
+        self.release = threading.Event()
+
+    @property
+    def model(self):
+        return f"{self.name}-model"
+
+    def generate(self, prompt):
+        self.calls += 1
+        if self.delay:
+            self.release.wait(self.delay)
+        if self.error:
+            raise self.error
+        return LLMResponse(text=f"from {self.name}", provider=self.name, model=self.model,
+                           input_tokens=10, output_tokens=5)
+
+
+ITEMS = [{"source": "x", "content": "hello", "engagement": {}}]
+
+
+def test_primary_answer_has_normalized_metadata():
+    router = LLMRouter(FakeProvider("a"), FakeProvider("b"), timeout=5)
+
+    result = router.analyze("topic", ITEMS, "quick")
+
+    assert result["success"]
+    meta = result["metadata"]
+    assert meta["provider"] == "a" and meta["model"] == "a-model"
+    assert meta["tokens_used"] == 15
+    assert meta["failover"] is False
+    assert set(meta) >= {"cache_read_tokens", "cache_write_tokens", "latency_seconds", "items_analyzed"}
+
+
+def test_fails_over_on_error():
+    primary = FakeProvider("a", error=requests.exceptions.ConnectionError("down"))
+    router = LLMRouter(primary, FakeProvider("b"), timeout=5)
+
+    result = router.analyze("topic", ITEMS, "quick")
+
+    assert result["analysis"] == "from b"
+    assert result["metadata"]["failover"] is True
+
+
+def test_fails_over_on_timeout():
+    primary = FakeProvider("a", delay=5)
+    router = LLMRouter(primary, FakeProvider("b"), timeout=0.1)
+
+    response = router.generate("prompt")
+    primary.release.set()
+
+    assert response.provider == "b"
+
+
+def test_hedges_when_primary_exceeds_slo():
+    primary = FakeProvider("a", delay=5)
+    fallback = FakeProvider("b")
+    router = LLMRouter(primary, fallback, timeout=10, hedge_after=0.05)
+
+    response = router.generate("prompt")
+    primary.release.set()
+
+    assert response.provider == "b"
+    assert fallback.calls == 1
+
+
+def test_cancelled_hedge_leaves_provider_health_alone():
+    primary = FakeProvider("a", delay=0.5)
+    router = LLMRouter(primary, FakeProvider("b"), timeout=10, hedge_after=0.05)
+    breaker = resilience.get_breaker("llm:a")
+    breaker.state, breaker.opened_at = breaker.OPEN, time.time() - breaker.reset_timeout - 1
+
+    async def race():
+        response = await router.agenerate("prompt")
+        await asyncio.sleep(0.01)  # let the losing call handle its cancellation
+        return response
+
+    response = asyncio.run(race())
+
+    assert response.provider == "b"
+    # The cancelled probe neither closed the circuit nor kept it blocked
+    assert breaker.state == breaker.HALF_OPEN
+    assert breaker.before_call() is True
+
+
+def test_open_circuit_skips_primary():
+    primary = FakeProvider("a", error=requests.exceptions.Timeout("slow"))
+    router = LLMRouter(primary, FakeProvider("b"), timeout=5)
+
+    for _ in range(3):
+        router.generate("prompt")
+    router.generate("prompt")
+
+    assert primary.calls == 3
+
+
+def test_raises_when_every_provider_fails():
+    error = requests.exceptions.ConnectionError("down")
+    router = LLMRouter(FakeProvider("a", error=error), FakeProvider("b", error=error), timeout=5)
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        router.generate("prompt")
+
+    slow = LLMRouter(FakeProvider("a", delay=1), timeout=0.05)
+    with pytest.raises(LLMTimeoutError):
+        slow.generate("prompt")
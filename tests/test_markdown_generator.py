@@ -0,0 +1,101 @@
+"""Tests for report rendering and the streaming report writer."""
+
+import json
+
+import pytest
+
+from src.generators import MarkdownGenerator
+from src.generators.renderers import get_renderer
+from src.generators.sidecar import load_sidecar
+from src.generators.templates import Template, TemplateError, TemplateSet
+from src.utils.metrics import metrics
+
+
+ANALYSIS = {"analysis": "## Executive Summary\n\nText.", "metadata": {"model": "m"}}
+
+
+def test_report_is_streamed_and_renamed_into_place(tmp_path):
+    sources = {
+        "x": [{"author": f"user{i}", "content": "post", "date": "2026-01-01", "url": f"https://x.com/{i}",
+               "engagement": {"likes": i}} for i in range(500)],
+        "web": [{"title": "Article", "source": "news", "date": "", "url": "https://example.com"}],
+    }
+    path = tmp_path / "reports" / "report.md"
+
+    assert MarkdownGenerator().generate_report("Solar", ANALYSIS, sources, path, sidecar=False)
+
+    content = path.read_text(encoding="utf-8")
+    assert content.startswith("# Solar - Research Report\n\n**Generated**: ")
+    assert "### X (Twitter) - 500 posts" in content and "500. **@user499**" in content
+    assert content.endswith("*This report was generated by Research Agent - AI-powered research automation tool*\n")
+    assert [p.name for p in path.parent.iterdir()] == ["report.md"]
+
+
+def test_failed_render_keeps_previous_report(tmp_path, monkeypatch):
+    path = tmp_path / "report.md"
+    path.write_text("previous report", encoding="utf-8")
+    generator = MarkdownGenerator()
+
+    def broken(*args):
+        yield "# Partial"
+        raise RuntimeError("render failed")
+
+    monkeypatch.setattr(generator.renderers["markdown"], "render", broken)
+
+    assert not generator.generate_report("Solar", ANALYSIS, {"x": [], "web": []}, path, sidecar=False)
+    assert path.read_text(encoding="utf-8") == "previous report"
+    assert [p.name for p in tmp_path.iterdir()] == ["report.md"]
+
+
+def test_templates_compile_fields_specs_and_escaping():
+    template = Template("row", "{name} {score:+.2f} {html:s} {{literal}}", escape=lambda v: f"<{v}>")
+    assert template.fields == ["name", "score", "html"]
+    assert template.format(name="a", score=0.5, html="<b>", unused=1) == "<a> +0.50 <b> {literal}"
+
+    with pytest.raises(TemplateError):
+        Template("bad", "{item.name}")
+    with pytest.raises(TemplateError, match="needs fields: score"):
+        template.render({"name": "a", "html": ""})
+
+    templates = TemplateSet({"header": "# {topic}", "close": None})
+    assert templates.header(topic="Solar") == "# Solar" and templates.close is None
+
+
+def test_extra_formats_render_the_same_result(tmp_path):
+    metrics.reset()
+    sources = {"x": [{"author": "a<b>", "content": "x & y", "url": "https://x.com/1", "engagement": {"likes": 3}}],
+               "web": []}
+    sentiment = {"overall": "Positive", "average_compound": 0.4, "distribution": {}}
+    path = tmp_path / "report.md"
+
+    assert MarkdownGenerator().generate_report("Solar", ANALYSIS, sources, path, sentiment=sentiment,
+                                               keywords=[("solar", 0.1)], formats=["html", "json"])
+
+    page = (tmp_path / "report.html").read_text(encoding="utf-8")
+    assert page.startswith("<!DOCTYPE html>") and page.rstrip().endswith("</html>")
+    assert "@a&lt;b&gt;" in page and "x &amp; y" in page and "Positive (+0.400)" in page
+
+    data = json.loads((tmp_path / "report.json").read_text(encoding="utf-8"))
+    sidecar = load_sidecar(path)
+    assert data["topic"] == "Solar" and data["generated"] == sidecar["generated"]
+    assert data["sources"] == sidecar["sources"]
+    assert metrics.total("render_seconds_total", format="html") > 0
+
+    with pytest.raises(ValueError):
+        get_renderer("pdf")
+
+
+def test_html_links_allow_only_http_urls(tmp_path):
+    sources = {
+        "x": [{"author": "a", "content": "c", "url": "javascript:alert(1)", "engagement": {"likes": 1}}],
+        "web": [{"title": "t", "source": "s", "url": "data:text/html,<script>x</script>"},
+                {"title": "ok", "source": "s", "url": "https://example.com/?a=1&b=2"}],
+    }
+    path = tmp_path / "report.md"
+
+    assert MarkdownGenerator().generate_report("Solar", ANALYSIS, sources, path, sidecar=False, formats=["html"])
+
+    page = (tmp_path / "report.html").read_text(encoding="utf-8")
+    assert "javascript:" not in page and "data:text/html" not in page
+    assert page.count('href="#"') == 2
+    assert 'href="https://example.com/?a=1&amp;b=2"' in page
@@ -0,0 +1,98 @@
+"""Tests for compiled schema extractors."""
+
+import itertools
+import random
+
+import pytest
+
+from src.collectors.normalizer import Const, FirstOf, Key, SchemaNormalizer
+from src.collectors.web_collector import WEB_RESULT_SCHEMA
+from src.collectors.x_collector import X_POST_SCHEMA
+
+
+def reference_x(post):
+    """The original per-item key chains of XCollector._parse_x_response."""
+    return {
+        "source": "x",
+        "content": (post.get("text") or post.get("content") or post.get("tweet_text") or
+                    post.get("full_text", "")),
+        "author": (post.get("username") or post.get("author") or
+                   post.get("user", {}).get("username", "")),
+        "author_name": (post.get("displayName") or post.get("name") or
+                        post.get("user", {}).get("name", "")),
+        "date": post.get("created_at") or post.get("timestamp") or post.get("date", ""),
+        "url": (post.get("url") or post.get("link") or
+                f"https://twitter.com/{post.get('username', 'user')}/status/{post.get('id', '')}"),
+        "engagement": {
+            "likes": post.get("likes") or post.get("favorite_count") or post.get("like_count", 0),
+            "retweets": post.get("retweets") or post.get("retweet_count", 0),
+            "replies": post.get("replies") or post.get("reply_count", 0),
+        },
+        "metadata": {
+            "id": post.get("id") or post.get("tweet_id", ""),
+            "language": post.get("lang") or post.get("language", ""),
+            "verified": post.get("verified", False),
+        },
+    }
+
+
+def reference_web(item):
+    """The original per-item key chains of WebCollector._parse_web_response."""
+    return {
+        "source": "web",
+        "title": item.get("title") or item.get("headline") or "",
+        "content": item.get("snippet") or item.get("description") or item.get("summary") or "",
+        "url": item.get("link") or item.get("url") or "",
+        "author": item.get("source") or item.get("domain") or item.get("site_name") or "",
+        "date": item.get("date") or item.get("published_date") or item.get("timestamp", ""),
+        "metadata": {
+            "domain": item.get("domain") or item.get("displayed_link") or "",
+            "position": item.get("position", 0),
+            "thumbnail": item.get("thumbnail") or item.get("image", ""),
+        },
+    }
+
+
+def _random_items(keys, count, seed):
+    rng = random.Random(seed)
+    values = ["", None, 0, "value", 42, {"username": "nested", "name": "N"}, {}]
+    for _ in range(count):
+        chosen = rng.sample(sorted(keys), rng.randint(0, len(keys)))
+        item = {key: rng.choice(values) for key in chosen}
+        item["unrelated"] = "ignored"
+        yield item
+
+
+@pytest.mark.parametrize("schema,reference", [
+    (X_POST_SCHEMA, reference_x),
+    (WEB_RESULT_SCHEMA, reference_web),
+])
+def test_compiled_extractors_match_reference(schema, reference):
+    for item in _random_items(schema.relevant_keys, 2000, seed=7):
+        try:
+            expected = reference(item)
+        except AttributeError:
+            with pytest.raises(AttributeError):
+                schema.normalize(item)
+            continue
+        assert schema.normalize(item) == expected
+
+
+def test_extractor_compiled_once_per_variant():
+    schema = SchemaNormalizer("test", {"a": FirstOf(Key("a"), Key("b"), Const(""))}, ["a", "b"])
+
+    for value in itertools.islice(itertools.count(), 50):
+        assert schema.normalize({"a": value, "b": "fallback"}) == {"a": value or "fallback"}
+
+    assert len(schema._extractors) == 1
+
+
+def test_unknown_schema_reported_once(monkeypatch):
+    warnings = []
+    monkeypatch.setattr("src.collectors.normalizer.logger.warning", warnings.append)
+    schema = SchemaNormalizer("test", {"a": FirstOf(Key("a"), Const(""))}, ["a"])
+
+    for _ in range(10):
+        assert schema.normalize({"other": 1}) == {"a": ""}
+
+    assert len(warnings) == 1
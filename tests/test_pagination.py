@@ -0,0 +1,120 @@
+"""Tests for multi-page collection."""
+
+import time
+
+import pytest
+
+from src.collectors.base import BaseCollector
+from src.collectors.pagination import (
+    Deadline,
+    DeadlineExceeded,
+    Page,
+    iter_cursor_pages,
+    iter_numbered_pages,
+    merge_streams,
+)
+
+
+def _items(start, count, source="web"):
+    return [{"source": source, "content": f"item {i}"} for i in range(start, start + count)]
+
+
+class FakeCollector(BaseCollector):
+    """Collector serving canned pages."""
+
+    def __init__(self, pages, pagination="page"):
+        super().__init__(api_key="test", api_url="http://localhost")
+        self.pages = pages
+        self.PAGINATION = pagination
+        self.requests = []
+
+    def _fetch_page(self, topic, page_size, deadline, page=0, cursor=None):
+        key = cursor if self.PAGINATION == "cursor" else page
+        self.requests.append(key)
+        return self.pages.get(key, Page())
+
+
+def test_numbered_pages_stop_after_empty_page():
+    pages = {0: Page(_items(0, 2)), 1: Page(_items(2, 2))}
+    result = list(iter_numbered_pages(lambda n: pages.get(n, Page()), 10, 1, Deadline(5)))
+
+    assert [item["content"] for page in result for item in page.items] == [
+        "item 0", "item 1", "item 2", "item 3"
+    ]
+
+
+def test_numbered_pages_drop_pages_after_empty_page():
+    def fetch(n):
+        if n == 1:
+            return Page()
+        if n > 1:
+            time.sleep(0.3)
+        return Page(_items(n, 1))
+
+    started = time.monotonic()
+    result = list(iter_numbered_pages(fetch, 4, 4, Deadline(5)))
+
+    assert [item["content"] for page in result for item in page.items] == ["item 0"]
+    assert time.monotonic() - started < 0.3
+
+
+def test_numbered_pages_respect_deadline():
+    def slow_page(n):
+        time.sleep(0.5)
+        return Page(_items(n, 1))
+
+    with pytest.raises(DeadlineExceeded):
+        list(iter_numbered_pages(slow_page, 4, 2, Deadline(0.05)))
+
+
+def test_deadline_timeout_is_capped_and_never_zero():
+    assert Deadline(5).timeout(1) == 1
+
+    with pytest.raises(DeadlineExceeded):
+        Deadline(0).timeout(1)
+
+
+def test_cursor_pages_follow_cursor_and_stop_on_repeat():
+    pages = {
+        None: Page(_items(0, 2), next_cursor="a"),
+        "a": Page(_items(2, 2), next_cursor="b"),
+        "b": Page(_items(4, 2), next_cursor="a"),
+    }
+    result = list(iter_cursor_pages(lambda c: pages[c], Deadline(5), max_pages=10))
+
+    assert len(result) == 3
+
+
+def test_stream_stops_at_max_items(monkeypatch):
+    monkeypatch.setattr("src.config.Config.PAGE_SIZE", 2)
+    collector = FakeCollector({n: Page(_items(n * 2, 2)) for n in range(5)})
+
+    collected = collector.collect("topic", max_items=5)
+
+    assert len(collected) == 5
+
+
+def test_stream_uses_cursor_pagination(monkeypatch):
+    monkeypatch.setattr("src.config.Config.PAGE_SIZE", 2)
+    collector = FakeCollector(
+        {None: Page(_items(0, 2, "x"), next_cursor="next"), "next": Page(_items(2, 2, "x"))},
+        pagination="cursor"
+    )
+
+    collected = collector.collect("topic", max_items=10)
+
+    assert len(collected) == 4
+    assert collector.requests == [None, "next"]
+
+
+def test_merge_streams_reports_errors_per_stream():
+    def failing():
+        yield {"content": "first"}
+        raise RuntimeError("boom")
+
+    events = list(merge_streams({"ok": iter(_items(0, 3)), "bad": failing()}))
+
+    items = [item for _, item, error in events if error is None]
+    errors = [(name, error) for name, _, error in events if error is not None]
+    assert len(items) == 4
+    assert errors[0][0] == "bad"
@@ -0,0 +1,76 @@
+"""Tests for the pipeline DAG executor."""
+
+import time
+
+import pytest
+from click.testing import CliRunner
+
+from src import main
+from src.utils.pipeline import Pipeline, StageError
+from tests.test_batch import EchoProvider, FakeCollector
+
+
+def test_independent_stages_overlap():
+    pipeline = Pipeline()
+    pipeline.add("a", lambda: time.sleep(0.2) or 1)
+    pipeline.add("b", lambda: time.sleep(0.2) or 2)
+    pipeline.add("sum", lambda a, b: a + b, after=("a", "b"))
+
+    started = time.monotonic()
+    results = pipeline.run()
+
+    assert results["sum"] == 3
+    assert time.monotonic() - started < 0.35
+    assert pipeline.timings["sum"].started >= pipeline.timings["a"].finished
+
+
+def test_optional_failure_yields_none_and_required_failure_stops():
+    pipeline = Pipeline()
+    pipeline.add("extra", lambda: 1 / 0, required=False)
+    pipeline.add("main", lambda extra: extra, after=("extra",))
+    assert pipeline.run()["main"] is None
+
+    pipeline = Pipeline()
+    pipeline.add("fetch", lambda: 1 / 0)
+    pipeline.add("render", lambda fetch: fetch, after=("fetch",))
+    with pytest.raises(StageError) as excinfo:
+        pipeline.run()
+    assert excinfo.value.stage == "fetch"
+    assert isinstance(excinfo.value.__cause__, ZeroDivisionError)
+    assert pipeline.timings["render"].status == "skipped"
+
+
+def test_dependencies_must_be_declared_first():
+    with pytest.raises(ValueError):
+        Pipeline().add("report", lambda analysis: analysis, after=("analysis",))
+
+
+def test_critical_path_follows_the_slowest_chain():
+    pipeline = Pipeline()
+    with pipeline.time("collection"):
+        time.sleep(0.05)
+    pipeline.add("fast", lambda: None, after=("collection",))
+    pipeline.add("slow", lambda: time.sleep(0.1), after=("collection",))
+    pipeline.add("report", lambda fast, slow: None, after=("fast", "slow"))
+    pipeline.run()
+
+    path, seconds = pipeline.critical_path()
+
+    assert path == ["collection", "slow", "report"]
+    assert seconds >= 0.15
+
+
+def test_cli_runs_stages_and_prints_timings(monkeypatch, tmp_path):
+    monkeypatch.setattr("src.config.Config.OUTPUT_DIR", tmp_path)
+    monkeypatch.setattr("src.config.Config.validate", classmethod(lambda cls, model=None: True))
+    monkeypatch.setattr(main, "WebCollector", FakeCollector)
+    monkeypatch.setattr(main, "create_analyzer", lambda model: EchoProvider())
+
+    result = CliRunner().invoke(main.cli, [
+        "--topic", "solar power", "--sources", "web", "--output", "report"
+    ])
+
+    assert result.exit_code == 0, result.output
+    assert (tmp_path / "report.md").exists()
+    assert "Critical path: collection → " in result.output
+    assert "Analysis completed" in result.output
@@ -0,0 +1,80 @@
+"""Tests for per-stage metrics, run records and the Prometheus export."""
+
+import json
+import threading
+
+from click.testing import CliRunner
+
+from src import main
+from src.utils.metrics import MetricsRegistry, bind_stage, metrics, stage_scope
+from src.utils.profiling import prometheus_text
+from tests.test_batch import EchoProvider, FakeCollector
+
+
+def test_stage_scope_labels_metrics_across_threads():
+    metrics.reset()
+
+    with stage_scope("collect.web"):
+        metrics.increment("bytes_received_total", 100)
+        worker = threading.Thread(target=bind_stage(lambda: metrics.increment("bytes_received_total", 50)))
+        worker.start()
+        worker.join()
+    metrics.increment("bytes_received_total", 7)
+
+    assert metrics.total("bytes_received_total", stage="collect.web") == 150
+    assert metrics.total("bytes_received_total") == 157
+    assert metrics.total("stage_cpu_seconds_total", stage="collect.web") >= 0
+    assert metrics.total("stage_peak_rss_bytes", stage="collect.web") > 0
+    metrics.reset()
+
+
+def test_prometheus_text_types_and_escapes_series():
+    registry = MetricsRegistry()
+    registry.increment("retry_attempts_total", 2, operation='say "hi"', outcome="retry")
+    registry.maximum("stage_peak_rss_bytes", 2048, stage="report")
+    registry.maximum("stage_peak_rss_bytes", 1024, stage="report")
+
+    assert prometheus_text(registry).splitlines() == [
+        "# TYPE research_agent_retry_attempts_total counter",
+        'research_agent_retry_attempts_total{operation="say \\"hi\\"",outcome="retry"} 2',
+        "# TYPE research_agent_stage_peak_rss_bytes gauge",
+        'research_agent_stage_peak_rss_bytes{stage="report"} 2048',
+    ]
+
+
+def test_prometheus_text_keeps_full_precision():
+    registry = MetricsRegistry()
+    registry.increment("bytes_received_total", 123456789)
+    registry.increment("bytes_received_total", 1)
+    registry.increment("stage_cpu_seconds_total", 0.1234567891, stage="collect")
+
+    lines = prometheus_text(registry).splitlines()
+
+    assert "research_agent_bytes_received_total 123456790" in lines
+    assert 'research_agent_stage_cpu_seconds_total{stage="collect"} 0.1234567891' in lines
+
+
+def test_cli_profile_writes_run_record_and_textfile(monkeypatch, tmp_path):
+    monkeypatch.setattr("src.config.Config.OUTPUT_DIR", tmp_path)
+    monkeypatch.setattr("src.config.Config.validate", classmethod(lambda cls, model=None: True))
+    monkeypatch.setattr(main, "WebCollector", FakeCollector)
+    monkeypatch.setattr(main, "create_analyzer", lambda model: EchoProvider())
+    textfile = tmp_path / "metrics" / "research_agent.prom"
+
+    result = CliRunner().invoke(main.cli, [
+        "--topic", "solar power", "--sources", "web", "--output", "report",
+        "--profile", "--metrics-file", str(textfile)
+    ])
+
+    assert result.exit_code == 0, result.output
+    assert "Stage profile" in result.output and "collect.web" in result.output
+
+    record = json.loads((tmp_path / ".runs" / "report.json").read_text(encoding="utf-8"))
+    assert record["status"] == "ok" and record["options"]["topic"] == "solar power"
+    stages = {stage["stage"]: stage for stage in record["stages"]}
+    assert {"collection", "collect.web", "sentiment", "analysis", "report"} <= set(stages)
+    assert stages["collect.web"]["items"] == 3
+    assert stages["analysis"]["items"] == 3 and stages["analysis"]["bytes_sent"] > 0
+    written = sum(path.stat().st_size for path in (tmp_path / "report.md", tmp_path / "report.sidecar.json"))
+    assert stages["report"]["bytes_sent"] == written
+    assert 'research_agent_stage_seconds_total{stage="analysis"}' in textfile.read_text(encoding="utf-8")
@@ -0,0 +1,216 @@
+"""Tests for cacheable prompt prefixes and Anthropic prompt caching."""
+
+from types import SimpleNamespace
+
+from src.analyzers.claude_analyzer import ClaudeAnalyzer
+from src.analyzers.prompt_templates import get_analysis_prompt, get_analysis_spec
+from src.interactive.followup_analyzer import FollowupAnalyzer
+
+
+ITEMS = [
+    {"source": "x", "author": "@alice", "content": "Battery costs keep falling", "date": "2026-01-01",
+     "engagement": {"likes": 10, "retweets": 2}, "url": "https://x.com/a/1"},
+    {"source": "web", "author": "example.com", "title": "Grid storage report",
+     "content": "Storage deployments doubled", "date": "2026-01-02", "url": "https://example.com/r"},
+]
+
+
+class FakeMessages:
+    def __init__(self):
+        self.calls = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        usage = SimpleNamespace(
+            input_tokens=100, output_tokens=50,
+            cache_read_input_tokens=900 if len(self.calls) > 1 else 0,
+            cache_creation_input_tokens=0 if len(self.calls) > 1 else 900
+        )
+        return SimpleNamespace(content=[SimpleNamespace(text="answer")], usage=usage)
+
+
+def _analyzer():
+    analyzer = ClaudeAnalyzer.__new__(ClaudeAnalyzer)
+    analyzer.client = SimpleNamespace(messages=FakeMessages())
+    analyzer.logger = SimpleNamespace(info=lambda *_: None, warning=lambda *_: None, error=lambda *_: None)
+    return analyzer
+
+
+def _prefix(call):
+    """System plus every user block except the trailing task."""
+    return call["system"], call["messages"][0]["content"][:-1]
+
+
+def test_rendered_spec_matches_prompt_string():
+    spec = get_analysis_spec("energy storage", ITEMS, "quick")
+
+    assert get_analysis_prompt("energy storage", ITEMS, "quick") == spec.render()
+    assert "Grid storage report" in spec.context[0]
+    assert "Grid storage report" not in spec.task
+
+
+def test_analysis_marks_system_and_data_as_cacheable():
+    analyzer = _analyzer()
+
+    result = analyzer.analyze("energy storage", ITEMS, "detailed")
+
+    call = analyzer.client.messages.calls[0]
+    assert call["system"][0]["cache_control"] == {"type": "ephemeral"}
+    blocks = call["messages"][0]["content"]
+    assert blocks[0]["cache_control"] == {"type": "ephemeral"}
+    assert "cache_control" not in blocks[-1]
+    assert result["metadata"]["cache_write_tokens"] == 900
+    assert result["metadata"]["tokens_used"] == 1050
+
+
+def test_followups_share_the_analysis_prefix():
+    analyzer = _analyzer()
+    analyzer.analyze("energy storage", ITEMS, "detailed")
+    followup = FollowupAnalyzer(analyzer)
+
+    for question in ("What about battery prices?", "Any grid concerns?"):
+        followup.analyze_question(
+            question=question,
+            data=ITEMS,
+            original_analysis={"analysis": "Storage is growing."},
+            context={"topic": "energy storage"}
+        )
+
+    first, second, third = analyzer.client.messages.calls
+    assert _prefix(second) == _prefix(third)
+    assert second["system"] == first["system"]
+    # The data block is byte-identical to the one the analysis cached
+    assert second["messages"][0]["content"][0]["text"] == first["messages"][0]["content"][0]["text"]
+    assert "battery prices" in second["messages"][0]["content"][-1]["text"]
+
+
+class FakeGeminiModels:
+    def __init__(self):
+        self.calls = []
+
+    def generate_content(self, **kwargs):
+        self.calls.append(kwargs)
+        cached = 900 if "cached_content" in kwargs["config"] else 0
+        return SimpleNamespace(text="answer", usage_metadata=SimpleNamespace(cached_content_token_count=cached))
+
+
+class FakeCaches:
+    def __init__(self):
+        self.created, self.deleted = [], []
+
+    def create(self, **kwargs):
+        self.created.append(kwargs)
+        return SimpleNamespace(name="cachedContents/abc")
+
+    def update(self, **kwargs):
+        pass
+
+    def delete(self, name):
+        self.deleted.append(name)
+
+
+def test_gemini_session_followups_reference_the_context_cache():
+    from src.analyzers.gemini_analyzer import GeminiAnalyzer
+    from src.interactive.session import InteractiveSession
+
+    analyzer = GeminiAnalyzer.__new__(GeminiAnalyzer)
+    analyzer.client = SimpleNamespace(models=FakeGeminiModels(), caches=FakeCaches())
+    analyzer.logger = _analyzer().logger
+    analyzer._cache_name = analyzer._cache_key = None
+    analyzer._cache_expires = 0.0
+
+    session = InteractiveSession(
+        topic="energy storage", data=ITEMS,
+        analysis={"analysis": "Storage is growing."}, analyzer=analyzer
+    )
+    session.ask_question("What about battery prices?")
+    session.close()
+
+    assert session.context_cached
+    created = analyzer.client.caches.created[0]["config"]
+    assert "Grid storage report" in created["contents"][0]["parts"][0]["text"]
+    call = analyzer.client.models.calls[0]
+    assert call["config"]["cached_content"] == "cachedContents/abc"
+    # Only the question-specific task is sent alongside the cache reference
+    assert "Storage is growing." not in call["contents"]
+    assert "battery prices" in call["contents"]
+    assert analyzer.client.caches.deleted == ["cachedContents/abc"]
+
+
+class FlakyGeminiModels(FakeGeminiModels):
+    def __init__(self, error):
+        super().__init__()
+        self.error = error
+
+    def generate_content(self, **kwargs):
+        if "cached_content" in kwargs["config"]:
+            self.calls.append(kwargs)
+            raise self.error
+        return super().generate_content(**kwargs)
+
+
+def _cached_gemini(error):
+    from src.analyzers.gemini_analyzer import GeminiAnalyzer
+    from src.analyzers.prompt_templates import PromptSpec
+
+    analyzer = GeminiAnalyzer.__new__(GeminiAnalyzer)
+    analyzer.client = SimpleNamespace(models=FlakyGeminiModels(error), caches=FakeCaches())
+    analyzer.logger = _analyzer().logger
+    analyzer._cache_expires = float("inf")
+    spec = PromptSpec(system="system", context=["context"], task="task")
+    analyzer._cache_name, analyzer._cache_key = "cachedContents/abc", ("system", ("context",))
+    return analyzer, spec
+
+
+class GeminiError(Exception):
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+
+def test_gemini_cache_survives_transient_errors(monkeypatch):
+    monkeypatch.setattr("src.utils.retry.time.sleep", lambda seconds: None)
+    analyzer, spec = _cached_gemini(GeminiError(503, "unavailable"))
+
+    assert analyzer.generate(spec).text == "answer"
+    assert analyzer._cache_name == "cachedContents/abc"
+    assert analyzer.client.caches.deleted == []
+
+
+def test_gemini_cache_is_forgotten_when_gone():
+    analyzer, spec = _cached_gemini(GeminiError(404, "CachedContent not found"))
+
+    assert analyzer.generate(spec).text == "answer"
+    assert analyzer._cache_name is None
+    assert analyzer.client.caches.deleted == []
+
+
+def test_gemini_rejected_cache_is_deleted():
+    analyzer, spec = _cached_gemini(GeminiError(400, "invalid cached content"))
+
+    assert analyzer.generate(spec).text == "answer"
+    assert analyzer._cache_name is None
+    assert analyzer.client.caches.deleted == ["cachedContents/abc"]
+
+
+def test_session_builds_its_data_block_once(monkeypatch):
+    from src.interactive import prompts
+    from src.interactive.session import InteractiveSession
+
+    built = []
+    build = prompts.build_data_block
+    monkeypatch.setattr(prompts, "build_data_block", lambda topic, data: built.append(topic) or build(topic, data))
+
+    analyzer = _analyzer()
+    session = InteractiveSession(
+        topic="energy storage", data=ITEMS,
+        analysis={"analysis": "Storage is growing."}, analyzer=analyzer
+    )
+    session.ask_question("What about battery prices?")
+    session.ask_question("Any grid concerns?")
+
+    assert built == ["energy storage"]
+    calls = analyzer.client.messages.calls
+    assert len(calls) == 2
+    prefixes = {call["messages"][0]["content"][0]["text"] for call in calls}
+    assert len(prefixes) == 1
@@ -0,0 +1,60 @@
+"""Tests for X query planning and fan-out."""
+
+from src.collectors.pagination import Page
+from src.collectors.query_planner import QueryPlanner, QueryTarget
+from src.collectors.x_collector import XCollector
+
+
+def _post(post_id):
+    return {"source": "x", "content": f"post {post_id}", "url": "", "metadata": {"id": post_id}}
+
+
+def test_plan_expands_known_topic():
+    targets = QueryPlanner(max_targets=10).plan("Uniswap v4 hooks")
+
+    assert QueryTarget("account", "Uniswap") in targets
+    assert QueryTarget("search", "Uniswap v4 hooks") in targets
+    assert QueryTarget("hashtag", "UniswapV4Hooks") in targets
+    # Known accounts replace the compacted-topic handle fallback
+    assert QueryTarget("account", "Uniswapv4hooks") not in targets
+
+
+def test_plan_keeps_explicit_handles_and_hashtags_first():
+    targets = QueryPlanner(max_targets=10).plan("@vitalik #EIP4844 rollups")
+
+    assert targets[0] == QueryTarget("account", "vitalik")
+    assert targets[1] == QueryTarget("hashtag", "EIP4844")
+
+
+def test_plan_falls_back_to_compact_handle_and_caps_targets():
+    planner = QueryPlanner(max_targets=3)
+    targets = planner.plan("some obscure project")
+
+    assert len(targets) == 3
+    assert QueryTarget("account", "someobscureproject") in QueryPlanner(max_targets=10).plan(
+        "some obscure project"
+    )
+
+
+def test_target_urls():
+    assert QueryTarget("account", "Uniswap").scrape_type == "TWITTER_PROFILE"
+    assert QueryTarget("search", "a b").url == "https://twitter.com/search?q=a%20b&f=live"
+
+
+def test_collect_merges_targets_and_dedupes(monkeypatch):
+    monkeypatch.setattr("src.config.Config.SELA_API_KEY", "test")
+    collector = XCollector()
+    collector.planner = QueryPlanner(max_targets=3)
+
+    pages = {
+        "Uniswap": [_post("1"), _post("2")],
+        "haydenzadams": [_post("2"), _post("3")],
+    }
+
+    def fake_fetch(query, page_size, deadline, page=0, cursor=None):
+        return Page(items=pages.get(query.value, [_post("4")]))
+
+    collector._fetch_page = fake_fetch
+    collected = collector.collect("uniswap", max_items=10)
+
+    assert sorted(item["metadata"]["id"] for item in collected) == ["1", "2", "3", "4"]
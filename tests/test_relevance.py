@@ -0,0 +1,50 @@
+"""Tests for local relevance ranking of prompt data."""
+
+from src.analyzers.prompt_templates import _estimate_tokens, _format_data_summary
+from src.analyzers.relevance import HashedVectorizer, RelevanceRanker, cosine
+
+
+def _item(i, content, source="web"):
+    return {"source": source, "title": f"Item {i}", "content": content, "author": "a",
+            "url": f"https://example.com/{i}", "engagement": {"likes": 0}}
+
+
+def test_vectors_are_normalized_and_deterministic():
+    vectors = HashedVectorizer().fit(["solar panels on roofs", "wind turbines offshore"])
+    again = HashedVectorizer().fit(["solar panels on roofs", "wind turbines offshore"])
+
+    assert vectors == again
+    assert abs(cosine(vectors[0], vectors[0]) - 1.0) < 1e-9
+    assert cosine(vectors[0], vectors[1]) == 0.0
+
+
+def test_keeps_relevant_items_within_budget():
+    items = [_item(i, "celebrity gossip and football transfer rumours") for i in range(40)]
+    items += [_item(100 + i, f"home battery storage prices fell {i} percent") for i in range(5)]
+    ranker = RelevanceRanker(token_budget=10 * _estimate_tokens(items[0]))
+
+    selected = ranker.select("battery storage prices", items, _estimate_tokens)
+
+    assert sum(_estimate_tokens(item) for item in selected) <= ranker.token_budget
+    assert {item["title"] for item in selected[:5]} == {f"Item {100 + i}" for i in range(5)}
+
+
+def test_mmr_skips_near_duplicates():
+    duplicates = [_item(i, "battery storage prices are falling fast") for i in range(5)]
+    distinct = [_item(10, "battery storage policy changes in europe")]
+    filler = [_item(20 + i, "unrelated sports news") for i in range(30)]
+    items = duplicates + distinct + filler
+    ranker = RelevanceRanker(token_budget=2 * _estimate_tokens(items[0]) + 1, diversity=0.5)
+
+    selected = ranker.select("battery storage", items, _estimate_tokens)
+
+    assert [item["title"] for item in selected] == ["Item 0", "Item 10"]
+
+
+def test_summary_labels_selection_and_keeps_small_sets_whole():
+    small = [_item(i, "battery news") for i in range(3)]
+    assert "## Web Results (3 items)" in _format_data_summary(small, "battery")
+
+    large = [_item(i, f"battery storage update number {i} " + "details " * 60) for i in range(400)]
+    summary = _format_data_summary(large, "battery storage")
+    assert "most relevant of 400 items" in summary
@@ -0,0 +1,82 @@
+"""Tests for the concurrent report writer and its batch manifest."""
+
+import json
+
+import pytest
+
+from src.generators import MarkdownGenerator, RenderJob, RenderPool
+from src.generators.render_pool import MANIFEST_FORMAT
+from src.utils.files import atomic_writer
+
+
+ANALYSIS = {"analysis": "## Executive Summary\n\nText.", "metadata": {"model": "m"}}
+SOURCES = {"x": [], "web": [{"title": "Article", "source": "news", "date": "", "url": "https://example.com"}]}
+
+
+def test_pool_renders_reports_and_writes_manifest(tmp_path):
+    manifest_path = tmp_path / "batch.manifest.json"
+    jobs = [
+        RenderJob(f"Topic {i}", ANALYSIS, SOURCES, tmp_path / f"topic-{i}.md", formats=["json"])
+        for i in range(6)
+    ]
+
+    with RenderPool(max_workers=3, manifest_path=manifest_path) as pool:
+        results = list(pool.render(jobs))
+
+    assert sorted(result.job.topic for result in results) == [f"Topic {i}" for i in range(6)]
+    assert all(result.ok and len(result.outputs) == 3 and result.bytes > 0 for result in results)
+    assert (tmp_path / "topic-0.json").exists() and (tmp_path / "topic-0.sidecar.json").exists()
+    assert not list(tmp_path.glob("*.tmp"))
+
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    assert manifest["format"] == MANIFEST_FORMAT and manifest["complete"] is True
+    assert len(manifest["reports"]) == 6
+    assert {report["status"] for report in manifest["reports"]} == {"ok"}
+
+
+def test_failed_render_is_recorded_in_manifest(tmp_path, monkeypatch):
+    generator = MarkdownGenerator()
+
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(generator, "write_report", fail)
+    manifest_path = tmp_path / "batch.manifest.json"
+
+    with RenderPool(generator=generator, manifest_path=manifest_path) as pool:
+        pool.submit(RenderJob("Solar", ANALYSIS, SOURCES, tmp_path / "solar.md"))
+        [result] = pool.results()
+
+    assert not result.ok and result.outputs == []
+    [report] = json.loads(manifest_path.read_text(encoding="utf-8"))["reports"]
+    assert report["status"] == "failed" and report["error"] == "disk full"
+    assert report["error_type"] == "OSError"
+
+
+def test_atomic_writer_keeps_previous_file_on_error(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text("old", encoding="utf-8")
+
+    with pytest.raises(RuntimeError):
+        with atomic_writer(path) as handle:
+            handle.write("new")
+            raise RuntimeError("interrupted")
+
+    assert path.read_text(encoding="utf-8") == "old"
+    assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
+
+    with atomic_writer(path) as handle:
+        handle.write("new")
+    assert path.read_text(encoding="utf-8") == "new"
+
+
+def test_atomic_writers_of_one_path_do_not_collide(tmp_path):
+    path = tmp_path / "data.json"
+
+    with atomic_writer(path, durable=False) as first:
+        with atomic_writer(path, durable=False) as second:
+            second.write("second")
+        first.write("first")
+
+    assert path.read_text(encoding="utf-8") == "first"
+    assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
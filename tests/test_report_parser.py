@@ -0,0 +1,54 @@
+"""Tests for the section tokenizer and Markdown report parsing."""
+
+from src.generators import MarkdownGenerator
+from src.parsers import ReportParser
+from src.parsers.sections import MarkdownDocument
+
+
+def test_tokenizer_builds_section_tree():
+    document = MarkdownDocument(
+        "# Title\nintro\n## One\nbody\n```\n## not a heading\n```\n### Sub\nsub body\n## Two\n#hashtag\nend"
+    )
+
+    one = document.section("One")
+    assert [child.title for child in one.children] == ["Sub"]
+    assert document.body(one) == "body\n```\n## not a heading\n```"
+    assert document.section("Two").end == len(document.lines)
+    assert document.section("not a heading") is None
+    assert document.preamble_end == 2
+
+
+def test_markdown_report_sections_are_extracted(tmp_path):
+    report = tmp_path / "report.md"
+    analysis = {"analysis": "## Executive Summary\n\nText.\n\n### Detail\n\nMore.", "metadata": {"model": "m"}}
+    sources = {
+        "x": [{"author": "a", "content": "c", "date": "d", "url": "u"}],
+        "web": [{"title": "t", "source": "s", "date": "d", "url": "u"}] * 2,
+    }
+    MarkdownGenerator().generate_report(
+        "topic", analysis, sources, report,
+        keywords=[("solar", 0.1)], trends={"frequency": {"avg_per_day": 1}}, sidecar=False
+    )
+
+    parsed = ReportParser().parse_report(report)
+
+    assert parsed["metadata"]["model"] == "m"
+    assert parsed["keywords"] == ["solar"]
+    assert parsed["sources"]["x_count"] == 1
+    assert parsed["sources"]["web_count"] == 2
+    assert parsed["analysis"] == "## Executive Summary\n\nText.\n\n### Detail\n\nMore."
+
+
+def test_analysis_keeps_text_before_first_section(tmp_path):
+    report = tmp_path / "report.md"
+    analysis = {
+        "analysis": "# Research Analysis: Solar\n\nIntro paragraph.\n\n## Executive Summary\n\nText.",
+        "metadata": {"model": "m"},
+    }
+    MarkdownGenerator().generate_report("Solar", analysis, {"x": [], "web": []}, report, sidecar=False)
+
+    parsed = ReportParser().parse_report(report)
+
+    assert parsed["analysis"] == (
+        "# Research Analysis: Solar\n\nIntro paragraph.\n\n## Executive Summary\n\nText."
+    )
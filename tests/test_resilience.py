@@ -0,0 +1,138 @@
+"""Tests for circuit breaking and hedged requests."""
+
+import threading
+import time
+
+import pytest
+import requests
+
+from src.collectors.pagination import Page
+from src.utils import resilience
+from src.utils.resilience import CircuitBreaker, CircuitOpenError, get_breaker, hedged_call
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry(monkeypatch, tmp_path):
+    monkeypatch.setattr("src.config.Config.OUTPUT_DIR", tmp_path)
+    monkeypatch.setattr(resilience, "_breakers", {})
+    monkeypatch.setattr(resilience, "_latencies", {})
+
+
+def _timeout():
+    raise requests.exceptions.Timeout("slow")
+
+
+def test_opens_after_threshold_and_fails_fast():
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=60)
+
+    for _ in range(2):
+        with pytest.raises(requests.exceptions.Timeout):
+            breaker.call(_timeout)
+
+    calls = []
+    with pytest.raises(CircuitOpenError):
+        breaker.call(calls.append, 1)
+    assert calls == []
+
+
+def test_half_open_probe_closes_on_success():
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=60)
+    with pytest.raises(requests.exceptions.Timeout):
+        breaker.call(_timeout)
+
+    breaker.opened_at -= 61
+    assert breaker.call(lambda: "ok") == "ok"
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_probe_reopens_on_failure():
+    breaker = CircuitBreaker("test", failure_threshold=3, reset_timeout=60)
+    breaker.state, breaker.opened_at = CircuitBreaker.OPEN, time.time() - 61
+
+    with pytest.raises(requests.exceptions.Timeout):
+        breaker.call(_timeout)
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.call(lambda: "ok")
+
+
+def test_half_open_probe_is_released_when_interrupted():
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=60)
+    breaker.state, breaker.opened_at = CircuitBreaker.OPEN, time.time() - 61
+
+    def interrupted():
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        breaker.call(interrupted)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.call(lambda: "ok") == "ok"
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_client_errors_do_not_trip_the_circuit():
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=60)
+    response = requests.Response()
+    response.status_code = 401
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        breaker.call(lambda: (_ for _ in ()).throw(requests.exceptions.HTTPError(response=response)))
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_open_circuit_survives_restart(monkeypatch):
+    breaker = get_breaker("sela")
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+    monkeypatch.setattr(resilience, "_breakers", {})
+    with pytest.raises(CircuitOpenError):
+        get_breaker("sela").before_call()
+
+
+def test_concurrent_trips_keep_every_endpoint_state(monkeypatch):
+    endpoints = [f"endpoint-{i}" for i in range(8)]
+    breakers = [get_breaker(name) for name in endpoints]
+
+    def trip(breaker):
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure()
+
+    threads = [threading.Thread(target=trip, args=(breaker,)) for breaker in breakers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert set(resilience._load_state()) == set(endpoints)
+    assert not list(resilience._state_file().parent.glob("*.tmp"))
+
+
+def test_hedged_call_returns_fastest(monkeypatch):
+    monkeypatch.setattr("src.config.Config.HEDGE_REQUESTS", True)
+    tracker = resilience.get_latency_tracker("hedged")
+    for _ in range(10):
+        tracker.record(0.01)
+
+    calls = []
+
+    def first_slow():
+        calls.append(len(calls))
+        time.sleep(1.0 if len(calls) == 1 else 0.0)
+        return len(calls)
+
+    start = time.monotonic()
+    assert hedged_call("hedged", first_slow) == 2
+    assert time.monotonic() - start < 0.5
+
+
+def test_collector_fails_fast_when_circuit_open():
+    from tests.test_pagination import FakeCollector
+
+    collector = FakeCollector({0: Page([{"content": "a"}])})
+    breaker = get_breaker(collector._endpoint_name("topic"))
+    breaker.state, breaker.opened_at = CircuitBreaker.OPEN, time.time()
+
+    with pytest.raises(CircuitOpenError):
+        collector.collect("topic", max_items=5)
+    assert collector.requests == []
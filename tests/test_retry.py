@@ -0,0 +1,90 @@
+"""Tests for the unified retry policy and budget."""
+
+import pytest
+import requests
+
+from src.utils.metrics import metrics
+from src.utils.retry import RetryBudget, RetryPolicy, is_retriable_error, retry_after
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    slept = []
+    monkeypatch.setattr("src.utils.retry.time.sleep", slept.append)
+    metrics.reset()
+    return slept
+
+
+def _http_error(status, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    return requests.exceptions.HTTPError(response=response)
+
+
+def _flaky(failures, error):
+    calls = []
+
+    def func():
+        calls.append(1)
+        if len(calls) <= failures:
+            raise error
+        return "ok"
+
+    return func, calls
+
+
+def test_retries_until_success_and_records_attempts():
+    func, calls = _flaky(2, requests.exceptions.ConnectionError("down"))
+    policy = RetryPolicy("test", max_attempts=4, budget=RetryBudget(10, 100))
+
+    assert policy.call(func) == "ok"
+    assert len(calls) == 3
+    assert metrics.total("retry_attempts_total", operation="test", outcome="retry") == 2
+    assert metrics.total("retry_attempts_total", operation="test", outcome="success") == 1
+
+
+def test_does_not_retry_client_errors():
+    func, calls = _flaky(5, _http_error(401))
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        RetryPolicy("test", budget=RetryBudget(10, 100)).call(func)
+    assert len(calls) == 1
+
+
+def test_budget_is_shared_across_calls():
+    budget = RetryBudget(max_retries=3, max_wait=100)
+    error = requests.exceptions.Timeout("slow")
+
+    for _ in range(2):
+        func, _ = _flaky(10, error)
+        with pytest.raises(requests.exceptions.Timeout):
+            RetryPolicy("test", max_attempts=10, budget=budget).call(func)
+
+    assert budget.retries == 3
+    assert budget.exhausted
+    assert metrics.total("retry_attempts_total", outcome="budget_exhausted") == 2
+
+
+def test_honors_retry_after(no_sleep):
+    func, _ = _flaky(1, _http_error(429, {"Retry-After": "7"}))
+
+    RetryPolicy("test", budget=RetryBudget(10, 100)).call(func)
+
+    assert no_sleep == [7.0]
+
+
+def test_jittered_backoff_stays_within_cap():
+    policy = RetryPolicy("test", min_wait=1, max_wait=4)
+    delays = [policy.backoff(attempt, RuntimeError()) for attempt in range(1, 10) for _ in range(20)]
+
+    assert min(delays) >= 0.5
+    assert max(delays) <= 4
+
+
+def test_classification():
+    assert is_retriable_error(_http_error(503))
+    assert not is_retriable_error(_http_error(404))
+    assert is_retriable_error(requests.exceptions.ConnectionError())
+    assert not is_retriable_error(ValueError("bad input"))
+    assert retry_after(_http_error(503)) is None
@@ -0,0 +1,79 @@
+"""Tests for the structured report sidecar."""
+
+import json
+
+import pytest
+
+from src.analyzers.comparison_analyzer import ComparisonAnalyzer
+from src.generators import MarkdownGenerator
+from src.generators.sidecar import SidecarError, load_sidecar, sidecar_path
+from src.parsers import ReportParser
+
+
+SENTIMENT = {
+    "overall": "Positive",
+    "average_compound": 0.412,
+    "distribution": {
+        "positive": {"count": 3, "percentage": 75.0},
+        "neutral": {"count": 1, "percentage": 25.0},
+        "negative": {"count": 0, "percentage": 0.0},
+    },
+    "total_analyzed": 4,
+}
+KEYWORDS = [("solar batteries", 0.0123), ("grid storage", 0.0456)]
+SOURCES = {"x": [{"author": "a", "content": "post...", "date": "2026-01-01", "url": "https://x.com/1"}], "web": []}
+
+
+def write_report(path, **kwargs):
+    analysis = {"success": True, "analysis": "## Executive Summary\n\nAll good.", "metadata": {"model": "m"}}
+    assert MarkdownGenerator().generate_report("solar", analysis, SOURCES, path,
+                                               sentiment=SENTIMENT, keywords=KEYWORDS, **kwargs)
+
+
+def test_report_writes_versioned_sidecar(tmp_path):
+    report = tmp_path / "report.md"
+    write_report(report)
+
+    assert sidecar_path(report) == tmp_path / "report.sidecar.json"
+    sidecar = load_sidecar(report)
+    assert sidecar["version"] == 1
+    assert sidecar["keywords"] == KEYWORDS
+    assert sidecar["sentiment"] == SENTIMENT
+    assert sidecar["sources"]["x_count"] == 1
+
+
+def test_parser_prefers_exact_sidecar_data(tmp_path):
+    report = tmp_path / "report.md"
+    write_report(report)
+
+    previous = ReportParser().parse_report(report)
+
+    assert previous["exact"] is True
+    assert previous["keywords"] == KEYWORDS
+    assert previous["analysis"].startswith("## Executive Summary")
+
+    comparison = ComparisonAnalyzer().compare_analyses(
+        current={"sentiment": SENTIMENT, "keywords": [("solar batteries", 0.01), ("heat pumps", 0.02)]},
+        previous=previous
+    )
+    assert comparison["new_topics"] == ["heat pumps"]
+    assert comparison["removed_topics"] == ["grid storage"]
+
+
+def test_parser_falls_back_to_markdown_without_sidecar(tmp_path):
+    report = tmp_path / "report.md"
+    write_report(report, sidecar=False)
+
+    previous = ReportParser().parse_report(report)
+
+    assert "exact" not in previous
+    assert previous["keywords"] == ["solar batteries", "grid storage"]
+    assert previous["sentiment"]["overall"] == "Positive"
+
+
+def test_newer_sidecar_versions_are_rejected(tmp_path):
+    path = tmp_path / "report.sidecar.json"
+    path.write_text(json.dumps({"format": "research-agent.report", "version": 99}), encoding="utf-8")
+
+    with pytest.raises(SidecarError):
+        load_sidecar(path)
@@ -0,0 +1,50 @@
+"""Tests for the columnar source summary."""
+
+import json
+
+from src.analyzers.sources import CONTENT_PREVIEW, SourceSummary
+from src.analyzers.streaming import StreamingAnalysis
+from src.generators import MarkdownGenerator
+from src.generators.sidecar import load_sidecar
+
+
+ITEMS = [
+    {"source": "x", "author": "alice", "content": "a" * 500, "date": "2026-01-01", "url": "https://x.com/1",
+     "engagement": {"likes": 40, "retweets": 2}},
+    {"source": "x", "author": "bob", "content": "short", "date": "2026-01-02", "url": "https://x.com/2",
+     "engagement": {}},
+    {"source": "web", "title": "Grid report", "author": "news", "date": "2026-01-03", "url": "https://example.com"},
+    {"source": "rss", "title": "ignored"},
+]
+
+
+def test_items_are_projected_into_columns_during_streaming():
+    live = StreamingAnalysis()
+    for item in ITEMS:
+        live.add(item)
+
+    sources = live.sources
+    assert (sources.x_count, sources.web_count, len(sources)) == (2, 1, 3)
+    assert sources.x_content[0] == "a" * CONTENT_PREVIEW + "..."
+    assert sources.x_likes == [40, 0]
+    assert list(sources.web_rows()) == [("Grid report", "news", "2026-01-03", "https://example.com")]
+    assert [len(chunk) for chunk in sources.chunks("x", 1)] == [1, 1]
+
+
+def test_summary_round_trips_through_sidecar_and_json(tmp_path):
+    path = tmp_path / "report.md"
+    summary = SourceSummary.from_items(ITEMS)
+
+    assert MarkdownGenerator().generate_report("Grid", {"analysis": "Text."}, summary, path, formats=["json"])
+
+    content = path.read_text(encoding="utf-8")
+    assert "### X (Twitter) - 2 posts" in content and "👍 40 likes" in content and "👍 N/A likes" in content
+    sidecar = load_sidecar(path)
+    assert sidecar["sources"]["x_count"] == 2
+    assert sidecar["sources"]["x"][1] == {"author": "bob", "content": "short...", "date": "2026-01-02",
+                                          "url": "https://x.com/2", "engagement": {"likes": 0}}
+    exported = json.loads(path.with_suffix(".json").read_text(encoding="utf-8"))
+    assert exported["sources"] == sidecar["sources"]
+
+    rebuilt = SourceSummary.from_sidecar(sidecar["sources"])
+    assert list(rebuilt.x_rows()) == list(summary.x_rows())
@@ -0,0 +1,139 @@
+"""Tests for the incremental Sela response parser."""
+
+import json
+
+import pytest
+
+from src.collectors.stream_parser import ResponseStream
+from src.collectors.web_collector import WEB_CONTAINER_KEYS, WEB_SINGLE_ITEM_KEYS, WebCollector
+from src.collectors.x_collector import X_CONTAINER_KEYS, X_SINGLE_ITEM_KEYS, XCollector
+from src.utils.logger import get_logger
+
+
+def _chunks(document, size=7):
+    body = json.dumps(document).encode("utf-8")
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+def _posts(count):
+    return [{"id": str(i), "text": f"post {i} ✓", "likes": i * 1.5} for i in range(count)]
+
+
+def test_streams_result_list_across_chunk_boundaries():
+    document = {"success": True, "data": {"result": _posts(25), "next_cursor": "abc"}}
+    stream = ResponseStream(_chunks(document, size=3), X_CONTAINER_KEYS)
+
+    items = list(stream.items())
+
+    assert items == _posts(25)
+    assert stream.finished and not stream.failed
+    assert stream.field("next_cursor") == "abc"
+
+
+def test_uses_first_non_empty_container():
+    document = {"success": True, "data": {"result": {
+        "cursor": "c1", "tweets": [], "posts": _posts(2), "items": _posts(5)
+    }}}
+    stream = ResponseStream(_chunks(document), X_CONTAINER_KEYS)
+
+    assert list(stream.items()) == _posts(2)
+    assert stream.container == "posts"
+    assert stream.field("cursor") == "c1"
+
+
+def test_container_priority_wins_over_document_order():
+    document = {"success": True, "data": {"result": {
+        "items": _posts(5), "posts": _posts(2), "tweets": None
+    }}}
+    stream = ResponseStream(_chunks(document), X_CONTAINER_KEYS)
+
+    assert list(stream.items()) == _posts(2)
+    assert stream.container == "posts"
+
+
+def test_single_item_overrides_containers():
+    document = {"success": True, "data": {"result": {"text": "one", "posts": _posts(2)}}}
+    stream = ResponseStream(_chunks(document), X_CONTAINER_KEYS, X_SINGLE_ITEM_KEYS)
+
+    assert list(stream.items()) == [{"text": "one", "posts": _posts(2)}]
+    assert stream.container is None
+
+
+def test_single_item_result():
+    document = {"success": True, "data": {"result": {"title": "Only", "link": "https://a"}}}
+    stream = ResponseStream(_chunks(document), WEB_CONTAINER_KEYS, WEB_SINGLE_ITEM_KEYS)
+
+    assert list(stream.items()) == [{"title": "Only", "link": "https://a"}]
+
+
+def test_reports_failure():
+    stream = ResponseStream(_chunks({"success": False, "message": "quota"}), X_CONTAINER_KEYS)
+
+    assert list(stream.items()) == []
+    assert stream.failed and stream.message == "quota"
+
+
+def test_missing_success_flag_fails_only_when_finished():
+    stream = ResponseStream(_chunks({"data": {"result": _posts(3)}}), X_CONTAINER_KEYS)
+    items = stream.items()
+
+    next(items)
+    assert not stream.failed
+    list(items)
+    assert stream.failed
+
+
+def test_stops_reading_after_max_items():
+    document = {"success": True, "data": {"result": {"organic_results": [
+        {"title": f"r{i}", "link": f"https://r/{i}", "snippet": "s"} for i in range(5000)
+    ]}}}
+    chunks = _chunks(document, size=1024)
+    consumed = []
+
+    def tracking():
+        for chunk in chunks:
+            consumed.append(chunk)
+            yield chunk
+
+    collector = WebCollector.__new__(WebCollector)
+    collector.logger = get_logger("test")
+    results = collector._parse_web_response(
+        ResponseStream(tracking(), WEB_CONTAINER_KEYS, WEB_SINGLE_ITEM_KEYS), max_items=10
+    )
+
+    assert [r["title"] for r in results] == [f"r{i}" for i in range(10)]
+    assert len(consumed) < len(chunks) / 2
+
+
+def test_finish_skips_items_and_keeps_trailing_fields():
+    posts = _posts(5) + [{"id": "x", "text": 'quote \\" and ] } [ {', "nested": {"a": [1, {"b": "]"}]}}]
+    document = {"success": True, "data": {"result": {"tweets": posts, "next_cursor": "CUR"}, "total": 6}}
+    stream = ResponseStream(_chunks(document, size=5), X_CONTAINER_KEYS)
+
+    items = stream.items()
+    assert next(items) == posts[0]
+    stream.finish()
+
+    assert stream.finished
+    assert stream.field("next_cursor") == "CUR"
+    assert stream.field("total") == 6
+
+
+def test_x_page_reads_cursor_after_the_post_list():
+    document = {"success": True, "data": {"result": {
+        "tweets": [{"id": str(i), "text": f"post {i}", "username": "ann"} for i in range(5)],
+        "next_cursor": "CUR",
+    }}}
+    collector = XCollector.__new__(XCollector)
+    collector.logger = get_logger("test")
+    stream = ResponseStream(_chunks(document), X_CONTAINER_KEYS, X_SINGLE_ITEM_KEYS)
+
+    results = collector._parse_x_response(stream, max_items=2)
+
+    assert len(results) == 2
+    assert collector._extract_cursor(stream) == "CUR"
+
+
+def test_malformed_body_raises():
+    with pytest.raises(ValueError):
+        list(ResponseStream([b"[1, 2]"], X_CONTAINER_KEYS).items())
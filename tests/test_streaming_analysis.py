@@ -0,0 +1,53 @@
+"""Tests for enhanced analysis fed item by item."""
+
+import pytest
+
+from src.analyzers.keyword_extractor import KeywordExtractor
+from src.analyzers.sentiment_analyzer import SentimentAnalyzer
+from src.analyzers.streaming import StreamingAnalysis
+from src.analyzers.trend_analyzer import TrendAnalyzer
+
+
+ITEMS = [
+    {"source": "x", "content": "Solar batteries are great and getting cheaper", "date": "2026-01-01",
+     "engagement": {"likes": 10, "retweets": 2, "replies": 1}},
+    {"source": "x", "content": "Terrible grid outage again, solar batteries saved us", "date": "2026-01-02",
+     "engagement": {"likes": 4, "retweets": 0, "replies": 3}},
+    {"source": "web", "title": "Solar battery prices fall", "content": "", "date": "Jan 2, 2026"},
+    {"source": "web", "title": "Undated", "content": "Home solar batteries explained", "date": ""},
+]
+
+
+def test_streamed_results_match_batch_analysis():
+    live = StreamingAnalysis()
+    for item in ITEMS:
+        live.add(item)
+
+    assert live.sentiment() == SentimentAnalyzer().analyze_items(ITEMS)
+    assert live.trends() == TrendAnalyzer().analyze_temporal_trends(ITEMS)
+    assert live.keywords(top_n=10) == KeywordExtractor().extract_keywords(ITEMS, top_n=10)
+
+
+def test_summary_shows_partial_stats():
+    live = StreamingAnalysis()
+    assert "Waiting" in live.summary()
+
+    for item in ITEMS[:2]:
+        live.add(item)
+
+    summary = live.summary()
+    assert "2 items" in summary
+    assert "solar batteries" in summary
+    assert "2 days" in summary
+
+
+def test_failing_accumulator_is_isolated(monkeypatch):
+    live = StreamingAnalysis()
+    monkeypatch.setattr(live.accumulators["sentiment"], "add", lambda item: 1 / 0)
+
+    for item in ITEMS:
+        live.add(item)
+
+    with pytest.raises(ZeroDivisionError):
+        live.sentiment()
+    assert live.trends()["total_dates"] == 3